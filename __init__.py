@@ -3,13 +3,19 @@
 """
 Módulo principal del SDK Fiskaly SIGN ES para Python.
 
-Provee el cliente principal y la versión del SDK.
+Provee el cliente principal y la versión del SDK. El cliente (y con él
+`requests`) se importa la primera vez que se usa `fiskaly_sdk.FiskalyClient`.
 """
 
-from .client import FiskalyClient
+from .lazy import lazy_exports
 from .version import __version__
 
+_EXPORTS = {
+    "FiskalyClient": ".client",
+}
+
 __all__ = [
     "FiskalyClient",
     "__version__"
 ]
+__getattr__, __dir__ = lazy_exports(globals(), _EXPORTS)
@@ -0,0 +1,19 @@
+# fiskaly_sdk/aio/__init__.py
+
+"""
+Soporte asyncio del SDK Fiskaly SIGN ES.
+
+Provee AsyncFiskalyClient, que requiere la dependencia opcional `httpx`
+(pip install 'fiskaly-sdk-sign-es[async]').
+"""
+
+from ..lazy import lazy_exports
+
+_EXPORTS = {
+    "AsyncFiskalyClient": ".client",
+}
+
+__all__ = [
+    "AsyncFiskalyClient",
+]
+__getattr__, __dir__ = lazy_exports(globals(), _EXPORTS)
@@ -0,0 +1,37 @@
+# fiskaly_sdk/aio/api/__init__.py
+
+"""
+Recursos asíncronos del SDK Fiskaly SIGN ES.
+
+Mismos métodos que el submódulo `api`, pero como corrutinas:
+    - AsyncAuthAPI
+    - AsyncTaxpayerAPI
+    - AsyncSignersAPI
+    - AsyncClientsAPI
+    - AsyncInvoicesAPI
+    - AsyncExportsAPI
+    - AsyncTaxpayerAgreementAPI
+    - AsyncInvoiceXMLAPI
+    - AsyncInvoiceSearchAPI
+    - AsyncSoftwareAPI
+
+Cada recurso se importa la primera vez que se pide.
+"""
+
+from ...lazy import lazy_exports
+
+_EXPORTS = {
+    "AsyncAuthAPI": ".auth",
+    "AsyncTaxpayerAPI": ".taxpayer",
+    "AsyncSignersAPI": ".signers",
+    "AsyncClientsAPI": ".clients",
+    "AsyncInvoicesAPI": ".invoices",
+    "AsyncExportsAPI": ".exports",
+    "AsyncTaxpayerAgreementAPI": ".taxpayer_agreement",
+    "AsyncInvoiceXMLAPI": ".invoice_xml",
+    "AsyncInvoiceSearchAPI": ".invoice_search",
+    "AsyncSoftwareAPI": ".software",
+}
+
+__all__ = list(_EXPORTS)
+__getattr__, __dir__ = lazy_exports(globals(), _EXPORTS)
@@ -0,0 +1,85 @@
+# fiskaly_sdk/aio/api/auth.py
+
+"""
+Autenticación asíncrona y obtención de Bearer Token con la API Fiskaly SIGN ES.
+"""
+
+from ...exceptions import FiskalyAuthError
+from ...instrumentation import timed_validation
+from ...models.auth import AuthResponse, AuthToken
+from ...token_store import ashared_token
+
+class AsyncAuthAPI:
+    """
+    API de autenticación Fiskaly (versión asíncrona).
+    """
+
+    def __init__(self, client):
+        """
+        :param client: Instancia de AsyncFiskalyClient.
+        """
+        self.client = client
+
+    async def retrieve_access_token(self) -> str:
+        """
+        Solicita un token Bearer usando las credenciales configuradas en el cliente.
+
+        :return: Token Bearer válido para ser usado en llamadas autenticadas.
+        :raises FiskalyAuthError: Si la autenticación falla.
+        """
+        token = await self.fetch_access_token()
+        self.client.set_bearer_token(token.bearer, expires_at=token.expires_at)
+        return token.bearer
+
+    async def fetch_access_token(self) -> AuthToken:
+        """
+        Obtiene un token nuevo sin modificar el estado del cliente.
+
+        Si el cliente tiene `token_store`, reutiliza el token que otro proceso haya
+        guardado para la misma API key, o lo renueva un solo proceso a la vez.
+
+        :return: AuthToken con el Bearer y su `expires_at`.
+        :raises FiskalyAuthError: Si la autenticación falla.
+        """
+        config = self.client.config
+        if config.token_store is None:
+            return await self._request_token()
+
+        async def fetch():
+            token = await self._request_token()
+            return token.bearer, token.expires_at
+
+        bearer, expires_at = await ashared_token(
+            config.token_store,
+            config.api_key,
+            fetch,
+            stale=self.client.get_bearer_token(),
+            margin=config.token_refresh_margin,
+        )
+        return AuthToken(bearer=bearer, expires_at=expires_at)
+
+    async def _request_token(self) -> AuthToken:
+        """
+        Solicita un token nuevo a `/auth`.
+        """
+        payload = {
+            "content": {
+                "api_key": self.client.config.api_key,
+                "api_secret": self.client.config.api_secret
+            }
+        }
+        try:
+            response = await self.client.request(
+                method="POST",
+                endpoint="/auth",
+                json=payload,
+                will_parse=True
+            )
+        except Exception as e:
+            raise FiskalyAuthError(f"Error de conexión al autenticar: {e}")
+
+        try:
+            auth_response = timed_validation(lambda: AuthResponse.model_validate(response))
+            return auth_response.content.access_token
+        except Exception as e:
+            raise FiskalyAuthError(f"Error procesando la respuesta de autenticación: {e}")
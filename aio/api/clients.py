@@ -0,0 +1,81 @@
+# fiskaly_sdk/aio/api/clients.py
+
+"""
+API asíncrona para gestionar dispositivos cliente (clients).
+"""
+
+from typing import Optional, Dict, Any, AsyncIterator
+from ...pagination import aiter_items
+from ...responses import split_page
+from ...models.client import (
+    ClientRequest,
+    ClientStateRequest,
+    ClientResponse,
+    ClientsListResponse,
+)
+from ...utils import generate_guid
+
+class AsyncClientsAPI:
+    """
+    Versión asíncrona de ClientsAPI: create(), disable(), get() y list().
+    """
+
+    def __init__(self, client):
+        """
+        :param client: Instancia de AsyncFiskalyClient.
+        """
+        self.client = client
+
+    async def create(self, client_id: Optional[str] = None, metadata: Optional[Dict[str, Any]] = None) -> ClientResponse:
+        """
+        Crea un nuevo client.
+
+        :param client_id: GUID único del client (si None, se genera automáticamente).
+        :param metadata: Metadata opcional.
+        :return: ClientResponse con los datos del client creado.
+        """
+        client_id = client_id or generate_guid()
+        body = ClientRequest(metadata=metadata or {})
+        resp = await self.client.request("PUT", f"/clients/{client_id}", json=body, will_parse=True)
+        return self.client.parse(ClientResponse, resp)
+
+    async def disable(self, client_id: str, metadata: Optional[Dict[str, Any]] = None) -> ClientResponse:
+        """
+        Deshabilita (deactiva) un client existente.
+        """
+        body = ClientStateRequest(
+            content={"state": "DISABLED"},
+            metadata=metadata or {}
+        )
+        resp = await self.client.request("PATCH", f"/clients/{client_id}", json=body, will_parse=True)
+        return self.client.parse(ClientResponse, resp)
+
+    async def get(self, client_id: str) -> ClientResponse:
+        """
+        Recupera los datos de un client específico.
+        """
+        resp = await self.client.request("GET", f"/clients/{client_id}", will_parse=True)
+        return self.client.parse(ClientResponse, resp)
+
+    async def list(self, limit: int = 10, token: Optional[str] = None) -> ClientsListResponse:
+        """
+        Lista los clients de la organización, soportando paginación.
+
+        :param limit: Límite de elementos por página.
+        :param token: Token de paginación (si aplica).
+        """
+        params = {"limit": limit}
+        if token:
+            params["token"] = token
+        resp = await self.client.request("GET", "/clients", params=params, will_parse=True)
+        return self.client.parse_page(ClientsListResponse, ClientResponse, resp)
+
+    def iter_all(self, limit: int = 100, prefetch: bool = True) -> AsyncIterator[ClientResponse]:
+        """
+        Recorre todos los clients siguiendo la paginación (`async for`).
+        """
+        async def fetch_page(token):
+            page = await self.list(limit=limit, token=token)
+            return split_page(page)
+
+        return aiter_items(fetch_page, prefetch=prefetch)
@@ -0,0 +1,80 @@
+# fiskaly_sdk/aio/api/exports.py
+
+"""
+API asíncrona para exportar facturas (exports).
+"""
+
+from typing import Optional, Dict, Any, List
+from ...models.export import (
+    ExportRequest,
+    ExportUpdateRequest,
+    ExportResponse,
+)
+from ...download import DownloadResult
+from ...export_scheduler import await_until_ready
+from ...utils import generate_guid
+
+class AsyncExportsAPI:
+    """
+    Versión asíncrona de ExportsAPI: create, get, list, wait_until_ready, download_zip y update_metadata.
+    """
+
+    def __init__(self, client):
+        """
+        :param client: Instancia de AsyncFiskalyClient.
+        """
+        self.client = client
+
+    async def create(self, export_id: Optional[str] = None, content: Dict[str, Any] = None, metadata: Optional[Dict[str, Any]] = None) -> ExportResponse:
+        """
+        Crea una nueva exportación de facturas.
+
+        :param export_id: ID único de la exportación (si None, se genera uno nuevo).
+        :param content: Filtros de exportación (según la API).
+        :param metadata: Metadata adicional (opcional).
+        :return: ExportResponse con los datos de la exportación creada.
+        """
+        export_id = export_id or generate_guid()
+        body = ExportRequest(content=content or {}, metadata=metadata or {})
+        resp = await self.client.request("PUT", f"/exports/{export_id}", json=body, will_parse=True)
+        return self.client.parse(ExportResponse, resp)
+
+    async def get(self, export_id: str) -> ExportResponse:
+        """
+        Recupera los datos de una exportación específica.
+        """
+        resp = await self.client.request("GET", f"/exports/{export_id}", will_parse=True)
+        return self.client.parse(ExportResponse, resp)
+
+    async def list(self, params: Optional[Dict[str, Any]] = None) -> List[ExportResponse]:
+        """
+        Lista todas las exportaciones existentes.
+        """
+        resp = await self.client.request("GET", "/exports", params=params or {}, will_parse=True)
+        return self.client.parse_list(ExportResponse, [{"content": item} for item in resp.get("content", [])])
+
+    async def wait_until_ready(self, export_id: str, timeout: Optional[float] = 600.0, **backoff) -> ExportResponse:
+        """
+        Espera a que una exportación termine, consultándola con backoff adaptativo.
+        """
+        return await await_until_ready(self, export_id, timeout=timeout, **backoff)
+
+    async def download_zip(self, export_id: str) -> bytes:
+        """
+        Descarga el archivo ZIP generado para una exportación.
+        """
+        return await self.client.request("GET", f"/exports/{export_id}/file")
+
+    async def download_zip_to(self, export_id: str, dest, **options) -> DownloadResult:
+        """
+        Descarga el ZIP de una exportación en streaming, sin cargarlo entero en memoria.
+        """
+        return await self.client.download(f"/exports/{export_id}/file", dest, **options)
+
+    async def update_metadata(self, export_id: str, content: Dict[str, Any], metadata: Optional[Dict[str, Any]] = None) -> ExportResponse:
+        """
+        Actualiza la metadata de una exportación existente.
+        """
+        body = ExportUpdateRequest(content=content, metadata=metadata or {})
+        resp = await self.client.request("PATCH", f"/exports/{export_id}", json=body, will_parse=True)
+        return self.client.parse(ExportResponse, resp)
@@ -0,0 +1,36 @@
+# fiskaly_sdk/aio/api/invoice_search.py
+
+from typing import Dict, Any, List, AsyncIterator, Optional
+from ...models.invoice import InvoicesListResponse, InvoiceResponse
+from ...pagination import aiter_items, page_params
+from ...responses import split_page
+
+class AsyncInvoiceSearchAPI:
+    """
+    Versión asíncrona de InvoiceSearchAPI.
+    """
+    def __init__(self, client):
+        self.client = client
+
+    async def search(self, params: Dict[str, Any]) -> List[InvoiceResponse]:
+        """
+        Busca facturas en toda la organización usando filtros globales.
+        """
+        return split_page(await self.search_page(params))[0]
+
+    async def search_page(self, params: Optional[Dict[str, Any]] = None) -> InvoicesListResponse:
+        """
+        Recupera una página de resultados de la búsqueda global, incluyendo la paginación.
+        """
+        resp = await self.client.request("GET", "/invoices", params=params or {}, will_parse=True)
+        return self.client.parse_page(InvoicesListResponse, InvoiceResponse, resp)
+
+    def iter_all(self, params: Optional[Dict[str, Any]] = None, limit: int = 100, prefetch: bool = True) -> AsyncIterator[InvoiceResponse]:
+        """
+        Recorre todos los resultados de la búsqueda global siguiendo la paginación (`async for`).
+        """
+        async def fetch_page(token):
+            page = await self.search_page(page_params(params, limit, token))
+            return split_page(page)
+
+        return aiter_items(fetch_page, prefetch=prefetch)
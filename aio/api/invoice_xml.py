@@ -0,0 +1,69 @@
+# fiskaly_sdk/aio/api/invoice_xml.py
+
+from typing import AsyncIterator, Iterable, Sequence
+
+from ...archive import archive_name, open_sink
+from ...bulk import XMLBulkResult, arun_in_lanes
+from ...download import DownloadResult
+
+class AsyncInvoiceXMLAPI:
+    """
+    Versión asíncrona de InvoiceXMLAPI.
+    """
+    def __init__(self, client):
+        self.client = client
+
+    async def get_xml(self, client_id: str, invoice_id: str) -> bytes:
+        """
+        Descarga la factura en formato XML.
+        """
+        return await self.client.request("GET", f"/clients/{client_id}/invoices/{invoice_id}/xml")
+
+    async def get_xml_to(self, client_id: str, invoice_id: str, dest, **options) -> DownloadResult:
+        """
+        Descarga el XML de la factura en streaming hacia `dest`.
+        """
+        return await self.client.download(f"/clients/{client_id}/invoices/{invoice_id}/xml", dest, **options)
+
+    async def get_many(
+        self,
+        pairs: Iterable[Sequence[str]],
+        dest,
+        max_concurrency: int = 64,
+        verify: bool = True,
+        **options
+    ) -> AsyncIterator[XMLBulkResult]:
+        """
+        Descarga concurrentemente el XML de muchas facturas hacia un directorio o un archivo.
+
+        Ver `InvoiceXMLAPI.get_many`.
+
+        :param max_concurrency: Descargas en curso a la vez.
+        :return: Iterador asíncrono de XMLBulkResult en orden de finalización.
+        """
+        sink = open_sink(dest, verify=verify)
+
+        async def fetch(pair):
+            name = archive_name(*pair)
+            if sink.exists(name):
+                return name, None
+            staged = sink.stage(name)
+            try:
+                result = await self.get_xml_to(pair[0], pair[1], staged, **options)
+                sink.commit(name, staged)
+            except BaseException:
+                sink.discard(staged)
+                raise
+            return name, result
+
+        try:
+            entries = (tuple(pair[:2]) for pair in pairs)
+            async for index, pair, fetched, error in arun_in_lanes(entries, lambda pair: pair, fetch, max_concurrency=max_concurrency):
+                name, result = fetched if fetched else (None, None)
+                yield XMLBulkResult(
+                    index=index, client_id=pair[0], invoice_id=pair[1], name=name,
+                    skipped=error is None and result is None, download=result, error=error,
+                )
+        finally:
+            if sink is not dest:
+                sink.close()
@@ -0,0 +1,139 @@
+# fiskaly_sdk/aio/api/invoices.py
+
+"""
+API asíncrona para gestionar facturas (invoices) y casos especiales.
+"""
+
+from typing import Optional, Dict, Any, List, AsyncIterator, Iterable, Sequence
+from ...bulk import BulkResult, arun_in_lanes
+from ...pagination import aiter_items, page_params
+from ...responses import split_page
+from ...models.invoice import (
+    InvoiceRequest,
+    InvoiceResponse,
+    InvoicesListResponse,
+)
+from ...utils import generate_guid
+
+class AsyncInvoicesAPI:
+    """
+    Versión asíncrona de InvoicesAPI.
+    """
+
+    def __init__(self, client):
+        self.client = client
+
+    async def create(self, client_id: str, invoice_id: Optional[str], content: Dict[str, Any], metadata: Optional[Dict[str, Any]] = None) -> InvoiceResponse:
+        """
+        Crea cualquier tipo de factura (SIMPLIFIED, COMPLETE, ENRICHMENT, CORRECTING, REMEDY, etc).
+
+        :param client_id: ID del dispositivo emisor.
+        :param invoice_id: ID único de la factura (si None, se genera uno nuevo).
+        :param content: Cuerpo de la factura según especificación.
+        :param metadata: Metadata adicional (opcional).
+        :return: InvoiceResponse con los datos de la factura creada.
+        """
+        invoice_id = invoice_id or generate_guid()
+        body = InvoiceRequest(content=content, metadata=metadata or {})
+        resp = await self.client.request("PUT", f"/clients/{client_id}/invoices/{invoice_id}", json=body, will_parse=True)
+        return self.client.parse(InvoiceResponse, resp)
+
+    async def get(self, client_id: str, invoice_id: str) -> InvoiceResponse:
+        """
+        Recupera los datos de una factura específica.
+        """
+        resp = await self.client.request("GET", f"/clients/{client_id}/invoices/{invoice_id}", will_parse=True)
+        return self.client.parse(InvoiceResponse, resp)
+
+    async def update_metadata(self, client_id: str, invoice_id: str, metadata: Dict[str, Any]) -> InvoiceResponse:
+        """
+        Actualiza la metadata de una factura.
+        """
+        body = {"content": {}, "metadata": metadata}
+        resp = await self.client.request("PATCH", f"/clients/{client_id}/invoices/{invoice_id}", json=body, will_parse=True)
+        return self.client.parse(InvoiceResponse, resp)
+
+    async def cancel(self, client_id: str, invoice_id: str, metadata: Optional[Dict[str, Any]] = None) -> InvoiceResponse:
+        """
+        Cancela una factura (cambia estado a CANCELLED).
+        """
+        body = {"content": {"state": "CANCELLED"}, "metadata": metadata or {}}
+        resp = await self.client.request("PATCH", f"/clients/{client_id}/invoices/{invoice_id}", json=body, will_parse=True)
+        return self.client.parse(InvoiceResponse, resp)
+
+    async def list(self, client_id: str, params: Optional[Dict[str, Any]] = None) -> List[InvoiceResponse]:
+        """
+        Lista facturas para un client (una página).
+        """
+        return split_page(await self.list_page(client_id, params))[0]
+
+    async def list_page(self, client_id: str, params: Optional[Dict[str, Any]] = None) -> InvoicesListResponse:
+        """
+        Recupera una página de facturas de un client, incluyendo la paginación.
+        """
+        resp = await self.client.request("GET", f"/clients/{client_id}/invoices", params=params or {}, will_parse=True)
+        return self.client.parse_page(InvoicesListResponse, InvoiceResponse, resp)
+
+    def iter_all(self, client_id: str, params: Optional[Dict[str, Any]] = None, limit: int = 100, prefetch: bool = True) -> AsyncIterator[InvoiceResponse]:
+        """
+        Recorre todas las facturas de un client siguiendo la paginación (`async for`).
+        """
+        async def fetch_page(token):
+            page = await self.list_page(client_id, page_params(params, limit, token))
+            return split_page(page)
+
+        return aiter_items(fetch_page, prefetch=prefetch)
+
+    async def create_many(self, invoices: Iterable[Sequence[Any]], max_concurrency: int = 64) -> AsyncIterator[BulkResult]:
+        """
+        Emite muchas facturas concurrentemente manteniendo el orden por client_id.
+
+        :param invoices: Iterable de tuplas (client_id, invoice_id, content[, metadata]).
+        :param max_concurrency: Facturas en curso a la vez.
+        :return: Iterador asíncrono de BulkResult en orden de finalización.
+        """
+        def prepare():
+            for entry in invoices:
+                client_id, invoice_id, content = entry[0], entry[1], entry[2]
+                metadata = entry[3] if len(entry) > 3 else None
+                yield client_id, invoice_id or generate_guid(), content, metadata
+
+        async def issue(entry):
+            return await self.create(*entry)
+
+        async for index, entry, response, error in arun_in_lanes(prepare(), lambda entry: entry[0], issue, max_concurrency=max_concurrency):
+            yield BulkResult(index=index, client_id=entry[0], invoice_id=entry[1], response=response, error=error)
+
+    # --- Helpers para casos especiales de facturación ---
+
+    async def create_enrichment_invoice(self, client_id: str, invoice_id: Optional[str], enrichment_content: Dict[str, Any], metadata: Optional[Dict[str, Any]] = None) -> InvoiceResponse:
+        """
+        Crea una factura de tipo ENRICHMENT.
+        """
+        content = {"type": "ENRICHMENT"}
+        content.update(enrichment_content)
+        return await self.create(client_id, invoice_id, content, metadata)
+
+    async def create_correcting_invoice(self, client_id: str, invoice_id: Optional[str], correcting_content: Dict[str, Any], metadata: Optional[Dict[str, Any]] = None) -> InvoiceResponse:
+        """
+        Crea una factura rectificativa (CORRECTING).
+        """
+        content = {"type": "CORRECTING"}
+        content.update(correcting_content)
+        return await self.create(client_id, invoice_id, content, metadata)
+
+    async def create_remedy_invoice(self, client_id: str, invoice_id: Optional[str], remedy_content: Dict[str, Any], metadata: Optional[Dict[str, Any]] = None) -> InvoiceResponse:
+        """
+        Crea una factura de recuperación (REMEDY).
+        """
+        content = {"type": "REMEDY"}
+        content.update(remedy_content)
+        return await self.create(client_id, invoice_id, content, metadata)
+
+    async def create_vat_system_switch_invoice(self, client_id: str, invoice_id: Optional[str], vat_content: Dict[str, Any], metadata: Optional[Dict[str, Any]] = None) -> InvoiceResponse:
+        """
+        Crea una factura de cambio de sistema de IVA (VAT SYSTEM SWITCH).
+        """
+        content = {"type": "COMPLETE"}
+        content.update(vat_content)
+        return await self.create(client_id, invoice_id, content, metadata)
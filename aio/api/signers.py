@@ -0,0 +1,99 @@
+# fiskaly_sdk/aio/api/signers.py
+
+"""
+API asíncrona para gestionar firmantes (signers).
+"""
+
+from typing import Optional, Dict, Any, AsyncIterator
+from ...pagination import aiter_items
+from ...responses import split_page
+from ...models.signer import (
+    SignerStateRequest,
+    SignerModel,
+    SignersListResponse
+)
+from ...utils import generate_guid
+
+class AsyncSignersAPI:
+    """
+    Versión asíncrona de SignersAPI: create(), disable(), get() y list().
+    """
+
+    def __init__(self, client):
+        """
+        :param client: Instancia de AsyncFiskalyClient.
+        """
+        self.client = client
+
+    async def create(
+        self,
+        signer_id: Optional[str] = None,
+        metadata: Optional[Dict[str, Any]] = None,
+        certificate_b64: Optional[str] = None,
+        private_key_b64: Optional[str] = None,
+        private_key_password: Optional[str] = None,
+    ) -> SignerModel:
+        """
+        Crea un nuevo signer. Si se pasan certificado y clave, se suben a la API.
+
+        :param signer_id: ID único del signer (opcional).
+        :param metadata: Metadata adicional (opcional).
+        :param certificate_b64: Certificado X509 en base64 (opcional).
+        :param private_key_b64: Clave privada en base64 (opcional, obligatorio si se pasa certificate).
+        :param private_key_password: Password de la clave privada (opcional).
+        :return: SignerModel
+        """
+        signer_id = signer_id or generate_guid()
+        body = {"metadata": metadata or {}}
+
+        if certificate_b64 and private_key_b64:
+            content = {
+                "certificate": certificate_b64,
+                "private_key": private_key_b64,
+            }
+            if private_key_password:
+                content["private_key_password"] = private_key_password
+            body["content"] = content
+
+        resp = await self.client.request("PUT", f"/signers/{signer_id}", json=body, will_parse=True)
+        return self.client.parse(SignerModel, resp)
+
+    async def disable(self, signer_id: str, metadata: Optional[Dict[str, Any]] = None) -> SignerModel:
+        """
+        Deshabilita (deactiva) un signer existente.
+        """
+        body = SignerStateRequest(
+            content={"state": "DISABLED"},
+            metadata=metadata or {}
+        )
+        resp = await self.client.request("PATCH", f"/signers/{signer_id}", json=body, will_parse=True)
+        return self.client.parse(SignerModel, resp)
+
+    async def get(self, signer_id: str) -> SignerModel:
+        """
+        Recupera los datos de un signer específico.
+        """
+        resp = await self.client.request("GET", f"/signers/{signer_id}", will_parse=True)
+        return self.client.parse(SignerModel, resp)
+
+    async def list(self, limit: Optional[int] = None, token: Optional[str] = None) -> SignersListResponse:
+        """
+        Lista los signers de la organización, soportando paginación.
+        """
+        params = {}
+        if limit:
+            params["limit"] = limit
+        if token:
+            params["token"] = token
+        resp = await self.client.request("GET", "/signers", params=params, will_parse=True)
+        return self.client.parse_page(SignersListResponse, SignerModel, resp)
+
+    def iter_all(self, limit: int = 100, prefetch: bool = True) -> AsyncIterator[SignerModel]:
+        """
+        Recorre todos los signers siguiendo la paginación (`async for`).
+        """
+        async def fetch_page(token):
+            page = await self.list(limit=limit, token=token)
+            return split_page(page)
+
+        return aiter_items(fetch_page, prefetch=prefetch)
@@ -0,0 +1,17 @@
+# fiskaly_sdk/aio/api/software.py
+
+from ...models.software import SoftwareResponse
+
+class AsyncSoftwareAPI:
+    """
+    Versión asíncrona de SoftwareAPI.
+    """
+    def __init__(self, client):
+        self.client = client
+
+    async def get(self) -> SoftwareResponse:
+        """
+        Recupera la información del software registrado.
+        """
+        resp = await self.client.request("GET", "/software", will_parse=True)
+        return self.client.parse(SoftwareResponse, resp)
@@ -0,0 +1,60 @@
+# fiskaly_sdk/aio/api/taxpayer.py
+
+"""
+API asíncrona de Taxpayer (contribuyente/emisor).
+"""
+
+from ...models.taxpayer import (
+    TaxpayerRequest,
+    TaxpayerResponse,
+    TaxpayerStateRequest
+)
+
+class AsyncTaxpayerAPI:
+    """
+    Versión asíncrona de TaxpayerAPI: set(), get() y disable().
+    """
+
+    def __init__(self, client):
+        """
+        :param client: Instancia de AsyncFiskalyClient.
+        """
+        self.client = client
+
+    async def set(self, issuer_tax_number: str, issuer_legal_name: str, territory: str) -> TaxpayerResponse:
+        """
+        Crea o actualiza la información del taxpayer (emisor).
+
+        :param issuer_tax_number: Número fiscal del emisor.
+        :param issuer_legal_name: Nombre legal del emisor.
+        :param territory: Territorio (ej: GIPUZKOA).
+        :return: TaxpayerResponse con los datos actualizados.
+        """
+        body = TaxpayerRequest(
+            content={
+                "issuer": {
+                    "tax_number": issuer_tax_number,
+                    "legal_name": issuer_legal_name
+                },
+                "territory": territory
+            }
+        )
+        resp = await self.client.request("PUT", "/taxpayer", json=body, will_parse=True)
+        return self.client.parse(TaxpayerResponse, resp)
+
+    async def get(self) -> TaxpayerResponse:
+        """
+        Recupera la información actual del taxpayer (emisor).
+        """
+        resp = await self.client.request("GET", "/taxpayer", will_parse=True)
+        return self.client.parse(TaxpayerResponse, resp)
+
+    async def disable(self) -> TaxpayerResponse:
+        """
+        Deshabilita el taxpayer (emisor) de forma permanente.
+        """
+        body = TaxpayerStateRequest(
+            content={"state": "DISABLED"}
+        )
+        resp = await self.client.request("PATCH", "/taxpayer", json=body, will_parse=True)
+        return self.client.parse(TaxpayerResponse, resp)
@@ -0,0 +1,50 @@
+# fiskaly_sdk/aio/api/taxpayer_agreement.py
+
+from ...download import DownloadResult
+from ...models.taxpayer_agreement import (
+    TaxpayerAgreementGenerateRequest,
+    TaxpayerAgreementUploadRequest,
+    TaxpayerAgreementResponse,
+)
+
+class AsyncTaxpayerAgreementAPI:
+    """
+    Versión asíncrona de TaxpayerAgreementAPI.
+    """
+    def __init__(self, client):
+        self.client = client
+
+    async def generate(self, content) -> TaxpayerAgreementResponse:
+        """
+        Genera el borrador del acuerdo.
+        """
+        body = TaxpayerAgreementGenerateRequest(content=content)
+        resp = await self.client.request("POST", "/taxpayer/agreement", json=body, will_parse=True)
+        return self.client.parse(TaxpayerAgreementResponse, resp)
+
+    async def upload(self, content) -> TaxpayerAgreementResponse:
+        """
+        Sube el acuerdo firmado.
+        """
+        body = TaxpayerAgreementUploadRequest(content=content)
+        resp = await self.client.request("PUT", "/taxpayer/agreement", json=body, will_parse=True)
+        return self.client.parse(TaxpayerAgreementResponse, resp)
+
+    async def get(self) -> TaxpayerAgreementResponse:
+        """
+        Obtiene la información del acuerdo del taxpayer.
+        """
+        resp = await self.client.request("GET", "/taxpayer/agreement", will_parse=True)
+        return self.client.parse(TaxpayerAgreementResponse, resp)
+
+    async def download_pdf(self) -> bytes:
+        """
+        Descarga el PDF del acuerdo firmado.
+        """
+        return await self.client.request("GET", "/taxpayer/agreement.pdf")
+
+    async def download_pdf_to(self, dest, **options) -> DownloadResult:
+        """
+        Descarga el PDF del acuerdo firmado en streaming hacia `dest`.
+        """
+        return await self.client.download("/taxpayer/agreement.pdf", dest, **options)
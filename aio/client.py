@@ -0,0 +1,411 @@
+# fiskaly_sdk/aio/client.py
+
+"""
+Cliente asíncrono del SDK Fiskaly SIGN ES.
+Contiene la clase AsyncFiskalyClient, equivalente asyncio de FiskalyClient.
+"""
+
+import asyncio
+import logging
+import time
+from typing import Optional, Dict, Any, List
+
+try:
+    import httpx
+except ImportError:  # pragma: no cover - dependencia opcional
+    httpx = None
+
+from ..config import FiskalyConfig
+from ..download import DownloadResult, astream_download
+from ..codec import JsonCodec, get_codec
+from ..coalesce import AsyncSingleFlight, request_key
+from ..instrumentation import (
+    RequestEvent,
+    begin_request,
+    end_request,
+    record_response,
+    record_transport,
+    timed_validation,
+)
+from ..lazy import LazyResource
+from ..responses import parse_model, parse_page
+from ..utils import copy_json
+from ..exceptions import (
+    FiskalyApiError,
+    FiskalyAuthError,
+)
+from .token_manager import AsyncTokenManager
+
+logger = logging.getLogger(__name__)
+
+class AsyncFiskalyClient:
+    """
+    Cliente asíncrono para la API de Fiskaly SIGN ES.
+
+    Expone los mismos recursos que FiskalyClient con métodos `async` y devuelve los
+    mismos modelos Pydantic. Usa un pool de conexiones de httpx, por lo que un único
+    event loop puede mantener miles de peticiones en curso.
+    """
+
+    # Recursos del API: se importan y crean en el primer acceso.
+    auth = LazyResource(".aio.api.auth", "AsyncAuthAPI")
+    taxpayer = LazyResource(".aio.api.taxpayer", "AsyncTaxpayerAPI")
+    signers = LazyResource(".aio.api.signers", "AsyncSignersAPI")
+    clients = LazyResource(".aio.api.clients", "AsyncClientsAPI")
+    invoices = LazyResource(".aio.api.invoices", "AsyncInvoicesAPI")
+    exports = LazyResource(".aio.api.exports", "AsyncExportsAPI")
+    taxpayer_agreement = LazyResource(".aio.api.taxpayer_agreement", "AsyncTaxpayerAgreementAPI")
+    invoice_xml = LazyResource(".aio.api.invoice_xml", "AsyncInvoiceXMLAPI")
+    invoice_search = LazyResource(".aio.api.invoice_search", "AsyncInvoiceSearchAPI")
+    software = LazyResource(".aio.api.software", "AsyncSoftwareAPI")
+
+    def __init__(
+        self,
+        api_key: str,
+        api_secret: str,
+        base_url: str = "https://sign-api.fiskaly.com/api/v1",
+        timeout: int = 30,
+        verify_ssl: bool = True,
+        **options
+    ):
+        """
+        :param api_key: API Key de Fiskaly.
+        :param api_secret: API Secret de Fiskaly.
+        :param base_url: URL base de la API.
+        :param timeout: Timeout de cada petición, en segundos.
+        :param verify_ssl: Verifica el certificado TLS del servidor.
+        :param options: Opciones avanzadas de FiskalyConfig (p.ej. pool_maxsize).
+        """
+        if httpx is None:
+            raise ImportError(
+                "AsyncFiskalyClient requiere httpx. Instálalo con: pip install 'fiskaly-sdk-sign-es[async]'"
+            )
+        self.config = FiskalyConfig(
+            api_key=api_key,
+            api_secret=api_secret,
+            base_url=base_url,
+            timeout=timeout,
+            **options
+        )
+        self.verify_ssl = verify_ssl
+        self.session = httpx.AsyncClient(
+            limits=self._build_limits(),
+            timeout=self.config.timeout,
+            verify=verify_ssl,
+        )
+        self._token_manager = AsyncTokenManager(
+            self._fetch_token,
+            refresh_margin=self.config.token_refresh_margin,
+            background=self.config.token_background_refresh,
+        )
+
+        self._flights = AsyncSingleFlight(copy=copy_json) if self.config.coalesce_gets else None
+        self._codec: Optional[JsonCodec] = None
+
+
+
+    def _build_limits(self) -> "httpx.Limits":
+        """
+        Traduce la configuración del pool a límites de httpx.
+
+        Con `pool_block` el número de conexiones queda limitado a `pool_maxsize` y las
+        peticiones esperan turno; sin él se abren conexiones extra y solo se mantienen
+        `pool_maxsize` vivas (igual que FiskalyClient).
+        """
+        config = self.config
+        return httpx.Limits(
+            max_connections=config.pool_maxsize if config.pool_block else None,
+            max_keepalive_connections=config.pool_maxsize,
+        )
+
+    async def authenticate(self) -> str:
+        """
+        Realiza la autenticación y obtiene un token Bearer.
+        """
+        return await self.auth.retrieve_access_token()
+
+    async def _fetch_token(self):
+        """
+        Obtiene un token nuevo para el AsyncTokenManager.
+        """
+        token = await self.auth.fetch_access_token()
+        return token.bearer, token.expires_at
+
+    async def _current_bearer(self) -> str:
+        """
+        Devuelve un token Bearer válido o lanza FiskalyAuthError si no hay ninguno.
+        """
+        bearer = await self._token_manager.get_token()
+        if not bearer:
+            raise FiskalyAuthError("El token Bearer no está presente. Llama a authenticate() primero.")
+        return bearer
+
+    @staticmethod
+    def _headers_for(bearer: Optional[str]) -> Dict[str, str]:
+        headers = {
+            "Content-Type": "application/json",
+            "Accept": "application/json"
+        }
+        if bearer is not None:
+            headers["Authorization"] = f"Bearer {bearer}"
+        return headers
+
+    async def request(self, method: str, endpoint: str, will_parse: bool = False, **kwargs) -> Any:
+        """
+        Envía una petición a la API y devuelve el cuerpo decodificado.
+
+        Los GET idénticos (mismo endpoint y parámetros) que coinciden en el tiempo
+        comparten una sola llamada HTTP si `coalesce_gets` está activo.
+        Cada llamada actualiza las métricas de `config.metrics` y, si hay
+        instrumentación, genera un RequestEvent. Un cuerpo `json=` (dict o modelo
+        Pydantic) se serializa a bytes con el codec de `config.json_codec`.
+
+        :param will_parse: El llamador convertirá la respuesta con `parse`, `parse_list`
+            o `parse_page` (siempre, aunque no haya elementos); el RequestEvent espera
+            a esa validación para incluir su duración. Si es False (por defecto) el
+            evento se emite antes de devolver.
+
+        :raises FiskalyApiError: Si la API responde con error o la conexión falla.
+        """
+        config = self.config
+        if kwargs.get("json") is not None:
+            kwargs["content"] = self.codec.dumps(kwargs.pop("json"))
+        instrumentation = config.instrumentation
+        event = begin_request(method, endpoint) if instrumentation is not None else None
+        meter = config.metrics.start(method, endpoint) if config.metrics is not None else None
+        try:
+            value = await self._request(method, endpoint, kwargs, event)
+        except BaseException as e:
+            if meter is not None:
+                meter.done(e)
+            if event is not None:
+                end_request(instrumentation, event, error=e)
+            raise
+        if meter is not None:
+            meter.done()
+        if event is not None:
+            end_request(instrumentation, event, value, defer=will_parse)
+        return value
+
+    async def _request(self, method: str, endpoint: str, kwargs: Dict[str, Any], event: Optional[RequestEvent]) -> Any:
+        flights = self._flights
+        if flights is not None and method == "GET" and not kwargs.get("headers"):
+            # Los seguidores no envían nada: su evento queda vacío y no se emite.
+            key = request_key(endpoint, kwargs.get("params"))
+            return await flights.do(key, lambda: self._cached_request(method, endpoint, kwargs, event))
+        return await self._cached_request(method, endpoint, kwargs, event)
+
+    async def _cached_request(self, method: str, endpoint: str, kwargs: Dict[str, Any], event: Optional[RequestEvent]) -> Any:
+        cache = self.config.response_cache
+        if cache is None:
+            return self._decode(await self._send(method, endpoint, kwargs.pop("headers", {}), kwargs, event), event)
+        if method != "GET":
+            try:
+                return self._decode(await self._send(method, endpoint, kwargs.pop("headers", {}), kwargs, event), event)
+            finally:
+                cache.invalidate(endpoint)
+
+        key = cache.key(endpoint, kwargs.get("params"))
+        entry = cache.lookup(key) if key is not None else None
+        if entry is not None and entry.fresh:
+            return entry.get()
+        headers = dict(kwargs.pop("headers", {}))
+        if entry is not None:
+            headers.update(entry.validators())
+        resp = await self._send(method, endpoint, headers, kwargs, event)
+        if resp.status_code == 304 and entry is not None:
+            return cache.revalidated(key, entry, resp.headers)
+        value = self._decode(resp, event)
+        if key is not None:
+            cache.store(key, value, resp.headers)
+        return value
+
+    @property
+    def codec(self) -> JsonCodec:
+        """
+        Codec JSON del cliente (se resuelve en la primera petición).
+        """
+        codec = self._codec
+        if codec is None:
+            codec = self._codec = get_codec(self.config.json_codec)
+        return codec
+
+    def _decode(self, resp, event: Optional[RequestEvent] = None) -> Any:
+        """
+        Devuelve el cuerpo de la respuesta (JSON decodificado o bytes).
+
+        :raises FiskalyApiError: Si la API responde con error.
+        """
+        if not resp.is_success:
+            try:
+                err = self.codec.loads(resp.content)
+            except Exception:
+                err = resp.text
+            raise FiskalyApiError(f"Error API [{resp.status_code}]: {err}", status_code=resp.status_code)
+
+        content_type = resp.headers.get('Content-Type', '')
+        if 'application/json' in content_type:
+            started = time.perf_counter()
+            value = self.codec.loads(resp.content)
+            if event is not None:
+                event.timings.decode += time.perf_counter() - started
+            return value
+        else:
+            return resp.content
+
+    def parse(self, model_cls, data):
+        """
+        Convierte una respuesta JSON según `response_mode` (modelo validado, LazyModel o dict).
+        """
+        return timed_validation(lambda: parse_model(self.config.response_mode, model_cls, data))
+
+    def parse_list(self, model_cls, items) -> List[Any]:
+        """
+        Convierte una lista de respuestas JSON según `response_mode` (una sola
+        validación medida, aunque la lista esté vacía).
+        """
+        mode = self.config.response_mode
+        return timed_validation(lambda: [parse_model(mode, model_cls, item) for item in items])
+
+    def parse_page(self, page_cls, item_cls, data, items_key: str = "results"):
+        """
+        Convierte la respuesta de un listado según `response_mode`.
+        """
+        return timed_validation(lambda: parse_page(self.config.response_mode, page_cls, item_cls, data, items_key))
+
+    async def download(self, endpoint: str, dest, **options) -> DownloadResult:
+        """
+        Descarga un endpoint binario en streaming hacia un fichero o un objeto con `write`.
+
+        :param endpoint: Endpoint a descargar.
+        :param dest: Ruta de fichero o objeto binario con `write`.
+        :param options: chunk_size, checksum y max_resumes (ver `download.stream_download`).
+        :return: DownloadResult.
+        """
+        return await astream_download(self, endpoint, dest, **options)
+
+    async def _send(
+        self,
+        method: str,
+        endpoint: str,
+        extra_headers: Dict[str, str],
+        kwargs: Dict[str, Any],
+        event: Optional[RequestEvent] = None,
+    ) -> "httpx.Response":
+        """
+        Envía la petición aplicando la política de reintentos y el refresco de token tras un 401.
+
+        :return: Última respuesta recibida (puede ser un error HTTP no reintentable).
+        :raises FiskalyApiError: Si la conexión falla y no quedan reintentos.
+        """
+        url = f"{self.config.base_url}{endpoint}"
+        policy = self.config.retry_policy
+        if policy is not None:
+            policy.budget.record_request()
+        attempt = 0
+        token_refreshed = False
+        while True:
+            try:
+                resp, bearer = await self._send_once(method, url, endpoint, extra_headers, kwargs, event)
+            except httpx.HTTPError as e:
+                delay = policy.delay_for_error(method, endpoint, attempt, e) if policy else None
+                if delay is None:
+                    raise FiskalyApiError(f"Error en la conexión: {e}")
+                logger.debug("Reintentando %s %s tras error de conexión en %.2fs: %s", method, endpoint, delay, e)
+                await asyncio.sleep(delay)
+                if event is not None:
+                    event.timings.queue += delay
+                attempt += 1
+                continue
+
+            if resp.status_code == 401 and bearer is not None and not token_refreshed:
+                await resp.aclose()
+                await self._token_manager.refresh(stale=bearer)
+                token_refreshed = True
+                continue
+
+            if resp.is_success or policy is None:
+                return resp
+            delay = policy.delay_for_status(method, endpoint, attempt, resp.status_code, resp.headers)
+            if delay is None:
+                return resp
+            logger.debug("Reintentando %s %s tras HTTP %s en %.2fs", method, endpoint, resp.status_code, delay)
+            await resp.aclose()
+            await asyncio.sleep(delay)
+            if event is not None:
+                event.timings.queue += delay
+            attempt += 1
+
+    async def _send_once(
+        self,
+        method: str,
+        url: str,
+        endpoint: str,
+        extra_headers: Dict[str, str],
+        kwargs: Dict[str, Any],
+        event: Optional[RequestEvent] = None,
+    ):
+        """
+        Envía una petición HTTP y devuelve (respuesta, bearer usado).
+        """
+        queued = time.perf_counter()
+        bearer = None if endpoint == "/auth" else await self._current_bearer()
+        headers = {**self._headers_for(bearer), **extra_headers}
+        limiter = self.config.rate_limiter
+        if limiter is not None:
+            await limiter.acquire_async(self.config.api_key, endpoint)
+        send_kwargs = {key: value for key, value in kwargs.items() if key != "stream"}
+        marks = {}
+        if event is not None:
+            async def trace(name, info):
+                # Fin de la obtención de conexión: httpx empieza a enviar la petición.
+                if name.endswith("send_request_headers.started"):
+                    marks.setdefault("sending", time.perf_counter())
+
+            send_kwargs["extensions"] = {**send_kwargs.get("extensions", {}), "trace": trace}
+        started = time.perf_counter()
+        if event is not None:
+            event.attempts += 1
+            event.timings.queue += started - queued
+        try:
+            if kwargs.get("stream"):
+                request = self.session.build_request(method, url, headers=headers, **send_kwargs)
+                resp = await self.session.send(request, stream=True)
+            else:
+                resp = await self.session.request(
+                    method=method,
+                    url=url,
+                    headers=headers,
+                    **send_kwargs
+                )
+        finally:
+            elapsed = time.perf_counter() - started
+            if event is not None:
+                record_transport(event, elapsed, marks.get("sending", started) - started)
+        if limiter is not None:
+            limiter.record_network(elapsed)
+        if event is not None:
+            record_response(event, resp, streamed=bool(kwargs.get("stream")))
+        return resp, bearer
+
+    def set_bearer_token(self, token: str, expires_at: Optional[int] = None):
+        """
+        Establece el token Bearer (y su expiración, si se conoce).
+        """
+        self._token_manager.set_token(token, expires_at)
+
+    def get_bearer_token(self) -> Optional[str]:
+        return self._token_manager.bearer
+
+    async def aclose(self):
+        """
+        Cancela el refresco de token pendiente y cierra el pool de conexiones.
+        """
+        self._token_manager.close()
+        await self.session.aclose()
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, exc_type, exc, tb):
+        await self.aclose()
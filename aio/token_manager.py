@@ -0,0 +1,132 @@
+# fiskaly_sdk/aio/token_manager.py
+
+"""
+Gestión asíncrona del token Bearer para AsyncFiskalyClient.
+
+Misma lógica que TokenManager (refresco antes de `expires_at` y single-flight),
+pero con tareas de asyncio en lugar de hilos.
+"""
+
+import asyncio
+import logging
+import time
+from typing import Awaitable, Callable, Optional, Tuple
+
+from ..exceptions import FiskalyAuthError
+from ..token_manager import _TokenState
+
+logger = logging.getLogger(__name__)
+
+# Corrutina que obtiene un token nuevo: devuelve (bearer, expires_at).
+AsyncTokenFetcher = Callable[[], Awaitable[Tuple[str, Optional[int]]]]
+
+
+class AsyncTokenManager(_TokenState):
+    """
+    Mantiene un token Bearer válido para un cliente asíncrono.
+
+    Todas las corrutinas que piden un refresco a la vez esperan a la misma tarea,
+    de modo que solo se hace una llamada a `/auth`.
+    """
+
+    def __init__(
+        self,
+        fetcher: AsyncTokenFetcher,
+        refresh_margin: float = 60.0,
+        background: bool = True,
+        clock: Callable[[], float] = time.time,
+    ):
+        """
+        :param fetcher: Corrutina que obtiene un token nuevo de la API.
+        :param refresh_margin: Segundos antes de `expires_at` en los que se refresca el token.
+        :param background: Si True, programa el refresco en el event loop antes de que caduque.
+        :param clock: Reloj en segundos epoch (inyectable para tests).
+        """
+        super().__init__(refresh_margin, background, clock)
+        self._fetcher = fetcher
+        self._flight: Optional[asyncio.Future] = None
+        self._timer: Optional[asyncio.TimerHandle] = None
+
+    def set_token(self, bearer: Optional[str], expires_at: Optional[int] = None):
+        """
+        Establece el token actual (por ejemplo, tras un login explícito).
+
+        :param bearer: Token Bearer (None para olvidar el token).
+        :param expires_at: Timestamp (segundos) de expiración, si se conoce.
+        """
+        self._store(bearer, expires_at if bearer else None)
+        self._schedule()
+
+    async def get_token(self) -> Optional[str]:
+        """
+        Devuelve un token válido, refrescándolo si está a punto de caducar.
+
+        :return: Token Bearer, o None si nunca se ha autenticado el cliente.
+        :raises FiskalyAuthError: Si el refresco necesario falla.
+        """
+        bearer = self._bearer
+        if bearer is None or not self.needs_refresh():
+            return bearer
+        return await self.refresh(stale=bearer)
+
+    async def refresh(self, stale: Optional[str] = None) -> str:
+        """
+        Obtiene un token nuevo en modo single-flight.
+
+        :param stale: Token que el llamador considera caducado o rechazado.
+        :return: Token Bearer nuevo.
+        :raises FiskalyAuthError: Si la autenticación falla.
+        """
+        if stale is not None and self._bearer is not None and self._bearer != stale:
+            return self._bearer
+        if self._flight is None:
+            self._flight = asyncio.ensure_future(self._do_refresh())
+        # shield: si un llamador se cancela, el refresco sigue para los demás.
+        return await asyncio.shield(self._flight)
+
+    async def _do_refresh(self) -> str:
+        try:
+            bearer, expires_at = await self._fetcher()
+        except FiskalyAuthError:
+            raise
+        except Exception as e:
+            raise FiskalyAuthError(f"Error refrescando el token: {e}")
+        finally:
+            self._flight = None
+        self._store(bearer, expires_at)
+        self._schedule()
+        return bearer
+
+    def close(self):
+        """
+        Cancela el refresco en segundo plano pendiente.
+        """
+        self._closed = True
+        if self._timer is not None:
+            self._timer.cancel()
+            self._timer = None
+
+    def _schedule(self):
+        if self._timer is not None:
+            self._timer.cancel()
+            self._timer = None
+        delay = self._refresh_delay()
+        if delay is None:
+            return
+        try:
+            loop = asyncio.get_running_loop()
+        except RuntimeError:
+            # Sin event loop en marcha: se refrescará al pedir el token.
+            return
+        self._timer = loop.call_later(delay, self._start_background_refresh, self._bearer)
+
+    def _start_background_refresh(self, stale: Optional[str]):
+        self._timer = None
+        task = asyncio.ensure_future(self.refresh(stale=stale))
+        task.add_done_callback(self._log_background_error)
+
+    @staticmethod
+    def _log_background_error(task: asyncio.Future):
+        if not task.cancelled() and task.exception() is not None:
+            # El siguiente request lo reintentará.
+            logger.warning("No se pudo refrescar el token en segundo plano: %s", task.exception())
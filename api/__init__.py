@@ -14,15 +14,24 @@ Incluye los clientes para interactuar con todos los recursos de la API:
     - InvoiceXMLAPI
     - InvoiceSearchAPI
     - SoftwareAPI
+
+Cada recurso se importa la primera vez que se pide.
 """
 
-from .auth import AuthAPI
-from .taxpayer import TaxpayerAPI
-from .signers import SignersAPI
-from .clients import ClientsAPI
-from .invoices import InvoicesAPI
-from .exports import ExportsAPI
-from .taxpayer_agreement import TaxpayerAgreementAPI
-from .invoice_xml import InvoiceXMLAPI
-from .invoice_search import InvoiceSearchAPI
-from .software import SoftwareAPI
+from ..lazy import lazy_exports
+
+_EXPORTS = {
+    "AuthAPI": ".auth",
+    "TaxpayerAPI": ".taxpayer",
+    "SignersAPI": ".signers",
+    "ClientsAPI": ".clients",
+    "InvoicesAPI": ".invoices",
+    "ExportsAPI": ".exports",
+    "TaxpayerAgreementAPI": ".taxpayer_agreement",
+    "InvoiceXMLAPI": ".invoice_xml",
+    "InvoiceSearchAPI": ".invoice_search",
+    "SoftwareAPI": ".software",
+}
+
+__all__ = list(_EXPORTS)
+__getattr__, __dir__ = lazy_exports(globals(), _EXPORTS)
@@ -6,7 +6,9 @@ Módulo para autenticación y obtención de Bearer Token con la API Fiskaly SIGN
 
 from typing import Optional
 from ..exceptions import FiskalyAuthError
-from ..models.auth import AuthRequest, AuthResponse
+from ..instrumentation import timed_validation
+from ..models.auth import AuthRequest, AuthResponse, AuthToken
+from ..token_store import shared_token
 
 class AuthAPI:
     """
@@ -30,7 +32,41 @@ class AuthAPI:
         :return: Token Bearer válido para ser usado en llamadas autenticadas.
         :raises FiskalyAuthError: Si la autenticación falla.
         """
-        # Prepara payload (puedes usar AuthRequest si quieres validación extra)
+        token = self.fetch_access_token()
+        self.client.set_bearer_token(token.bearer, expires_at=token.expires_at)
+        return token.bearer
+
+    def fetch_access_token(self) -> AuthToken:
+        """
+        Obtiene un token nuevo sin modificar el estado del cliente.
+
+        Si el cliente tiene `token_store`, reutiliza el token que otro proceso haya
+        guardado para la misma API key, o lo renueva un solo proceso a la vez.
+
+        :return: AuthToken con el Bearer y su `expires_at`.
+        :raises FiskalyAuthError: Si la autenticación falla.
+        """
+        config = self.client.config
+        if config.token_store is None:
+            return self._request_token()
+
+        def fetch():
+            token = self._request_token()
+            return token.bearer, token.expires_at
+
+        bearer, expires_at = shared_token(
+            config.token_store,
+            config.api_key,
+            fetch,
+            stale=self.client.get_bearer_token(),
+            margin=config.token_refresh_margin,
+        )
+        return AuthToken(bearer=bearer, expires_at=expires_at)
+
+    def _request_token(self) -> AuthToken:
+        """
+        Solicita un token nuevo a `/auth`.
+        """
         payload = {
             "content": {
                 "api_key": self.client.config.api_key,
@@ -42,16 +78,15 @@ class AuthAPI:
             response = self.client.request(
                 method="POST",
                 endpoint="/auth",
-                json=payload
+                json=payload,
+                will_parse=True
             )
         except Exception as e:
             raise FiskalyAuthError(f"Error de conexión al autenticar: {e}")
 
         try:
             # Aquí podrías validar con Pydantic v2 (model_validate)
-            auth_response = AuthResponse.model_validate(response)
-            bearer = auth_response.content.access_token.bearer
-            self.client.set_bearer_token(bearer)
-            return bearer
+            auth_response = timed_validation(lambda: AuthResponse.model_validate(response))
+            return auth_response.content.access_token
         except Exception as e:
             raise FiskalyAuthError(f"Error procesando la respuesta de autenticación: {e}")
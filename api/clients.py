@@ -4,8 +4,10 @@
 API para gestionar dispositivos cliente (clients) en el SDK Fiskaly SIGN ES.
 """
 
-from typing import Optional, Dict, Any, List
+from typing import Optional, Dict, Any, List, Iterator
 from ..exceptions import FiskalyApiError
+from ..pagination import iter_items
+from ..responses import split_page
 from ..models.client import (
     ClientRequest,
     ClientStateRequest,
@@ -23,6 +25,7 @@ class ClientsAPI:
       - disable(client_id, metadata)
       - get(client_id)
       - list()
+      - iter_all()
     """
 
     def __init__(self, client):
@@ -44,8 +47,8 @@ class ClientsAPI:
         """
         client_id = client_id or generate_guid()
         body = ClientRequest(metadata=metadata or {})
-        resp = self.client.request("PUT", f"/clients/{client_id}", json=body.dict())
-        return ClientResponse.model_validate(resp)
+        resp = self.client.request("PUT", f"/clients/{client_id}", json=body, will_parse=True)
+        return self.client.parse(ClientResponse, resp)
 
     def disable(self, client_id: str, metadata: Optional[Dict[str, Any]] = None) -> ClientResponse:
         """
@@ -60,8 +63,8 @@ class ClientsAPI:
             content={"state": "DISABLED"},
             metadata=metadata or {}
         )
-        resp = self.client.request("PATCH", f"/clients/{client_id}", json=body.dict())
-        return ClientResponse.model_validate(resp)
+        resp = self.client.request("PATCH", f"/clients/{client_id}", json=body, will_parse=True)
+        return self.client.parse(ClientResponse, resp)
 
     def get(self, client_id: str) -> ClientResponse:
         """
@@ -71,8 +74,8 @@ class ClientsAPI:
         :return: ClientResponse con los datos del client.
         :raises FiskalyApiError: Si la API responde con error.
         """
-        resp = self.client.request("GET", f"/clients/{client_id}")
-        return ClientResponse.model_validate(resp)
+        resp = self.client.request("GET", f"/clients/{client_id}", will_parse=True)
+        return self.client.parse(ClientResponse, resp)
 
     def list(self, limit: int = 10, token: Optional[str] = None) -> ClientsListResponse:
         """
@@ -86,5 +89,20 @@ class ClientsAPI:
         params = {"limit": limit}
         if token:
             params["token"] = token
-        resp = self.client.request("GET", "/clients", params=params)
-        return ClientsListResponse.model_validate(resp)
+        resp = self.client.request("GET", "/clients", params=params, will_parse=True)
+        return self.client.parse_page(ClientsListResponse, ClientResponse, resp)
+
+    def iter_all(self, limit: int = 100, prefetch: bool = True) -> Iterator[ClientResponse]:
+        """
+        Recorre todos los clients siguiendo la paginación, de forma perezosa.
+
+        :param limit: Elementos por página.
+        :param prefetch: Descarga la página siguiente mientras se procesa la actual.
+        :return: Iterador de ClientResponse.
+        """
+        def fetch_page(token):
+            page = self.list(limit=limit, token=token)
+            return split_page(page)
+
+        executor = self.client.prefetch_executor if prefetch else None
+        return iter_items(fetch_page, prefetch=prefetch, executor=executor)
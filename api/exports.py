@@ -6,12 +6,13 @@ Permite crear exportaciones, listar, obtener detalles, descargar ZIP y actualiza
 """
 
 from typing import Optional, Dict, Any, List
+from ..download import DownloadResult
 from ..exceptions import FiskalyApiError
+from ..export_scheduler import ExportScheduler, wait_until_ready
 from ..models.export import (
     ExportRequest,
     ExportUpdateRequest,
     ExportResponse,
-    ExportsListResponse,
 )
 from ..utils import generate_guid
 
@@ -23,7 +24,10 @@ class ExportsAPI:
       - create
       - get
       - list
+      - wait_until_ready
+      - scheduler
       - download_zip
+      - download_zip_to
       - update_metadata
     """
 
@@ -47,8 +51,8 @@ class ExportsAPI:
         """
         export_id = export_id or generate_guid()
         body = ExportRequest(content=content or {}, metadata=metadata or {})
-        resp = self.client.request("PUT", f"/exports/{export_id}", json=body.dict())
-        return ExportResponse.model_validate(resp)
+        resp = self.client.request("PUT", f"/exports/{export_id}", json=body, will_parse=True)
+        return self.client.parse(ExportResponse, resp)
 
     def get(self, export_id: str) -> ExportResponse:
         """
@@ -57,8 +61,8 @@ class ExportsAPI:
         :param export_id: ID de la exportación.
         :return: ExportResponse con los datos de la exportación.
         """
-        resp = self.client.request("GET", f"/exports/{export_id}")
-        return ExportResponse.model_validate(resp)
+        resp = self.client.request("GET", f"/exports/{export_id}", will_parse=True)
+        return self.client.parse(ExportResponse, resp)
 
     def list(self, params: Optional[Dict[str, Any]] = None) -> List[ExportResponse]:
         """
@@ -67,9 +71,30 @@ class ExportsAPI:
         :param params: Parámetros de filtro para la búsqueda (opcional).
         :return: Lista de ExportResponse.
         """
-        resp = self.client.request("GET", "/exports", params=params or {})
-        list_response = ExportsListResponse.model_validate(resp)
-        return [ExportResponse(content=item) for item in list_response.content]
+        resp = self.client.request("GET", "/exports", params=params or {}, will_parse=True)
+        return self.client.parse_list(ExportResponse, [{"content": item} for item in resp.get("content", [])])
+
+    def wait_until_ready(self, export_id: str, timeout: Optional[float] = 600.0, **backoff) -> ExportResponse:
+        """
+        Espera a que una exportación termine, consultándola con backoff adaptativo.
+
+        :param export_id: ID de la exportación.
+        :param timeout: Segundos máximos de espera (None = sin límite).
+        :param backoff: initial_delay, max_delay, factor y jitter del sondeo.
+        :return: ExportResponse de la exportación lista para descargar.
+        :raises FiskalyExportError: Si la exportación falla o no termina a tiempo.
+        """
+        return wait_until_ready(self, export_id, timeout=timeout, **backoff)
+
+    def scheduler(self, **options) -> ExportScheduler:
+        """
+        Crea un ExportScheduler para seguir muchas exportaciones con un presupuesto
+        de peticiones compartido.
+
+        :param options: requests_per_second, burst, timeout, initial_delay, max_delay y factor.
+        :return: ExportScheduler asociado a este recurso.
+        """
+        return ExportScheduler(self, **options)
 
     def download_zip(self, export_id: str) -> bytes:
         """
@@ -81,6 +106,17 @@ class ExportsAPI:
         resp = self.client.request("GET", f"/exports/{export_id}/file")
         return resp  # bytes
 
+    def download_zip_to(self, export_id: str, dest, **options) -> DownloadResult:
+        """
+        Descarga el ZIP de una exportación en streaming, sin cargarlo entero en memoria.
+
+        :param export_id: ID de la exportación.
+        :param dest: Ruta de fichero o objeto binario con `write`.
+        :param options: chunk_size, checksum y max_resumes.
+        :return: DownloadResult con bytes escritos y checksum.
+        """
+        return self.client.download(f"/exports/{export_id}/file", dest, **options)
+
     def update_metadata(self, export_id: str, content: Dict[str, Any], metadata: Optional[Dict[str, Any]] = None) -> ExportResponse:
         """
         Actualiza la metadata de una exportación existente.
@@ -91,5 +127,5 @@ class ExportsAPI:
         :return: ExportResponse con los datos actualizados.
         """
         body = ExportUpdateRequest(content=content, metadata=metadata or {})
-        resp = self.client.request("PATCH", f"/exports/{export_id}", json=body.dict())
-        return ExportResponse.model_validate(resp)
+        resp = self.client.request("PATCH", f"/exports/{export_id}", json=body, will_parse=True)
+        return self.client.parse(ExportResponse, resp)
@@ -1,7 +1,12 @@
 # fiskaly_sdk/api/invoice_search.py
 
-from typing import Dict, Any, List
+from typing import TYPE_CHECKING, Dict, Any, List, Iterator, Optional
 from ..models.invoice import InvoicesListResponse, InvoiceResponse
+from ..pagination import iter_items, page_params
+from ..responses import split_page
+
+if TYPE_CHECKING:  # pragma: no cover
+    from ..invoice_index import InvoiceIndex
 
 class InvoiceSearchAPI:
     """
@@ -14,6 +19,43 @@ class InvoiceSearchAPI:
         """
         Busca facturas en toda la organización usando filtros globales.
         """
-        resp = self.client.request("GET", "/invoices", params=params or {})
-        list_response = InvoicesListResponse.model_validate(resp)
-        return [InvoiceResponse.model_validate({"content": item}) for item in list_response.content]
+        return split_page(self.search_page(params))[0]
+
+    def search_page(self, params: Optional[Dict[str, Any]] = None) -> InvoicesListResponse:
+        """
+        Recupera una página de resultados de la búsqueda global, incluyendo la paginación.
+        """
+        resp = self.client.request("GET", "/invoices", params=params or {}, will_parse=True)
+        return self.client.parse_page(InvoicesListResponse, InvoiceResponse, resp)
+
+    def iter_all(self, params: Optional[Dict[str, Any]] = None, limit: int = 100, prefetch: bool = True) -> Iterator[InvoiceResponse]:
+        """
+        Recorre todos los resultados de la búsqueda global siguiendo la paginación.
+
+        :param params: Filtros globales.
+        :param limit: Elementos por página.
+        :param prefetch: Descarga la página siguiente mientras se procesa la actual.
+        :return: Iterador de InvoiceResponse.
+        """
+        def fetch_page(token):
+            page = self.search_page(page_params(params, limit, token))
+            return split_page(page)
+
+        executor = self.client.prefetch_executor if prefetch else None
+        return iter_items(fetch_page, prefetch=prefetch, executor=executor)
+
+    def index(self, path: str = "fiskaly_invoices.db", **options) -> "InvoiceIndex":
+        """
+        Abre un índice local (SQLite) de la búsqueda global que se sincroniza de forma incremental.
+
+        `sync()` trae solo las facturas nuevas o modificadas desde la sincronización
+        anterior y `query()` responde localmente por client, estado, fechas e id.
+
+        :param path: Fichero SQLite del índice.
+        :param options: since_param, changed_field, issued_field, overlap y page_size.
+        :return: InvoiceIndex asociado a este cliente.
+        """
+        # Import diferido: sqlite3 solo se carga si se usa el índice.
+        from ..invoice_index import InvoiceIndex
+
+        return InvoiceIndex(self.client, path, **options)
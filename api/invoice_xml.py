@@ -1,5 +1,11 @@
 # fiskaly_sdk/api/invoice_xml.py
 
+from typing import Iterable, Iterator, Optional, Sequence
+
+from ..archive import archive_name, open_sink
+from ..bulk import XMLBulkResult, run_in_lanes
+from ..download import DownloadResult
+
 class InvoiceXMLAPI:
     """
     API para exportar una factura individual como XML.
@@ -13,3 +19,61 @@ class InvoiceXMLAPI:
         """
         resp = self.client.request("GET", f"/clients/{client_id}/invoices/{invoice_id}/xml")
         return resp  # bytes
+
+    def get_xml_to(self, client_id: str, invoice_id: str, dest, **options) -> DownloadResult:
+        """
+        Descarga el XML de la factura en streaming hacia `dest`.
+        """
+        return self.client.download(f"/clients/{client_id}/invoices/{invoice_id}/xml", dest, **options)
+
+    def get_many(
+        self,
+        pairs: Iterable[Sequence[str]],
+        dest,
+        max_workers: Optional[int] = None,
+        verify: bool = True,
+        **options
+    ) -> Iterator[XMLBulkResult]:
+        """
+        Descarga en paralelo el XML de muchas facturas hacia un directorio o un archivo.
+
+        Cada XML se escribe en streaming como `<client_id>/<invoice_id>.xml` y solo
+        se publica cuando está completo. Las entradas que ya están presentes (y son
+        XML bien formado, si `verify`) se saltan, así que repetir la llamada tras un
+        corte solo descarga lo que falta. Un fallo no detiene el lote: se devuelve
+        en el XMLBulkResult correspondiente.
+
+        :param pairs: Iterable de (client_id, invoice_id); se consume de forma perezosa.
+        :param dest: Directorio, ruta `.tar`/`.zip` (se crea o se amplía) o un ArchiveSink.
+        :param max_workers: Descargas en paralelo (por defecto, `pool_maxsize` del cliente).
+        :param verify: Comprueba que las entradas existentes y las nuevas son XML bien formado.
+        :param options: chunk_size, checksum y max_resumes de cada descarga.
+        :return: Iterador de XMLBulkResult en orden de finalización.
+        """
+        sink = open_sink(dest, verify=verify)
+
+        def fetch(pair):
+            name = archive_name(*pair)
+            if sink.exists(name):
+                return name, None
+            staged = sink.stage(name)
+            try:
+                result = self.get_xml_to(pair[0], pair[1], staged, **options)
+                sink.commit(name, staged)
+            except BaseException:
+                sink.discard(staged)
+                raise
+            return name, result
+
+        workers = max_workers or self.client.config.pool_maxsize
+        try:
+            entries = (tuple(pair[:2]) for pair in pairs)
+            for index, pair, fetched, error in run_in_lanes(entries, lambda pair: pair, fetch, max_workers=workers):
+                name, result = fetched if fetched else (None, None)
+                yield XMLBulkResult(
+                    index=index, client_id=pair[0], invoice_id=pair[1], name=name,
+                    skipped=error is None and result is None, download=result, error=error,
+                )
+        finally:
+            if sink is not dest:
+                sink.close()
@@ -4,8 +4,11 @@
 API para gestionar facturas (invoices) y casos especiales en el SDK Fiskaly SIGN ES.
 """
 
-from typing import Optional, Dict, Any, List
+from typing import TYPE_CHECKING, Optional, Dict, Any, List, Iterable, Iterator, Sequence
+from ..bulk import BulkResult, run_in_lanes
 from ..exceptions import FiskalyApiError
+from ..pagination import iter_items, page_params
+from ..responses import split_page
 from ..models.invoice import (
     InvoiceRequest,
     InvoiceResponse,
@@ -13,6 +16,9 @@ from ..models.invoice import (
 )
 from ..utils import generate_guid
 
+if TYPE_CHECKING:  # pragma: no cover
+    from ..outbox import InvoiceOutbox
+
 class InvoicesAPI:
     """
     API para gestionar facturas y casos avanzados (enrichment, correcting, remedy, VAT switch) en Fiskaly SIGN ES.
@@ -33,39 +39,108 @@ class InvoicesAPI:
         """
         invoice_id = invoice_id or generate_guid()
         body = InvoiceRequest(content=content, metadata=metadata or {})
-        resp = self.client.request("PUT", f"/clients/{client_id}/invoices/{invoice_id}", json=body.dict())
-        return InvoiceResponse.model_validate(resp)
+        resp = self.client.request("PUT", f"/clients/{client_id}/invoices/{invoice_id}", json=body, will_parse=True)
+        return self.client.parse(InvoiceResponse, resp)
 
     def get(self, client_id: str, invoice_id: str) -> InvoiceResponse:
         """
         Recupera los datos de una factura específica.
         """
-        resp = self.client.request("GET", f"/clients/{client_id}/invoices/{invoice_id}")
-        return InvoiceResponse.model_validate(resp)
+        resp = self.client.request("GET", f"/clients/{client_id}/invoices/{invoice_id}", will_parse=True)
+        return self.client.parse(InvoiceResponse, resp)
 
     def update_metadata(self, client_id: str, invoice_id: str, metadata: Dict[str, Any]) -> InvoiceResponse:
         """
         Actualiza la metadata de una factura.
         """
         body = {"content": {}, "metadata": metadata}
-        resp = self.client.request("PATCH", f"/clients/{client_id}/invoices/{invoice_id}", json=body)
-        return InvoiceResponse.model_validate(resp)
+        resp = self.client.request("PATCH", f"/clients/{client_id}/invoices/{invoice_id}", json=body, will_parse=True)
+        return self.client.parse(InvoiceResponse, resp)
 
     def cancel(self, client_id: str, invoice_id: str, metadata: Optional[Dict[str, Any]] = None) -> InvoiceResponse:
         """
         Cancela una factura (cambia estado a CANCELLED).
         """
         body = {"content": {"state": "CANCELLED"}, "metadata": metadata or {}}
-        resp = self.client.request("PATCH", f"/clients/{client_id}/invoices/{invoice_id}", json=body)
-        return InvoiceResponse.model_validate(resp)
+        resp = self.client.request("PATCH", f"/clients/{client_id}/invoices/{invoice_id}", json=body, will_parse=True)
+        return self.client.parse(InvoiceResponse, resp)
 
     def list(self, client_id: str, params: Optional[Dict[str, Any]] = None) -> List[InvoiceResponse]:
         """
-        Lista facturas para un client.
+        Lista facturas para un client (una página).
+        """
+        return split_page(self.list_page(client_id, params))[0]
+
+    def list_page(self, client_id: str, params: Optional[Dict[str, Any]] = None) -> InvoicesListResponse:
+        """
+        Recupera una página de facturas de un client, incluyendo la paginación.
+
+        :param client_id: ID del dispositivo emisor.
+        :param params: Filtros y paginación (`limit`, `token`...).
+        :return: InvoicesListResponse con las facturas y el token de la página siguiente.
+        """
+        resp = self.client.request("GET", f"/clients/{client_id}/invoices", params=params or {}, will_parse=True)
+        return self.client.parse_page(InvoicesListResponse, InvoiceResponse, resp)
+
+    def iter_all(self, client_id: str, params: Optional[Dict[str, Any]] = None, limit: int = 100, prefetch: bool = True) -> Iterator[InvoiceResponse]:
+        """
+        Recorre todas las facturas de un client siguiendo la paginación, de forma perezosa.
+
+        :param client_id: ID del dispositivo emisor.
+        :param params: Filtros adicionales.
+        :param limit: Elementos por página.
+        :param prefetch: Descarga la página siguiente mientras se procesa la actual.
+        :return: Iterador de InvoiceResponse.
+        """
+        def fetch_page(token):
+            page = self.list_page(client_id, page_params(params, limit, token))
+            return split_page(page)
+
+        executor = self.client.prefetch_executor if prefetch else None
+        return iter_items(fetch_page, prefetch=prefetch, executor=executor)
+
+    def create_many(self, invoices: Iterable[Sequence[Any]], max_workers: Optional[int] = None) -> Iterator[BulkResult]:
+        """
+        Emite muchas facturas en paralelo manteniendo el orden por client_id.
+
+        Las facturas de un mismo client (dispositivo) se emiten de una en una y en el
+        orden recibido, porque el encadenamiento fiscal es por dispositivo; las de
+        clients distintos van en paralelo. Un fallo no detiene el lote: se devuelve
+        en el BulkResult correspondiente.
+
+        :param invoices: Iterable de tuplas (client_id, invoice_id, content[, metadata]).
+            Si invoice_id es None se genera un GUID antes de enviar.
+        :param max_workers: Facturas en paralelo (por defecto, `pool_maxsize` del cliente).
+        :return: Iterador de BulkResult en orden de finalización.
+        """
+        def prepare():
+            for entry in invoices:
+                client_id, invoice_id, content = entry[0], entry[1], entry[2]
+                metadata = entry[3] if len(entry) > 3 else None
+                yield client_id, invoice_id or generate_guid(), content, metadata
+
+        def issue(entry):
+            return self.create(*entry)
+
+        workers = max_workers or self.client.config.pool_maxsize
+        for index, entry, response, error in run_in_lanes(prepare(), lambda entry: entry[0], issue, max_workers=workers):
+            yield BulkResult(index=index, client_id=entry[0], invoice_id=entry[1], response=response, error=error)
+
+    def outbox(self, path: str = "fiskaly_outbox.db", **options) -> "InvoiceOutbox":
+        """
+        Abre un outbox duradero para emitir facturas sin esperar a la API.
+
+        `enqueue` guarda la factura en SQLite y vuelve al momento; un hilo de fondo
+        la entrega con reintentos idempotentes.
+
+        :param path: Fichero SQLite de la cola.
+        :param options: workers, initial_delay, max_delay, poll_interval y start.
+        :return: InvoiceOutbox asociado a este cliente.
         """
-        resp = self.client.request("GET", f"/clients/{client_id}/invoices", params=params or {})
-        list_response = InvoicesListResponse.model_validate(resp)
-        return [InvoiceResponse.model_validate({"content": item}) for item in list_response.content]
+        # Import diferido: sqlite3 solo se carga si se usa el outbox.
+        from ..outbox import InvoiceOutbox
+
+        return InvoiceOutbox(self.client, path, **options)
 
     # --- Helpers para casos especiales de facturación (opcional) ---
     # Estos métodos generan el payload adecuado y llaman a create().
@@ -101,3 +176,4 @@ class InvoicesAPI:
         content = {"type": "COMPLETE"}
         content.update(vat_content)
         return self.create(client_id, invoice_id, content, metadata)
+
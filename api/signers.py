@@ -2,8 +2,10 @@
 API para gestionar firmantes (signers) en el SDK Fiskaly SIGN ES.
 """
 
-from typing import Optional, Dict, Any
+from typing import Optional, Dict, Any, Iterator
 from ..exceptions import FiskalyApiError
+from ..pagination import iter_items
+from ..responses import split_page
 from ..models.signer import (
     SignerStateRequest,
     SignerModel,
@@ -20,6 +22,7 @@ class SignersAPI:
       - disable(signer_id, metadata)
       - get(signer_id)
       - list()
+      - iter_all()
     """
 
     def __init__(self, client):
@@ -61,8 +64,8 @@ class SignersAPI:
                 content["private_key_password"] = private_key_password
             body["content"] = content
 
-        resp = self.client.request("PUT", f"/signers/{signer_id}", json=body)
-        return SignerModel.model_validate(resp)
+        resp = self.client.request("PUT", f"/signers/{signer_id}", json=body, will_parse=True)
+        return self.client.parse(SignerModel, resp)
 
     def disable(self, signer_id: str, metadata: Optional[Dict[str, Any]] = None) -> SignerModel:
         """
@@ -77,8 +80,8 @@ class SignersAPI:
             content={"state": "DISABLED"},
             metadata=metadata or {}
         )
-        resp = self.client.request("PATCH", f"/signers/{signer_id}", json=body.dict())
-        return SignerModel.model_validate(resp)
+        resp = self.client.request("PATCH", f"/signers/{signer_id}", json=body, will_parse=True)
+        return self.client.parse(SignerModel, resp)
 
     def get(self, signer_id: str) -> SignerModel:
         """
@@ -88,15 +91,37 @@ class SignersAPI:
         :return: SignerModel con los datos del signer.
         :raises FiskalyApiError: Si la API responde con error.
         """
-        resp = self.client.request("GET", f"/signers/{signer_id}")
-        return SignerModel.model_validate(resp)
+        resp = self.client.request("GET", f"/signers/{signer_id}", will_parse=True)
+        return self.client.parse(SignerModel, resp)
 
-    def list(self) -> SignersListResponse:
+    def list(self, limit: Optional[int] = None, token: Optional[str] = None) -> SignersListResponse:
         """
-        Lista todos los signers de la organización.
+        Lista los signers de la organización, soportando paginación.
 
+        :param limit: Límite de elementos por página (opcional).
+        :param token: Token de paginación (si aplica).
         :return: SignersListResponse con los signers y la paginación.
         :raises FiskalyApiError: Si la API responde con error.
         """
-        resp = self.client.request("GET", "/signers")
-        return SignersListResponse.model_validate(resp)
+        params = {}
+        if limit:
+            params["limit"] = limit
+        if token:
+            params["token"] = token
+        resp = self.client.request("GET", "/signers", params=params, will_parse=True)
+        return self.client.parse_page(SignersListResponse, SignerModel, resp)
+
+    def iter_all(self, limit: int = 100, prefetch: bool = True) -> Iterator[SignerModel]:
+        """
+        Recorre todos los signers siguiendo la paginación, de forma perezosa.
+
+        :param limit: Elementos por página.
+        :param prefetch: Descarga la página siguiente mientras se procesa la actual.
+        :return: Iterador de SignerModel.
+        """
+        def fetch_page(token):
+            page = self.list(limit=limit, token=token)
+            return split_page(page)
+
+        executor = self.client.prefetch_executor if prefetch else None
+        return iter_items(fetch_page, prefetch=prefetch, executor=executor)
@@ -13,5 +13,5 @@ class SoftwareAPI:
         """
         Recupera la información del software registrado.
         """
-        resp = self.client.request("GET", "/software")
-        return SoftwareResponse.model_validate(resp)
+        resp = self.client.request("GET", "/software", will_parse=True)
+        return self.client.parse(SoftwareResponse, resp)
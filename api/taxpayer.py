@@ -44,8 +44,8 @@ class TaxpayerAPI:
                 "territory": territory
             }
         )
-        resp = self.client.request("PUT", "/taxpayer", json=body.dict())
-        return TaxpayerResponse.model_validate(resp)
+        resp = self.client.request("PUT", "/taxpayer", json=body, will_parse=True)
+        return self.client.parse(TaxpayerResponse, resp)
 
     def get(self) -> TaxpayerResponse:
         """
@@ -53,8 +53,8 @@ class TaxpayerAPI:
 
         :return: TaxpayerResponse con los datos actuales.
         """
-        resp = self.client.request("GET", "/taxpayer")
-        return TaxpayerResponse.model_validate(resp)
+        resp = self.client.request("GET", "/taxpayer", will_parse=True)
+        return self.client.parse(TaxpayerResponse, resp)
 
     def disable(self) -> TaxpayerResponse:
         """
@@ -66,5 +66,5 @@ class TaxpayerAPI:
         body = TaxpayerStateRequest(
             content={"state": "DISABLED"}
         )
-        resp = self.client.request("PATCH", "/taxpayer", json=body.dict())
-        return TaxpayerResponse.model_validate(resp)
+        resp = self.client.request("PATCH", "/taxpayer", json=body, will_parse=True)
+        return self.client.parse(TaxpayerResponse, resp)
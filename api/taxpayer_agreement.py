@@ -1,3 +1,4 @@
+from ..download import DownloadResult
 from ..models.taxpayer_agreement import (
     TaxpayerAgreementGenerateRequest,
     TaxpayerAgreementUploadRequest,
@@ -16,23 +17,23 @@ class TaxpayerAgreementAPI:
         Genera el borrador del acuerdo.
         """
         body = TaxpayerAgreementGenerateRequest(content=content)
-        resp = self.client.request("POST", "/taxpayer/agreement", json=body.dict())
-        return TaxpayerAgreementResponse.model_validate(resp)
+        resp = self.client.request("POST", "/taxpayer/agreement", json=body, will_parse=True)
+        return self.client.parse(TaxpayerAgreementResponse, resp)
 
     def upload(self, content) -> TaxpayerAgreementResponse:
         """
         Sube el acuerdo firmado.
         """
         body = TaxpayerAgreementUploadRequest(content=content)
-        resp = self.client.request("PUT", "/taxpayer/agreement", json=body.dict())
-        return TaxpayerAgreementResponse.model_validate(resp)
+        resp = self.client.request("PUT", "/taxpayer/agreement", json=body, will_parse=True)
+        return self.client.parse(TaxpayerAgreementResponse, resp)
 
     def get(self) -> TaxpayerAgreementResponse:
         """
         Obtiene la información del acuerdo del taxpayer.
         """
-        resp = self.client.request("GET", "/taxpayer/agreement")
-        return TaxpayerAgreementResponse.model_validate(resp)
+        resp = self.client.request("GET", "/taxpayer/agreement", will_parse=True)
+        return self.client.parse(TaxpayerAgreementResponse, resp)
 
     def download_pdf(self) -> bytes:
         """
@@ -40,3 +41,9 @@ class TaxpayerAgreementAPI:
         """
         resp = self.client.request("GET", "/taxpayer/agreement.pdf")
         return resp  # bytes
+
+    def download_pdf_to(self, dest, **options) -> DownloadResult:
+        """
+        Descarga el PDF del acuerdo firmado en streaming hacia `dest`.
+        """
+        return self.client.download("/taxpayer/agreement.pdf", dest, **options)
@@ -0,0 +1,294 @@
+# fiskaly_sdk/archive.py
+
+"""
+Destinos de las descargas masivas de XML del SDK Fiskaly SIGN ES.
+
+`InvoiceXMLAPI.get_many` escribe cada XML en un destino que puede ser:
+
+  - un directorio (`<dir>/<client_id>/<invoice_id>.xml`),
+  - un fichero `.tar` o `.zip`, al que se añaden entradas con el mismo nombre.
+
+Cada descarga se escribe primero en un fichero temporal (en el directorio) o en
+un SpooledTemporaryFile (para los archivos) y solo se publica cuando está
+completa y es un XML bien formado. Así, al repetir una descarga interrumpida,
+las entradas presentes y válidas se saltan y las incompletas se descargan de
+nuevo.
+"""
+
+import os
+import shutil
+import tarfile
+import tempfile
+import threading
+import time
+import zipfile
+from typing import Dict, Set, Union
+from xml.parsers import expat
+
+from .download import Destination
+from .exceptions import FiskalyApiError
+
+DEFAULT_SPOOL_SIZE = 1024 * 1024
+
+
+def archive_name(client_id: str, invoice_id: str) -> str:
+    """
+    Nombre de la entrada de una factura: `<client_id>/<invoice_id>.xml`.
+
+    :raises ValueError: Si algún identificador está vacío o contiene separadores de ruta.
+    """
+    for part in (client_id, invoice_id):
+        if not part or part in (".", "..") or "/" in part or "\\" in part or "\0" in part:
+            raise ValueError(f"Identificador no válido para un nombre de fichero: {part!r}")
+    return f"{client_id}/{invoice_id}.xml"
+
+
+def is_valid_xml(fileobj) -> bool:
+    """
+    Comprueba en streaming (con expat) que el contenido es un XML bien formado.
+    """
+    parser = expat.ParserCreate()
+    try:
+        parser.ParseFile(fileobj)
+    except expat.ExpatError:
+        return False
+    return True
+
+
+class ArchiveSink:
+    """
+    Interfaz de un destino de descargas masivas.
+
+    `stage` devuelve dónde escribir una descarga, `commit` la publica con su
+    nombre y `discard` la descarta. Los métodos son seguros entre hilos.
+    """
+
+    def __init__(self, verify: bool = True):
+        """
+        :param verify: Comprueba que las entradas existentes y las nuevas son XML bien formado.
+        """
+        self.verify = verify
+
+    def exists(self, name: str) -> bool:
+        """
+        Indica si la entrada ya está presente (y es válida, si `verify`).
+        """
+        raise NotImplementedError
+
+    def stage(self, name: str) -> Destination:
+        raise NotImplementedError
+
+    def commit(self, name: str, staged: Destination):
+        raise NotImplementedError
+
+    def discard(self, staged: Destination):
+        pass
+
+    def close(self):
+        pass
+
+    def _check(self, name: str, fileobj):
+        if self.verify and not is_valid_xml(fileobj):
+            raise FiskalyApiError(f"La respuesta de {name} no es un XML bien formado")
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.close()
+
+
+class DirectorySink(ArchiveSink):
+    """
+    Un fichero por factura dentro de un directorio.
+
+    Las descargas se escriben en un fichero oculto `.part` junto al destino y se
+    renombran de forma atómica al terminar.
+    """
+
+    def __init__(self, path: Union[str, "os.PathLike[str]"], verify: bool = True):
+        super().__init__(verify)
+        self.path = os.fspath(path)
+        os.makedirs(self.path, exist_ok=True)
+
+    def _target(self, name: str) -> str:
+        return os.path.join(self.path, *name.split("/"))
+
+    def exists(self, name: str) -> bool:
+        target = self._target(name)
+        if not os.path.isfile(target):
+            return False
+        if not self.verify:
+            return True
+        with open(target, "rb") as f:
+            return is_valid_xml(f)
+
+    def stage(self, name: str) -> str:
+        target = self._target(name)
+        directory, base = os.path.split(target)
+        os.makedirs(directory, exist_ok=True)
+        fd, staged = tempfile.mkstemp(prefix=f".{base}.", suffix=".part", dir=directory)
+        os.close(fd)
+        return staged
+
+    def commit(self, name: str, staged: str):
+        with open(staged, "rb") as f:
+            self._check(name, f)
+        os.replace(staged, self._target(name))
+
+    def discard(self, staged: str):
+        try:
+            os.unlink(staged)
+        except FileNotFoundError:
+            pass
+
+
+class _SpooledSink(ArchiveSink):
+    """
+    Base de los destinos de un solo fichero: las descargas van a un
+    SpooledTemporaryFile (en memoria hasta `spool_size` bytes, luego a disco) y se
+    copian al archivo bajo un lock.
+    """
+
+    def __init__(self, verify: bool = True, spool_size: int = DEFAULT_SPOOL_SIZE):
+        super().__init__(verify)
+        self.spool_size = spool_size
+        self._lock = threading.Lock()
+
+    def stage(self, name: str):
+        return tempfile.SpooledTemporaryFile(max_size=self.spool_size)
+
+    def commit(self, name: str, staged):
+        size = staged.tell()
+        staged.seek(0)
+        self._check(name, staged)
+        staged.seek(0)
+        with self._lock:
+            self._append(name, staged, size)
+        staged.close()
+
+    def discard(self, staged):
+        staged.close()
+
+    def _append(self, name: str, staged, size: int):
+        raise NotImplementedError
+
+
+class TarSink(_SpooledSink):
+    """
+    Archivo `.tar` sin comprimir al que se añaden entradas.
+
+    Al abrir un archivo existente se recorren sus entradas: las completas (y bien
+    formadas, si `verify`) cuentan como presentes y una última entrada cortada
+    (p.ej. por una ejecución interrumpida) se elimina antes de seguir añadiendo.
+    """
+
+    def __init__(self, path: Union[str, "os.PathLike[str]"], verify: bool = True, spool_size: int = DEFAULT_SPOOL_SIZE):
+        super().__init__(verify, spool_size)
+        self.path = os.fspath(path)
+        self._names: Set[str] = set()
+        if os.path.exists(self.path):
+            self._recover()
+        self._tar = tarfile.open(self.path, "a")
+
+    def _recover(self):
+        size = os.path.getsize(self.path)
+        end = 0
+        try:
+            with tarfile.open(self.path, "r:") as tar:
+                for member in tar:
+                    blocks = -(-member.size // tarfile.BLOCKSIZE) * tarfile.BLOCKSIZE
+                    if member.offset_data + member.size > size:
+                        break
+                    end = member.offset_data + blocks
+                    if member.isfile() and (not self.verify or is_valid_xml(tar.extractfile(member))):
+                        self._names.add(member.name)
+        except tarfile.ReadError:
+            pass
+        # Descarta la cola cortada y reescribe el marcador de fin, que tarfile "a"
+        # necesita para saber dónde empezar a añadir.
+        with open(self.path, "r+b") as f:
+            f.truncate(end)
+            f.seek(end)
+            f.write(b"\0" * 2 * tarfile.BLOCKSIZE)
+
+    def exists(self, name: str) -> bool:
+        with self._lock:
+            return name in self._names
+
+    def _append(self, name: str, staged, size: int):
+        info = tarfile.TarInfo(name)
+        info.size = size
+        info.mtime = int(time.time())
+        info.mode = 0o644
+        self._tar.addfile(info, staged)
+        self._tar.fileobj.flush()
+        self._names.add(name)
+
+    def close(self):
+        with self._lock:
+            self._tar.close()
+
+
+class ZipSink(_SpooledSink):
+    """
+    Archivo `.zip` (deflate) al que se añaden entradas.
+
+    El índice de un zip se escribe al cerrarlo: si el proceso muere antes, el
+    archivo no se puede reabrir. Para descargas que se reanudan tras cortes es más
+    robusto un directorio o un `.tar`.
+    """
+
+    def __init__(self, path: Union[str, "os.PathLike[str]"], verify: bool = True, spool_size: int = DEFAULT_SPOOL_SIZE):
+        super().__init__(verify, spool_size)
+        self.path = os.fspath(path)
+        self._zip = zipfile.ZipFile(self.path, "a", compression=zipfile.ZIP_DEFLATED)
+        self._valid: Dict[str, bool] = {}
+
+    def exists(self, name: str) -> bool:
+        with self._lock:
+            if name not in self._valid:
+                try:
+                    info = self._zip.getinfo(name)
+                except KeyError:
+                    return False
+                if self.verify:
+                    with self._zip.open(info) as f:
+                        self._valid[name] = is_valid_xml(f)
+                else:
+                    self._valid[name] = True
+            return self._valid[name]
+
+    def _append(self, name: str, staged, size: int):
+        if name in self._zip.NameToInfo:
+            raise FiskalyApiError(f"{name} ya existe en {self.path} y no es válido; no se puede reemplazar en un zip")
+        info = zipfile.ZipInfo(name, date_time=time.localtime()[:6])
+        info.compress_type = zipfile.ZIP_DEFLATED
+        info.external_attr = 0o644 << 16
+        with self._zip.open(info, "w", force_zip64=size > zipfile.ZIP64_LIMIT) as out:
+            shutil.copyfileobj(staged, out)
+        self._valid[name] = True
+
+    def close(self):
+        with self._lock:
+            self._zip.close()
+
+
+def open_sink(dest: Union[str, "os.PathLike[str]", ArchiveSink], verify: bool = True) -> ArchiveSink:
+    """
+    Crea el destino según la ruta: `.tar` o `.zip` para un archivo, cualquier otra
+    cosa para un directorio. Un ArchiveSink se devuelve tal cual.
+
+    :raises ValueError: Si la ruta es un tar comprimido (no admite añadir entradas).
+    """
+    if isinstance(dest, ArchiveSink):
+        return dest
+    path = os.fspath(dest)
+    lower = path.lower()
+    if lower.endswith((".tar.gz", ".tgz", ".tar.bz2", ".tar.xz")):
+        raise ValueError(f"{path}: los tar comprimidos no admiten añadir entradas; usa .tar o .zip")
+    if lower.endswith(".tar"):
+        return TarSink(path, verify=verify)
+    if lower.endswith(".zip"):
+        return ZipSink(path, verify=verify)
+    return DirectorySink(path, verify=verify)
@@ -0,0 +1,5 @@
+# fiskaly_sdk/benchmarks/__init__.py
+
+"""
+Benchmarks offline del SDK Fiskaly SIGN ES (no hacen peticiones a la API real).
+"""
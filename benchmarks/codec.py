@@ -0,0 +1,156 @@
+# fiskaly_sdk/benchmarks/codec.py
+
+"""
+Coste de serializar y decodificar cuerpos JSON grandes con cada codec.
+
+Sin red, compara la ruta anterior del cliente con cada backend de `codec`:
+
+  - encode_invoice: factura con muchas líneas. Antes `body.dict()` + `json.dumps`
+    (lo que hacía requests con `json=`); ahora `codec.dumps(modelo)`.
+  - decode_list: respuesta de `GET /clients/{id}/invoices` con muchas facturas.
+    Antes `bytes.decode()` + `json.loads` (lo que hace `resp.json()`); ahora
+    `codec.loads(bytes)`.
+
+Uso:
+    python -m fiskaly_sdk.benchmarks.codec --lines 2000 --items 2000 --repeat 20
+"""
+
+import argparse
+import json
+import time
+from typing import Any, Callable, Dict, List
+
+from ..codec import CODECS
+from ..models.invoice import InvoiceRequest
+
+
+def make_invoice(lines: int) -> InvoiceRequest:
+    """
+    Genera una factura COMPLETE con `lines` líneas.
+    """
+    items = [
+        {
+            "text": f"Artículo {i}",
+            "quantity": "1",
+            "unit_amount": "10.00",
+            "discount": "0.00",
+            "full_amount": "12.10",
+            "system": {"type": "REGULAR", "category": {"type": "VAT", "rate": "21"}},
+        }
+        for i in range(lines)
+    ]
+    content = {
+        "type": "COMPLETE",
+        "number": "0001",
+        "series": "A",
+        "text": "Benchmark",
+        "full_amount": f"{12.10 * lines:.2f}",
+        "items": items,
+        "recipients": [{"id": {"legal_name": "Cliente SL", "tax_number": "B12345678"}}],
+    }
+    return InvoiceRequest(content=content, metadata={"source": "benchmark"})
+
+
+def make_list_body(items: int) -> bytes:
+    """
+    Cuerpo (bytes) de una página de `GET /clients/{id}/invoices` con `items` facturas.
+    """
+    page = {
+        "results": [
+            {
+                "content": {
+                    "id": f"invoice-{i}",
+                    "state": "ISSUED",
+                    "number": f"{i:06d}",
+                    "series": "A",
+                    "full_amount": "12.10",
+                    "issued_at": "2024-01-01T00:00:00Z",
+                    "compliance": {"code": "QR" * 40, "url": f"https://example.com/v/{i}"},
+                },
+                "metadata": {"order": str(i), "store": "benchmark"},
+            }
+            for i in range(items)
+        ],
+        "pagination": {"limit": items, "token": "next-page"},
+    }
+    return json.dumps(page).encode("utf-8")
+
+
+def _best(fn: Callable[[], Any], repeat: int) -> float:
+    best = float("inf")
+    for _ in range(repeat):
+        started = time.perf_counter()
+        fn()
+        best = min(best, time.perf_counter() - started)
+    return best
+
+
+def _available_codecs() -> Dict[str, Any]:
+    codecs = {}
+    for name, factory in CODECS.items():
+        try:
+            codecs[name] = factory()
+        except ImportError:
+            continue
+    return codecs
+
+
+def run(lines: int = 2000, items: int = 2000, repeat: int = 20) -> List[Dict[str, Any]]:
+    """
+    Ejecuta el benchmark y devuelve una fila por (caso, codec).
+
+    :param lines: Líneas de la factura a serializar.
+    :param items: Facturas de la página a decodificar.
+    :param repeat: Repeticiones; se informa la mejor.
+    :return: Lista de dicts con case, codec, bytes, ms y speedup (frente a "baseline").
+    """
+    invoice = make_invoice(lines)
+    body = make_list_body(items)
+    cases = {
+        "encode_invoice": (
+            len(invoice.model_dump_json()),
+            lambda: json.dumps(invoice.model_dump()).encode("utf-8"),
+            lambda codec: lambda: codec.dumps(invoice),
+        ),
+        "decode_list": (
+            len(body),
+            lambda: json.loads(body.decode("utf-8")),
+            lambda codec: lambda: codec.loads(body),
+        ),
+    }
+    rows = []
+    codecs = _available_codecs()
+    for case, (size, baseline, build) in cases.items():
+        reference = _best(baseline, repeat)
+        rows.append({"case": case, "codec": "baseline", "bytes": size, "ms": round(reference * 1000, 3), "speedup": 1.0})
+        for name, codec in codecs.items():
+            seconds = _best(build(codec), repeat)
+            rows.append({
+                "case": case,
+                "codec": name,
+                "bytes": size,
+                "ms": round(seconds * 1000, 3),
+                "speedup": round(reference / seconds, 2),
+            })
+    return rows
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--lines", type=int, default=2000, help="Líneas de la factura a serializar")
+    parser.add_argument("--items", type=int, default=2000, help="Facturas de la página a decodificar")
+    parser.add_argument("--repeat", type=int, default=20, help="Repeticiones por medición")
+    parser.add_argument("--json", action="store_true", help="Salida en JSON")
+    args = parser.parse_args(argv)
+
+    rows = run(args.lines, args.items, args.repeat)
+    if args.json:
+        print(json.dumps(rows, indent=2))
+        return
+    print(f"{'caso':<16} {'codec':<10} {'bytes':>10} {'ms':>9} {'x':>6}")
+    for row in rows:
+        print(f"{row['case']:<16} {row['codec']:<10} {row['bytes']:>10} {row['ms']:>9.3f} {row['speedup']:>6.2f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,179 @@
+# fiskaly_sdk/benchmarks/fixtures.py
+
+"""
+Respuestas fijas de la API y casos de benchmark por método de recurso.
+
+`canned_response` devuelve, para cada ruta de la API, una respuesta válida para
+los modelos del SDK; la usa el transporte en memoria de `standin`. Para medir
+con red, `start_simulator` arranca un `FiskalySimulator` sin latencia con los
+recursos que usan los casos.
+"""
+
+import functools
+import json
+import re
+import time
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+from ..simulator import FiskalySimulator
+
+# Respuesta: (código HTTP, Content-Type, cuerpo).
+Canned = Tuple[int, str, bytes]
+
+PAGE_SIZE = 100
+ZIP_BYTES = b"PK\x03\x04" + b"\x00" * 4096
+PDF_BYTES = b"%PDF-1.4\n" + b"0" * 4096
+XML_BYTES = b"<?xml version='1.0'?><Invoice>" + b"<Line/>" * 200 + b"</Invoice>"
+
+
+def _signer(signer_id: str) -> Dict[str, Any]:
+    return {
+        "content": {
+            "id": signer_id,
+            "state": "ENABLED",
+            "certificate": {
+                "expires_at": "2030-01-01T00:00:00Z",
+                "serial_number": "0123456789",
+                "x509_pem": "MIIB" + "A" * 512,
+            },
+        },
+        "metadata": {},
+    }
+
+
+def _client(client_id: str) -> Dict[str, Any]:
+    return {"content": {"id": client_id, "signer": {"id": "signer-1"}, "state": "ENABLED"}, "metadata": {}}
+
+
+def _invoice(invoice_id: str, state: str = "ISSUED") -> Dict[str, Any]:
+    return {"content": {"id": invoice_id, "state": state}, "metadata": {"source": "benchmark"}}
+
+
+def _export(export_id: str) -> Dict[str, Any]:
+    return {"content": {"id": export_id, "state": "COMPLETED"}, "metadata": {}}
+
+
+def _page(items: List[Dict[str, Any]]) -> Dict[str, Any]:
+    return {"results": items, "pagination": {"limit": len(items), "token": None}}
+
+
+def _json(payload: Dict[str, Any]) -> Canned:
+    return 200, "application/json", json.dumps(payload).encode()
+
+
+_ROUTES: List[Tuple[str, "re.Pattern[str]", Callable[..., Canned]]] = [
+    ("POST", re.compile(r"^/auth$"), lambda: _json({
+        "content": {"access_token": {"bearer": "bench-token", "expires_at": int(time.time()) + 3600}},
+    })),
+    ("*", re.compile(r"^/taxpayer$"), lambda: _json({
+        "content": {"issuer": {"tax_number": "B12345678", "legal_name": "Bench SL"}, "territory": "GIPUZKOA", "state": "ENABLED"},
+    })),
+    ("GET", re.compile(r"^/taxpayer/agreement\.pdf$"), lambda: (200, "application/pdf", PDF_BYTES)),
+    ("*", re.compile(r"^/taxpayer/agreement$"), lambda: _json({"content": {"agreement_id": "agreement-1", "state": "SIGNED"}})),
+    ("GET", re.compile(r"^/signers$"), lambda: _json(_page([_signer(f"signer-{i}") for i in range(PAGE_SIZE)]))),
+    ("*", re.compile(r"^/signers/([^/]+)$"), lambda signer_id: _json(_signer(signer_id))),
+    ("GET", re.compile(r"^/clients$"), lambda: _json(_page([_client(f"client-{i}") for i in range(PAGE_SIZE)]))),
+    ("GET", re.compile(r"^/clients/[^/]+/invoices/([^/]+)/xml$"), lambda invoice_id: (200, "application/xml", XML_BYTES)),
+    ("GET", re.compile(r"^/clients/[^/]+/invoices$"), lambda: _json(_page([_invoice(f"invoice-{i}") for i in range(PAGE_SIZE)]))),
+    ("*", re.compile(r"^/clients/[^/]+/invoices/([^/]+)$"), lambda invoice_id: _json(_invoice(invoice_id))),
+    ("*", re.compile(r"^/clients/([^/]+)$"), lambda client_id: _json(_client(client_id))),
+    ("GET", re.compile(r"^/invoices$"), lambda: _json(_page([_invoice(f"invoice-{i}") for i in range(PAGE_SIZE)]))),
+    ("GET", re.compile(r"^/exports$"), lambda: _json({"content": [_export(f"export-{i}")["content"] for i in range(PAGE_SIZE)]})),
+    ("GET", re.compile(r"^/exports/([^/]+)/file$"), lambda export_id: (200, "application/zip", ZIP_BYTES)),
+    ("*", re.compile(r"^/exports/([^/]+)$"), lambda export_id: _json(_export(export_id))),
+    ("GET", re.compile(r"^/software$"), lambda: _json({"content": {"software_id": "software-1", "name": "Bench"}})),
+]
+
+
+@functools.lru_cache(maxsize=256)
+def canned_response(method: str, path: str) -> Canned:
+    """
+    Devuelve la respuesta fija para una petición (404 si la ruta no existe).
+
+    Se cachea para que construir la respuesta no cuente como coste del SDK.
+
+    :param method: Método HTTP.
+    :param path: Ruta relativa a la URL base (sin query string).
+    """
+    for route_method, pattern, build in _ROUTES:
+        if route_method not in ("*", method):
+            continue
+        match = pattern.match(path)
+        if match:
+            return build(*match.groups())
+    return 404, "application/json", b'{"error": "not found"}'
+
+
+# Caso de benchmark: (nombre, función que hace una llamada con el cliente).
+Case = Tuple[str, Callable[[Any], Any]]
+
+INVOICE_CONTENT = {
+    "type": "SIMPLIFIED",
+    "number": "0001",
+    "series": "A",
+    "text": "Benchmark",
+    "full_amount": "12.10",
+    "items": [{"text": "Item", "quantity": "1", "unit_amount": "10.00", "full_amount": "12.10"}],
+}
+
+CASES: List[Case] = [
+    ("taxpayer.get", lambda c: c.taxpayer.get()),
+    ("taxpayer.set", lambda c: c.taxpayer.set("B12345678", "Bench SL", "GIPUZKOA")),
+    ("taxpayer_agreement.get", lambda c: c.taxpayer_agreement.get()),
+    ("taxpayer_agreement.download_pdf", lambda c: c.taxpayer_agreement.download_pdf()),
+    ("signers.get", lambda c: c.signers.get("signer-1")),
+    ("signers.list", lambda c: c.signers.list(limit=PAGE_SIZE)),
+    ("clients.create", lambda c: c.clients.create("client-1")),
+    ("clients.get", lambda c: c.clients.get("client-1")),
+    ("clients.list", lambda c: c.clients.list(limit=PAGE_SIZE)),
+    ("invoices.create", lambda c: c.invoices.create("client-1", "invoice-1", INVOICE_CONTENT)),
+    ("invoices.get", lambda c: c.invoices.get("client-1", "invoice-1")),
+    ("invoices.cancel", lambda c: c.invoices.cancel("client-1", "invoice-1")),
+    ("invoices.list_page", lambda c: c.invoices.list_page("client-1", {"limit": PAGE_SIZE})),
+    ("invoice_search.search_page", lambda c: c.invoice_search.search_page({"limit": PAGE_SIZE})),
+    ("invoice_xml.get_xml", lambda c: c.invoice_xml.get_xml("client-1", "invoice-1")),
+    ("exports.create", lambda c: c.exports.create("export-1", {})),
+    ("exports.get", lambda c: c.exports.get("export-1")),
+    ("exports.list", lambda c: c.exports.list()),
+    ("exports.download_zip", lambda c: c.exports.download_zip("export-1")),
+    ("software.get", lambda c: c.software.get()),
+]
+
+
+def start_simulator() -> Tuple[FiskalySimulator, str]:
+    """
+    Arranca un simulador sin latencia con los recursos que usan los casos.
+
+    Crea taxpayer, acuerdo, `signer-1`, `client-1`, `PAGE_SIZE` facturas (entre
+    ellas `invoice-1`) y `export-1` ya completado, para que cada caso responda
+    lo mismo que su respuesta fija. El llamador debe parar el simulador.
+
+    :return: (simulador, token Bearer válido durante toda la medición).
+    """
+    sim = FiskalySimulator(token_ttl=24 * 3600, export_ready_after=0.0).start()
+    bearer, _ = sim.api.issue_token()
+    headers = {"authorization": f"Bearer {bearer}"}
+
+    def put(method: str, path: str, content: Dict[str, Any]):
+        resp = sim.api.handle(method, path, {}, headers, json.dumps({"content": content}).encode())
+        if resp.status != 200:
+            raise RuntimeError(f"No se pudo preparar {method} {path}: {resp.status}")
+
+    put("PUT", "/taxpayer", {"issuer": {"tax_number": "B12345678", "legal_name": "Bench SL"}, "territory": "GIPUZKOA"})
+    put("POST", "/taxpayer/agreement", {})
+    put("PUT", "/taxpayer/agreement", {})
+    put("PUT", "/signers/signer-1", {})
+    put("PUT", "/clients/client-1", {})
+    for i in range(PAGE_SIZE):
+        put("PUT", f"/clients/client-1/invoices/invoice-{i + 1}", INVOICE_CONTENT)
+    put("PUT", "/exports/export-1", {})
+    return sim, bearer
+
+
+def select_cases(names: Optional[List[str]] = None) -> List[Case]:
+    """
+    Filtra los casos por nombre o prefijo (p.ej. "invoices").
+    """
+    if not names:
+        return list(CASES)
+    return [case for case in CASES if any(case[0] == name or case[0].startswith(name + ".") for name in names)]
@@ -0,0 +1,375 @@
+# fiskaly_sdk/benchmarks/load.py
+
+"""
+Generador de carga `fiskaly-bench`.
+
+Lanza una mezcla realista de operaciones (emisión de facturas, cancelaciones,
+búsquedas globales y descargas de exports) contra una URL base, con la
+concurrencia y la duración indicadas, e informa por endpoint de p50/p95/p99/max,
+peticiones por segundo, tasa de errores y CPU del cliente por petición.
+
+Las latencias salen de los RequestEvent de la instrumentación del cliente: cada
+petición HTTP cuenta en su endpoint (un export son el PUT, cada consulta de
+estado y la descarga del ZIP), sin las esperas entre consultas. Los GET que se
+unen a otro idéntico en curso (`coalesce_gets`) no hacen petición y no cuentan.
+
+    fiskaly-bench --simulator --concurrency 16 --duration 30
+    fiskaly-bench --base-url https://sign-api.fiskaly.com/api/v1 \\
+        --client-id 0b5c... --mix create=80,cancel=10,search=10 --concurrency 8
+"""
+
+import argparse
+import io
+import json
+import math
+import multiprocessing
+import os
+import random
+import sys
+import threading
+import time
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable, Deque, Dict, List, Optional, Sequence, Tuple
+
+from ..client import FiskalyClient
+from ..instrumentation import CompositeInstrumentation, Instrumentation, RequestEvent
+from ..utils import generate_guid
+from ..version import __version__
+
+DEFAULT_MIX = "create=70,cancel=10,search=15,export=5"
+
+INVOICE_CONTENT = {
+    "type": "SIMPLIFIED",
+    "text": "fiskaly-bench",
+    "full_amount": "12.10",
+    "items": [{"text": "Item", "quantity": "1", "unit_amount": "10.00", "full_amount": "12.10"}],
+}
+
+
+def parse_mix(mix: str) -> Dict[str, float]:
+    """
+    Convierte "create=70,cancel=10" en pesos por operación.
+
+    :raises ValueError: Si una operación no existe o no hay ningún peso positivo.
+    """
+    weights = {}
+    for part in mix.split(","):
+        if not part.strip():
+            continue
+        name, _, weight = part.partition("=")
+        name = name.strip()
+        if name not in OPERATIONS:
+            raise ValueError(f"Operación desconocida en la mezcla: {name} (válidas: {', '.join(OPERATIONS)})")
+        weights[name] = float(weight or 1)
+    if not any(weight > 0 for weight in weights.values()):
+        raise ValueError("La mezcla no tiene ninguna operación con peso positivo")
+    return weights
+
+
+def percentile(sorted_values: Sequence[float], fraction: float) -> float:
+    """
+    Percentil por rango más cercano sobre una lista ya ordenada.
+    """
+    if not sorted_values:
+        return 0.0
+    index = max(0, min(len(sorted_values) - 1, math.ceil(fraction * len(sorted_values)) - 1))
+    return sorted_values[index]
+
+
+class LoadContext:
+    """
+    Estado compartido por los workers: cliente, clients disponibles y facturas
+    emitidas pendientes de cancelar.
+    """
+
+    def __init__(self, client: FiskalyClient, client_ids: List[str], export_timeout: float = 120.0):
+        self.client = client
+        self.client_ids = client_ids
+        self.export_timeout = export_timeout
+        self.issued: Deque[Tuple[str, str]] = deque(maxlen=10000)
+
+    def random_client(self) -> str:
+        return random.choice(self.client_ids)
+
+
+def _create(ctx: LoadContext):
+    client_id = ctx.random_client()
+    invoice_id = generate_guid()
+    ctx.client.invoices.create(client_id, invoice_id, INVOICE_CONTENT)
+    ctx.issued.append((client_id, invoice_id))
+
+
+def _cancel(ctx: LoadContext) -> Optional[str]:
+    try:
+        client_id, invoice_id = ctx.issued.popleft()
+    except IndexError:
+        # Todavía no hay facturas que cancelar: se emite una y cuenta como "create".
+        _create(ctx)
+        return "create"
+    ctx.client.invoices.cancel(client_id, invoice_id)
+    return None
+
+
+def _search(ctx: LoadContext):
+    ctx.client.invoice_search.search({"limit": 100})
+
+
+def _export(ctx: LoadContext):
+    export = ctx.client.exports.create(content={})
+    ctx.client.exports.wait_until_ready(export.content.id, timeout=ctx.export_timeout, initial_delay=0.2)
+    ctx.client.exports.download_zip_to(export.content.id, io.BytesIO(), checksum=None)
+
+
+# Operación -> función. Devuelve el nombre de otra operación si acabó haciendo esa.
+OPERATIONS: Dict[str, Callable[[LoadContext], Optional[str]]] = {
+    "create": _create,
+    "cancel": _cancel,
+    "search": _search,
+    "export": _export,
+}
+
+
+class _Recorder(Instrumentation):
+    """
+    Latencias y errores por endpoint (de los RequestEvent de cada hilo) y
+    recuento de operaciones, fusionados al final.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._local = threading.local()
+        self._shards: List[Dict[str, List[Tuple[float, bool]]]] = []
+        self.operations: Dict[str, int] = {name: 0 for name in OPERATIONS}
+        self.errors: Dict[str, int] = {name: 0 for name in OPERATIONS}
+        self.error_samples: Dict[str, str] = {}
+
+    def on_request(self, event: RequestEvent):
+        shard = getattr(self._local, "shard", None)
+        if shard is None:
+            shard = self._local.shard = {}
+            with self._lock:
+                self._shards.append(shard)
+        key = f"{event.method} {event.endpoint}"
+        samples = shard.get(key)
+        if samples is None:
+            samples = shard[key] = []
+        samples.append((event.duration, event.error is not None))
+
+    def endpoints(self) -> Dict[str, List[Tuple[float, bool]]]:
+        merged: Dict[str, List[Tuple[float, bool]]] = {}
+        with self._lock:
+            for shard in self._shards:
+                for key, samples in shard.items():
+                    merged.setdefault(key, []).extend(samples)
+        return merged
+
+    def merge(self, operations: Dict[str, int], errors: Dict[str, int], samples: Dict[str, str]):
+        with self._lock:
+            for name, count in operations.items():
+                self.operations[name] += count
+            for name, count in errors.items():
+                self.errors[name] += count
+            for name, message in samples.items():
+                self.error_samples.setdefault(name, message)
+
+
+def run_load(
+    ctx: LoadContext,
+    mix: Dict[str, float],
+    concurrency: int = 8,
+    duration: float = 30.0,
+) -> Dict[str, Any]:
+    """
+    Ejecuta la mezcla durante `duration` segundos con `concurrency` hilos.
+
+    Mientras dura, la instrumentación del cliente incluye el registro de la prueba
+    (junto a la que ya tuviera).
+
+    :return: Informe con totales, métricas por endpoint y recuento por operación.
+    """
+    names = [name for name, weight in mix.items() if weight > 0]
+    weights = [mix[name] for name in names]
+    recorder = _Recorder()
+    deadline = time.perf_counter() + duration
+
+    def worker(seed: int):
+        rng = random.Random(seed)
+        operations = {name: 0 for name in OPERATIONS}
+        errors = {name: 0 for name in OPERATIONS}
+        samples = {}
+        while time.perf_counter() < deadline:
+            name = rng.choices(names, weights)[0]
+            try:
+                name = OPERATIONS[name](ctx) or name
+            except Exception as e:
+                errors[name] += 1
+                samples.setdefault(name, f"{type(e).__name__}: {e}"[:200])
+            operations[name] += 1
+        recorder.merge(operations, errors, samples)
+
+    config = ctx.client.config
+    previous = config.instrumentation
+    config.instrumentation = recorder if previous is None else CompositeInstrumentation([previous, recorder])
+    try:
+        cpu_started = time.process_time()
+        started = time.perf_counter()
+        with ThreadPoolExecutor(max_workers=concurrency) as executor:
+            for seed in range(concurrency):
+                executor.submit(worker, seed)
+        elapsed = time.perf_counter() - started
+        cpu = time.process_time() - cpu_started
+    finally:
+        config.instrumentation = previous
+
+    endpoints = []
+    total = total_errors = 0
+    for endpoint, samples in sorted(recorder.endpoints().items()):
+        values = sorted(seconds for seconds, _ in samples)
+        count, errors = len(values), sum(1 for _, failed in samples if failed)
+        total += count
+        total_errors += errors
+        endpoints.append({
+            "endpoint": endpoint,
+            "count": count,
+            "errors": errors,
+            "error_rate": round(errors / count, 4),
+            "rps": round(count / elapsed, 2),
+            "p50_ms": round(percentile(values, 0.50) * 1000, 2),
+            "p95_ms": round(percentile(values, 0.95) * 1000, 2),
+            "p99_ms": round(percentile(values, 0.99) * 1000, 2),
+            "max_ms": round(values[-1] * 1000, 2),
+        })
+    operations = [
+        {
+            "operation": name,
+            "count": recorder.operations[name],
+            "errors": recorder.errors[name],
+            "first_error": recorder.error_samples.get(name),
+        }
+        for name in OPERATIONS
+        if recorder.operations[name]
+    ]
+    return {
+        "sdk_version": __version__,
+        "concurrency": concurrency,
+        "duration_s": round(elapsed, 3),
+        "requests": total,
+        "errors": total_errors,
+        "error_rate": round(total_errors / total, 4) if total else 0.0,
+        "rps": round(total / elapsed, 2) if elapsed else 0.0,
+        "cpu_s": round(cpu, 3),
+        "cpu_ms_per_request": round(cpu / total * 1000, 3) if total else 0.0,
+        "endpoints": endpoints,
+        "operations": operations,
+    }
+
+
+def prepare(client: FiskalyClient, clients: int) -> List[str]:
+    """
+    Da de alta taxpayer, un signer y `clients` dispositivos para la prueba.
+
+    Pensado para el simulador o una organización de pruebas.
+    """
+    client.taxpayer.set("B00000000", "fiskaly-bench", "GIPUZKOA")
+    signer = client.signers.create()
+    client_ids = []
+    for _ in range(clients):
+        client_ids.append(client.clients.create(metadata={"signer": signer.content.id}).content.id)
+    return client_ids
+
+
+def _serve_simulator(port_queue, latency_mean: float):
+    from ..simulator import FiskalySimulator, LatencyModel
+
+    simulator = FiskalySimulator(latency=LatencyModel("lognormal", mean=latency_mean), export_ready_after=1.0)
+    port_queue.put((simulator.base_url, simulator.api_key, simulator.api_secret))
+    simulator._server.serve_forever()
+
+
+def start_simulator(latency_mean: float = 0.0):
+    """
+    Arranca el simulador en otro proceso para que su CPU no cuente como CPU del cliente.
+
+    :return: (proceso, base_url, api_key, api_secret).
+    """
+    context = multiprocessing.get_context("spawn")
+    queue = context.Queue()
+    process = context.Process(target=_serve_simulator, args=(queue, latency_mean), daemon=True)
+    process.start()
+    base_url, api_key, api_secret = queue.get(timeout=30)
+    return process, base_url, api_key, api_secret
+
+
+def _print_report(report: Dict[str, Any]):
+    print(f"fiskaly-bench {report['sdk_version']}: {report['concurrency']} hilos, {report['duration_s']}s")
+    header = f"{'endpoint':<40} {'n':>7} {'rps':>8} {'err%':>6} {'p50':>8} {'p95':>8} {'p99':>8} {'max':>8}"
+    print(header)
+    for ep in report["endpoints"]:
+        print(f"{ep['endpoint']:<40} {ep['count']:>7} {ep['rps']:>8.1f} {ep['error_rate'] * 100:>6.2f} "
+              f"{ep['p50_ms']:>8.1f} {ep['p95_ms']:>8.1f} {ep['p99_ms']:>8.1f} {ep['max_ms']:>8.1f}")
+    print(f"total: {report['requests']} peticiones, {report['rps']} req/s, errores {report['error_rate'] * 100:.2f}%, "
+          f"CPU cliente {report['cpu_ms_per_request']} ms/petición")
+    print("operaciones: " + ", ".join(f"{op['operation']}={op['count']} ({op['errors']} errores)" for op in report["operations"]))
+    for op in report["operations"]:
+        if op["first_error"]:
+            print(f"  primer error en {op['operation']}: {op['first_error']}")
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(prog="fiskaly-bench", description="Generador de carga para Fiskaly SIGN ES")
+    parser.add_argument("--base-url", help="URL base de la API (por defecto, la de producción)")
+    parser.add_argument("--api-key", default=os.environ.get("FISKALY_API_KEY"), help="API key (o FISKALY_API_KEY)")
+    parser.add_argument("--api-secret", default=os.environ.get("FISKALY_API_SECRET"), help="API secret (o FISKALY_API_SECRET)")
+    parser.add_argument("--simulator", action="store_true", help="Arranca el simulador local y lanza la carga contra él")
+    parser.add_argument("--simulator-latency", type=float, default=0.02, help="Latencia media del simulador, en segundos")
+    parser.add_argument("--client-id", action="append", default=[], help="Client (dispositivo) a usar; repetible")
+    parser.add_argument("--setup-clients", type=int, default=0, help="Crea N clients antes de empezar (10 con --simulator)")
+    parser.add_argument("--mix", default=DEFAULT_MIX, help=f"Pesos por operación (por defecto {DEFAULT_MIX})")
+    parser.add_argument("--concurrency", type=int, default=8, help="Hilos concurrentes")
+    parser.add_argument("--duration", type=float, default=30.0, help="Duración en segundos")
+    parser.add_argument("--export-timeout", type=float, default=120.0, help="Espera máxima de cada export")
+    parser.add_argument("--json", dest="json_path", help="Guarda el informe JSON en este fichero")
+    args = parser.parse_args(argv)
+
+    try:
+        mix = parse_mix(args.mix)
+    except ValueError as e:
+        parser.error(str(e))
+
+    process = None
+    base_url, api_key, api_secret = args.base_url, args.api_key, args.api_secret
+    setup_clients = args.setup_clients
+    if args.simulator:
+        process, base_url, api_key, api_secret = start_simulator(args.simulator_latency)
+        setup_clients = setup_clients or 10
+    if not api_key or not api_secret:
+        parser.error("Faltan credenciales: usa --api-key/--api-secret, FISKALY_API_KEY/FISKALY_API_SECRET o --simulator")
+
+    options = {"pool_maxsize": max(args.concurrency, 1)}
+    if base_url:
+        options["base_url"] = base_url
+    client = FiskalyClient(api_key, api_secret, **options)
+    try:
+        client.authenticate()
+        client_ids = list(args.client_id)
+        if setup_clients:
+            client_ids += prepare(client, setup_clients)
+        if not client_ids and (mix.get("create") or mix.get("cancel")):
+            parser.error("La emisión necesita al menos un --client-id o --setup-clients")
+        ctx = LoadContext(client, client_ids, export_timeout=args.export_timeout)
+        report = run_load(ctx, mix, concurrency=args.concurrency, duration=args.duration)
+    finally:
+        client.close()
+        if process is not None:
+            process.terminate()
+
+    _print_report(report)
+    if args.json_path:
+        with open(args.json_path, "w", encoding="utf-8") as f:
+            json.dump(report, f, indent=2)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
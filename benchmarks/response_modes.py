@@ -0,0 +1,99 @@
+# fiskaly_sdk/benchmarks/response_modes.py
+
+"""
+Coste por elemento de cada modo de respuesta en listados grandes.
+
+Mide `InvoicesAPI.list_page` sobre una página sintética (sin red: la petición se
+sustituye por el JSON ya decodificado) en tres escenarios: solo recibir la
+página, leer un campo de cada elemento y leer un campo de un único elemento.
+
+Uso:
+    python -m fiskaly_sdk.benchmarks.response_modes --items 1000 --repeat 20
+"""
+
+import argparse
+import json
+import time
+from typing import Any, Callable, Dict, List
+
+from ..client import FiskalyClient
+from ..responses import ResponseMode, split_page
+
+
+def make_page(items: int) -> Dict[str, Any]:
+    """
+    Genera una página de facturas con la forma de `GET /clients/{id}/invoices`.
+    """
+    return {
+        "results": [
+            {
+                "content": {"id": f"invoice-{i}", "state": "ISSUED"},
+                "metadata": {"order": str(i), "store": "benchmark"},
+            }
+            for i in range(items)
+        ],
+        "pagination": {"limit": items, "token": "next-page"},
+    }
+
+
+def _state(item: Any) -> str:
+    return item["content"]["state"] if isinstance(item, dict) else item.content.state
+
+
+def _scenarios() -> Dict[str, Callable[[List[Any]], None]]:
+    return {
+        "receive": lambda items: None,
+        "read_all": lambda items: [_state(item) for item in items],
+        "read_one": lambda items: _state(items[0]),
+    }
+
+
+def run(items: int = 1000, repeat: int = 20) -> List[Dict[str, Any]]:
+    """
+    Ejecuta el benchmark y devuelve una fila por (modo, escenario).
+
+    :param items: Elementos por página.
+    :param repeat: Repeticiones; se informa la mejor.
+    :return: Lista de dicts con mode, scenario, items y us_per_item.
+    """
+    page = make_page(items)
+    rows = []
+    for mode in ResponseMode:
+        client = FiskalyClient(api_key="bench", api_secret="bench", response_mode=mode, token_background_refresh=False)
+        # Sin red: la "respuesta" es siempre el mismo JSON ya decodificado.
+        client.request = lambda method, endpoint, **kwargs: page
+        for scenario, consume in _scenarios().items():
+            best = float("inf")
+            for _ in range(repeat):
+                started = time.perf_counter()
+                results, _token = split_page(client.invoices.list_page("bench-client"))
+                consume(results)
+                best = min(best, time.perf_counter() - started)
+            rows.append({
+                "mode": mode.value,
+                "scenario": scenario,
+                "items": items,
+                "us_per_item": round(best / items * 1e6, 3),
+            })
+        client.close()
+    return rows
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--items", type=int, default=1000, help="Elementos por página")
+    parser.add_argument("--repeat", type=int, default=20, help="Repeticiones por medición")
+    parser.add_argument("--json", action="store_true", help="Salida en JSON")
+    args = parser.parse_args(argv)
+
+    rows = run(args.items, args.repeat)
+    if args.json:
+        print(json.dumps(rows, indent=2))
+        return
+    print(f"{'modo':<10} {'escenario':<10} {'us/elemento':>12}")
+    for row in rows:
+        print(f"{row['mode']:<10} {row['scenario']:<10} {row['us_per_item']:>12.3f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,45 @@
+# fiskaly_sdk/benchmarks/standin.py
+
+"""
+Transporte en memoria para los benchmarks de overhead y memoria.
+
+`CannedAdapter` responde sin sockets, de modo que se mide solo el coste del SDK
+(cabeceras, reintentos, JSON, Pydantic...). Las mediciones con red (throughput,
+transportes) usan el simulador local sin latencia (ver `fixtures.start_simulator`).
+"""
+
+from urllib.parse import urlsplit
+
+import requests
+from requests.adapters import BaseAdapter
+from requests.structures import CaseInsensitiveDict
+
+from .fixtures import canned_response
+
+BASE_PATH = "/api/v1"
+
+
+def _route(url: str) -> str:
+    path = urlsplit(url).path
+    return path[len(BASE_PATH):] if path.startswith(BASE_PATH) else path
+
+
+class CannedAdapter(BaseAdapter):
+    """
+    Adaptador de requests que responde desde `canned_response` sin tocar la red.
+    """
+
+    def send(self, request, stream=False, timeout=None, verify=True, cert=None, proxies=None):
+        status, content_type, body = canned_response(request.method, _route(request.url))
+        resp = requests.Response()
+        resp.status_code = status
+        resp.headers = CaseInsensitiveDict({"Content-Type": content_type, "Content-Length": str(len(body))})
+        resp._content = body
+        resp._content_consumed = True
+        resp.encoding = "utf-8"
+        resp.url = request.url
+        resp.request = request
+        return resp
+
+    def close(self):
+        pass
@@ -0,0 +1,96 @@
+# fiskaly_sdk/benchmarks/startup.py
+
+"""
+Benchmark de arranque del SDK Fiskaly SIGN ES.
+
+Mide, en un intérprete nuevo cada vez (como un arranque en frío):
+
+  - import: `import fiskaly_sdk`.
+  - client_import: primer acceso a `fiskaly_sdk.FiskalyClient` (carga requests).
+  - construct: `FiskalyClient(...)`.
+  - first_resource: primer acceso a `client.invoices` (recurso y sus modelos).
+
+    python -m fiskaly_sdk.benchmarks.startup --repeat 10
+"""
+
+import argparse
+import json
+import os
+import statistics
+import subprocess
+import sys
+from typing import Any, Dict, List
+
+STEPS = ("import", "client_import", "construct", "first_resource")
+
+_SCRIPT = """
+import json, sys, time
+t0 = time.perf_counter()
+import fiskaly_sdk
+t1 = time.perf_counter()
+FiskalyClient = fiskaly_sdk.FiskalyClient
+t2 = time.perf_counter()
+client = FiskalyClient("bench", "bench", token_background_refresh=False)
+t3 = time.perf_counter()
+modules = sorted(sys.modules)
+client.invoices
+t4 = time.perf_counter()
+print(json.dumps({
+    "import": t1 - t0,
+    "client_import": t2 - t1,
+    "construct": t3 - t2,
+    "first_resource": t4 - t3,
+    "modules": modules,
+}))
+"""
+
+
+def _run_once() -> Dict[str, Any]:
+    env = dict(os.environ)
+    env["PYTHONPATH"] = os.pathsep.join(path for path in sys.path if path)
+    out = subprocess.run(
+        [sys.executable, "-c", _SCRIPT],
+        check=True,
+        stdout=subprocess.PIPE,
+        env=env,
+    ).stdout
+    return json.loads(out.decode())
+
+
+def measure_startup(repeat: int = 5) -> List[Dict[str, Any]]:
+    """
+    Mide el arranque en `repeat` intérpretes nuevos.
+
+    :return: Una fila por paso con median_ms y max_ms, más el número de módulos
+        del SDK cargados tras crear el cliente (fila "construct").
+    """
+    runs = [_run_once() for _ in range(repeat)]
+    rows = []
+    for step in STEPS:
+        samples = [run[step] * 1000 for run in runs]
+        row = {"case": step, "runs": repeat, "median_ms": round(statistics.median(samples), 3), "max_ms": round(max(samples), 3)}
+        if step == "construct":
+            row["sdk_modules"] = sum(1 for name in runs[0]["modules"] if name.startswith("fiskaly_sdk"))
+        rows.append(row)
+    return rows
+
+
+def loaded_modules() -> List[str]:
+    """
+    Módulos cargados en un intérprete nuevo tras importar el SDK y crear un cliente.
+    """
+    return _run_once()["modules"]
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description="Benchmark de arranque del SDK Fiskaly SIGN ES")
+    parser.add_argument("--repeat", type=int, default=5, help="Intérpretes nuevos a medir")
+    args = parser.parse_args(argv)
+    print(f"{'paso':<16} {'mediana_ms':>12} {'max_ms':>10}")
+    for row in measure_startup(args.repeat):
+        print(f"{row['case']:<16} {row['median_ms']:>12.2f} {row['max_ms']:>10.2f}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,341 @@
+# fiskaly_sdk/benchmarks/suite.py
+
+"""
+Suite de benchmarks offline del SDK Fiskaly SIGN ES.
+
+Mide, para cada método de recurso de `fixtures.CASES`:
+
+  - overhead: coste por llamada del SDK con un transporte en memoria (sin red).
+  - allocations: memoria asignada por llamada (pico y retenida, con tracemalloc).
+  - throughput: llamadas por segundo contra el simulador local sin latencia a
+    varios niveles de concurrencia (hilos compartiendo un FiskalyClient).
+  - startup: importación y construcción del cliente en un intérprete nuevo
+    (ver `startup.py`).
+
+Los resultados se guardan en JSON para comparar versiones:
+
+    python -m fiskaly_sdk.benchmarks.suite --output bench-0.1.0.json
+    python -m fiskaly_sdk.benchmarks.suite --compare bench-0.1.0.json --threshold 0.15
+
+Con `--compare` el proceso termina con código 1 si alguna métrica empeora más
+que el umbral indicado.
+"""
+
+import argparse
+import json
+import platform
+import statistics
+import sys
+import threading
+import time
+import tracemalloc
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timezone
+from typing import Any, Dict, List, Optional, Sequence
+
+from ..client import FiskalyClient
+from ..version import __version__
+from .fixtures import Case, select_cases, start_simulator
+from .standin import CannedAdapter
+from .startup import measure_startup
+
+SCHEMA_VERSION = 1
+DEFAULT_THROUGHPUT_CASES = ["invoices.create", "invoices.get", "invoice_search.search_page"]
+
+# Métrica -> True si un valor mayor es peor.
+_METRICS = {
+    "overhead": {"mean_us": True, "p95_us": True},
+    "allocations": {"peak_kib": True},
+    "throughput": {"rps": False},
+    "startup": {"median_ms": True},
+}
+
+
+def make_client(base_url: str = "http://bench.invalid/api/v1", bearer_token: str = "bench-token", **options) -> FiskalyClient:
+    """
+    Crea un FiskalyClient ya autenticado para los benchmarks.
+
+    :param base_url: URL base de la API.
+    :param bearer_token: Token Bearer que se envía en cada petición.
+    """
+    options.setdefault("token_background_refresh", False)
+    client = FiskalyClient(api_key="bench", api_secret="bench", base_url=base_url, **options)
+    client.set_bearer_token(bearer_token, expires_at=int(time.time()) + 24 * 3600)
+    return client
+
+
+def _in_memory_client(**options) -> FiskalyClient:
+    client = make_client(**options)
+    client.session.mount(client.config.base_url, CannedAdapter())
+    return client
+
+
+def measure_overhead(cases: Sequence[Case], iterations: int = 500, warmup: int = 50) -> List[Dict[str, Any]]:
+    """
+    Coste por llamada del SDK con un transporte en memoria.
+
+    :return: Una fila por caso con mean_us, p50_us y p95_us.
+    """
+    client = _in_memory_client()
+    rows = []
+    try:
+        for name, call in cases:
+            for _ in range(warmup):
+                call(client)
+            samples = []
+            for _ in range(iterations):
+                started = time.perf_counter()
+                call(client)
+                samples.append(time.perf_counter() - started)
+            samples.sort()
+            rows.append({
+                "case": name,
+                "calls": iterations,
+                "mean_us": round(statistics.mean(samples) * 1e6, 2),
+                "p50_us": round(samples[len(samples) // 2] * 1e6, 2),
+                "p95_us": round(samples[min(len(samples) - 1, int(len(samples) * 0.95))] * 1e6, 2),
+            })
+    finally:
+        client.close()
+    return rows
+
+
+def measure_allocations(cases: Sequence[Case], iterations: int = 50) -> List[Dict[str, Any]]:
+    """
+    Memoria asignada por llamada, con tracemalloc.
+
+    CPython no expone el número de asignaciones, así que se informa el pico de
+    memoria trazada durante una llamada y los bytes que quedan retenidos tras ella.
+
+    :return: Una fila por caso con peak_kib y retained_bytes.
+    """
+    client = _in_memory_client()
+    rows = []
+    already_tracing = tracemalloc.is_tracing()
+    if not already_tracing:
+        tracemalloc.start()
+    try:
+        for name, call in cases:
+            call(client)
+            peaks = []
+            before, _ = tracemalloc.get_traced_memory()
+            for _ in range(iterations):
+                start, _ = tracemalloc.get_traced_memory()
+                if hasattr(tracemalloc, "reset_peak"):
+                    tracemalloc.reset_peak()
+                call(client)
+                _, peak = tracemalloc.get_traced_memory()
+                peaks.append(max(0, peak - start))
+            after, _ = tracemalloc.get_traced_memory()
+            rows.append({
+                "case": name,
+                "calls": iterations,
+                "peak_kib": round(statistics.median(peaks) / 1024, 2),
+                "retained_bytes": round(max(0, after - before) / iterations, 1),
+            })
+    finally:
+        if not already_tracing:
+            tracemalloc.stop()
+        client.close()
+    return rows
+
+
+def measure_throughput(
+    base_url: str,
+    cases: Sequence[Case],
+    concurrency_levels: Sequence[int] = (1, 4, 16),
+    duration: float = 2.0,
+    bearer_token: str = "bench-token",
+    **options
+) -> List[Dict[str, Any]]:
+    """
+    Llamadas por segundo contra un servidor a varios niveles de concurrencia.
+
+    :param base_url: URL base del servidor (p.ej. el de `fixtures.start_simulator`).
+    :param bearer_token: Token Bearer aceptado por el servidor.
+    :param options: Opciones extra del cliente (p.ej. transport).
+    :return: Una fila por (caso, concurrencia) con rps, mean_ms y errors.
+    """
+    rows = []
+    for name, call in cases:
+        for concurrency in concurrency_levels:
+            client = make_client(base_url, bearer_token, pool_maxsize=max(concurrency, 1), retry_policy=None, **options)
+            lock = threading.Lock()
+            totals = {"calls": 0, "errors": 0, "seconds": 0.0}
+            deadline = time.perf_counter() + duration
+
+            def worker():
+                calls = errors = 0
+                busy = 0.0
+                while time.perf_counter() < deadline:
+                    started = time.perf_counter()
+                    try:
+                        call(client)
+                    except Exception:
+                        errors += 1
+                    busy += time.perf_counter() - started
+                    calls += 1
+                with lock:
+                    totals["calls"] += calls
+                    totals["errors"] += errors
+                    totals["seconds"] += busy
+
+            started = time.perf_counter()
+            with ThreadPoolExecutor(max_workers=concurrency) as executor:
+                for _ in range(concurrency):
+                    executor.submit(worker)
+            elapsed = time.perf_counter() - started
+            client.close()
+            calls = totals["calls"]
+            rows.append({
+                "case": name,
+                "concurrency": concurrency,
+                "calls": calls,
+                "errors": totals["errors"],
+                "rps": round(calls / elapsed, 1) if elapsed else 0.0,
+                "mean_ms": round(totals["seconds"] / calls * 1000, 3) if calls else None,
+            })
+    return rows
+
+
+def run_suite(
+    cases: Optional[List[str]] = None,
+    iterations: int = 500,
+    concurrency_levels: Sequence[int] = (1, 4, 16),
+    duration: float = 2.0,
+    throughput_cases: Optional[List[str]] = None,
+    base_url: Optional[str] = None,
+    startup_repeat: int = 5,
+) -> Dict[str, Any]:
+    """
+    Ejecuta la suite completa y devuelve el informe.
+
+    :param cases: Casos (o prefijos) a medir; None para todos.
+    :param iterations: Llamadas por caso para overhead (allocations usa una décima parte).
+    :param concurrency_levels: Niveles de concurrencia para throughput.
+    :param duration: Segundos por medición de throughput (0 para omitirla).
+    :param throughput_cases: Casos para throughput (por defecto, emisión, lectura y búsqueda).
+    :param base_url: Servidor para throughput; None arranca el simulador local sin latencia.
+    :param startup_repeat: Intérpretes nuevos para medir el arranque (0 para omitirlo).
+    :return: Informe serializable a JSON.
+    """
+    selected = select_cases(cases)
+    report = {
+        "schema": SCHEMA_VERSION,
+        "sdk_version": __version__,
+        "python": platform.python_version(),
+        "implementation": platform.python_implementation(),
+        "platform": platform.platform(),
+        "timestamp": datetime.now(timezone.utc).isoformat(),
+        "overhead": measure_overhead(selected, iterations=iterations, warmup=max(1, iterations // 10)),
+        "allocations": measure_allocations(selected, iterations=max(1, iterations // 10)),
+        "throughput": [],
+        "startup": measure_startup(startup_repeat) if startup_repeat > 0 else [],
+    }
+    if duration > 0:
+        throughput = select_cases(throughput_cases or DEFAULT_THROUGHPUT_CASES)
+        if base_url is not None:
+            report["throughput"] = measure_throughput(base_url, throughput, concurrency_levels, duration)
+        else:
+            sim, bearer = start_simulator()
+            try:
+                report["throughput"] = measure_throughput(sim.base_url, throughput, concurrency_levels, duration, bearer)
+            finally:
+                sim.stop()
+    return report
+
+
+def _row_key(row: Dict[str, Any]) -> str:
+    return row["case"] if "concurrency" not in row else f"{row['case']}@{row['concurrency']}"
+
+
+def compare(baseline: Dict[str, Any], current: Dict[str, Any], threshold: float = 0.10) -> List[Dict[str, Any]]:
+    """
+    Compara dos informes y devuelve las métricas que empeoran más que `threshold`.
+
+    :param baseline: Informe de referencia.
+    :param current: Informe actual.
+    :param threshold: Empeoramiento relativo tolerado (0.10 = 10%).
+    :return: Lista de regresiones (section, key, metric, baseline, current, change).
+    """
+    regressions = []
+    for section, metrics in _METRICS.items():
+        previous = {_row_key(row): row for row in baseline.get(section, [])}
+        for row in current.get(section, []):
+            old = previous.get(_row_key(row))
+            if old is None:
+                continue
+            for metric, higher_is_worse in metrics.items():
+                before, after = old.get(metric), row.get(metric)
+                if not before or after is None:
+                    continue
+                change = (after - before) / before
+                if (change if higher_is_worse else -change) > threshold:
+                    regressions.append({
+                        "section": section,
+                        "key": _row_key(row),
+                        "metric": metric,
+                        "baseline": before,
+                        "current": after,
+                        "change": round(change, 4),
+                    })
+    return regressions
+
+
+def _print_report(report: Dict[str, Any]):
+    print(f"fiskaly_sdk {report['sdk_version']} - Python {report['python']}")
+    print(f"\n{'caso':<34} {'mean_us':>10} {'p95_us':>10} {'peak_kib':>10}")
+    peaks = {row["case"]: row["peak_kib"] for row in report["allocations"]}
+    for row in report["overhead"]:
+        print(f"{row['case']:<34} {row['mean_us']:>10.1f} {row['p95_us']:>10.1f} {peaks.get(row['case'], 0):>10.1f}")
+    if report["throughput"]:
+        print(f"\n{'caso':<34} {'hilos':>6} {'rps':>10} {'mean_ms':>10} {'errores':>8}")
+        for row in report["throughput"]:
+            print(f"{row['case']:<34} {row['concurrency']:>6} {row['rps']:>10.1f} {row['mean_ms'] or 0:>10.3f} {row['errors']:>8}")
+    if report.get("startup"):
+        print(f"\n{'arranque':<34} {'mediana_ms':>10} {'max_ms':>10}")
+        for row in report["startup"]:
+            print(f"{row['case']:<34} {row['median_ms']:>10.2f} {row['max_ms']:>10.2f}")
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description="Benchmarks offline del SDK Fiskaly SIGN ES")
+    parser.add_argument("--cases", nargs="*", help="Casos o prefijos a medir (p.ej. invoices clients.get)")
+    parser.add_argument("--iterations", type=int, default=500, help="Llamadas por caso para overhead")
+    parser.add_argument("--concurrency", default="1,4,16", help="Niveles de concurrencia separados por comas")
+    parser.add_argument("--duration", type=float, default=2.0, help="Segundos por medición de throughput (0 = omitir)")
+    parser.add_argument("--throughput-cases", nargs="*", help="Casos para throughput")
+    parser.add_argument("--base-url", help="Servidor para throughput (por defecto, el simulador local)")
+    parser.add_argument("--startup-repeat", type=int, default=5, help="Intérpretes nuevos para medir el arranque (0 = omitir)")
+    parser.add_argument("--output", help="Guarda el informe JSON en este fichero")
+    parser.add_argument("--compare", help="Informe JSON de referencia con el que comparar")
+    parser.add_argument("--threshold", type=float, default=0.10, help="Empeoramiento tolerado al comparar (0.10 = 10%%)")
+    args = parser.parse_args(argv)
+
+    report = run_suite(
+        cases=args.cases,
+        iterations=args.iterations,
+        concurrency_levels=[int(level) for level in args.concurrency.split(",") if level],
+        duration=args.duration,
+        throughput_cases=args.throughput_cases,
+        base_url=args.base_url,
+        startup_repeat=args.startup_repeat,
+    )
+    _print_report(report)
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as f:
+            json.dump(report, f, indent=2)
+
+    if args.compare:
+        with open(args.compare, encoding="utf-8") as f:
+            baseline = json.load(f)
+        regressions = compare(baseline, report, args.threshold)
+        for item in regressions:
+            print(f"REGRESIÓN {item['section']} {item['key']} {item['metric']}: "
+                  f"{item['baseline']} -> {item['current']} ({item['change']:+.1%})")
+        return 1 if regressions else 0
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
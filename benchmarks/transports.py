@@ -0,0 +1,93 @@
+# fiskaly_sdk/benchmarks/transports.py
+
+"""
+Comparativa de los transportes HTTP del cliente síncrono.
+
+Para cada transporte disponible ("requests", "urllib3" y, si están instalados
+httpx y h2, "http2") mide llamadas por segundo y latencia media de un caso (por
+defecto `invoices.create`, un PUT) contra el simulador local sin latencia, con
+1, 16 y 256 hilos compartiendo un cliente.
+
+El simulador habla HTTP/1.1 sin TLS, así que aquí "http2" mide httpx en
+HTTP/1.1: la multiplexación solo aparece contra un servidor HTTPS con HTTP/2
+(como la API real).
+
+Uso:
+    python -m fiskaly_sdk.benchmarks.transports --duration 2 --concurrency 1 16 256
+"""
+
+import argparse
+import json
+from typing import Any, Dict, List, Optional, Sequence
+
+from ..transport import TRANSPORTS
+from .fixtures import select_cases, start_simulator
+from .suite import measure_throughput
+
+DEFAULT_CONCURRENCY = (1, 16, 256)
+
+
+def available_transports() -> List[str]:
+    """
+    Transportes que se pueden crear en este entorno.
+    """
+    names = []
+    for name in TRANSPORTS:
+        if name == "http2":
+            try:
+                import h2  # noqa: F401
+                import httpx  # noqa: F401
+            except ImportError:
+                continue
+        names.append(name)
+    return names
+
+
+def run(
+    transports: Optional[Sequence[str]] = None,
+    concurrency_levels: Sequence[int] = DEFAULT_CONCURRENCY,
+    duration: float = 2.0,
+    case: str = "invoices.create",
+) -> List[Dict[str, Any]]:
+    """
+    Ejecuta la comparativa.
+
+    :param transports: Transportes a medir (por defecto, todos los disponibles).
+    :param concurrency_levels: Hilos concurrentes de cada medición.
+    :param duration: Segundos por medición.
+    :param case: Caso de `fixtures.CASES` a repetir.
+    :return: Una fila por (transporte, concurrencia) con rps, mean_ms y errors.
+    """
+    cases = select_cases([case])
+    rows = []
+    sim, bearer = start_simulator()
+    try:
+        for name in transports or available_transports():
+            for row in measure_throughput(sim.base_url, cases, concurrency_levels, duration, bearer, transport=name):
+                rows.append({"transport": name, **row})
+    finally:
+        sim.stop()
+    return rows
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--transports", nargs="*", help="Transportes a medir (por defecto, todos los disponibles)")
+    parser.add_argument("--concurrency", nargs="*", type=int, default=list(DEFAULT_CONCURRENCY), help="Niveles de concurrencia")
+    parser.add_argument("--duration", type=float, default=2.0, help="Segundos por medición")
+    parser.add_argument("--case", default="invoices.create", help="Caso de benchmark a repetir")
+    parser.add_argument("--json", action="store_true", help="Salida en JSON")
+    args = parser.parse_args(argv)
+
+    rows = run(args.transports, args.concurrency, args.duration, args.case)
+    if args.json:
+        print(json.dumps(rows, indent=2))
+        return
+    print(f"{'transporte':<10} {'hilos':>6} {'rps':>10} {'media_ms':>10} {'errores':>8}")
+    for row in rows:
+        mean = f"{row['mean_ms']:.3f}" if row["mean_ms"] is not None else "-"
+        print(f"{row['transport']:<10} {row['concurrency']:>6} {row['rps']:>10.1f} {mean:>10} {row['errors']:>8}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,200 @@
+# fiskaly_sdk/bulk.py
+
+"""
+Ejecución concurrente de operaciones masivas del SDK Fiskaly SIGN ES.
+
+Las operaciones se agrupan en "carriles" (p.ej. un carril por client_id): los
+elementos de un mismo carril se ejecutan de uno en uno y en el orden de entrada,
+mientras que carriles distintos avanzan en paralelo hasta el límite indicado.
+La entrada se consume de forma perezosa y los resultados se devuelven a medida
+que terminan, sin abortar el lote por un fallo individual.
+"""
+
+import asyncio
+from collections import deque
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+from dataclasses import dataclass
+from typing import (
+    Any,
+    AsyncIterator,
+    Awaitable,
+    Callable,
+    Deque,
+    Dict,
+    Hashable,
+    Iterable,
+    Iterator,
+    Optional,
+    Tuple,
+    TypeVar,
+)
+
+T = TypeVar("T")
+
+
+@dataclass
+class BulkResult:
+    """
+    Resultado de un elemento de una operación masiva.
+    """
+    index: int
+    client_id: str
+    invoice_id: str
+    response: Optional[Any] = None
+    error: Optional[Exception] = None
+
+    @property
+    def ok(self) -> bool:
+        return self.error is None
+
+
+@dataclass
+class XMLBulkResult:
+    """
+    Resultado de la descarga de un XML en `InvoiceXMLAPI.get_many`.
+
+    `skipped` indica que la entrada ya estaba presente y no se descargó.
+    """
+    index: int
+    client_id: str
+    invoice_id: str
+    name: Optional[str] = None
+    skipped: bool = False
+    download: Optional[Any] = None
+    error: Optional[Exception] = None
+
+    @property
+    def ok(self) -> bool:
+        return self.error is None
+
+
+class _Lanes:
+    """
+    Cola de elementos pendientes agrupados por carril.
+
+    Un carril está "ocupado" mientras uno de sus elementos se ejecuta; solo los
+    carriles libres con elementos pendientes están listos para arrancar.
+    """
+
+    def __init__(self, lane_of: Callable[[Any], Hashable]):
+        self._lane_of = lane_of
+        self._pending: Dict[Hashable, Deque[Tuple[int, Any]]] = {}
+        self._busy = set()
+        self._ready: Deque[Hashable] = deque()
+        self.buffered = 0
+
+    def add(self, index: int, item: Any):
+        lane = self._lane_of(item)
+        queue = self._pending.setdefault(lane, deque())
+        if not queue and lane not in self._busy:
+            self._ready.append(lane)
+        queue.append((index, item))
+        self.buffered += 1
+
+    def has_ready(self) -> bool:
+        return bool(self._ready)
+
+    def start_next(self) -> Tuple[int, Any, Hashable]:
+        lane = self._ready.popleft()
+        index, item = self._pending[lane].popleft()
+        self._busy.add(lane)
+        return index, item, lane
+
+    def finish(self, lane: Hashable):
+        self._busy.discard(lane)
+        self.buffered -= 1
+        if self._pending[lane]:
+            self._ready.append(lane)
+        else:
+            del self._pending[lane]
+
+
+def run_in_lanes(
+    items: Iterable[T],
+    lane_of: Callable[[T], Hashable],
+    func: Callable[[T], Any],
+    max_workers: int = 8,
+    max_buffered: Optional[int] = None,
+) -> Iterator[Tuple[int, T, Any, Optional[Exception]]]:
+    """
+    Ejecuta `func` sobre cada elemento con hilos, respetando el orden dentro de cada carril.
+
+    :param items: Elementos a procesar (se consumen de forma perezosa).
+    :param lane_of: Función que devuelve el carril de un elemento.
+    :param func: Operación a ejecutar por elemento.
+    :param max_workers: Número máximo de operaciones en paralelo.
+    :param max_buffered: Máximo de elementos leídos y no terminados (por defecto 4 * max_workers).
+    :return: Iterador de (índice, elemento, resultado, error) en orden de finalización.
+    """
+    max_buffered = max_buffered or max_workers * 4
+    source = enumerate(items)
+    exhausted = False
+    lanes = _Lanes(lane_of)
+    running = {}
+    executor = ThreadPoolExecutor(max_workers=max_workers)
+    try:
+        while True:
+            while not exhausted and lanes.buffered < max_buffered:
+                try:
+                    index, item = next(source)
+                except StopIteration:
+                    exhausted = True
+                    break
+                lanes.add(index, item)
+            while lanes.has_ready() and len(running) < max_workers:
+                index, item, lane = lanes.start_next()
+                running[executor.submit(func, item)] = (index, item, lane)
+            if not running:
+                return
+            done, _ = wait(running, return_when=FIRST_COMPLETED)
+            for future in done:
+                index, item, lane = running.pop(future)
+                lanes.finish(lane)
+                error = future.exception()
+                yield index, item, None if error else future.result(), error
+    finally:
+        for future in running:
+            future.cancel()
+        executor.shutdown(wait=False)
+
+
+async def arun_in_lanes(
+    items: Iterable[T],
+    lane_of: Callable[[T], Hashable],
+    func: Callable[[T], Awaitable[Any]],
+    max_concurrency: int = 64,
+    max_buffered: Optional[int] = None,
+) -> AsyncIterator[Tuple[int, T, Any, Optional[Exception]]]:
+    """
+    Versión asyncio de `run_in_lanes`: `func` es una corrutina.
+
+    :return: Iterador asíncrono de (índice, elemento, resultado, error) en orden de finalización.
+    """
+    max_buffered = max_buffered or max_concurrency * 4
+    source = enumerate(items)
+    exhausted = False
+    lanes = _Lanes(lane_of)
+    running = {}
+    try:
+        while True:
+            while not exhausted and lanes.buffered < max_buffered:
+                try:
+                    index, item = next(source)
+                except StopIteration:
+                    exhausted = True
+                    break
+                lanes.add(index, item)
+            while lanes.has_ready() and len(running) < max_concurrency:
+                index, item, lane = lanes.start_next()
+                running[asyncio.ensure_future(func(item))] = (index, item, lane)
+            if not running:
+                return
+            done, _ = await asyncio.wait(running, return_when=asyncio.FIRST_COMPLETED)
+            for task in done:
+                index, item, lane = running.pop(task)
+                lanes.finish(lane)
+                error = task.exception()
+                yield index, item, None if error else task.result(), error
+    finally:
+        for task in running:
+            task.cancel()
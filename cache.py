@@ -0,0 +1,195 @@
+# fiskaly_sdk/cache.py
+
+"""
+Caché de respuestas (read-through) del SDK Fiskaly SIGN ES.
+
+Pensada para recursos que cambian pocas veces al año (taxpayer, software,
+signers, clients y acuerdo del taxpayer) y se consultan en cada venta. Las
+entradas caducan tras `ttl` segundos y se expulsan por LRU al superar
+`max_entries`. Una entrada caducada con `ETag` o `Last-Modified` se revalida con
+`If-None-Match`/`If-Modified-Since`: si el servidor responde 304 se reutiliza
+sin volver a descargarla. Cualquier PUT/PATCH/POST del mismo cliente sobre un
+recurso invalida sus entradas.
+
+Cada acierto devuelve una copia del JSON cacheado: en los modos "raw" y "lazy"
+el llamador recibe dicts y listas que puede modificar sin alterar la caché.
+"""
+
+import re
+import threading
+import time
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Any, Dict, Iterable, Mapping, Optional, Pattern, Tuple
+
+from .coalesce import RequestKey, request_key
+from .utils import copy_json
+
+# GET cacheables por defecto: recursos que cambian muy poco.
+DEFAULT_CACHEABLE = (
+    r"^/taxpayer$",
+    r"^/taxpayer/agreement$",
+    r"^/software$",
+    r"^/signers/[^/]+$",
+    r"^/clients/[^/]+$",
+)
+
+CacheKey = RequestKey
+
+
+@dataclass
+class CacheEntry:
+    """
+    Respuesta cacheada con sus validadores HTTP.
+    """
+    value: Any
+    expires_at: float
+    etag: Optional[str] = None
+    last_modified: Optional[str] = None
+
+    def get(self) -> Any:
+        """
+        Copia del valor cacheado, que el llamador puede modificar libremente.
+        """
+        return copy_json(self.value)
+
+    @property
+    def fresh(self) -> bool:
+        return time.monotonic() < self.expires_at
+
+    def validators(self) -> Dict[str, str]:
+        """
+        Cabeceras condicionales para revalidar la entrada.
+        """
+        headers = {}
+        if self.etag:
+            headers["If-None-Match"] = self.etag
+        if self.last_modified:
+            headers["If-Modified-Since"] = self.last_modified
+        return headers
+
+
+@dataclass
+class CacheStats:
+    """
+    Contadores de la caché.
+    """
+    hits: int
+    misses: int
+    revalidated: int
+    evictions: int
+    invalidations: int
+    size: int
+
+
+class ResponseCache:
+    """
+    Caché LRU con TTL para respuestas GET de recursos poco cambiantes.
+
+    Se activa pasando una instancia en `response_cache` al crear el cliente; se
+    puede compartir entre varios clientes de la misma organización.
+    """
+
+    def __init__(self, ttl: float = 300.0, max_entries: int = 1024, endpoints: Iterable[str] = DEFAULT_CACHEABLE):
+        """
+        :param ttl: Segundos que una respuesta se sirve sin consultar a la API.
+        :param max_entries: Máximo de entradas (se expulsa la usada hace más tiempo).
+        :param endpoints: Expresiones regulares de los endpoints GET cacheables.
+        """
+        self.ttl = ttl
+        self.max_entries = max_entries
+        self._patterns: Tuple[Pattern[str], ...] = tuple(re.compile(pattern) for pattern in endpoints)
+        self._lock = threading.Lock()
+        self._entries: "OrderedDict[CacheKey, CacheEntry]" = OrderedDict()
+        self._hits = 0
+        self._misses = 0
+        self._revalidated = 0
+        self._evictions = 0
+        self._invalidations = 0
+
+    def key(self, endpoint: str, params: Optional[Mapping[str, Any]] = None) -> Optional[CacheKey]:
+        """
+        Clave de caché de un GET, o None si el endpoint no es cacheable.
+        """
+        if not any(pattern.match(endpoint) for pattern in self._patterns):
+            return None
+        return request_key(endpoint, params)
+
+    def lookup(self, key: CacheKey) -> Optional[CacheEntry]:
+        """
+        Devuelve la entrada (fresca o caducada) y cuenta el acierto o el fallo.
+        """
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                self._misses += 1
+                return None
+            self._entries.move_to_end(key)
+            if entry.fresh:
+                self._hits += 1
+            elif not (entry.etag or entry.last_modified):
+                # Caducada y sin validadores: no sirve para revalidar.
+                del self._entries[key]
+                self._misses += 1
+                return None
+            return entry
+
+    def store(self, key: CacheKey, value: Any, headers: Mapping[str, str]):
+        """
+        Guarda (una copia de) una respuesta 200 con su ETag/Last-Modified, respetando
+        `Cache-Control: no-store`.
+        """
+        if "no-store" in (headers.get("Cache-Control") or ""):
+            return
+        entry = CacheEntry(
+            value=copy_json(value),
+            expires_at=time.monotonic() + self.ttl,
+            etag=headers.get("ETag"),
+            last_modified=headers.get("Last-Modified"),
+        )
+        with self._lock:
+            self._entries[key] = entry
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+                self._evictions += 1
+
+    def revalidated(self, key: CacheKey, entry: CacheEntry, headers: Mapping[str, str]) -> Any:
+        """
+        Renueva una entrada tras un 304 Not Modified y devuelve una copia de su valor.
+        """
+        with self._lock:
+            entry.expires_at = time.monotonic() + self.ttl
+            entry.etag = headers.get("ETag") or entry.etag
+            entry.last_modified = headers.get("Last-Modified") or entry.last_modified
+            self._revalidated += 1
+            if key not in self._entries:
+                self._entries[key] = entry
+        return entry.get()
+
+    def invalidate(self, endpoint: str):
+        """
+        Elimina las entradas de un recurso y de sus subrecursos (p.ej. tras un PUT o PATCH).
+        """
+        prefix = endpoint.rstrip("/") + "/"
+        with self._lock:
+            stale = [key for key in self._entries if key[0] == endpoint or key[0].startswith(prefix)]
+            for key in stale:
+                del self._entries[key]
+            self._invalidations += len(stale)
+
+    def clear(self):
+        with self._lock:
+            self._invalidations += len(self._entries)
+            self._entries.clear()
+
+    def stats(self) -> CacheStats:
+        with self._lock:
+            return CacheStats(
+                hits=self._hits,
+                misses=self._misses,
+                revalidated=self._revalidated,
+                evictions=self._evictions,
+                invalidations=self._invalidations,
+                size=len(self._entries),
+            )
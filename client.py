@@ -5,23 +5,36 @@ Módulo principal del SDK Fiskaly SIGN ES.
 Contiene la clase FiskalyClient, punto de entrada para toda la funcionalidad.
 """
 
+import logging
+import threading
+import time
 import requests
-from typing import Optional, Dict, Any
+from concurrent.futures import ThreadPoolExecutor
+from typing import Optional, Dict, Any, List
 from .config import FiskalyConfig
+from .download import DownloadResult, stream_download
+from .codec import JsonCodec, get_codec
+from .coalesce import SingleFlight, request_key
+from .responses import parse_model, parse_page
+from .instrumentation import (
+    RequestEvent,
+    begin_request,
+    end_request,
+    record_response,
+    record_transport,
+    timed_validation,
+)
+from .lazy import LazyResource
+from .pool import PoolStats, connect_timer
+from .token_manager import TokenManager
+from .transport import Transport, build_transport
+from .utils import copy_json
 from .exceptions import (
     FiskalyApiError,
     FiskalyAuthError,
 )
-from .api.auth import AuthAPI
-from .api.taxpayer import TaxpayerAPI
-from .api.signers import SignersAPI
-from .api.clients import ClientsAPI
-from .api.invoices import InvoicesAPI
-from .api.exports import ExportsAPI
-from .api.taxpayer_agreement import TaxpayerAgreementAPI
-from .api.invoice_xml import InvoiceXMLAPI
-from .api.invoice_search import InvoiceSearchAPI
-from .api.software import SoftwareAPI
+
+logger = logging.getLogger(__name__)
 
 class FiskalyClient:
     """
@@ -29,98 +42,384 @@ class FiskalyClient:
     Proporciona acceso a todos los recursos del API, maneja autenticación y configuración.
     """
 
+    # Recursos del API: se importan y crean en el primer acceso.
+    auth = LazyResource(".api.auth", "AuthAPI")
+    taxpayer = LazyResource(".api.taxpayer", "TaxpayerAPI")
+    signers = LazyResource(".api.signers", "SignersAPI")
+    clients = LazyResource(".api.clients", "ClientsAPI")
+    invoices = LazyResource(".api.invoices", "InvoicesAPI")
+    exports = LazyResource(".api.exports", "ExportsAPI")
+    taxpayer_agreement = LazyResource(".api.taxpayer_agreement", "TaxpayerAgreementAPI")
+    invoice_xml = LazyResource(".api.invoice_xml", "InvoiceXMLAPI")
+    invoice_search = LazyResource(".api.invoice_search", "InvoiceSearchAPI")
+    software = LazyResource(".api.software", "SoftwareAPI")
+
     def __init__(
         self,
         api_key: str,
         api_secret: str,
         base_url: str = "https://sign-api.fiskaly.com/api/v1",
         timeout: int = 30,
-        verify_ssl: bool = True
+        verify_ssl: bool = True,
+        **options
     ):
+        """
+        :param api_key: API Key de Fiskaly.
+        :param api_secret: API Secret de Fiskaly.
+        :param base_url: URL base de la API.
+        :param timeout: Timeout de cada petición, en segundos.
+        :param verify_ssl: Verifica el certificado TLS del servidor.
+        :param options: Opciones avanzadas de FiskalyConfig (p.ej. token_refresh_margin).
+            Si `transport` es un objeto Transport (p.ej. el de un TenantPool), se
+            comparte: el cliente no lo cierra ni registra su pool en las métricas.
+        """
         self.config = FiskalyConfig(
             api_key=api_key,
             api_secret=api_secret,
             base_url=base_url,
-            timeout=timeout
+            timeout=timeout,
+            **options
+        )
+        self._owns_transport = isinstance(self.config.transport, str)
+        self.transport: Transport = build_transport(self.config, verify_ssl)
+        # Sesión de requests del transporte "requests" (None con otros transportes).
+        self.session: Optional[requests.Session] = getattr(self.transport, "session", None)
+        self._token_manager = TokenManager(
+            self._fetch_token,
+            refresh_margin=self.config.token_refresh_margin,
+            background=self.config.token_background_refresh,
         )
-        self.session = requests.Session()
-        self._bearer_token: Optional[str] = None
-
-        # Inicializa los recursos principales del API
-        self.auth = AuthAPI(self)
-        self.taxpayer = TaxpayerAPI(self)
-        self.signers = SignersAPI(self)
-        self.clients = ClientsAPI(self)
-        self.invoices = InvoicesAPI(self)
-        self.exports = ExportsAPI(self)
-        self.taxpayer_agreement = TaxpayerAgreementAPI(self)
-        self.invoice_xml = InvoiceXMLAPI(self)
-        self.invoice_search = InvoiceSearchAPI(self)
-        self.software = SoftwareAPI(self)
+
+        self._flights = SingleFlight(copy=copy_json) if self.config.coalesce_gets else None
+        self._codec: Optional[JsonCodec] = None
+        # Executor de las descargas anticipadas de la paginación (se crea al primer uso).
+        self._prefetch_executor: Optional[ThreadPoolExecutor] = None
+        self._prefetch_lock = threading.Lock()
+        if self.config.metrics is not None and self._owns_transport:
+            self.config.metrics.track_pool(self)
+
         self.verify_ssl = verify_ssl
 
+    def pool_stats(self) -> PoolStats:
+        """
+        Devuelve las estadísticas en vivo del pool de conexiones
+        (en uso, ociosas, creadas y reutilizadas).
+        """
+        return self.transport.stats()
+
     def authenticate(self) -> str:
         """
         Realiza la autenticación y obtiene un token Bearer.
         """
-        token = self.auth.retrieve_access_token()
-        self._bearer_token = token
-        return token
+        return self.auth.retrieve_access_token()
+
+    def _fetch_token(self):
+        """
+        Obtiene un token nuevo para el TokenManager.
+        """
+        token = self.auth.fetch_access_token()
+        return token.bearer, token.expires_at
 
     @property
     def headers(self) -> Dict[str, str]:
         """
         Obtiene los headers HTTP requeridos para las peticiones autenticadas.
+
+        Si el token está a punto de caducar, lo refresca antes (una sola vez aunque
+        lo pidan varios hilos a la vez).
+        """
+        return self._headers_for(self._current_bearer())
+
+    def _current_bearer(self) -> str:
+        """
+        Devuelve un token Bearer válido o lanza FiskalyAuthError si no hay ninguno.
         """
-        if not self._bearer_token:
+        bearer = self._token_manager.get_token()
+        if not bearer:
             raise FiskalyAuthError("El token Bearer no está presente. Llama a authenticate() primero.")
+        return bearer
+
+    @staticmethod
+    def _headers_for(bearer: str) -> Dict[str, str]:
         return {
-            "Authorization": f"Bearer {self._bearer_token}",
+            "Authorization": f"Bearer {bearer}",
             "Content-Type": "application/json",
             "Accept": "application/json"
         }
 
-    def request(self, method: str, endpoint: str, **kwargs) -> Any:
-        url = f"{self.config.base_url}{endpoint}"
-        headers = kwargs.pop("headers", {})
-        # Para login: NO uses self.headers (que requiere Bearer)
-        if endpoint == "/auth":
-            # Solo content-type y accept
-            headers = {
-                "Content-Type": "application/json",
-                "Accept": "application/json",
-                **headers
-            }
-        else:
-            headers = {**self.headers, **headers}
+    def request(self, method: str, endpoint: str, will_parse: bool = False, **kwargs) -> Any:
+        """
+        Envía una petición a la API y devuelve el cuerpo decodificado.
+
+        Los GET idénticos (mismo endpoint y parámetros) que coinciden en el tiempo
+        comparten una sola llamada HTTP si `coalesce_gets` está activo.
+        Cada llamada actualiza las métricas de `config.metrics` y, si hay
+        instrumentación, genera un RequestEvent. Un cuerpo `json=` (dict o modelo
+        Pydantic) se serializa a bytes con el codec de `config.json_codec`.
+
+        :param will_parse: El llamador convertirá la respuesta con `parse`, `parse_list`
+            o `parse_page` (siempre, aunque no haya elementos); el RequestEvent espera
+            a esa validación para incluir su duración. Si es False (por defecto) el
+            evento se emite antes de devolver.
+
+        :raises FiskalyApiError: Si la API responde con error o la conexión falla.
+        """
+        config = self.config
+        if kwargs.get("json") is not None:
+            kwargs["data"] = self.codec.dumps(kwargs.pop("json"))
+        instrumentation = config.instrumentation
+        event = begin_request(method, endpoint) if instrumentation is not None else None
+        meter = config.metrics.start(method, endpoint) if config.metrics is not None else None
         try:
-            resp = self.session.request(
-                method=method,
-                url=url,
-                headers=headers,
-                timeout=self.config.timeout,
-                verify=self.verify_ssl,
-                **kwargs
-            )
-        except requests.RequestException as e:
-            raise FiskalyApiError(f"Error en la conexión: {e}")
+            value = self._request(method, endpoint, kwargs, event)
+        except BaseException as e:
+            if meter is not None:
+                meter.done(e)
+            if event is not None:
+                end_request(instrumentation, event, error=e)
+            raise
+        if meter is not None:
+            meter.done()
+        if event is not None:
+            end_request(instrumentation, event, value, defer=will_parse)
+        return value
+
+    def _request(self, method: str, endpoint: str, kwargs: Dict[str, Any], event: Optional[RequestEvent]) -> Any:
+        flights = self._flights
+        if flights is not None and method == "GET" and not kwargs.get("headers"):
+            # Los seguidores no envían nada: su evento queda vacío y no se emite.
+            key = request_key(endpoint, kwargs.get("params"))
+            return flights.do(key, lambda: self._cached_request(method, endpoint, kwargs, event))
+        return self._cached_request(method, endpoint, kwargs, event)
 
+    def _cached_request(self, method: str, endpoint: str, kwargs: Dict[str, Any], event: Optional[RequestEvent]) -> Any:
+        cache = self.config.response_cache
+        if cache is None:
+            return self._decode(self._send(method, endpoint, kwargs.pop("headers", {}), kwargs, event), event)
+        if method != "GET":
+            try:
+                return self._decode(self._send(method, endpoint, kwargs.pop("headers", {}), kwargs, event), event)
+            finally:
+                cache.invalidate(endpoint)
+
+        key = cache.key(endpoint, kwargs.get("params"))
+        entry = cache.lookup(key) if key is not None else None
+        if entry is not None and entry.fresh:
+            return entry.get()
+        headers = dict(kwargs.pop("headers", {}))
+        if entry is not None:
+            headers.update(entry.validators())
+        resp = self._send(method, endpoint, headers, kwargs, event)
+        if resp.status_code == 304 and entry is not None:
+            return cache.revalidated(key, entry, resp.headers)
+        value = self._decode(resp, event)
+        if key is not None:
+            cache.store(key, value, resp.headers)
+        return value
+
+    @property
+    def codec(self) -> JsonCodec:
+        """
+        Codec JSON del cliente (se resuelve en la primera petición).
+        """
+        codec = self._codec
+        if codec is None:
+            codec = self._codec = get_codec(self.config.json_codec)
+        return codec
+
+    @property
+    def prefetch_executor(self) -> ThreadPoolExecutor:
+        """
+        Executor compartido por los `iter_all` del cliente para descargar la página
+        siguiente. Sus hilos se reutilizan entre recorridos y se cierran en `close()`.
+        """
+        with self._prefetch_lock:
+            if self._prefetch_executor is None:
+                self._prefetch_executor = ThreadPoolExecutor(
+                    max_workers=self.config.pool_maxsize,
+                    thread_name_prefix="fiskaly-prefetch",
+                )
+            return self._prefetch_executor
+
+    def _decode(self, resp, event: Optional[RequestEvent] = None) -> Any:
+        """
+        Devuelve el cuerpo de la respuesta (JSON decodificado o bytes).
+
+        :raises FiskalyApiError: Si la API responde con error.
+        """
         if not resp.ok:
             try:
-                err = resp.json()
+                err = self.codec.loads(resp.content)
             except Exception:
                 err = resp.text
-            raise FiskalyApiError(f"Error API [{resp.status_code}]: {err}")
+            raise FiskalyApiError(f"Error API [{resp.status_code}]: {err}", status_code=resp.status_code)
 
         content_type = resp.headers.get('Content-Type', '')
         if 'application/json' in content_type:
-            return resp.json()
+            started = time.perf_counter()
+            value = self.codec.loads(resp.content)
+            if event is not None:
+                event.timings.decode += time.perf_counter() - started
+            return value
         else:
             return resp.content
 
+    def parse(self, model_cls, data):
+        """
+        Convierte una respuesta JSON según `response_mode` (modelo validado, LazyModel o dict).
+        """
+        return timed_validation(lambda: parse_model(self.config.response_mode, model_cls, data))
+
+    def parse_list(self, model_cls, items) -> List[Any]:
+        """
+        Convierte una lista de respuestas JSON según `response_mode` (una sola
+        validación medida, aunque la lista esté vacía).
+        """
+        mode = self.config.response_mode
+        return timed_validation(lambda: [parse_model(mode, model_cls, item) for item in items])
+
+    def parse_page(self, page_cls, item_cls, data, items_key: str = "results"):
+        """
+        Convierte la respuesta de un listado según `response_mode`.
+        """
+        return timed_validation(lambda: parse_page(self.config.response_mode, page_cls, item_cls, data, items_key))
+
+    def download(self, endpoint: str, dest, **options) -> DownloadResult:
+        """
+        Descarga un endpoint binario en streaming hacia un fichero o un objeto con `write`.
+
+        Reanuda con `Range` si la conexión se corta y calcula el checksum al vuelo.
+
+        :param endpoint: Endpoint a descargar.
+        :param dest: Ruta de fichero o objeto binario con `write`.
+        :param options: chunk_size, checksum y max_resumes (ver `download.stream_download`).
+        :return: DownloadResult.
+        """
+        return stream_download(self, endpoint, dest, **options)
+
+    def _send(
+        self,
+        method: str,
+        endpoint: str,
+        extra_headers: Dict[str, str],
+        kwargs: Dict[str, Any],
+        event: Optional[RequestEvent] = None,
+    ) -> requests.Response:
+        """
+        Envía la petición aplicando la política de reintentos y el refresco de token tras un 401.
+
+        :return: Última respuesta recibida (puede ser un error HTTP no reintentable).
+        :raises FiskalyApiError: Si la conexión falla y no quedan reintentos.
+        """
+        url = f"{self.config.base_url}{endpoint}"
+        policy = self.config.retry_policy
+        if policy is not None:
+            policy.budget.record_request()
+        attempt = 0
+        token_refreshed = False
+        while True:
+            try:
+                resp, bearer = self._send_once(method, url, endpoint, extra_headers, kwargs, event)
+            except requests.RequestException as e:
+                delay = policy.delay_for_error(method, endpoint, attempt, e) if policy else None
+                if delay is None:
+                    raise FiskalyApiError(f"Error en la conexión: {e}")
+                logger.debug("Reintentando %s %s tras error de conexión en %.2fs: %s", method, endpoint, delay, e)
+                time.sleep(delay)
+                if event is not None:
+                    event.timings.queue += delay
+                attempt += 1
+                continue
+
+            if resp.status_code == 401 and bearer is not None and not token_refreshed:
+                # Token rechazado (revocado o caducado antes de tiempo): se refresca
+                # una sola vez para todos los hilos y se reintenta la petición.
+                resp.close()
+                self._token_manager.refresh(stale=bearer)
+                token_refreshed = True
+                continue
 
-    def set_bearer_token(self, token: str):
-        self._bearer_token = token
+            if resp.ok or policy is None:
+                return resp
+            delay = policy.delay_for_status(method, endpoint, attempt, resp.status_code, resp.headers)
+            if delay is None:
+                return resp
+            logger.debug("Reintentando %s %s tras HTTP %s en %.2fs", method, endpoint, resp.status_code, delay)
+            resp.close()
+            time.sleep(delay)
+            if event is not None:
+                event.timings.queue += delay
+            attempt += 1
+
+    def _send_once(
+        self,
+        method: str,
+        url: str,
+        endpoint: str,
+        extra_headers: Dict[str, str],
+        kwargs: Dict[str, Any],
+        event: Optional[RequestEvent] = None,
+    ):
+        """
+        Envía una petición HTTP y devuelve (respuesta, bearer usado).
+        """
+        queued = time.perf_counter()
+        bearer = None
+        # Para login: NO uses self.headers (que requiere Bearer)
+        if endpoint == "/auth":
+            # Solo content-type y accept
+            headers = {
+                "Content-Type": "application/json",
+                "Accept": "application/json",
+                **extra_headers
+            }
+        else:
+            bearer = self._current_bearer()
+            headers = {**self._headers_for(bearer), **extra_headers}
+        limiter = self.config.rate_limiter
+        if limiter is not None:
+            limiter.acquire(self.config.api_key, endpoint)
+        started = time.perf_counter()
+        if event is not None:
+            event.attempts += 1
+            event.timings.queue += started - queued
+            connect_timer.seconds = 0.0
+        try:
+            resp = self.transport.send(method, url, headers, self.config.timeout, **kwargs)
+        finally:
+            elapsed = time.perf_counter() - started
+            if event is not None:
+                record_transport(event, elapsed, connect_timer.seconds)
+        if limiter is not None:
+            limiter.record_network(elapsed)
+        if event is not None:
+            record_response(event, resp, streamed=bool(kwargs.get("stream")))
+        return resp, bearer
+
+    def set_bearer_token(self, token: str, expires_at: Optional[int] = None):
+        """
+        Establece el token Bearer (y su expiración, si se conoce).
+        """
+        self._token_manager.set_token(token, expires_at)
 
     def get_bearer_token(self) -> Optional[str]:
-        return self._bearer_token
+        return self._token_manager.bearer
+
+    def close(self):
+        """
+        Detiene el refresco de token en segundo plano, cierra el executor de la
+        paginación y el transporte HTTP (salvo que sea uno compartido).
+        """
+        self._token_manager.close()
+        with self._prefetch_lock:
+            executor, self._prefetch_executor = self._prefetch_executor, None
+        if executor is not None:
+            executor.shutdown(wait=False)
+        if self._owns_transport:
+            self.transport.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.close()
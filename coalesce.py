@@ -0,0 +1,145 @@
+# fiskaly_sdk/coalesce.py
+
+"""
+Agrupación (single-flight) de peticiones GET idénticas concurrentes.
+
+Cuando varios hilos o tareas piden a la vez el mismo recurso (p.ej. tras caducar
+una entrada de caché o al reconectar un dispositivo), solo el primero ("líder")
+hace la llamada HTTP; el resto espera y recibe su mismo resultado o su misma
+excepción. Las peticiones que llegan después de terminar el vuelo inician uno nuevo.
+
+Con `copy`, si el vuelo tuvo seguidores cada llamador recibe su propia copia del
+resultado, de modo que modificarlo no altera lo que ven los demás.
+"""
+
+import asyncio
+import threading
+from typing import Any, Awaitable, Callable, Dict, Hashable, Mapping, Optional, Tuple
+
+RequestKey = Tuple[str, Tuple[Tuple[str, str], ...]]
+
+
+def request_key(endpoint: str, params: Optional[Mapping[str, Any]] = None) -> RequestKey:
+    """
+    Clave que identifica un GET: endpoint y parámetros de query ordenados.
+    """
+    return endpoint, tuple(sorted((str(k), str(v)) for k, v in (params or {}).items()))
+
+
+class _Flight:
+    """
+    Llamada en curso compartida por el líder y sus seguidores.
+    """
+
+    def __init__(self):
+        self.done = threading.Event()
+        self.result: Any = None
+        self.error: Optional[BaseException] = None
+        self.followers = 0
+
+
+class SingleFlight:
+    """
+    Single-flight para hilos: una sola ejecución de `fn` por clave a la vez.
+    """
+
+    def __init__(self, copy: Optional[Callable[[Any], Any]] = None):
+        """
+        :param copy: Función que copia el resultado para cada llamador de un vuelo compartido.
+        """
+        self._lock = threading.Lock()
+        self._flights: Dict[Hashable, _Flight] = {}
+        self.coalesced = 0
+        self.copy = copy
+
+    def do(self, key: Hashable, fn: Callable[[], Any]) -> Any:
+        """
+        Ejecuta `fn` o, si ya hay un vuelo en curso para `key`, espera su resultado.
+
+        :raises: La misma excepción que lanzó `fn` en el líder.
+        """
+        with self._lock:
+            flight = self._flights.get(key)
+            leader = flight is None
+            if leader:
+                flight = self._flights[key] = _Flight()
+            else:
+                self.coalesced += 1
+                flight.followers += 1
+
+        if not leader:
+            flight.done.wait()
+            if flight.error is not None:
+                raise flight.error
+            return flight.result if self.copy is None else self.copy(flight.result)
+
+        try:
+            flight.result = fn()
+        except BaseException as e:
+            flight.error = e
+            raise
+        finally:
+            with self._lock:
+                del self._flights[key]
+            flight.done.set()
+        # Con seguidores, el original queda intacto y el líder también recibe una copia.
+        if flight.followers and self.copy is not None:
+            return self.copy(flight.result)
+        return flight.result
+
+    def in_flight(self) -> int:
+        with self._lock:
+            return len(self._flights)
+
+
+class _AsyncFlight:
+    """
+    Futuro compartido por las tareas de una misma clave.
+    """
+
+    def __init__(self, future: "asyncio.Future"):
+        self.future = future
+        self.followers = 0
+
+
+class AsyncSingleFlight:
+    """
+    Single-flight para asyncio: las tareas con la misma clave comparten un futuro.
+
+    Si se cancela la tarea de un seguidor, la llamada compartida sigue en curso
+    para los demás.
+    """
+
+    def __init__(self, copy: Optional[Callable[[Any], Any]] = None):
+        """
+        :param copy: Función que copia el resultado para cada llamador de un vuelo compartido.
+        """
+        self._flights: Dict[Hashable, _AsyncFlight] = {}
+        self.coalesced = 0
+        self.copy = copy
+
+    async def do(self, key: Hashable, fn: Callable[[], Awaitable[Any]]) -> Any:
+        """
+        Espera el vuelo en curso para `key` o inicia uno nuevo con `fn()`.
+
+        :raises: La misma excepción que lanzó `fn`.
+        """
+        flight = self._flights.get(key)
+        if flight is None:
+            flight = self._flights[key] = _AsyncFlight(asyncio.ensure_future(self._run(key, fn)))
+        else:
+            self.coalesced += 1
+            flight.followers += 1
+        result = await asyncio.shield(flight.future)
+        if flight.followers and self.copy is not None:
+            return self.copy(result)
+        return result
+
+    async def _run(self, key: Hashable, fn: Callable[[], Awaitable[Any]]) -> Any:
+        try:
+            return await fn()
+        finally:
+            self._flights.pop(key, None)
+
+    def in_flight(self) -> int:
+        return len(self._flights)
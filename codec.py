@@ -0,0 +1,147 @@
+# fiskaly_sdk/codec.py
+
+"""
+Codificación JSON de los cuerpos de petición y respuesta del SDK Fiskaly SIGN ES.
+
+El cliente serializa los cuerpos directamente a bytes (los modelos Pydantic sin
+pasar por `dict()`) y decodifica los bytes de la respuesta en un solo paso, sin
+convertirlos antes a texto. El backend se elige con `json_codec`:
+
+  - "orjson": el más rápido, si está instalado (`pip install 'fiskaly-sdk-sign-es[fast-json]'`).
+  - "pydantic": el parser en Rust de pydantic-core (siempre disponible con Pydantic 2).
+  - "json": la librería estándar.
+  - "auto" (por defecto): el primero disponible de los anteriores.
+
+También se puede pasar cualquier objeto con `dumps(obj) -> bytes` y `loads(data) -> Any`.
+"""
+
+import json
+from typing import Any, Callable, Dict, Union
+
+
+def _default(obj: Any) -> Any:
+    """
+    Tipos no nativos de JSON que pueden aparecer en los cuerpos de petición.
+    """
+    from decimal import Decimal
+    if hasattr(obj, "model_dump"):
+        return obj.model_dump(mode="json")
+    if isinstance(obj, Decimal):
+        return str(obj)
+    raise TypeError(f"Object of type {type(obj).__name__} is not JSON serializable")
+
+
+class JsonCodec:
+    """
+    Interfaz de un codec JSON: bytes de entrada y de salida.
+    """
+    name = "base"
+
+    def dumps(self, obj: Any) -> bytes:
+        """
+        Serializa un cuerpo (dict, lista o modelo Pydantic) a bytes UTF-8.
+        """
+        raise NotImplementedError
+
+    def loads(self, data: bytes) -> Any:
+        """
+        Decodifica un cuerpo JSON recibido como bytes.
+
+        :raises ValueError: Si los bytes no son JSON válido.
+        """
+        raise NotImplementedError
+
+    def __repr__(self):
+        return f"<{type(self).__name__} {self.name}>"
+
+
+class StdlibJsonCodec(JsonCodec):
+    """
+    Codec basado en el módulo `json` de la librería estándar.
+    """
+    name = "json"
+
+    def dumps(self, obj: Any) -> bytes:
+        if hasattr(obj, "model_dump_json"):
+            return obj.model_dump_json().encode("utf-8")
+        return json.dumps(obj, ensure_ascii=False, separators=(",", ":"), default=_default).encode("utf-8")
+
+    def loads(self, data: bytes) -> Any:
+        return json.loads(data)
+
+
+class OrjsonCodec(JsonCodec):
+    """
+    Codec basado en orjson.
+    """
+    name = "orjson"
+
+    def __init__(self):
+        import orjson
+        self._dumps = orjson.dumps
+        self._loads = orjson.loads
+
+    def dumps(self, obj: Any) -> bytes:
+        if hasattr(obj, "model_dump_json"):
+            return obj.model_dump_json().encode("utf-8")
+        return self._dumps(obj, default=_default)
+
+    def loads(self, data: bytes) -> Any:
+        return self._loads(data)
+
+
+class PydanticJsonCodec(JsonCodec):
+    """
+    Codec basado en el serializador y el parser en Rust de pydantic-core.
+    """
+    name = "pydantic"
+
+    def __init__(self):
+        from pydantic_core import from_json, to_json
+        self._to_json = to_json
+        self._from_json = from_json
+
+    def dumps(self, obj: Any) -> bytes:
+        return self._to_json(obj)
+
+    def loads(self, data: bytes) -> Any:
+        return self._from_json(data)
+
+
+CODECS: Dict[str, Callable[[], JsonCodec]] = {
+    "orjson": OrjsonCodec,
+    "pydantic": PydanticJsonCodec,
+    "json": StdlibJsonCodec,
+}
+
+_AUTO_ORDER = ("orjson", "pydantic", "json")
+
+_auto_codec = None
+
+
+def get_codec(codec: Union[str, JsonCodec, None] = "auto") -> JsonCodec:
+    """
+    Resuelve la opción `json_codec` a un codec.
+
+    :param codec: "auto", el nombre de un backend o un objeto codec (se devuelve tal cual).
+    :return: JsonCodec listo para usar.
+    :raises ValueError: Si el nombre no corresponde a ningún backend.
+    :raises ImportError: Si el backend pedido no está instalado.
+    """
+    global _auto_codec
+    if codec is None or codec == "auto":
+        if _auto_codec is None:
+            for name in _AUTO_ORDER:
+                try:
+                    _auto_codec = CODECS[name]()
+                    break
+                except ImportError:
+                    continue
+        return _auto_codec
+    if not isinstance(codec, str):
+        return codec
+    try:
+        factory = CODECS[codec]
+    except KeyError:
+        raise ValueError(f"json_codec desconocido: {codec!r} (opciones: auto, {', '.join(CODECS)})")
+    return factory()
@@ -4,7 +4,20 @@
 Módulo de configuración del SDK Fiskaly.
 """
 
-from dataclasses import dataclass
+from dataclasses import dataclass, field
+from typing import TYPE_CHECKING, Optional, Union
+
+from .cache import ResponseCache
+from .codec import CODECS, JsonCodec
+from .instrumentation import Instrumentation
+from .metrics import MetricsRegistry, default_registry
+from .rate_limit import RateLimiter
+from .responses import ResponseMode
+from .retry import RetryPolicy
+
+if TYPE_CHECKING:  # pragma: no cover
+    from .token_store import TokenStore
+    from .transport import Transport
 
 @dataclass
 class FiskalyConfig:
@@ -15,3 +28,42 @@ class FiskalyConfig:
     api_secret: str
     base_url: str = "https://sign-api.fiskaly.com/api/v1"
     timeout: int = 30
+    # Segundos antes de `expires_at` en los que se refresca el token Bearer.
+    token_refresh_margin: int = 60
+    # Refresca el token en un hilo de fondo antes de que caduque.
+    token_background_refresh: bool = True
+    # Pool de conexiones: número de hosts cacheados, conexiones por host y si se
+    # bloquea (en lugar de abrir conexiones extra) cuando el pool está lleno.
+    pool_connections: int = 10
+    pool_maxsize: int = 10
+    pool_block: bool = False
+    # Keep-alive TCP de las conexiones del pool (segundos / número de sondas).
+    tcp_keepalive: bool = True
+    tcp_keepalive_idle: int = 60
+    tcp_keepalive_interval: int = 15
+    tcp_keepalive_count: int = 4
+    # Política de reintentos (backoff, Retry-After, presupuesto). None desactiva los reintentos.
+    retry_policy: Optional[RetryPolicy] = field(default_factory=RetryPolicy)
+    # Limitador de tasa por organización y client_id (None = sin límite en el cliente).
+    rate_limiter: Optional[RateLimiter] = None
+    # Cómo devuelven los recursos las respuestas: "validated", "lazy" o "raw".
+    response_mode: ResponseMode = ResponseMode.VALIDATED
+    # Caché de GET para recursos poco cambiantes (None = sin caché).
+    response_cache: Optional[ResponseCache] = None
+    # Agrupa los GET idénticos concurrentes en una sola llamada HTTP (single-flight).
+    coalesce_gets: bool = True
+    # Recibe un RequestEvent por petición con el desglose de tiempos (None = sin instrumentación).
+    instrumentation: Optional[Instrumentation] = None
+    # Histogramas y contadores por endpoint (por defecto, el registro compartido; None = sin métricas).
+    metrics: Optional[MetricsRegistry] = field(default_factory=default_registry)
+    # Codec JSON de los cuerpos: "auto", "orjson", "pydantic", "json" o un JsonCodec propio.
+    json_codec: Union[str, JsonCodec] = "auto"
+    # Almacén de tokens compartido entre procesos (None = cada proceso se autentica por su cuenta).
+    token_store: Optional["TokenStore"] = None
+    # Transporte HTTP del cliente síncrono: "requests", "urllib3", "http2" o un Transport propio.
+    transport: Union[str, "Transport"] = "requests"
+
+    def __post_init__(self):
+        self.response_mode = ResponseMode(self.response_mode)
+        if isinstance(self.json_codec, str) and self.json_codec != "auto" and self.json_codec not in CODECS:
+            raise ValueError(f"json_codec desconocido: {self.json_codec!r}")
@@ -0,0 +1,282 @@
+# fiskaly_sdk/download.py
+
+"""
+Descargas en streaming del SDK Fiskaly SIGN ES.
+
+Escribe la respuesta por trozos directamente en un fichero (o cualquier objeto
+con `write`) con memoria acotada, calcula el checksum a medida que escribe y,
+si la conexión se corta, reanuda desde el último byte recibido con una cabecera
+HTTP `Range`. Se usa para los ZIP de exports, el PDF del acuerdo del taxpayer y
+el XML de las facturas. Cada descarga (con sus reanudaciones) cuenta como una
+llamada en las métricas de `config.metrics` y, si hay instrumentación, cada
+intento (la petición inicial y cada reanudación) genera su RequestEvent, con la
+lectura del cuerpo incluida en la fase `server`.
+"""
+
+import asyncio
+import hashlib
+import logging
+import os
+import time
+from dataclasses import dataclass
+from typing import BinaryIO, Dict, Optional, Union
+
+import requests
+
+from .exceptions import FiskalyApiError
+from .instrumentation import RequestEvent, begin_request, end_request
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_CHUNK_SIZE = 64 * 1024
+
+Destination = Union[str, "os.PathLike[str]", BinaryIO]
+
+
+@dataclass
+class DownloadResult:
+    """
+    Resultado de una descarga en streaming.
+    """
+    bytes_written: int
+    checksum: Optional[str] = None
+    algorithm: Optional[str] = None
+    resumes: int = 0
+    path: Optional[str] = None
+
+
+class _DownloadState:
+    """
+    Estado de una descarga: destino, checksum incremental y posición para reanudar.
+    """
+
+    def __init__(self, dest: Destination, checksum: Optional[str]):
+        self.owns_sink = isinstance(dest, (str, os.PathLike))
+        self.path = os.fspath(dest) if self.owns_sink else None
+        self.sink = open(self.path, "wb") if self.owns_sink else dest
+        self.start = self.sink.tell() if self._seekable() else 0
+        self.algorithm = checksum
+        self.hasher = hashlib.new(checksum) if checksum else None
+        self.written = 0
+        # Bytes recibidos en total (no se reinicia si el servidor ignora el Range).
+        self.received = 0
+        self.resumes = 0
+
+    def _seekable(self) -> bool:
+        seekable = getattr(self.sink, "seekable", None)
+        return bool(seekable and seekable())
+
+    def range_headers(self) -> Dict[str, str]:
+        return {"Range": f"bytes={self.written}-"} if self.written else {}
+
+    def check_resumed(self, status_code: int):
+        """
+        Si el servidor ignora el `Range` (responde 200 en lugar de 206), se vuelve a
+        empezar desde cero siempre que el destino permita rebobinar.
+        """
+        if not self.written or status_code == 206:
+            return
+        if not self._seekable():
+            raise FiskalyApiError("El servidor no admite reanudar la descarga y el destino no permite rebobinar.")
+        logger.debug("El servidor ignoró Range; se reinicia la descarga desde cero")
+        self.sink.seek(self.start)
+        self.sink.truncate()
+        self.hasher = hashlib.new(self.algorithm) if self.algorithm else None
+        self.written = 0
+
+    def write(self, chunk: bytes):
+        if not chunk:
+            return
+        self.sink.write(chunk)
+        if self.hasher is not None:
+            self.hasher.update(chunk)
+        self.written += len(chunk)
+        self.received += len(chunk)
+
+    def result(self) -> DownloadResult:
+        return DownloadResult(
+            bytes_written=self.written,
+            checksum=self.hasher.hexdigest() if self.hasher is not None else None,
+            algorithm=self.algorithm,
+            resumes=self.resumes,
+            path=self.path,
+        )
+
+    def close(self):
+        if self.owns_sink:
+            self.sink.close()
+
+
+def _api_error(status_code: int, text: str) -> FiskalyApiError:
+    return FiskalyApiError(f"Error API [{status_code}]: {text}", status_code=status_code)
+
+
+def _begin_attempt(client, endpoint: str) -> Optional[RequestEvent]:
+    return begin_request("GET", endpoint) if client.config.instrumentation is not None else None
+
+
+def _end_attempt(
+    client,
+    event: Optional[RequestEvent],
+    state: _DownloadState,
+    received: int,
+    body_started: Optional[float],
+    error: Optional[BaseException] = None,
+):
+    """
+    Cierra el evento de un intento con el tiempo y los bytes de la lectura del cuerpo.
+    """
+    if event is None:
+        return
+    if body_started is not None:
+        event.timings.server += time.perf_counter() - body_started
+    event.bytes_in += state.received - received
+    end_request(client.config.instrumentation, event, error=error)
+
+
+def stream_download(
+    client,
+    endpoint: str,
+    dest: Destination,
+    chunk_size: int = DEFAULT_CHUNK_SIZE,
+    checksum: Optional[str] = "sha256",
+    max_resumes: int = 5,
+) -> DownloadResult:
+    """
+    Descarga un endpoint binario en streaming hacia `dest`.
+
+    :param client: Instancia de FiskalyClient.
+    :param endpoint: Endpoint a descargar (p.ej. `/exports/{id}/file`).
+    :param dest: Ruta de fichero o objeto binario con `write`.
+    :param chunk_size: Tamaño de cada trozo leído, en bytes.
+    :param checksum: Algoritmo de hashlib para el checksum (None para no calcularlo).
+    :param max_resumes: Reanudaciones máximas tras cortes de conexión.
+    :return: DownloadResult con bytes escritos, checksum y reanudaciones.
+    :raises FiskalyApiError: Si la API responde con error o se agotan las reanudaciones.
+    """
+    metrics = client.config.metrics
+    if metrics is None:
+        return _download(client, endpoint, dest, chunk_size, checksum, max_resumes)
+    meter = metrics.start("GET", endpoint)
+    try:
+        result = _download(client, endpoint, dest, chunk_size, checksum, max_resumes)
+    except BaseException as e:
+        meter.done(e)
+        raise
+    meter.done()
+    return result
+
+
+def _download(
+    client,
+    endpoint: str,
+    dest: Destination,
+    chunk_size: int,
+    checksum: Optional[str],
+    max_resumes: int,
+) -> DownloadResult:
+    state = _DownloadState(dest, checksum)
+    try:
+        while True:
+            event = _begin_attempt(client, endpoint)
+            received = state.received
+            try:
+                resp = client._send("GET", endpoint, state.range_headers(), {"stream": True}, event)
+            except BaseException as e:
+                _end_attempt(client, event, state, received, None, e)
+                raise
+            body_started = time.perf_counter()
+            try:
+                if not resp.ok:
+                    raise _api_error(resp.status_code, resp.text)
+                state.check_resumed(resp.status_code)
+                for chunk in resp.iter_content(chunk_size=chunk_size):
+                    state.write(chunk)
+            except (requests.ConnectionError, requests.Timeout, requests.exceptions.ChunkedEncodingError) as e:
+                _end_attempt(client, event, state, received, body_started, e)
+                if state.resumes >= max_resumes:
+                    raise FiskalyApiError(f"Descarga interrumpida tras {state.resumes} reanudaciones: {e}")
+                state.resumes += 1
+                logger.debug("Descarga de %s cortada en %d bytes; reanudando: %s", endpoint, state.written, e)
+                time.sleep(min(2 ** state.resumes * 0.1, 5))
+            except BaseException as e:
+                _end_attempt(client, event, state, received, body_started, e)
+                raise
+            else:
+                _end_attempt(client, event, state, received, body_started)
+                return state.result()
+            finally:
+                resp.close()
+    finally:
+        state.close()
+
+
+async def astream_download(
+    client,
+    endpoint: str,
+    dest: Destination,
+    chunk_size: int = DEFAULT_CHUNK_SIZE,
+    checksum: Optional[str] = "sha256",
+    max_resumes: int = 5,
+) -> DownloadResult:
+    """
+    Versión asyncio de `stream_download` para AsyncFiskalyClient.
+    """
+    metrics = client.config.metrics
+    if metrics is None:
+        return await _adownload(client, endpoint, dest, chunk_size, checksum, max_resumes)
+    meter = metrics.start("GET", endpoint)
+    try:
+        result = await _adownload(client, endpoint, dest, chunk_size, checksum, max_resumes)
+    except BaseException as e:
+        meter.done(e)
+        raise
+    meter.done()
+    return result
+
+
+async def _adownload(
+    client,
+    endpoint: str,
+    dest: Destination,
+    chunk_size: int,
+    checksum: Optional[str],
+    max_resumes: int,
+) -> DownloadResult:
+    import httpx
+
+    state = _DownloadState(dest, checksum)
+    try:
+        while True:
+            event = _begin_attempt(client, endpoint)
+            received = state.received
+            try:
+                resp = await client._send("GET", endpoint, state.range_headers(), {"stream": True}, event)
+            except BaseException as e:
+                _end_attempt(client, event, state, received, None, e)
+                raise
+            body_started = time.perf_counter()
+            try:
+                if not resp.is_success:
+                    await resp.aread()
+                    raise _api_error(resp.status_code, resp.text)
+                state.check_resumed(resp.status_code)
+                async for chunk in resp.aiter_bytes(chunk_size=chunk_size):
+                    state.write(chunk)
+            except httpx.TransportError as e:
+                _end_attempt(client, event, state, received, body_started, e)
+                if state.resumes >= max_resumes:
+                    raise FiskalyApiError(f"Descarga interrumpida tras {state.resumes} reanudaciones: {e}")
+                state.resumes += 1
+                logger.debug("Descarga de %s cortada en %d bytes; reanudando: %s", endpoint, state.written, e)
+                await asyncio.sleep(min(2 ** state.resumes * 0.1, 5))
+            except BaseException as e:
+                _end_attempt(client, event, state, received, body_started, e)
+                raise
+            else:
+                _end_attempt(client, event, state, received, body_started)
+                return state.result()
+            finally:
+                await resp.aclose()
+    finally:
+        state.close()
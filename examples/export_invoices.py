@@ -21,8 +21,14 @@ export_content = {
 export = client.exports.create(content=export_content)
 print("Exportación iniciada:", export.content.id)
 
-# Descargar el ZIP asociado (cuando esté listo en la API)
-zip_bytes = client.exports.download_zip(export.content.id)
-with open("invoices_export.zip", "wb") as f:
-    f.write(zip_bytes)
-print("Archivo ZIP guardado como invoices_export.zip")
+# Esperar a que la exportación termine (backoff adaptativo, máximo 10 minutos)
+client.exports.wait_until_ready(export.content.id, timeout=600)
+
+# Descargar el ZIP asociado en streaming
+result = client.exports.download_zip_to(export.content.id, "invoices_export.zip")
+print("Archivo ZIP guardado como invoices_export.zip, sha256:", result.checksum)
+
+# Para muchas exportaciones a la vez, un único scheduler reparte las consultas
+with client.exports.scheduler(requests_per_second=5) as scheduler:
+    future = scheduler.track(export.content.id)
+    print("Estado final:", future.result().content.state)
@@ -13,8 +13,23 @@ class FiskalyError(Exception):
 class FiskalyApiError(FiskalyError):
     """
     Errores relacionados con la respuesta de la API Fiskaly.
+
+    `status_code` contiene el código HTTP de la respuesta, o None si el error
+    fue de conexión.
     """
-    pass
+    def __init__(self, message: str = "", status_code: int = None):
+        super().__init__(message)
+        self.status_code = status_code
+
+class FiskalyExportError(FiskalyError):
+    """
+    Una exportación terminó con error o no estuvo lista a tiempo.
+
+    `export` contiene el último estado conocido de la exportación, si lo hay.
+    """
+    def __init__(self, message: str = "", export=None):
+        super().__init__(message)
+        self.export = export
 
 class FiskalyAuthError(FiskalyError):
     """
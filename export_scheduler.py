@@ -0,0 +1,364 @@
+# fiskaly_sdk/export_scheduler.py
+
+"""
+Espera de exportaciones del SDK Fiskaly SIGN ES.
+
+`ExportsAPI.create` devuelve la exportación todavía en curso (p.ej. RUNNING). Este
+módulo consulta su estado con un backoff adaptativo hasta que termina: el
+intervalo crece mientras el estado no cambia y vuelve al mínimo cuando cambia.
+`ExportScheduler` sigue muchas exportaciones a la vez desde un único hilo y
+reparte entre todas un presupuesto común de peticiones por segundo.
+"""
+
+import asyncio
+import heapq
+import itertools
+import logging
+import random
+import threading
+import time
+from concurrent.futures import Future, wait
+from typing import Callable, Dict, FrozenSet, List, Optional, Tuple
+
+from .exceptions import FiskalyApiError, FiskalyExportError
+from .models.export import ExportResponse
+from .rate_limit import TokenBucket
+from .responses import ensure_model
+
+logger = logging.getLogger(__name__)
+
+READY_STATES: FrozenSet[str] = frozenset({"COMPLETED", "READY", "DONE", "SUCCEEDED"})
+FAILED_STATES: FrozenSet[str] = frozenset({"ERROR", "FAILED", "CANCELLED", "CANCELED", "EXPIRED", "ABORTED"})
+
+# Callback de finalización: recibe (export_id, exportación terminada o None, error o None).
+ExportCallback = Callable[[str, Optional[ExportResponse], Optional[BaseException]], None]
+
+
+class ExportBackoff:
+    """
+    Intervalo de sondeo adaptativo para una exportación.
+
+    Cada consulta sin cambios multiplica el intervalo por `factor` (hasta `max_delay`);
+    un cambio de estado lo devuelve a `initial_delay`. Se aplica jitter para no
+    sincronizar las consultas de muchas exportaciones creadas a la vez.
+    """
+
+    def __init__(self, initial_delay: float = 1.0, max_delay: float = 30.0, factor: float = 1.5, jitter: float = 0.1):
+        """
+        :param initial_delay: Primer intervalo, en segundos.
+        :param max_delay: Intervalo máximo, en segundos.
+        :param factor: Multiplicador del intervalo mientras el estado no cambia.
+        :param jitter: Fracción aleatoria (+/-) aplicada a cada intervalo.
+        """
+        self.initial_delay = initial_delay
+        self.max_delay = max_delay
+        self.factor = factor
+        self.jitter = jitter
+        self._delay = initial_delay
+        self._state: Optional[str] = None
+
+    def next_delay(self, state: Optional[str]) -> float:
+        """
+        Devuelve cuánto esperar antes de la siguiente consulta.
+
+        :param state: Último estado observado de la exportación.
+        """
+        if state != self._state:
+            self._state = state
+            self._delay = self.initial_delay
+        delay = self._delay
+        self._delay = min(self.max_delay, self._delay * self.factor)
+        if self.jitter:
+            delay *= 1 + random.uniform(-self.jitter, self.jitter)
+        return max(0.0, delay)
+
+
+def export_outcome(
+    export: ExportResponse,
+    ready_states: FrozenSet[str] = READY_STATES,
+    failed_states: FrozenSet[str] = FAILED_STATES,
+) -> Optional[bool]:
+    """
+    Clasifica una exportación: True si está lista, False si falló y None si sigue en curso.
+    """
+    state = (export.content.state or "").upper()
+    if state in ready_states:
+        return True
+    if state in failed_states:
+        return False
+    return None
+
+
+def _is_transient(error: FiskalyApiError) -> bool:
+    # Errores de conexión, 429 y 5xx no deciden el resultado: se sigue sondeando.
+    return error.status_code is None or error.status_code == 429 or error.status_code >= 500
+
+
+def _failed(export_id: str, export: ExportResponse) -> FiskalyExportError:
+    return FiskalyExportError(f"La exportación {export_id} terminó en estado {export.content.state}", export=export)
+
+
+def _timed_out(export_id: str, export: Optional[ExportResponse], timeout: float) -> FiskalyExportError:
+    state = export.content.state if export is not None else None
+    return FiskalyExportError(f"La exportación {export_id} no terminó en {timeout}s (estado {state})", export=export)
+
+
+def wait_until_ready(exports_api, export_id: str, timeout: Optional[float] = 600.0, **backoff) -> ExportResponse:
+    """
+    Consulta una exportación hasta que termina.
+
+    :param exports_api: Instancia de ExportsAPI.
+    :param export_id: ID de la exportación.
+    :param timeout: Segundos máximos de espera (None = sin límite).
+    :param backoff: Parámetros de ExportBackoff (initial_delay, max_delay, factor, jitter).
+    :return: ExportResponse de la exportación lista.
+    :raises FiskalyExportError: Si la exportación falla o no termina a tiempo.
+    :raises FiskalyApiError: Si la API responde con un error no transitorio.
+    """
+    policy = ExportBackoff(**backoff)
+    deadline = None if timeout is None else time.monotonic() + timeout
+    export = None
+    while True:
+        try:
+            export = ensure_model(ExportResponse, exports_api.get(export_id))
+            outcome = export_outcome(export)
+            if outcome is True:
+                return export
+            if outcome is False:
+                raise _failed(export_id, export)
+        except FiskalyApiError as e:
+            if not _is_transient(e):
+                raise
+            logger.debug("Error transitorio consultando la exportación %s: %s", export_id, e)
+        delay = policy.next_delay(export.content.state if export is not None else None)
+        if deadline is not None:
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                raise _timed_out(export_id, export, timeout)
+            delay = min(delay, remaining)
+        time.sleep(delay)
+
+
+async def await_until_ready(exports_api, export_id: str, timeout: Optional[float] = 600.0, **backoff) -> ExportResponse:
+    """
+    Versión asyncio de `wait_until_ready` para AsyncExportsAPI.
+    """
+    policy = ExportBackoff(**backoff)
+    deadline = None if timeout is None else time.monotonic() + timeout
+    export = None
+    while True:
+        try:
+            export = ensure_model(ExportResponse, await exports_api.get(export_id))
+            outcome = export_outcome(export)
+            if outcome is True:
+                return export
+            if outcome is False:
+                raise _failed(export_id, export)
+        except FiskalyApiError as e:
+            if not _is_transient(e):
+                raise
+            logger.debug("Error transitorio consultando la exportación %s: %s", export_id, e)
+        delay = policy.next_delay(export.content.state if export is not None else None)
+        if deadline is not None:
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                raise _timed_out(export_id, export, timeout)
+            delay = min(delay, remaining)
+        await asyncio.sleep(delay)
+
+
+class _Tracked:
+    """
+    Exportación seguida por el scheduler.
+    """
+
+    def __init__(self, export_id: str, future: Future, callback: Optional[ExportCallback], backoff: ExportBackoff, deadline: Optional[float]):
+        self.export_id = export_id
+        self.future = future
+        self.callback = callback
+        self.backoff = backoff
+        self.deadline = deadline
+        self.export: Optional[ExportResponse] = None
+
+
+class ExportScheduler:
+    """
+    Sigue muchas exportaciones pendientes desde un único hilo de sondeo.
+
+    Cada exportación tiene su propio backoff adaptativo, pero todas las consultas
+    comparten un token bucket de `requests_per_second`, de modo que seguir cientos
+    de exportaciones no dispara el número de peticiones a la API. Al terminar cada
+    exportación se resuelve su Future y se llama a su callback (si lo tiene).
+    """
+
+    def __init__(
+        self,
+        exports_api,
+        requests_per_second: float = 5.0,
+        burst: Optional[float] = None,
+        timeout: Optional[float] = 3600.0,
+        initial_delay: float = 1.0,
+        max_delay: float = 30.0,
+        factor: float = 1.5,
+    ):
+        """
+        :param exports_api: Instancia de ExportsAPI.
+        :param requests_per_second: Presupuesto de consultas compartido por todas las exportaciones.
+        :param burst: Ráfaga máxima de consultas (por defecto, igual a `requests_per_second`).
+        :param timeout: Segundos máximos de espera por exportación (None = sin límite).
+        :param initial_delay: Primer intervalo de sondeo, en segundos.
+        :param max_delay: Intervalo máximo de sondeo, en segundos.
+        :param factor: Multiplicador del intervalo mientras el estado no cambia.
+        """
+        self.exports_api = exports_api
+        self.timeout = timeout
+        self._backoff = {"initial_delay": initial_delay, "max_delay": max_delay, "factor": factor}
+        self._bucket = TokenBucket(requests_per_second, burst)
+        self._lock = threading.Condition()
+        self._queue: List[Tuple[float, int, _Tracked]] = []
+        self._counter = itertools.count()
+        self._tracked: Dict[str, _Tracked] = {}
+        self._thread: Optional[threading.Thread] = None
+        self._closed = False
+
+    def track(self, export_id: str, callback: Optional[ExportCallback] = None) -> "Future[ExportResponse]":
+        """
+        Empieza a seguir una exportación.
+
+        :param export_id: ID de la exportación.
+        :param callback: Función llamada al terminar con (export_id, exportación, error).
+        :return: Future que se resuelve con la ExportResponse lista o con el error.
+        """
+        with self._lock:
+            if self._closed:
+                raise RuntimeError("El ExportScheduler está cerrado")
+            existing = self._tracked.get(export_id)
+            if existing is not None:
+                return existing.future
+            deadline = None if self.timeout is None else time.monotonic() + self.timeout
+            item = _Tracked(export_id, Future(), callback, ExportBackoff(**self._backoff), deadline)
+            self._tracked[export_id] = item
+            self._push(item, time.monotonic())
+            if self._thread is None:
+                self._thread = threading.Thread(target=self._run, name="fiskaly-export-scheduler", daemon=True)
+                self._thread.start()
+            self._lock.notify()
+            return item.future
+
+    @property
+    def pending(self) -> int:
+        """
+        Número de exportaciones que siguen en curso.
+        """
+        with self._lock:
+            return len(self._tracked)
+
+    def wait_all(self, timeout: Optional[float] = None) -> Dict[str, "Future[ExportResponse]"]:
+        """
+        Espera a que terminen todas las exportaciones seguidas en este momento.
+
+        :return: Diccionario export_id -> Future.
+        """
+        with self._lock:
+            futures = {export_id: item.future for export_id, item in self._tracked.items()}
+        wait(list(futures.values()), timeout=timeout)
+        return futures
+
+    def close(self):
+        """
+        Deja de sondear; los Future aún pendientes se cancelan.
+        """
+        with self._lock:
+            self._closed = True
+            pending = list(self._tracked.values())
+            self._tracked.clear()
+            self._queue.clear()
+            self._lock.notify()
+        for item in pending:
+            item.future.cancel()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.close()
+
+    def _push(self, item: _Tracked, due: float):
+        heapq.heappush(self._queue, (due, next(self._counter), item))
+
+    def _next_due(self) -> Optional[_Tracked]:
+        """
+        Espera a la siguiente exportación a consultar y reserva su petición del presupuesto.
+        """
+        with self._lock:
+            while not self._closed:
+                if not self._queue:
+                    self._lock.wait()
+                    continue
+                due, _, item = self._queue[0]
+                now = time.monotonic()
+                if due > now:
+                    self._lock.wait(due - now)
+                    continue
+                heapq.heappop(self._queue)
+                wait = self._bucket.reserve(now)
+                break
+            else:
+                return None
+        if wait > 0:
+            time.sleep(wait)
+        return item
+
+    def _run(self):
+        while True:
+            item = self._next_due()
+            if item is None:
+                return
+            try:
+                self._poll(item)
+            except Exception:  # pragma: no cover - defensivo: el hilo no debe morir
+                logger.exception("Error inesperado sondeando la exportación %s", item.export_id)
+                self._finish(item, None, FiskalyExportError(f"Error sondeando la exportación {item.export_id}"))
+
+    def _poll(self, item: _Tracked):
+        if item.future.cancelled():
+            with self._lock:
+                self._tracked.pop(item.export_id, None)
+            return
+        try:
+            item.export = ensure_model(ExportResponse, self.exports_api.get(item.export_id))
+            outcome = export_outcome(item.export)
+            if outcome is True:
+                return self._finish(item, item.export, None)
+            if outcome is False:
+                return self._finish(item, None, _failed(item.export_id, item.export))
+        except FiskalyApiError as e:
+            if not _is_transient(e):
+                return self._finish(item, None, e)
+            logger.debug("Error transitorio consultando la exportación %s: %s", item.export_id, e)
+
+        now = time.monotonic()
+        if item.deadline is not None and now >= item.deadline:
+            return self._finish(item, None, _timed_out(item.export_id, item.export, self.timeout))
+        delay = item.backoff.next_delay(item.export.content.state if item.export is not None else None)
+        due = now + delay if item.deadline is None else min(now + delay, item.deadline)
+        with self._lock:
+            if self._tracked.get(item.export_id) is item:
+                self._push(item, due)
+
+    def _finish(self, item: _Tracked, export: Optional[ExportResponse], error: Optional[BaseException]):
+        with self._lock:
+            if self._tracked.get(item.export_id) is not item:
+                return
+            del self._tracked[item.export_id]
+        if item.future.cancelled():
+            return
+        if error is None:
+            item.future.set_result(export)
+        else:
+            item.future.set_exception(error)
+        if item.callback is not None:
+            try:
+                item.callback(item.export_id, export, error)
+            except Exception:
+                logger.exception("El callback de la exportación %s lanzó una excepción", item.export_id)
@@ -0,0 +1,315 @@
+# fiskaly_sdk/instrumentation.py
+
+"""
+Instrumentación por petición del SDK Fiskaly SIGN ES.
+
+Si `FiskalyConfig.instrumentation` tiene una Instrumentation, cada petición HTTP
+que hace el cliente genera un RequestEvent con el endpoint normalizado (p.ej.
+`/clients/{id}/invoices/{id}`), método, estado, reintentos, bytes enviados y
+recibidos y el desglose de tiempos:
+
+  - queue: espera antes de enviar (token, limitador de tasa y backoff entre reintentos).
+  - connect: obtención de una conexión del pool (y apertura TCP/TLS si hace falta).
+  - server: desde el envío hasta recibir la respuesta completa.
+  - decode: decodificación del JSON.
+  - validate: conversión al modelo Pydantic (`client.parse`).
+
+Como la validación ocurre después de `request()`, el evento de una respuesta
+JSON que los recursos van a convertir a modelo (`request(..., will_parse=True)`)
+se emite al validarla; el de cualquier otra llamada se emite antes de que
+`request()` devuelva. Las descargas en streaming generan un evento por intento
+(la petición inicial y cada reanudación). Los aciertos de la caché de respuestas
+no generan evento.
+"""
+
+import contextvars
+import logging
+import time
+from dataclasses import dataclass, field
+from typing import Any, Callable, Iterable, List, Optional, Tuple
+
+try:
+    from opentelemetry import trace as otel_trace
+except ImportError:  # pragma: no cover - dependencia opcional
+    otel_trace = None
+
+from .version import __version__
+
+logger = logging.getLogger(__name__)
+
+# Colecciones de la API: el segmento que las sigue es un ID.
+_COLLECTIONS = frozenset(("clients", "signers", "invoices", "exports"))
+
+
+def endpoint_template(endpoint: str) -> str:
+    """
+    Sustituye los IDs de un endpoint por `{id}`: `/clients/c1/invoices/i1` -> `/clients/{id}/invoices/{id}`.
+    """
+    segments = endpoint.split("/")
+    for index in range(2, len(segments)):
+        if segments[index - 1] in _COLLECTIONS and segments[index]:
+            segments[index] = "{id}"
+    return "/".join(segments)
+
+
+@dataclass
+class RequestTimings:
+    """
+    Desglose de tiempos de una petición, en segundos.
+    """
+    queue: float = 0.0
+    connect: float = 0.0
+    server: float = 0.0
+    decode: float = 0.0
+    validate: float = 0.0
+
+    def phases(self) -> List[Tuple[str, float]]:
+        """
+        Fases en orden cronológico: [(nombre, segundos), ...].
+        """
+        return [
+            ("queue", self.queue),
+            ("connect", self.connect),
+            ("server", self.server),
+            ("decode", self.decode),
+            ("validate", self.validate),
+        ]
+
+
+@dataclass
+class RequestEvent:
+    """
+    Evento emitido por cada petición HTTP del cliente.
+
+    `retries` cuenta los envíos repetidos (reintentos y repetición tras un 401);
+    `status` es None si no llegó ninguna respuesta y `error` contiene la
+    excepción que recibió el llamador, si la hubo.
+    """
+    method: str
+    endpoint: str
+    path: str
+    started_at: float
+    status: Optional[int] = None
+    attempts: int = 0
+    bytes_out: int = 0
+    bytes_in: int = 0
+    duration: float = 0.0
+    error: Optional[BaseException] = None
+    timings: RequestTimings = field(default_factory=RequestTimings)
+    _started: float = field(default=0.0, repr=False)
+
+    @property
+    def retries(self) -> int:
+        return max(0, self.attempts - 1)
+
+
+class Instrumentation:
+    """
+    Interfaz de instrumentación: sobrescribe `on_request` para recibir los eventos.
+
+    Se llama en el hilo (o tarea) que hizo la petición, así que debe ser rápida;
+    las excepciones que lance se registran y se ignoran.
+    """
+
+    def on_request(self, event: RequestEvent):
+        pass
+
+
+class CallbackInstrumentation(Instrumentation):
+    """
+    Instrumentación que llama a una función con cada evento.
+    """
+
+    def __init__(self, callback: Callable[[RequestEvent], Any]):
+        self.callback = callback
+
+    def on_request(self, event: RequestEvent):
+        self.callback(event)
+
+
+class CompositeInstrumentation(Instrumentation):
+    """
+    Reparte cada evento entre varias instrumentaciones.
+    """
+
+    def __init__(self, instrumentations: Iterable[Instrumentation]):
+        self.instrumentations = list(instrumentations)
+
+    def on_request(self, event: RequestEvent):
+        for instrumentation in self.instrumentations:
+            _safe_emit(instrumentation, event)
+
+
+class LoggingInstrumentation(Instrumentation):
+    """
+    Escribe una línea por petición en el logger `fiskaly_sdk.requests`
+    (ver `logging_config.setup_logging`).
+    """
+
+    def __init__(self, level: int = logging.DEBUG, log: Optional[logging.Logger] = None):
+        self.level = level
+        self.log = log or logging.getLogger("fiskaly_sdk.requests")
+
+    def on_request(self, event: RequestEvent):
+        if not self.log.isEnabledFor(self.level):
+            return
+        t = event.timings
+        self.log.log(
+            self.level,
+            "%s %s -> %s en %.1fms (queue=%.1f connect=%.1f server=%.1f decode=%.1f validate=%.1f) "
+            "reintentos=%d out=%dB in=%dB%s",
+            event.method, event.endpoint, event.status if event.status is not None else "error",
+            event.duration * 1000, t.queue * 1000, t.connect * 1000, t.server * 1000, t.decode * 1000,
+            t.validate * 1000, event.retries, event.bytes_out, event.bytes_in,
+            f" error={event.error!r}" if event.error is not None else "",
+        )
+
+
+class OpenTelemetryInstrumentation(Instrumentation):
+    """
+    Convierte cada evento en un span CLIENT de OpenTelemetry con un span hijo por fase.
+
+    Los spans se crean al emitir el evento, con las marcas de tiempo reales de la
+    petición, como hijos del span activo en ese momento. Requiere opentelemetry-api
+    (`pip install 'fiskaly-sdk-sign-es[otel]'`) y un TracerProvider configurado.
+    """
+
+    def __init__(self, tracer=None):
+        """
+        :param tracer: Tracer a usar (por defecto, `trace.get_tracer("fiskaly_sdk")`).
+        """
+        if otel_trace is None:
+            raise ImportError(
+                "OpenTelemetryInstrumentation requiere opentelemetry-api. "
+                "Instálalo con: pip install 'fiskaly-sdk-sign-es[otel]'"
+            )
+        self.tracer = tracer or otel_trace.get_tracer("fiskaly_sdk", __version__)
+
+    def on_request(self, event: RequestEvent):
+        start = int(event.started_at * 1e9)
+        attributes = {
+            "http.request.method": event.method,
+            "url.template": event.endpoint,
+            "fiskaly.retries": event.retries,
+            "http.request.body.size": event.bytes_out,
+            "http.response.body.size": event.bytes_in,
+        }
+        if event.status is not None:
+            attributes["http.response.status_code"] = event.status
+        span = self.tracer.start_span(
+            f"{event.method} {event.endpoint}",
+            kind=otel_trace.SpanKind.CLIENT,
+            start_time=start,
+            attributes=attributes,
+        )
+        context = otel_trace.set_span_in_context(span)
+        offset = start
+        for phase, seconds in event.timings.phases():
+            if seconds <= 0:
+                continue
+            end = offset + int(seconds * 1e9)
+            self.tracer.start_span(f"fiskaly.{phase}", context=context, start_time=offset).end(end_time=end)
+            offset = end
+        if event.error is not None:
+            span.record_exception(event.error)
+            span.set_status(otel_trace.Status(otel_trace.StatusCode.ERROR, str(event.error)))
+        elif event.status is not None and event.status >= 400:
+            span.set_status(otel_trace.Status(otel_trace.StatusCode.ERROR))
+        span.end(end_time=max(offset, start + int(event.duration * 1e9)))
+
+
+# Evento de una respuesta JSON a la espera de su validación, por hilo o tarea.
+_pending: "contextvars.ContextVar[Optional[Tuple[Instrumentation, RequestEvent]]]" = contextvars.ContextVar(
+    "fiskaly_pending_event", default=None
+)
+
+
+def _safe_emit(instrumentation: Instrumentation, event: RequestEvent):
+    try:
+        instrumentation.on_request(event)
+    except Exception:
+        logger.exception("Error en la instrumentación de %s %s", event.method, event.endpoint)
+
+
+def flush_pending():
+    """
+    Emite el evento que quedó pendiente de validación en este hilo o tarea, si lo hay.
+    """
+    pending = _pending.get()
+    if pending is not None:
+        _pending.set(None)
+        _safe_emit(*pending)
+
+
+def begin_request(method: str, endpoint: str) -> RequestEvent:
+    """
+    Crea el evento de una petición (emitiendo antes el pendiente, si lo hay).
+    """
+    flush_pending()
+    return RequestEvent(
+        method=method,
+        endpoint=endpoint_template(endpoint),
+        path=endpoint,
+        started_at=time.time(),
+        _started=time.perf_counter(),
+    )
+
+
+def end_request(
+    instrumentation: Instrumentation,
+    event: RequestEvent,
+    value: Any = None,
+    error: Optional[BaseException] = None,
+    defer: bool = False,
+):
+    """
+    Cierra el evento: lo emite ya o, si `defer` y la respuesta es JSON, lo deja
+    pendiente de la validación que hará el llamador.
+    """
+    if event.attempts == 0:
+        # Servido desde la caché: no hubo petición HTTP.
+        return
+    event.duration = time.perf_counter() - event._started
+    event.error = error
+    if defer and error is None and isinstance(value, (dict, list)):
+        _pending.set((instrumentation, event))
+    else:
+        _safe_emit(instrumentation, event)
+
+
+def record_transport(event: RequestEvent, elapsed: float, connect: float):
+    """
+    Reparte el tiempo de un envío entre obtener la conexión y esperar al servidor.
+    """
+    connect = min(connect, elapsed)
+    event.timings.connect += connect
+    event.timings.server += elapsed - connect
+
+
+def record_response(event: RequestEvent, resp, streamed: bool = False):
+    """
+    Anota el estado y los bytes de una respuesta (de requests o httpx).
+    """
+    event.status = resp.status_code
+    event.bytes_out += int(resp.request.headers.get("Content-Length") or 0)
+    if not streamed:
+        event.bytes_in += len(resp.content)
+
+
+def timed_validation(parse: Callable[[], Any]) -> Any:
+    """
+    Ejecuta la validación de una respuesta y emite el evento pendiente con su duración.
+    """
+    pending = _pending.get()
+    if pending is None:
+        return parse()
+    _pending.set(None)
+    instrumentation, event = pending
+    started = time.perf_counter()
+    try:
+        return parse()
+    finally:
+        elapsed = time.perf_counter() - started
+        event.timings.validate += elapsed
+        event.duration += elapsed
+        _safe_emit(instrumentation, event)
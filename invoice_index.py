@@ -0,0 +1,364 @@
+# fiskaly_sdk/invoice_index.py
+
+"""
+Índice local de facturas del SDK Fiskaly SIGN ES.
+
+`InvoiceIndex` replica la búsqueda global (`GET /invoices`) en una base SQLite
+(modo WAL) y responde las consultas por client, estado, tipo, rango de fechas e
+id localmente, sin recorrer páginas de la API en cada consulta.
+
+Cada `sync()` guarda una marca de agua: la mayor fecha de modificación vista.
+La siguiente sincronización solo pide a la API las facturas modificadas desde
+esa marca (menos un margen `overlap`, para no perder las que cambiaron mientras
+la anterior paginaba) y las inserta o actualiza; las que no cambiaron no se
+reescriben. Las marcas se guardan por conjunto de filtros, así que se pueden
+mantener varios índices parciales (p.ej. uno por client) en el mismo fichero.
+
+Uso:
+    with client.invoice_search.index("invoices.db") as index:
+        index.sync()
+        issued = index.query(client_id="client-1", state="ISSUED", issued_from="2024-01-01")
+"""
+
+import json
+import sqlite3
+import threading
+import time
+from dataclasses import dataclass
+from datetime import date, datetime, timedelta, timezone
+from typing import Any, Dict, List, Optional, Union
+
+from .models.invoice import InvoiceResponse
+from .pagination import page_params
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS invoices (
+    client_id TEXT NOT NULL,
+    invoice_id TEXT NOT NULL,
+    state TEXT,
+    type TEXT,
+    issued_at TEXT,
+    changed_at TEXT,
+    doc TEXT NOT NULL,
+    synced_at REAL NOT NULL,
+    PRIMARY KEY (client_id, invoice_id)
+);
+CREATE INDEX IF NOT EXISTS invoices_issued ON invoices (issued_at);
+CREATE INDEX IF NOT EXISTS invoices_client ON invoices (client_id, issued_at);
+CREATE INDEX IF NOT EXISTS invoices_state ON invoices (state, issued_at);
+CREATE INDEX IF NOT EXISTS invoices_id ON invoices (invoice_id);
+CREATE TABLE IF NOT EXISTS sync_state (
+    scope TEXT PRIMARY KEY,
+    high_water_mark TEXT,
+    synced_at REAL NOT NULL
+);
+"""
+
+Timestamp = Union[str, int, float, date, datetime]
+
+_ISO = "%Y-%m-%dT%H:%M:%SZ"
+
+
+def _timestamp(value: Optional[Timestamp]) -> Optional[str]:
+    """
+    Normaliza una fecha a ISO 8601 UTC (`YYYY-MM-DDTHH:MM:SSZ`), que en SQLite se
+    ordena como texto. Los epoch se interpretan en segundos; una `date` es su
+    medianoche UTC. Un texto que no se reconoce se deja tal cual.
+    """
+    if value is None or value == "":
+        return None
+    if isinstance(value, str) and len(value) == 20 and value[10] == "T" and value[19] == "Z":
+        return value
+    if isinstance(value, datetime):
+        if value.tzinfo is not None:
+            value = value.astimezone(timezone.utc)
+        return value.strftime(_ISO)
+    if isinstance(value, date):
+        return value.strftime("%Y-%m-%dT00:00:00Z")
+    if isinstance(value, (int, float)):
+        return time.strftime(_ISO, time.gmtime(value))
+    text = str(value)
+    try:
+        parsed = datetime.fromisoformat(text[:-1] + "+00:00" if text.endswith("Z") else text)
+    except ValueError:
+        return text
+    return _timestamp(parsed)
+
+
+def _shift(stamp: str, seconds: float) -> str:
+    try:
+        moment = datetime.strptime(stamp, _ISO)
+    except ValueError:
+        return stamp
+    return (moment - timedelta(seconds=seconds)).strftime(_ISO)
+
+
+@dataclass
+class IndexSyncResult:
+    """
+    Resultado de una sincronización del índice.
+    """
+    fetched: int
+    inserted: int
+    updated: int
+    unchanged: int
+    since: Optional[str]
+    high_water_mark: Optional[str]
+    duration: float
+
+
+class InvoiceIndex:
+    """
+    Réplica local, en SQLite, de la búsqueda global de facturas.
+    """
+
+    def __init__(
+        self,
+        client,
+        path: str = "fiskaly_invoices.db",
+        since_param: str = "updated_since",
+        changed_field: str = "updated_at",
+        issued_field: str = "issued_at",
+        overlap: float = 300.0,
+        page_size: int = 100,
+        commit_rows: int = 5000,
+    ):
+        """
+        :param client: FiskalyClient con el que sincronizar.
+        :param path: Fichero SQLite del índice (":memory:" para pruebas).
+        :param since_param: Filtro de `/invoices` con el que se piden las facturas
+            modificadas desde una fecha. Si la API lo ignora, cada sincronización
+            recorre todo (el índice sigue siendo correcto, solo más lento).
+        :param changed_field: Campo de `content` con la fecha de última modificación
+            (si falta se usa `issued_field`).
+        :param issued_field: Campo de `content` con la fecha de emisión.
+        :param overlap: Segundos antes de la marca de agua que se vuelven a pedir.
+        :param page_size: Facturas por página al sincronizar.
+        :param commit_rows: Filas escritas entre confirmaciones durante una sincronización
+            (confirmar cada página multiplica el coste de mantener los índices).
+        """
+        self.client = client
+        self.path = path
+        self.since_param = since_param
+        self.changed_field = changed_field
+        self.issued_field = issued_field
+        self.overlap = overlap
+        self.page_size = page_size
+        self.commit_rows = commit_rows
+        self._db = sqlite3.connect(path, check_same_thread=False, isolation_level=None)
+        self._db.execute("PRAGMA journal_mode=WAL")
+        self._db.execute("PRAGMA synchronous=NORMAL")
+        self._db.executescript(_SCHEMA)
+        self._lock = threading.Lock()
+        self._sync_lock = threading.Lock()
+
+    @staticmethod
+    def _scope(params: Optional[Dict[str, Any]]) -> str:
+        return json.dumps(params or {}, sort_keys=True, default=str)
+
+    def high_water_mark(self, params: Optional[Dict[str, Any]] = None) -> Optional[str]:
+        """
+        Marca de agua de la última sincronización completa con esos filtros.
+        """
+        with self._lock:
+            row = self._db.execute("SELECT high_water_mark FROM sync_state WHERE scope = ?", (self._scope(params),)).fetchone()
+        return row[0] if row else None
+
+    def sync(self, params: Optional[Dict[str, Any]] = None, full: bool = False) -> IndexSyncResult:
+        """
+        Trae de la API las facturas nuevas o modificadas desde la última sincronización.
+
+        La marca de agua solo avanza cuando se han recorrido todas las páginas: si
+        la sincronización falla a mitad, la siguiente vuelve a empezar desde la
+        marca anterior (lo ya guardado no se duplica).
+
+        :param params: Filtros de `/invoices` que delimitan lo que se replica (p.ej. client_id).
+        :param full: Ignora la marca de agua y recorre todas las facturas.
+        :return: IndexSyncResult con facturas leídas, insertadas, actualizadas y sin cambios.
+        :raises FiskalyApiError: Si la API responde con error.
+        """
+        with self._sync_lock:
+            started = time.perf_counter()
+            scope = self._scope(params)
+            previous = None if full else self.high_water_mark(params)
+            since = _shift(previous, self.overlap) if previous else None
+            query = dict(params or {})
+            if since:
+                query[self.since_param] = since
+
+            fetched = inserted = updated = pending = 0
+            mark = previous
+            token = None
+            with self._lock:
+                self._db.execute("BEGIN")
+            try:
+                while True:
+                    page = self.client.request("GET", "/invoices", params=page_params(query, self.page_size, token))
+                    items = page.get("results") or []
+                    added, changed, newest = self._store(items, (params or {}).get("client_id"))
+                    fetched += len(items)
+                    inserted += added
+                    updated += changed
+                    pending += added + changed
+                    if newest and (mark is None or newest > mark):
+                        mark = newest
+                    if pending >= self.commit_rows:
+                        self._commit(reopen=True)
+                        pending = 0
+                    next_token = (page.get("pagination") or {}).get("token")
+                    if not items or not next_token or next_token == token:
+                        break
+                    token = next_token
+            finally:
+                # Lo guardado es correcto aunque la sincronización falle: se confirma igual.
+                self._commit(reopen=False)
+
+            with self._lock:
+                self._db.execute(
+                    "INSERT OR REPLACE INTO sync_state (scope, high_water_mark, synced_at) VALUES (?, ?, ?)",
+                    (scope, mark, time.time()),
+                )
+            return IndexSyncResult(
+                fetched=fetched,
+                inserted=inserted,
+                updated=updated,
+                unchanged=fetched - inserted - updated,
+                since=since,
+                high_water_mark=mark,
+                duration=time.perf_counter() - started,
+            )
+
+    def _store(self, items: List[Dict[str, Any]], default_client: Optional[str]):
+        rows = {}
+        newest = None
+        now = time.time()
+        for item in items:
+            content = item.get("content") or {}
+            issued_at = _timestamp(content.get(self.issued_field))
+            changed_at = _timestamp(content.get(self.changed_field)) or issued_at
+            key = (content.get("client_id") or default_client or "", content["id"])
+            doc = json.dumps(item, sort_keys=True, separators=(",", ":"))
+            rows[key] = (content.get("state"), content.get("type"), issued_at, changed_at, doc, now) + key
+            if changed_at and (newest is None or changed_at > newest):
+                newest = changed_at
+        if not rows:
+            return 0, 0, newest
+
+        with self._lock:
+            lookup = "SELECT doc FROM invoices WHERE client_id = ? AND invoice_id = ?"
+            existing = {}
+            for key in rows:
+                found = self._db.execute(lookup, key).fetchone()
+                if found is not None:
+                    existing[key] = found[0]
+            new = [row for key, row in rows.items() if key not in existing]
+            changed = [row for key, row in rows.items() if key in existing and existing[key] != row[4]]
+            self._db.executemany(
+                "INSERT INTO invoices (state, type, issued_at, changed_at, doc, synced_at, client_id, invoice_id)"
+                " VALUES (?, ?, ?, ?, ?, ?, ?, ?)",
+                new,
+            )
+            self._db.executemany(
+                "UPDATE invoices SET state = ?, type = ?, issued_at = ?, changed_at = ?, doc = ?, synced_at = ?"
+                " WHERE client_id = ? AND invoice_id = ?",
+                changed,
+            )
+        return len(new), len(changed), newest
+
+    def _commit(self, reopen: bool):
+        with self._lock:
+            self._db.execute("COMMIT")
+            if reopen:
+                self._db.execute("BEGIN")
+
+    def _where(self, client_id, state, invoice_type, invoice_id, issued_from, issued_before):
+        clauses, args = [], []
+        for column, value in (("client_id", client_id), ("state", state), ("type", invoice_type), ("invoice_id", invoice_id)):
+            if value is None:
+                continue
+            if isinstance(value, (list, tuple, set, frozenset)):
+                values = list(value)
+                clauses.append(f"{column} IN ({', '.join('?' * len(values))})")
+                args.extend(values)
+            else:
+                clauses.append(f"{column} = ?")
+                args.append(value)
+        if issued_from is not None:
+            clauses.append("issued_at >= ?")
+            args.append(_timestamp(issued_from))
+        if issued_before is not None:
+            clauses.append("issued_at < ?")
+            args.append(_timestamp(issued_before))
+        return (" WHERE " + " AND ".join(clauses)) if clauses else "", args
+
+    def query(
+        self,
+        client_id: Optional[Union[str, List[str]]] = None,
+        state: Optional[Union[str, List[str]]] = None,
+        invoice_type: Optional[Union[str, List[str]]] = None,
+        invoice_id: Optional[str] = None,
+        issued_from: Optional[Timestamp] = None,
+        issued_before: Optional[Timestamp] = None,
+        limit: Optional[int] = None,
+        offset: int = 0,
+        newest_first: bool = False,
+    ) -> List[Any]:
+        """
+        Busca facturas en el índice local (no llama a la API).
+
+        Los filtros de texto admiten un valor o una lista de valores. Las fechas
+        admiten texto ISO 8601, epoch en segundos, `date` o `datetime`.
+
+        :param issued_from: Emitidas en o después de esta fecha.
+        :param issued_before: Emitidas antes de esta fecha (excluida).
+        :param limit: Máximo de resultados (None = todos).
+        :param offset: Resultados a saltar.
+        :param newest_first: Ordena de la más reciente a la más antigua (por defecto, al revés).
+        :return: Facturas según `response_mode` del cliente (InvoiceResponse, LazyModel o dict).
+        """
+        where, args = self._where(client_id, state, invoice_type, invoice_id, issued_from, issued_before)
+        order = "DESC" if newest_first else "ASC"
+        sql = f"SELECT doc FROM invoices{where} ORDER BY issued_at {order}, invoice_id {order}"
+        if limit is not None or offset:
+            sql += " LIMIT ? OFFSET ?"
+            args += [-1 if limit is None else limit, offset]
+        with self._lock:
+            rows = self._db.execute(sql, args).fetchall()
+        return [self.client.parse(InvoiceResponse, json.loads(doc)) for (doc,) in rows]
+
+    def count(
+        self,
+        client_id: Optional[Union[str, List[str]]] = None,
+        state: Optional[Union[str, List[str]]] = None,
+        invoice_type: Optional[Union[str, List[str]]] = None,
+        issued_from: Optional[Timestamp] = None,
+        issued_before: Optional[Timestamp] = None,
+    ) -> int:
+        """
+        Cuenta las facturas del índice que cumplen los filtros (ver `query`).
+        """
+        where, args = self._where(client_id, state, invoice_type, None, issued_from, issued_before)
+        with self._lock:
+            return self._db.execute(f"SELECT COUNT(*) FROM invoices{where}", args).fetchone()[0]
+
+    def get(self, invoice_id: str, client_id: Optional[str] = None) -> Optional[Any]:
+        """
+        Factura del índice por id (y client, si hay ids repetidos entre clients).
+
+        :return: La factura, o None si no está en el índice.
+        """
+        found = self.query(client_id=client_id, invoice_id=invoice_id, limit=1)
+        return found[0] if found else None
+
+    def __len__(self) -> int:
+        return self.count()
+
+    def close(self):
+        with self._lock:
+            self._db.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.close()
@@ -0,0 +1,68 @@
+# fiskaly_sdk/lazy.py
+
+"""
+Carga perezosa de módulos del SDK Fiskaly SIGN ES.
+
+Importar el paquete o crear un cliente no carga los recursos de la API ni los
+modelos Pydantic: cada módulo se importa la primera vez que se usa. Así un
+proceso que solo emite una factura (p.ej. una función serverless en frío) no
+paga por construir los modelos del resto de recursos.
+"""
+
+import importlib
+from typing import Any, Callable, Dict, List, Mapping, Tuple
+
+
+class LazyResource:
+    """
+    Atributo de cliente que importa y crea el recurso en el primer acceso.
+
+    El recurso se guarda en la instancia, así que los accesos siguientes son una
+    búsqueda normal de atributo. Si dos hilos acceden a la vez por primera vez se
+    pueden crear dos instancias; es inocuo porque los recursos no tienen estado
+    propio aparte del cliente.
+    """
+
+    def __init__(self, module: str, class_name: str):
+        """
+        :param module: Módulo del recurso, relativo al paquete (p.ej. ".api.invoices").
+        :param class_name: Clase del recurso (se construye con el cliente).
+        """
+        self.module = module
+        self.class_name = class_name
+        self.name = class_name
+
+    def __set_name__(self, owner, name):
+        self.name = name
+
+    def __get__(self, instance, owner=None):
+        if instance is None:
+            return self
+        resource_cls = getattr(importlib.import_module(self.module, __package__), self.class_name)
+        resource = instance.__dict__[self.name] = resource_cls(instance)
+        return resource
+
+
+def lazy_exports(namespace: Dict[str, Any], exports: Mapping[str, str]) -> Tuple[Callable[[str], Any], Callable[[], List[str]]]:
+    """
+    Crea `__getattr__` y `__dir__` de módulo (PEP 562) que importan cada nombre exportado
+    desde su submódulo la primera vez que se pide.
+
+    :param namespace: `globals()` del paquete.
+    :param exports: Nombre exportado -> submódulo relativo (p.ej. {"InvoiceResponse": ".invoice"}).
+    :return: (__getattr__, __dir__) para asignar en el módulo.
+    """
+    package = namespace["__name__"]
+
+    def __getattr__(name: str) -> Any:
+        module = exports.get(name)
+        if module is None:
+            raise AttributeError(f"module {package!r} has no attribute {name!r}")
+        value = getattr(importlib.import_module(module, package), name)
+        namespace[name] = value
+        return value
+
+    def __dir__() -> List[str]:
+        return sorted(set(namespace) | set(exports))
+
+    return __getattr__, __dir__
@@ -10,6 +10,9 @@ def setup_logging(level=logging.INFO):
     """
     Configura el logging global del SDK Fiskaly.
 
+    Para registrar una línea por petición, pasa `instrumentation=LoggingInstrumentation()`
+    al cliente (ver `fiskaly_sdk.instrumentation`).
+
     :param level: Nivel de logging (por defecto: INFO).
     """
     logging.basicConfig(
@@ -0,0 +1,299 @@
+# fiskaly_sdk/metrics.py
+
+"""
+Métricas agregadas del SDK Fiskaly SIGN ES.
+
+Cada llamada a `FiskalyClient.request` y cada descarga en streaming (y sus
+versiones asíncronas) actualiza un MetricsRegistry: histograma de latencia de buckets fijos y contadores por
+endpoint normalizado (p.ej. `/clients/{id}/invoices/{id}`), método y clase de
+estado (2xx, 4xx, 5xx o "error" si no hubo respuesta), más el gauge de
+peticiones en curso y el uso del pool de conexiones.
+
+Cada hilo escribe en su propio fragmento ("shard"), así que registrar una
+petición no toma ningún lock compartido; `snapshot()` suma los fragmentos.
+Cuando un hilo termina, su fragmento se suma a un acumulado de hilos retirados
+y se descarta, así que la memoria no crece con el número de hilos creados.
+
+    from fiskaly_sdk.metrics import default_registry, prometheus_text
+    print(prometheus_text(default_registry()))
+"""
+
+import bisect
+import threading
+import time
+import weakref
+from dataclasses import dataclass, field
+from typing import Dict, List, Optional, Sequence, Set, Tuple
+
+from .exceptions import FiskalyApiError
+from .instrumentation import endpoint_template
+
+# Límites superiores (segundos) de los buckets del histograma de latencia.
+DEFAULT_BUCKETS: Tuple[float, ...] = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0)
+
+SeriesKey = Tuple[str, str, str]
+
+
+def status_class(error: Optional[BaseException]) -> str:
+    """
+    Clase de estado de una llamada a partir de la excepción que lanzó (None = éxito).
+    """
+    if error is None:
+        return "2xx"
+    if isinstance(error, FiskalyApiError) and error.status_code is not None:
+        return f"{error.status_code // 100}xx"
+    return "error"
+
+
+class _Shard:
+    """
+    Contadores escritos por un único hilo.
+    """
+
+    def __init__(self, buckets: Tuple[float, ...]):
+        self.buckets = buckets
+        self.in_flight = 0
+        # (método, endpoint, clase) -> [cuenta por bucket..., cuenta +Inf, suma]
+        self.series: Dict[SeriesKey, List[float]] = {}
+
+    def observe(self, method: str, endpoint: str, status: str, seconds: float):
+        key = (method, endpoint_template(endpoint), status)
+        values = self.series.get(key)
+        if values is None:
+            values = self.series[key] = [0] * (len(self.buckets) + 1) + [0.0]
+        values[bisect.bisect_left(self.buckets, seconds)] += 1
+        values[-1] += seconds
+
+
+class RequestMeter:
+    """
+    Medición de una llamada en curso: la cuenta en el gauge al crearse y, en
+    `done`, observa su latencia y clase de estado en el fragmento del hilo.
+    """
+    __slots__ = ("shard", "method", "endpoint", "started")
+
+    def __init__(self, shard: _Shard, method: str, endpoint: str):
+        self.shard = shard
+        self.method = method
+        self.endpoint = endpoint
+        shard.in_flight += 1
+        self.started = time.perf_counter()
+
+    def done(self, error: Optional[BaseException] = None):
+        """
+        Cierra la medición (`error` es la excepción que recibió el llamador, si la hubo).
+        """
+        shard = self.shard
+        shard.in_flight -= 1
+        shard.observe(self.method, self.endpoint, status_class(error), time.perf_counter() - self.started)
+
+
+def _merge(totals: Dict[SeriesKey, List[float]], series: Dict[SeriesKey, List[float]]):
+    for key, values in list(series.items()):
+        merged = totals.get(key)
+        if merged is None:
+            totals[key] = list(values)
+        else:
+            for index, value in enumerate(values):
+                merged[index] += value
+
+
+class _ThreadToken:
+    """
+    Objeto guardado solo en el `threading.local` de un hilo: se libera cuando el
+    hilo termina y su finalizador retira el fragmento.
+    """
+    __slots__ = ("__weakref__",)
+
+
+def _retire_shard(registry_ref, shard: _Shard):
+    registry = registry_ref()
+    if registry is not None:
+        registry._retire(shard)
+
+
+@dataclass
+class RequestSeries:
+    """
+    Histograma de latencia de una combinación (método, endpoint, clase de estado).
+
+    `buckets` son pares (límite superior, cuenta acumulada), como en Prometheus.
+    """
+    method: str
+    endpoint: str
+    status_class: str
+    count: int
+    sum: float
+    buckets: List[Tuple[float, int]]
+
+
+@dataclass
+class MetricsSnapshot:
+    """
+    Foto de las métricas de un MetricsRegistry.
+    """
+    requests: List[RequestSeries] = field(default_factory=list)
+    in_flight: int = 0
+    pool_in_use: int = 0
+    pool_idle: int = 0
+    pool_created: int = 0
+    pool_reused: int = 0
+
+    def series(self, method: str, endpoint: str, status_class: str = "2xx") -> Optional[RequestSeries]:
+        """
+        Busca una serie por método, endpoint normalizado y clase de estado.
+        """
+        for series in self.requests:
+            if (series.method, series.endpoint, series.status_class) == (method, endpoint, status_class):
+                return series
+        return None
+
+
+class MetricsRegistry:
+    """
+    Registro de métricas del SDK, compartible entre varios clientes.
+    """
+
+    def __init__(self, buckets: Sequence[float] = DEFAULT_BUCKETS):
+        """
+        :param buckets: Límites superiores de los buckets de latencia, en segundos.
+        """
+        self.buckets = tuple(sorted(buckets))
+        # Reentrante: el finalizador de un hilo puede ejecutarse con el lock tomado.
+        self._lock = threading.RLock()
+        self._local = threading.local()
+        self._shards: Set[_Shard] = set()
+        # Suma de los fragmentos de hilos ya terminados.
+        self._retired: Dict[SeriesKey, List[float]] = {}
+        self._retired_in_flight = 0
+        self._pools = weakref.WeakSet()
+
+    def shard(self) -> _Shard:
+        """
+        Fragmento del hilo actual (se crea la primera vez y se retira al terminar el hilo).
+        """
+        shard = getattr(self._local, "shard", None)
+        if shard is None:
+            shard = self._local.shard = _Shard(self.buckets)
+            token = self._local.token = _ThreadToken()
+            with self._lock:
+                self._shards.add(shard)
+            weakref.finalize(token, _retire_shard, weakref.ref(self), shard).atexit = False
+        return shard
+
+    def start(self, method: str, endpoint: str) -> RequestMeter:
+        """
+        Empieza a medir una llamada en el hilo actual; ciérrala con `done()`.
+        """
+        return RequestMeter(self.shard(), method, endpoint)
+
+    def _retire(self, shard: _Shard):
+        with self._lock:
+            if shard in self._shards:
+                self._shards.discard(shard)
+                _merge(self._retired, shard.series)
+                self._retired_in_flight += shard.in_flight
+
+    def track_pool(self, client):
+        """
+        Incluye el pool de conexiones de un cliente (con `pool_stats()`) en los gauges.
+        """
+        with self._lock:
+            self._pools.add(client)
+
+    def snapshot(self) -> MetricsSnapshot:
+        """
+        Suma los fragmentos de todos los hilos y el uso de los pools registrados.
+        """
+        totals: Dict[SeriesKey, List[float]] = {}
+        with self._lock:
+            shards = list(self._shards)
+            pools = list(self._pools)
+            _merge(totals, self._retired)
+            in_flight = self._retired_in_flight
+        for shard in shards:
+            in_flight += shard.in_flight
+            _merge(totals, shard.series)
+
+        snapshot = MetricsSnapshot(in_flight=in_flight)
+        for (method, endpoint, status), values in sorted(totals.items()):
+            cumulative, running = [], 0
+            for bound, count in zip(self.buckets, values):
+                running += count
+                cumulative.append((bound, running))
+            count = running + values[len(self.buckets)]
+            cumulative.append((float("inf"), count))
+            snapshot.requests.append(RequestSeries(method, endpoint, status, count, values[-1], cumulative))
+        for client in pools:
+            stats = client.pool_stats()
+            snapshot.pool_in_use += stats.in_use
+            snapshot.pool_idle += stats.idle
+            snapshot.pool_created += stats.created
+            snapshot.pool_reused += stats.reused
+        return snapshot
+
+    def reset(self):
+        """
+        Pone a cero los histogramas (el gauge de peticiones en curso se conserva).
+        """
+        with self._lock:
+            for shard in self._shards:
+                shard.series = {}
+            self._retired = {}
+
+
+_DEFAULT_REGISTRY = MetricsRegistry()
+
+
+def default_registry() -> MetricsRegistry:
+    """
+    Registro compartido que usan por defecto todos los clientes.
+    """
+    return _DEFAULT_REGISTRY
+
+
+def _escape(value: str) -> str:
+    return value.replace("\\", "\\\\").replace("\"", "\\\"").replace("\n", "\\n")
+
+
+def _format_bound(bound: float) -> str:
+    return "+Inf" if bound == float("inf") else repr(bound)
+
+
+def prometheus_text(registry: MetricsRegistry, prefix: str = "fiskaly") -> str:
+    """
+    Exposición de las métricas en formato de texto de Prometheus (versión 0.0.4).
+
+    :param registry: Registro a exponer.
+    :param prefix: Prefijo de los nombres de métrica.
+    :return: Texto listo para servir en `/metrics`.
+    """
+    snapshot = registry.snapshot()
+    name = f"{prefix}_request_duration_seconds"
+    lines = [
+        f"# HELP {name} Latencia de las llamadas a la API Fiskaly.",
+        f"# TYPE {name} histogram",
+    ]
+    for series in snapshot.requests:
+        labels = (f'method="{_escape(series.method)}",endpoint="{_escape(series.endpoint)}",'
+                  f'status_class="{_escape(series.status_class)}"')
+        for bound, count in series.buckets:
+            lines.append(f'{name}_bucket{{{labels},le="{_format_bound(bound)}"}} {count}')
+        lines.append(f"{name}_sum{{{labels}}} {series.sum!r}")
+        lines.append(f"{name}_count{{{labels}}} {series.count}")
+    lines += [
+        f"# HELP {prefix}_requests_in_flight Llamadas a la API en curso.",
+        f"# TYPE {prefix}_requests_in_flight gauge",
+        f"{prefix}_requests_in_flight {snapshot.in_flight}",
+        f"# HELP {prefix}_pool_connections Conexiones del pool por estado.",
+        f"# TYPE {prefix}_pool_connections gauge",
+        f'{prefix}_pool_connections{{state="in_use"}} {snapshot.pool_in_use}',
+        f'{prefix}_pool_connections{{state="idle"}} {snapshot.pool_idle}',
+        f"# HELP {prefix}_pool_connections_created_total Conexiones nuevas abiertas por el pool.",
+        f"# TYPE {prefix}_pool_connections_created_total counter",
+        f"{prefix}_pool_connections_created_total {snapshot.pool_created}",
+        f"# HELP {prefix}_pool_connections_reused_total Peticiones servidas con una conexión reutilizada.",
+        f"# TYPE {prefix}_pool_connections_reused_total counter",
+        f"{prefix}_pool_connections_reused_total {snapshot.pool_reused}",
+    ]
+    return "\n".join(lines) + "\n"
@@ -12,13 +12,62 @@ Incluye todos los esquemas y validadores Pydantic para los distintos recursos de
     - Exports (exportaciones)
     - TaxpayerAgreement (acuerdos)
     - Software (software registrado)
+
+Los módulos se importan al pedir el primer modelo de cada uno, así que
+`import fiskaly_sdk.models` no construye ningún modelo Pydantic.
 """
 
-from .auth import *
-from .taxpayer import *
-from .signer import *
-from .client import *
-from .invoice import *
-from .export import *
-from .taxpayer_agreement import *
-from .software import *
+from ..lazy import lazy_exports
+
+_EXPORTS = {
+    "AuthRequestContent": ".auth",
+    "AuthRequest": ".auth",
+    "AuthToken": ".auth",
+    "AuthResponseContent": ".auth",
+    "AuthResponse": ".auth",
+    "IssuerModel": ".taxpayer",
+    "TaxpayerRequestContent": ".taxpayer",
+    "TaxpayerRequest": ".taxpayer",
+    "TaxpayerStateRequest": ".taxpayer",
+    "TaxpayerResponseContent": ".taxpayer",
+    "TaxpayerResponse": ".taxpayer",
+    "CertificateModel": ".signer",
+    "SignerContentModel": ".signer",
+    "SignerModel": ".signer",
+    "SignerRequestContent": ".signer",
+    "SignerRequest": ".signer",
+    "SignerStateRequest": ".signer",
+    "SignerResponse": ".signer",
+    "SignersListResponse": ".signer",
+    "ClientRequestContent": ".client",
+    "ClientRequest": ".client",
+    "ClientStateRequest": ".client",
+    "ClientSignerModel": ".client",
+    "ClientResponseContent": ".client",
+    "ClientResponse": ".client",
+    "ClientsPaginationModel": ".client",
+    "ClientsListResponse": ".client",
+    "InvoiceRequest": ".invoice",
+    "InvoiceResponseContent": ".invoice",
+    "InvoiceResponse": ".invoice",
+    "PaginationModel": ".invoice",
+    "InvoicesListResponse": ".invoice",
+    "ExportRequestContent": ".export",
+    "ExportRequest": ".export",
+    "ExportUpdateRequest": ".export",
+    "ExportResponseContent": ".export",
+    "ExportResponse": ".export",
+    "ExportsListResponse": ".export",
+    "AddressModel": ".taxpayer_agreement",
+    "RepresentativeModel": ".taxpayer_agreement",
+    "TaxpayerAgreementGenerateRequestContent": ".taxpayer_agreement",
+    "TaxpayerAgreementGenerateRequest": ".taxpayer_agreement",
+    "TaxpayerAgreementUploadRequest": ".taxpayer_agreement",
+    "TaxpayerAgreementResponseContent": ".taxpayer_agreement",
+    "TaxpayerAgreementResponse": ".taxpayer_agreement",
+    "SoftwareResponseContent": ".software",
+    "SoftwareResponse": ".software",
+}
+
+__all__ = list(_EXPORTS)
+__getattr__, __dir__ = lazy_exports(globals(), _EXPORTS)
@@ -0,0 +1,412 @@
+# fiskaly_sdk/outbox.py
+
+"""
+Outbox duradero para la emisión de facturas del SDK Fiskaly SIGN ES.
+
+`InvoiceOutbox.enqueue` guarda la factura con su GUID ya generado en una cola
+SQLite (modo WAL) y vuelve de inmediato, así que el cobro no espera a la API.
+Un hilo de fondo reparte las facturas pendientes entre varios workers y las
+entrega con `PUT /clients/{client_id}/invoices/{invoice_id}`; como el PUT es
+idempotente por GUID, reintentar una entrega (o reenviarla tras un reinicio a
+mitad de envío) nunca duplica la factura.
+
+Las facturas de un mismo client (dispositivo) se entregan de una en una y en el
+orden en que se encolaron, porque el encadenamiento fiscal es por dispositivo;
+las de clients distintos van en paralelo. Los errores transitorios (conexión,
+429, 5xx) se reintentan con backoff exponencial sin límite; el resto marca la
+factura como FAILED y no bloquea a las siguientes.
+
+Uso:
+    with client.invoices.outbox("outbox.db") as outbox:
+        invoice_id = outbox.enqueue("client-1", content)
+        ...
+        entry = outbox.wait(invoice_id, timeout=10)
+"""
+
+import json
+import logging
+import random
+import sqlite3
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from typing import Any, Dict, List, Optional, Tuple
+
+from .exceptions import FiskalyApiError, FiskalyError
+from .models.invoice import InvoiceRequest
+from .utils import generate_guid
+
+logger = logging.getLogger(__name__)
+
+PENDING = "PENDING"
+SENDING = "SENDING"
+DELIVERED = "DELIVERED"
+FAILED = "FAILED"
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS outbox (
+    seq INTEGER PRIMARY KEY AUTOINCREMENT,
+    invoice_id TEXT NOT NULL UNIQUE,
+    client_id TEXT NOT NULL,
+    payload TEXT NOT NULL,
+    state TEXT NOT NULL,
+    attempts INTEGER NOT NULL DEFAULT 0,
+    next_attempt_at REAL NOT NULL,
+    last_error TEXT,
+    response TEXT,
+    created_at REAL NOT NULL,
+    updated_at REAL NOT NULL
+);
+CREATE INDEX IF NOT EXISTS outbox_lane ON outbox (client_id, state, seq);
+CREATE INDEX IF NOT EXISTS outbox_due ON outbox (state, next_attempt_at);
+"""
+
+# Primera factura sin entregar de cada client, si no hay otra suya en envío.
+_LANE_HEAD = "state = 'PENDING' AND seq = (SELECT MIN(seq) FROM outbox WHERE client_id = o.client_id AND state IN ('PENDING', 'SENDING'))"
+_CLAIM = f"SELECT seq, invoice_id, client_id, payload, attempts FROM outbox AS o WHERE {_LANE_HEAD} AND next_attempt_at <= ? ORDER BY seq LIMIT ?"
+_NEXT_DUE = f"SELECT MIN(next_attempt_at) FROM outbox AS o WHERE {_LANE_HEAD}"
+
+
+@dataclass
+class OutboxEntry:
+    """
+    Estado de entrega de una factura encolada.
+
+    `response` es la respuesta JSON de la API una vez entregada (se puede convertir
+    con `client.parse(InvoiceResponse, entry.response)`); si el cuerpo no era JSON,
+    el texto recibido.
+    """
+    invoice_id: str
+    client_id: str
+    state: str
+    attempts: int
+    last_error: Optional[str]
+    response: Optional[Any]
+    created_at: float
+    updated_at: float
+
+    @property
+    def done(self) -> bool:
+        """
+        True si la factura ya no se va a intentar entregar (DELIVERED o FAILED).
+        """
+        return self.state in (DELIVERED, FAILED)
+
+
+def _response_json(response: Any) -> str:
+    """
+    Serializa la respuesta de una entrega. Un cuerpo que no es JSON (bytes) se
+    guarda como texto, para que la fila pase igualmente a DELIVERED.
+    """
+    if isinstance(response, (bytes, bytearray)):
+        response = bytes(response).decode("utf-8", errors="replace")
+    try:
+        return json.dumps(response)
+    except (TypeError, ValueError):
+        return json.dumps(repr(response))
+
+
+def _is_transient(error: Exception) -> bool:
+    if not isinstance(error, FiskalyApiError):
+        return False
+    status = error.status_code
+    return status is None or status in (408, 429) or status >= 500
+
+
+class InvoiceOutbox:
+    """
+    Cola duradera de facturas con entrega en segundo plano.
+    """
+
+    def __init__(
+        self,
+        client,
+        path: str = "fiskaly_outbox.db",
+        workers: Optional[int] = None,
+        initial_delay: float = 1.0,
+        max_delay: float = 60.0,
+        poll_interval: float = 1.0,
+        start: bool = True,
+    ):
+        """
+        :param client: FiskalyClient usado para entregar las facturas.
+        :param path: Fichero SQLite de la cola (":memory:" para pruebas, sin durabilidad).
+        :param workers: Entregas en paralelo (por defecto, `pool_maxsize` del cliente).
+        :param initial_delay: Primera espera tras un error transitorio, en segundos.
+        :param max_delay: Espera máxima entre reintentos, en segundos.
+        :param poll_interval: Cada cuánto se revisa la cola aunque nadie encole, en segundos.
+        :param start: Arranca el hilo de entrega al crear el outbox.
+        """
+        self.client = client
+        self.path = path
+        self.workers = workers or client.config.pool_maxsize
+        self.initial_delay = initial_delay
+        self.max_delay = max_delay
+        self.poll_interval = poll_interval
+        self._db = sqlite3.connect(path, check_same_thread=False, isolation_level=None)
+        self._db.execute("PRAGMA journal_mode=WAL")
+        # FULL: en WAL, NORMAL puede perder las últimas facturas confirmadas al llamador
+        # si se corta la luz.
+        self._db.execute("PRAGMA synchronous=FULL")
+        self._db.executescript(_SCHEMA)
+        # Entregas interrumpidas (p.ej. el proceso murió a mitad de envío): se
+        # repiten, el PUT idempotente evita duplicados.
+        self._db.execute("UPDATE outbox SET state = ? WHERE state = ?", (PENDING, SENDING))
+        self._lock = threading.Condition()
+        self._running = 0
+        self._wake = threading.Event()
+        self._closed = False
+        self._executor: Optional[ThreadPoolExecutor] = None
+        self._thread: Optional[threading.Thread] = None
+        if start:
+            self.start()
+
+    def start(self) -> "InvoiceOutbox":
+        """
+        Arranca el hilo de entrega (si no estaba ya en marcha).
+        """
+        with self._lock:
+            if self._closed:
+                raise RuntimeError("El InvoiceOutbox está cerrado")
+            if self._thread is None:
+                self._executor = ThreadPoolExecutor(max_workers=self.workers, thread_name_prefix="fiskaly-outbox")
+                self._thread = threading.Thread(target=self._run, name="fiskaly-outbox-flusher", daemon=True)
+                self._thread.start()
+        return self
+
+    def enqueue(
+        self,
+        client_id: str,
+        content: Dict[str, Any],
+        metadata: Optional[Dict[str, Any]] = None,
+        invoice_id: Optional[str] = None,
+    ) -> str:
+        """
+        Guarda una factura para entregarla en segundo plano y vuelve de inmediato.
+
+        Encolar dos veces el mismo `invoice_id` no crea una segunda entrega.
+
+        :param client_id: ID del dispositivo emisor.
+        :param content: Cuerpo de la factura según especificación.
+        :param metadata: Metadata adicional (opcional).
+        :param invoice_id: ID único de la factura (si None, se genera uno nuevo).
+        :return: ID de la factura, con el que consultar su estado.
+        """
+        invoice_id = invoice_id or generate_guid()
+        payload = InvoiceRequest(content=content, metadata=metadata or {}).model_dump_json()
+        now = time.time()
+        with self._lock:
+            self._db.execute(
+                "INSERT OR IGNORE INTO outbox (invoice_id, client_id, payload, state, next_attempt_at, created_at, updated_at)"
+                " VALUES (?, ?, ?, ?, ?, ?, ?)",
+                (invoice_id, client_id, payload, PENDING, now, now, now),
+            )
+        self._wake.set()
+        return invoice_id
+
+    def status(self, invoice_id: str) -> OutboxEntry:
+        """
+        Estado de entrega de una factura.
+
+        :raises FiskalyError: Si la factura no está en el outbox.
+        """
+        with self._lock:
+            row = self._db.execute(
+                "SELECT invoice_id, client_id, state, attempts, last_error, response, created_at, updated_at"
+                " FROM outbox WHERE invoice_id = ?",
+                (invoice_id,),
+            ).fetchone()
+        if row is None:
+            raise FiskalyError(f"La factura {invoice_id} no está en el outbox")
+        return OutboxEntry(
+            invoice_id=row[0],
+            client_id=row[1],
+            state=row[2],
+            attempts=row[3],
+            last_error=row[4],
+            response=json.loads(row[5]) if row[5] else None,
+            created_at=row[6],
+            updated_at=row[7],
+        )
+
+    def wait(self, invoice_id: str, timeout: Optional[float] = None) -> OutboxEntry:
+        """
+        Espera a que una factura se entregue o falle definitivamente.
+
+        :param timeout: Segundos máximos de espera (None = sin límite).
+        :return: Último estado conocido; si vence el timeout, `entry.done` es False.
+        """
+        deadline = None if timeout is None else time.monotonic() + timeout
+        with self._lock:
+            entry = self.status(invoice_id)
+            while not entry.done:
+                remaining = None if deadline is None else deadline - time.monotonic()
+                if remaining is not None and remaining <= 0:
+                    break
+                self._lock.wait(remaining)
+                if self._closed:
+                    break
+                entry = self.status(invoice_id)
+            return entry
+
+    def flush(self, timeout: Optional[float] = None) -> bool:
+        """
+        Espera a que no quede ninguna factura pendiente de entrega.
+
+        :return: True si la cola quedó vacía antes del timeout.
+        """
+        deadline = None if timeout is None else time.monotonic() + timeout
+        with self._lock:
+            while self.pending():
+                remaining = None if deadline is None else deadline - time.monotonic()
+                if self._closed or (remaining is not None and remaining <= 0):
+                    return False
+                self._lock.wait(remaining)
+            return True
+
+    def pending(self) -> int:
+        """
+        Facturas aún sin entregar (PENDING o SENDING).
+        """
+        with self._lock:
+            return self._db.execute("SELECT COUNT(*) FROM outbox WHERE state IN (?, ?)", (PENDING, SENDING)).fetchone()[0]
+
+    def counts(self) -> Dict[str, int]:
+        """
+        Número de facturas por estado.
+        """
+        with self._lock:
+            return dict(self._db.execute("SELECT state, COUNT(*) FROM outbox GROUP BY state").fetchall())
+
+    def failed(self) -> List[OutboxEntry]:
+        """
+        Facturas que fallaron definitivamente.
+        """
+        with self._lock:
+            ids = [row[0] for row in self._db.execute("SELECT invoice_id FROM outbox WHERE state = ? ORDER BY seq", (FAILED,))]
+        return [self.status(invoice_id) for invoice_id in ids]
+
+    def retry_failed(self, invoice_id: Optional[str] = None) -> int:
+        """
+        Vuelve a poner en cola las facturas fallidas (o solo `invoice_id`).
+
+        :return: Número de facturas reencoladas.
+        """
+        query = "UPDATE outbox SET state = ?, next_attempt_at = ?, updated_at = ? WHERE state = ?"
+        now = time.time()
+        args: Tuple[Any, ...] = (PENDING, now, now, FAILED)
+        if invoice_id is not None:
+            query += " AND invoice_id = ?"
+            args += (invoice_id,)
+        with self._lock:
+            count = self._db.execute(query, args).rowcount
+        self._wake.set()
+        return count
+
+    def purge(self, older_than: float = 0.0) -> int:
+        """
+        Borra las facturas entregadas hace más de `older_than` segundos.
+
+        :return: Número de facturas borradas.
+        """
+        with self._lock:
+            return self._db.execute(
+                "DELETE FROM outbox WHERE state = ? AND updated_at <= ?", (DELIVERED, time.time() - older_than)
+            ).rowcount
+
+    def close(self, timeout: Optional[float] = None):
+        """
+        Detiene la entrega y cierra la cola. Lo no entregado se queda en el fichero
+        y se retoma al abrir de nuevo el outbox.
+
+        :param timeout: Segundos a esperar a que termine el hilo de entrega.
+        """
+        with self._lock:
+            if self._closed:
+                return
+            self._closed = True
+            self._lock.notify_all()
+        self._wake.set()
+        if self._thread is not None:
+            self._thread.join(timeout)
+        if self._executor is not None:
+            self._executor.shutdown(wait=True)
+        with self._lock:
+            self._db.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.close()
+
+    def _claim(self, limit: int) -> List[Tuple[int, str, str, str, int]]:
+        """
+        Reserva (marca como SENDING) hasta `limit` facturas listas, una por client.
+        """
+        with self._lock:
+            db = self._db
+            db.execute("BEGIN IMMEDIATE")
+            try:
+                rows = db.execute(_CLAIM, (time.time(), limit)).fetchall()
+                db.executemany("UPDATE outbox SET state = ? WHERE seq = ?", [(SENDING, row[0]) for row in rows])
+                db.execute("COMMIT")
+            except BaseException:
+                db.execute("ROLLBACK")
+                raise
+            self._running += len(rows)
+            return rows
+
+    def _next_wakeup(self) -> float:
+        with self._lock:
+            due = self._db.execute(_NEXT_DUE).fetchone()[0]
+        if due is None:
+            return self.poll_interval
+        return min(self.poll_interval, max(0.0, due - time.time()))
+
+    def _run(self):
+        while not self._closed:
+            self._wake.clear()
+            try:
+                free = self.workers - self._running
+                claimed = self._claim(free) if free > 0 else []
+                for row in claimed:
+                    self._executor.submit(self._deliver, *row)
+                delay = self._next_wakeup() if free > len(claimed) else self.poll_interval
+            except Exception:  # pragma: no cover - defensivo: el hilo no debe morir
+                logger.exception("Error inesperado leyendo el outbox")
+                delay = self.poll_interval
+            if delay > 0:
+                self._wake.wait(delay)
+
+    def _deliver(self, seq: int, invoice_id: str, client_id: str, payload: str, attempts: int):
+        attempts += 1
+        try:
+            # El cuerpo ya está serializado: se envía tal cual, sin volver a decodificarlo.
+            response = self.client.request("PUT", f"/clients/{client_id}/invoices/{invoice_id}", data=payload.encode("utf-8"))
+        except Exception as e:
+            if _is_transient(e):
+                delay = min(self.max_delay, self.initial_delay * 2 ** (attempts - 1)) * random.uniform(0.8, 1.2)
+                logger.debug("Reintentando la factura %s en %.1fs: %s", invoice_id, delay, e)
+                self._update(seq, PENDING, attempts, str(e), None, time.time() + delay)
+            else:
+                logger.warning("La factura %s no se pudo entregar: %s", invoice_id, e)
+                self._update(seq, FAILED, attempts, str(e), None, None)
+        else:
+            self._update(seq, DELIVERED, attempts, None, _response_json(response), None)
+
+    def _update(self, seq: int, state: str, attempts: int, error: Optional[str], response: Optional[str], next_attempt_at: Optional[float]):
+        now = time.time()
+        with self._lock:
+            try:
+                self._db.execute(
+                    "UPDATE outbox SET state = ?, attempts = ?, last_error = ?, response = COALESCE(?, response),"
+                    " next_attempt_at = COALESCE(?, next_attempt_at), updated_at = ? WHERE seq = ?",
+                    (state, attempts, error, response, next_attempt_at, now, seq),
+                )
+            finally:
+                # Aunque falle la escritura, el hueco del worker se libera para no bloquear el carril.
+                self._running -= 1
+                self._lock.notify_all()
+        self._wake.set()
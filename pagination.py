@@ -0,0 +1,120 @@
+# fiskaly_sdk/pagination.py
+
+"""
+Iteradores de paginación del SDK Fiskaly SIGN ES.
+
+Recorren los endpoints de listado siguiendo el token de paginación de forma
+perezosa. Mientras el llamador procesa la página N, la página N+1 ya se está
+descargando en segundo plano, de modo que un recorrido largo queda limitado por
+el tiempo de red y no por red + procesamiento. Las descargas anticipadas usan el
+executor compartido del cliente, de modo que recorrer muchos listados no crea un
+hilo por recorrido.
+"""
+
+import asyncio
+from concurrent.futures import Executor, ThreadPoolExecutor
+from typing import Any, AsyncIterator, Awaitable, Callable, Dict, Iterator, List, Optional, Tuple, TypeVar
+
+T = TypeVar("T")
+
+# Función que descarga una página: recibe el token (None = primera página)
+# y devuelve (elementos, token de la página siguiente o None).
+PageFetcher = Callable[[Optional[str]], Tuple[List[T], Optional[str]]]
+AsyncPageFetcher = Callable[[Optional[str]], Awaitable[Tuple[List[T], Optional[str]]]]
+
+
+def page_params(params: Optional[Dict[str, Any]], limit: int, token: Optional[str]) -> Dict[str, Any]:
+    """
+    Combina los filtros del llamador con el límite y el token de paginación.
+    """
+    combined = dict(params or {})
+    combined.setdefault("limit", limit)
+    if token:
+        combined["token"] = token
+    return combined
+
+
+def _has_next(items: List[T], token: Optional[str], previous: Optional[str]) -> bool:
+    # Sin elementos, sin token o con el mismo token no hay más páginas.
+    return bool(items) and bool(token) and token != previous
+
+
+def iter_pages(
+    fetch_page: PageFetcher,
+    token: Optional[str] = None,
+    prefetch: bool = True,
+    executor: Optional[Executor] = None,
+) -> Iterator[List[T]]:
+    """
+    Itera página a página siguiendo el token de paginación.
+
+    :param fetch_page: Función que descarga una página.
+    :param token: Token de la primera página (None para empezar desde el principio).
+    :param prefetch: Si True, descarga la página siguiente mientras se procesa la actual.
+    :param executor: Executor para la descarga anticipada (no se cierra al terminar).
+                     Si es None se crea uno propio para este recorrido.
+    :return: Iterador de listas de elementos.
+    """
+    if not prefetch:
+        while True:
+            items, next_token = fetch_page(token)
+            yield items
+            if not _has_next(items, next_token, token):
+                return
+            token = next_token
+
+    owned = executor is None
+    if owned:
+        executor = ThreadPoolExecutor(max_workers=1)
+    future = None
+    try:
+        future = executor.submit(fetch_page, token)
+        while future is not None:
+            items, next_token = future.result()
+            if _has_next(items, next_token, token):
+                token = next_token
+                future = executor.submit(fetch_page, token)
+            else:
+                future = None
+            yield items
+    finally:
+        if future is not None:
+            future.cancel()
+        if owned:
+            executor.shutdown(wait=False)
+
+
+def iter_items(
+    fetch_page: PageFetcher,
+    token: Optional[str] = None,
+    prefetch: bool = True,
+    executor: Optional[Executor] = None,
+) -> Iterator[T]:
+    """
+    Igual que `iter_pages`, pero devuelve los elementos uno a uno.
+    """
+    for items in iter_pages(fetch_page, token=token, prefetch=prefetch, executor=executor):
+        yield from items
+
+
+async def aiter_items(fetch_page: AsyncPageFetcher, token: Optional[str] = None, prefetch: bool = True) -> AsyncIterator[T]:
+    """
+    Versión asyncio de `iter_items`: la página siguiente se pide en una tarea aparte.
+    """
+    task = asyncio.ensure_future(fetch_page(token))
+    try:
+        while task is not None:
+            items, next_token = await task
+            task = None
+            has_next = _has_next(items, next_token, token)
+            if has_next:
+                token = next_token
+                if prefetch:
+                    task = asyncio.ensure_future(fetch_page(token))
+            for item in items:
+                yield item
+            if has_next and task is None:
+                task = asyncio.ensure_future(fetch_page(token))
+    finally:
+        if task is not None:
+            task.cancel()
@@ -0,0 +1,235 @@
+# fiskaly_sdk/pool.py
+
+"""
+Pool de conexiones HTTP del SDK Fiskaly SIGN ES.
+
+Define el HTTPAdapter que usa FiskalyClient.session: tamaño del pool configurable,
+keep-alive TCP y estadísticas en vivo del uso de conexiones (en uso, ociosas,
+creadas y reutilizadas) para dimensionar el pool con datos reales.
+
+También mide, por hilo, el tiempo dedicado a obtener conexiones (espera del pool
+y apertura TCP/TLS) para la instrumentación de peticiones.
+"""
+
+import socket
+import threading
+import time
+import weakref
+from dataclasses import dataclass
+from typing import List, Tuple
+
+from requests.adapters import HTTPAdapter
+from urllib3.connection import HTTPConnection, HTTPSConnection
+from urllib3.connectionpool import HTTPConnectionPool, HTTPSConnectionPool
+from urllib3.poolmanager import PoolManager
+
+
+@dataclass
+class PoolStats:
+    """
+    Foto de las estadísticas del pool de conexiones.
+    """
+    in_use: int
+    idle: int
+    created: int
+    reused: int
+    pools: int
+
+
+class _PoolCounters:
+    """
+    Contadores compartidos por todos los pools de un PoolManager.
+    """
+
+    def __init__(self):
+        self.lock = threading.Lock()
+        self.in_use = 0
+        self.created = 0
+        self.reused = 0
+
+
+class _ConnectTimer(threading.local):
+    """
+    Segundos que el hilo actual ha dedicado a obtener conexiones.
+
+    El cliente lo pone a cero antes de cada envío y lo lee al terminar.
+    """
+    seconds = 0.0
+
+
+connect_timer = _ConnectTimer()
+
+
+class _TimedConnectMixin:
+    """
+    Suma al `connect_timer` del hilo la apertura de la conexión (TCP + TLS).
+    """
+
+    def connect(self):
+        started = time.perf_counter()
+        try:
+            return super().connect()
+        finally:
+            connect_timer.seconds += time.perf_counter() - started
+
+
+class _TimedHTTPConnection(_TimedConnectMixin, HTTPConnection):
+    pass
+
+
+class _TimedHTTPSConnection(_TimedConnectMixin, HTTPSConnection):
+    pass
+
+
+class _CountingPoolMixin:
+    """
+    Cuenta las conexiones que se entregan y devuelven al pool.
+
+    Una conexión se considera reutilizada si al sacarla del pool ya tiene un socket
+    abierto; en caso contrario se abrirá uno nuevo (TCP + TLS).
+    """
+
+    _fiskaly_counters: _PoolCounters = None
+
+    def _get_conn(self, timeout=None):
+        started = time.perf_counter()
+        conn = super()._get_conn(timeout=timeout)
+        connect_timer.seconds += time.perf_counter() - started
+        counters = self._fiskaly_counters
+        if counters is not None:
+            with counters.lock:
+                counters.in_use += 1
+                if getattr(conn, "sock", None) is not None:
+                    counters.reused += 1
+                else:
+                    counters.created += 1
+        return conn
+
+    def _put_conn(self, conn):
+        counters = self._fiskaly_counters
+        if counters is not None:
+            with counters.lock:
+                counters.in_use -= 1
+        return super()._put_conn(conn)
+
+    def idle_connections(self) -> int:
+        queue = self.pool
+        if queue is None:
+            return 0
+        with queue.mutex:
+            return sum(1 for conn in queue.queue if conn is not None and getattr(conn, "sock", None) is not None)
+
+
+class _CountingHTTPConnectionPool(_CountingPoolMixin, HTTPConnectionPool):
+    ConnectionCls = _TimedHTTPConnection
+
+
+class _CountingHTTPSConnectionPool(_CountingPoolMixin, HTTPSConnectionPool):
+    ConnectionCls = _TimedHTTPSConnection
+
+
+class StatsPoolManager(PoolManager):
+    """
+    PoolManager de urllib3 que lleva la cuenta del uso de conexiones.
+    """
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.counters = _PoolCounters()
+        self._tracked_pools = weakref.WeakSet()
+        self.pool_classes_by_scheme = {
+            "http": _CountingHTTPConnectionPool,
+            "https": _CountingHTTPSConnectionPool,
+        }
+
+    def _new_pool(self, scheme, host, port, request_context=None):
+        pool = super()._new_pool(scheme, host, port, request_context=request_context)
+        pool._fiskaly_counters = self.counters
+        with self.counters.lock:
+            self._tracked_pools.add(pool)
+        return pool
+
+    def stats(self) -> PoolStats:
+        """
+        Devuelve las estadísticas actuales del pool.
+        """
+        counters = self.counters
+        with counters.lock:
+            pools = [pool for pool in self._tracked_pools if pool.pool is not None]
+            in_use, created, reused = counters.in_use, counters.created, counters.reused
+        return PoolStats(
+            in_use=in_use,
+            idle=sum(pool.idle_connections() for pool in pools),
+            created=created,
+            reused=reused,
+            pools=len(pools),
+        )
+
+
+def keepalive_socket_options(idle: int, interval: int, count: int) -> List[Tuple[int, int, int]]:
+    """
+    Opciones de socket para activar el keep-alive TCP en las conexiones del pool.
+
+    :param idle: Segundos de inactividad antes de enviar el primer keep-alive.
+    :param interval: Segundos entre keep-alives.
+    :param count: Keep-alives sin respuesta antes de dar la conexión por muerta.
+    :return: Lista de opciones para `socket_options` de urllib3.
+    """
+    options = list(HTTPConnection.default_socket_options)
+    options.append((socket.SOL_SOCKET, socket.SO_KEEPALIVE, 1))
+    # TCP_KEEPIDLE (Linux) / TCP_KEEPALIVE (macOS); no existen en todas las plataformas.
+    idle_option = getattr(socket, "TCP_KEEPIDLE", None) or getattr(socket, "TCP_KEEPALIVE", None)
+    if idle_option is not None:
+        options.append((socket.IPPROTO_TCP, idle_option, idle))
+    if hasattr(socket, "TCP_KEEPINTVL"):
+        options.append((socket.IPPROTO_TCP, socket.TCP_KEEPINTVL, interval))
+    if hasattr(socket, "TCP_KEEPCNT"):
+        options.append((socket.IPPROTO_TCP, socket.TCP_KEEPCNT, count))
+    return options
+
+
+class FiskalyHTTPAdapter(HTTPAdapter):
+    """
+    HTTPAdapter con pool configurable, keep-alive TCP y estadísticas de conexiones.
+    """
+
+    def __init__(self, socket_options=None, **kwargs):
+        """
+        :param socket_options: Opciones de socket para las conexiones nuevas.
+        :param kwargs: Parámetros de HTTPAdapter (pool_connections, pool_maxsize, pool_block...).
+        """
+        self.socket_options = socket_options
+        super().__init__(**kwargs)
+
+    @classmethod
+    def from_config(cls, config) -> "FiskalyHTTPAdapter":
+        """
+        Crea el adapter con el pool y keep-alive definidos en un FiskalyConfig.
+        """
+        socket_options = None
+        if config.tcp_keepalive:
+            socket_options = keepalive_socket_options(
+                config.tcp_keepalive_idle,
+                config.tcp_keepalive_interval,
+                config.tcp_keepalive_count,
+            )
+        return cls(
+            socket_options=socket_options,
+            pool_connections=config.pool_connections,
+            pool_maxsize=config.pool_maxsize,
+            pool_block=config.pool_block,
+        )
+
+    def init_poolmanager(self, connections, maxsize, block=False, **pool_kwargs):
+        if self.socket_options is not None:
+            pool_kwargs.setdefault("socket_options", self.socket_options)
+        self._pool_connections = connections
+        self._pool_maxsize = maxsize
+        self._pool_block = block
+        self.poolmanager = StatsPoolManager(num_pools=connections, maxsize=maxsize, block=block, **pool_kwargs)
+
+    def stats(self) -> PoolStats:
+        """
+        Devuelve las estadísticas actuales del pool de conexiones.
+        """
+        return self.poolmanager.stats()
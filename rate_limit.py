@@ -0,0 +1,184 @@
+# fiskaly_sdk/rate_limit.py
+
+"""
+Limitador de tasa del lado del cliente para el SDK Fiskaly SIGN ES.
+
+Usa token buckets separados por organización (API key) y por client_id (el
+segmento `/clients/{id}` del endpoint). Cuando no quedan tokens, la petición
+espera (con `time.sleep` o `asyncio.sleep`) en lugar de fallar, de modo que el
+tráfico saliente se ajusta a los límites de la API antes de recibir un 429.
+"""
+
+import asyncio
+import re
+import threading
+import time
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import List, Optional
+
+_CLIENT_ID_RE = re.compile(r"^/clients/([^/?]+)")
+
+
+@dataclass
+class RateLimiterStats:
+    """
+    Contadores del limitador: cuánto se espera por un token frente al tiempo en red.
+    """
+    requests: int
+    delayed: int
+    wait_seconds: float
+    network_requests: int
+    network_seconds: float
+
+
+class TokenBucket:
+    """
+    Token bucket con reservas.
+
+    Cada reserva consume un token aunque no haya disponibles (el saldo puede quedar
+    negativo) y devuelve cuánto hay que esperar; así la espera se hace sin tener el
+    lock y los turnos se respetan en orden de llegada.
+    """
+
+    def __init__(self, rate: float, capacity: Optional[float] = None):
+        """
+        :param rate: Tokens por segundo.
+        :param capacity: Ráfaga máxima (por defecto, igual a `rate`).
+        """
+        self.rate = float(rate)
+        self.capacity = float(capacity if capacity is not None else max(rate, 1.0))
+        self._tokens = self.capacity
+        self._updated = time.monotonic()
+
+    def reserve(self, now: float) -> float:
+        """
+        Reserva un token. Debe llamarse con el lock del limitador tomado.
+
+        :return: Segundos a esperar antes de usar el token.
+        """
+        self._tokens = min(self.capacity, self._tokens + max(0.0, now - self._updated) * self.rate)
+        self._updated = max(now, self._updated)
+        self._tokens -= 1
+        if self._tokens >= 0:
+            return 0.0
+        return -self._tokens / self.rate
+
+
+class RateLimiter:
+    """
+    Limitador de tasa por organización y por client_id.
+
+    Se puede compartir entre varios FiskalyClient de la misma organización para que
+    todos respeten el mismo límite.
+    """
+
+    def __init__(
+        self,
+        org_rate: Optional[float] = None,
+        org_burst: Optional[float] = None,
+        client_rate: Optional[float] = None,
+        client_burst: Optional[float] = None,
+        max_tracked_clients: int = 10000,
+    ):
+        """
+        :param org_rate: Peticiones por segundo por organización (None = sin límite).
+        :param org_burst: Ráfaga máxima por organización.
+        :param client_rate: Peticiones por segundo por client_id (None = sin límite).
+        :param client_burst: Ráfaga máxima por client_id.
+        :param max_tracked_clients: Máximo de buckets por client_id en memoria (LRU).
+        """
+        self.org_rate = org_rate
+        self.org_burst = org_burst
+        self.client_rate = client_rate
+        self.client_burst = client_burst
+        self.max_tracked_clients = max_tracked_clients
+        self._lock = threading.Lock()
+        self._org_buckets = {}
+        self._client_buckets: "OrderedDict[tuple, TokenBucket]" = OrderedDict()
+        self._requests = 0
+        self._delayed = 0
+        self._wait_seconds = 0.0
+        self._network_requests = 0
+        self._network_seconds = 0.0
+
+    def _buckets(self, org: str, endpoint: str) -> List[TokenBucket]:
+        buckets = []
+        if self.org_rate:
+            bucket = self._org_buckets.get(org)
+            if bucket is None:
+                bucket = self._org_buckets[org] = TokenBucket(self.org_rate, self.org_burst)
+            buckets.append(bucket)
+        if self.client_rate:
+            match = _CLIENT_ID_RE.match(endpoint)
+            if match:
+                key = (org, match.group(1))
+                bucket = self._client_buckets.get(key)
+                if bucket is None:
+                    bucket = self._client_buckets[key] = TokenBucket(self.client_rate, self.client_burst)
+                    if len(self._client_buckets) > self.max_tracked_clients:
+                        self._client_buckets.popitem(last=False)
+                else:
+                    self._client_buckets.move_to_end(key)
+                buckets.append(bucket)
+        return buckets
+
+    def reserve(self, org: str, endpoint: str) -> float:
+        """
+        Reserva turno para una petición.
+
+        :param org: Clave de la organización (normalmente la API key).
+        :param endpoint: Endpoint de la petición (p.ej. `/clients/{id}/invoices/{id}`).
+        :return: Segundos que hay que esperar antes de enviarla.
+        """
+        with self._lock:
+            now = time.monotonic()
+            wait = max([bucket.reserve(now) for bucket in self._buckets(org, endpoint)], default=0.0)
+            self._requests += 1
+            if wait > 0:
+                self._delayed += 1
+                self._wait_seconds += wait
+        return wait
+
+    def acquire(self, org: str, endpoint: str) -> float:
+        """
+        Espera (bloqueando el hilo) hasta que la petición puede enviarse.
+
+        :return: Segundos esperados.
+        """
+        wait = self.reserve(org, endpoint)
+        if wait > 0:
+            time.sleep(wait)
+        return wait
+
+    async def acquire_async(self, org: str, endpoint: str) -> float:
+        """
+        Espera (sin bloquear el event loop) hasta que la petición puede enviarse.
+
+        :return: Segundos esperados.
+        """
+        wait = self.reserve(org, endpoint)
+        if wait > 0:
+            await asyncio.sleep(wait)
+        return wait
+
+    def record_network(self, seconds: float):
+        """
+        Registra el tiempo que una petición pasó en la red.
+        """
+        with self._lock:
+            self._network_requests += 1
+            self._network_seconds += seconds
+
+    def stats(self) -> RateLimiterStats:
+        """
+        Devuelve los contadores acumulados del limitador.
+        """
+        with self._lock:
+            return RateLimiterStats(
+                requests=self._requests,
+                delayed=self._delayed,
+                wait_seconds=self._wait_seconds,
+                network_requests=self._network_requests,
+                network_seconds=self._network_seconds,
+            )
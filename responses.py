@@ -0,0 +1,146 @@
+# fiskaly_sdk/responses.py
+
+"""
+Modos de respuesta del SDK Fiskaly SIGN ES.
+
+Por defecto cada respuesta se valida entera con Pydantic (`model_validate`). En
+procesos masivos esa validación domina el uso de CPU, así que el cliente admite
+tres modos (`response_mode` en FiskalyConfig):
+
+  - "validated": modelos Pydantic validados al recibirlos (comportamiento original).
+  - "lazy": proxies `LazyModel` que validan al acceder al primer atributo; en los
+    listados cada elemento es su propio proxy, así que solo se paga por los que se usan.
+  - "raw": el JSON decodificado (dicts y listas), sin validación.
+"""
+
+from enum import Enum
+from typing import TYPE_CHECKING, Any, Dict, Generic, List, Optional, Tuple, Type, TypeVar, Union
+
+if TYPE_CHECKING:  # pragma: no cover - pydantic se importa con los modelos
+    from pydantic import BaseModel
+
+M = TypeVar("M", bound="BaseModel")
+
+
+class ResponseMode(str, Enum):
+    """
+    Modo en que los recursos devuelven las respuestas de la API.
+    """
+    VALIDATED = "validated"
+    LAZY = "lazy"
+    RAW = "raw"
+
+
+class LazyModel(Generic[M]):
+    """
+    Proxy que guarda el JSON de una respuesta y lo valida con Pydantic la primera
+    vez que se accede a un atributo.
+
+    Los errores de validación aparecen en ese primer acceso y no al recibir la
+    respuesta. `raw` da acceso al JSON sin validar y `model()` al modelo validado.
+    """
+    __slots__ = ("_model_cls", "_data", "_validated")
+
+    def __init__(self, model_cls: Type[M], data: Dict[str, Any]):
+        self._model_cls = model_cls
+        self._data = data
+        self._validated: Optional[M] = None
+
+    @property
+    def raw(self) -> Dict[str, Any]:
+        return self._data
+
+    @property
+    def is_validated(self) -> bool:
+        return self._validated is not None
+
+    def model(self) -> M:
+        """
+        Valida (una sola vez) y devuelve el modelo Pydantic.
+        """
+        if self._validated is None:
+            self._validated = self._model_cls.model_validate(self._data)
+        return self._validated
+
+    def __getattr__(self, name: str) -> Any:
+        return getattr(self.model(), name)
+
+    def __eq__(self, other: Any) -> bool:
+        if isinstance(other, LazyModel):
+            other = other.model()
+        return self.model() == other
+
+    __hash__ = None
+
+    def __repr__(self) -> str:
+        state = "validado" if self._validated is not None else "sin validar"
+        return f"LazyModel[{self._model_cls.__name__}]({state})"
+
+
+def parse_model(mode: ResponseMode, model_cls: Type[M], data: Any) -> Union[M, LazyModel, Any]:
+    """
+    Convierte una respuesta JSON según el modo indicado.
+
+    :param mode: Modo de respuesta.
+    :param model_cls: Modelo Pydantic de la respuesta.
+    :param data: JSON decodificado.
+    :return: Modelo validado, LazyModel o el propio JSON.
+    """
+    if mode is ResponseMode.RAW:
+        return data
+    if mode is ResponseMode.LAZY:
+        return LazyModel(model_cls, data)
+    return model_cls.model_validate(data)
+
+
+def parse_page(
+    mode: ResponseMode,
+    page_cls: Type[M],
+    item_cls: Type["BaseModel"],
+    data: Dict[str, Any],
+    items_key: str = "results",
+) -> Union[M, Dict[str, Any]]:
+    """
+    Convierte la respuesta de un listado.
+
+    En modo "lazy" la página (paginación incluida) se valida sin sus elementos y
+    cada elemento se devuelve como LazyModel independiente.
+
+    :param mode: Modo de respuesta.
+    :param page_cls: Modelo Pydantic de la página.
+    :param item_cls: Modelo Pydantic de cada elemento.
+    :param data: JSON decodificado.
+    :param items_key: Campo de la página que contiene los elementos.
+    :return: Página validada, página con elementos perezosos o el propio JSON.
+    """
+    if mode is ResponseMode.RAW:
+        return data
+    if mode is ResponseMode.VALIDATED:
+        return page_cls.model_validate(data)
+    items = data.get(items_key) or []
+    page = page_cls.model_validate({**data, items_key: []})
+    # La asignación no se valida (validate_assignment está desactivado en los modelos).
+    setattr(page, items_key, [LazyModel(item_cls, item) for item in items])
+    return page
+
+
+def split_page(page: Any, items_key: str = "results") -> Tuple[List[Any], Optional[str]]:
+    """
+    Devuelve (elementos, token de la página siguiente) de una página en cualquier modo.
+    """
+    if isinstance(page, dict):
+        pagination = page.get("pagination") or {}
+        return page.get(items_key) or [], pagination.get("token")
+    pagination = getattr(page, "pagination", None)
+    return getattr(page, items_key), pagination.token if pagination else None
+
+
+def ensure_model(model_cls: Type[M], value: Any) -> M:
+    """
+    Devuelve siempre un modelo validado, sea cual sea el modo de respuesta.
+    """
+    if isinstance(value, LazyModel):
+        return value.model()
+    if isinstance(value, model_cls):
+        return value
+    return model_cls.model_validate(value)
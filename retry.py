@@ -0,0 +1,215 @@
+# fiskaly_sdk/retry.py
+
+"""
+Política de reintentos del SDK Fiskaly SIGN ES.
+
+Solo se reintentan peticiones que es seguro repetir: métodos de lectura y los PUT
+sobre recursos identificados por un GUID elegido por el llamador (facturas,
+clients, exports...), que la API trata de forma idempotente. Los reintentos usan
+backoff exponencial con jitter, respetan `Retry-After` en 429/503 y están
+limitados por un presupuesto global para no amplificar una caída de la API.
+"""
+
+import random
+import re
+import sys
+import threading
+import time
+from email.utils import parsedate_to_datetime
+from typing import Iterable, Mapping, Optional, Tuple
+
+import requests
+
+# Métodos sin efectos secundarios.
+SAFE_METHODS = frozenset({"GET", "HEAD", "OPTIONS"})
+
+# Rutas no seguras que se pueden repetir sin riesgo de duplicar efectos.
+DEFAULT_IDEMPOTENT_ROUTES: Tuple[Tuple[str, str], ...] = (
+    ("PUT", r"/clients/[^/]+"),
+    ("PUT", r"/clients/[^/]+/invoices/[^/]+"),
+    ("PUT", r"/exports/[^/]+"),
+    ("PUT", r"/signers/[^/]+"),
+    ("PUT", r"/taxpayer"),
+    ("PUT", r"/taxpayer/agreement"),
+    ("POST", r"/auth"),
+)
+
+DEFAULT_RETRY_STATUSES = frozenset({429, 500, 502, 503, 504})
+
+
+class RetryBudget:
+    """
+    Presupuesto global de reintentos.
+
+    Cada petición original aporta `ratio` reintentos al presupuesto, que además se
+    recarga a `min_per_second` por segundo. Cada reintento consume uno. Si la API
+    cae, los reintentos se agotan enseguida y las peticiones fallan rápido en vez
+    de multiplicar la carga.
+    """
+
+    def __init__(self, ratio: float = 0.2, min_per_second: float = 5.0, max_balance: float = 100.0):
+        """
+        :param ratio: Reintentos que se ganan por cada petición original.
+        :param min_per_second: Reintentos que se recargan por segundo sin tráfico.
+        :param max_balance: Máximo de reintentos acumulables.
+        """
+        self.ratio = ratio
+        self.min_per_second = min_per_second
+        self.max_balance = max_balance
+        self._balance = max_balance
+        self._updated = time.monotonic()
+        self._lock = threading.Lock()
+
+    def _refill(self, now: float):
+        elapsed = now - self._updated
+        self._updated = now
+        self._balance = min(self.max_balance, self._balance + elapsed * self.min_per_second)
+
+    def record_request(self):
+        """
+        Registra una petición original.
+        """
+        with self._lock:
+            self._balance = min(self.max_balance, self._balance + self.ratio)
+
+    def try_spend(self) -> bool:
+        """
+        Consume un reintento si queda presupuesto.
+
+        :return: True si se puede reintentar.
+        """
+        with self._lock:
+            self._refill(time.monotonic())
+            if self._balance < 1:
+                return False
+            self._balance -= 1
+            return True
+
+
+class RetryPolicy:
+    """
+    Decide si una petición fallida se reintenta y cuánto esperar antes.
+
+    Compartir la misma instancia entre varios clientes hace que compartan también
+    el presupuesto de reintentos.
+    """
+
+    def __init__(
+        self,
+        max_retries: int = 3,
+        backoff_base: float = 0.5,
+        backoff_max: float = 30.0,
+        retry_after_max: float = 60.0,
+        retry_statuses: Iterable[int] = DEFAULT_RETRY_STATUSES,
+        idempotent_routes: Iterable[Tuple[str, str]] = DEFAULT_IDEMPOTENT_ROUTES,
+        budget: Optional[RetryBudget] = None,
+    ):
+        """
+        :param max_retries: Reintentos máximos por petición.
+        :param backoff_base: Espera base (segundos) del backoff exponencial.
+        :param backoff_max: Espera máxima (segundos) entre reintentos.
+        :param retry_after_max: Máximo `Retry-After` aceptado; si es mayor no se reintenta.
+        :param retry_statuses: Códigos HTTP que se consideran transitorios.
+        :param idempotent_routes: Pares (método, regex de endpoint) que se pueden repetir.
+        :param budget: Presupuesto de reintentos (uno nuevo si None).
+        """
+        self.max_retries = max_retries
+        self.backoff_base = backoff_base
+        self.backoff_max = backoff_max
+        self.retry_after_max = retry_after_max
+        self.retry_statuses = frozenset(retry_statuses)
+        self._routes = [(method.upper(), re.compile(pattern)) for method, pattern in idempotent_routes]
+        self.budget = budget or RetryBudget()
+
+    def is_idempotent(self, method: str, endpoint: str) -> bool:
+        """
+        Indica si la petición se puede repetir sin riesgo de duplicar efectos.
+        """
+        method = method.upper()
+        if method in SAFE_METHODS:
+            return True
+        return any(m == method and pattern.fullmatch(endpoint) for m, pattern in self._routes)
+
+    def backoff(self, attempt: int) -> float:
+        """
+        Espera exponencial con jitter completo para el reintento número `attempt` (desde 0).
+        """
+        ceiling = min(self.backoff_max, self.backoff_base * (2 ** attempt))
+        return random.uniform(0, ceiling)
+
+    @staticmethod
+    def parse_retry_after(headers: Mapping[str, str]) -> Optional[float]:
+        """
+        Interpreta la cabecera `Retry-After` (segundos o fecha HTTP).
+
+        :return: Segundos a esperar, o None si no viene o no es válida.
+        """
+        value = headers.get("Retry-After") if headers else None
+        if not value:
+            return None
+        try:
+            return max(0.0, float(value))
+        except ValueError:
+            pass
+        try:
+            when = parsedate_to_datetime(value)
+        except (TypeError, ValueError):
+            return None
+        return max(0.0, when.timestamp() - time.time())
+
+    def delay_for_status(self, method: str, endpoint: str, attempt: int, status: int, headers: Mapping[str, str]) -> Optional[float]:
+        """
+        Espera antes de reintentar una respuesta de error.
+
+        :return: Segundos a esperar, o None si no se debe reintentar.
+        """
+        if attempt >= self.max_retries or status not in self.retry_statuses:
+            return None
+        # Un 429 es un rechazo sin efectos: se puede repetir cualquier método.
+        if status != 429 and not self.is_idempotent(method, endpoint):
+            return None
+        delay = None
+        if status in (429, 503):
+            delay = self.parse_retry_after(headers)
+            if delay is not None and delay > self.retry_after_max:
+                return None
+        if delay is None:
+            delay = self.backoff(attempt)
+        return delay if self.budget.try_spend() else None
+
+    def delay_for_error(self, method: str, endpoint: str, attempt: int, error: Exception) -> Optional[float]:
+        """
+        Espera antes de reintentar un error de conexión.
+
+        :return: Segundos a esperar, o None si no se debe reintentar.
+        """
+        if attempt >= self.max_retries:
+            return None
+        if _not_sent(error):
+            # La conexión no llegó a establecerse: la petición no salió.
+            pass
+        elif not _is_transient(error):
+            return None
+        elif not self.is_idempotent(method, endpoint):
+            return None
+        return self.backoff(attempt) if self.budget.try_spend() else None
+
+
+def _not_sent(error: Exception) -> bool:
+    """
+    Indica si el error ocurrió antes de enviar la petición (requests o httpx).
+    """
+    if isinstance(error, requests.ConnectTimeout):
+        return True
+    httpx = sys.modules.get("httpx")
+    return httpx is not None and isinstance(error, (httpx.ConnectError, httpx.ConnectTimeout))
+
+
+def _is_transient(error: Exception) -> bool:
+    """
+    Indica si el error es de red/timeout y puede desaparecer al reintentar.
+    """
+    if isinstance(error, (requests.ConnectionError, requests.Timeout)):
+        return True
+    httpx = sys.modules.get("httpx")
+    return httpx is not None and isinstance(error, httpx.TransportError)
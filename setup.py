@@ -16,6 +16,15 @@ setup(
         'requests>=2.25.1',
         'pydantic>=2.0.0'
     ],
+    extras_require={
+        'async': ['httpx>=0.23'],
+        'otel': ['opentelemetry-api>=1.0'],
+        'fast-json': ['orjson>=3.0'],
+        'http2': ['httpx[http2]>=0.23'],
+    },
+    entry_points={
+        'console_scripts': ['fiskaly-bench=fiskaly_sdk.benchmarks.load:main'],
+    },
     python_requires='>=3.7',
     include_package_data=True,
     license='MIT',
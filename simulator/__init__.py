@@ -0,0 +1,23 @@
+# fiskaly_sdk/simulator/__init__.py
+
+"""
+Simulador local de la API Fiskaly SIGN ES.
+
+Implementa en memoria `/auth`, `/taxpayer`, `/signers`, `/clients`,
+`/clients/{id}/invoices`, `/invoices`, `/exports` (incluido el ZIP), `/software`
+y el XML de las facturas, con paginación por token, latencia configurable y
+fallos inyectados (429, 5xx, timeouts y caducidad de tokens). Permite probar el
+transporte, el pool de conexiones y los reintentos del SDK sin red.
+"""
+
+from .api import SimResponse, SimulatedAPI
+from .server import FaultConfig, FiskalySimulator, LatencyModel, SimulatorStats
+
+__all__ = [
+    "FaultConfig",
+    "FiskalySimulator",
+    "LatencyModel",
+    "SimResponse",
+    "SimulatedAPI",
+    "SimulatorStats",
+]
@@ -0,0 +1,5 @@
+# fiskaly_sdk/simulator/__main__.py
+
+from .server import main
+
+main()
@@ -0,0 +1,494 @@
+# fiskaly_sdk/simulator/api.py
+
+"""
+Estado en memoria y rutas del simulador de la API Fiskaly SIGN ES.
+
+`SimulatedAPI.handle` recibe una petición ya decodificada y devuelve una
+`SimResponse`; no sabe nada de sockets, así que se puede usar detrás del
+servidor HTTP de `server` o directamente en un test.
+"""
+
+import base64
+import hashlib
+import io
+import json
+import re
+import secrets
+import threading
+import time
+import zipfile
+from dataclasses import dataclass, field
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+
+@dataclass
+class SimResponse:
+    """
+    Respuesta del simulador.
+    """
+    status: int
+    body: bytes = b""
+    content_type: str = "application/json"
+    headers: Dict[str, str] = field(default_factory=dict)
+
+    @classmethod
+    def json(cls, payload: Any, status: int = 200, headers: Optional[Dict[str, str]] = None) -> "SimResponse":
+        return cls(status, json.dumps(payload).encode(), "application/json", headers or {})
+
+    @classmethod
+    def error(cls, status: int, code: str, message: str, headers: Optional[Dict[str, str]] = None) -> "SimResponse":
+        return cls.json({"status_code": status, "error": code, "message": message}, status, headers)
+
+
+def _encode_token(offset: int) -> str:
+    return base64.urlsafe_b64encode(f"offset:{offset}".encode()).decode()
+
+
+def _decode_token(token: Optional[str]) -> int:
+    if not token:
+        return 0
+    try:
+        return int(base64.urlsafe_b64decode(token.encode()).decode().split(":", 1)[1])
+    except (ValueError, IndexError):
+        raise ValueError("token de paginación inválido")
+
+
+def _now() -> str:
+    return time.strftime("%Y-%m-%dT%H:%M:%SZ", time.gmtime())
+
+
+class SimulatedAPI:
+    """
+    Implementación en memoria de los endpoints de Fiskaly SIGN ES.
+
+    Guarda taxpayer, acuerdo, signers, clients, facturas y exports; pagina los
+    listados con un token opaco y emite tokens Bearer que caducan a los
+    `token_ttl` segundos.
+    """
+
+    def __init__(
+        self,
+        api_key: str = "test_api_key",
+        api_secret: str = "test_api_secret",
+        token_ttl: float = 300.0,
+        max_page_size: int = 100,
+        default_page_size: int = 10,
+        export_ready_after: float = 0.5,
+    ):
+        """
+        :param api_key: API key aceptada por `/auth`.
+        :param api_secret: API secret aceptado por `/auth`.
+        :param token_ttl: Vida de cada token Bearer, en segundos.
+        :param max_page_size: Límite máximo de elementos por página.
+        :param default_page_size: Elementos por página si no se indica `limit`.
+        :param export_ready_after: Segundos que tarda una exportación en completarse.
+        """
+        self.api_key = api_key
+        self.api_secret = api_secret
+        self.token_ttl = token_ttl
+        self.max_page_size = max_page_size
+        self.default_page_size = default_page_size
+        self.export_ready_after = export_ready_after
+        self._lock = threading.RLock()
+        self._tokens: Dict[str, float] = {}
+        self.taxpayer: Optional[Dict[str, Any]] = None
+        self.agreement: Optional[Dict[str, Any]] = None
+        self.signers: Dict[str, Dict[str, Any]] = {}
+        self.clients: Dict[str, Dict[str, Any]] = {}
+        self.invoices: Dict[Tuple[str, str], Dict[str, Any]] = {}
+        self.exports: Dict[str, Dict[str, Any]] = {}
+        self.exports_created: Dict[str, float] = {}
+        self._routes: List[Tuple[str, "re.Pattern[str]", Callable[..., SimResponse]]] = [
+            ("GET", re.compile(r"^/software$"), self._software),
+            ("PUT", re.compile(r"^/taxpayer$"), self._put_taxpayer),
+            ("GET", re.compile(r"^/taxpayer$"), self._get_taxpayer),
+            ("PATCH", re.compile(r"^/taxpayer$"), self._patch_taxpayer),
+            ("POST", re.compile(r"^/taxpayer/agreement$"), self._generate_agreement),
+            ("PUT", re.compile(r"^/taxpayer/agreement$"), self._upload_agreement),
+            ("GET", re.compile(r"^/taxpayer/agreement$"), self._get_agreement),
+            ("GET", re.compile(r"^/taxpayer/agreement\.pdf$"), self._agreement_pdf),
+            ("GET", re.compile(r"^/signers$"), self._list_signers),
+            ("PUT", re.compile(r"^/signers/([^/]+)$"), self._put_signer),
+            ("PATCH", re.compile(r"^/signers/([^/]+)$"), self._patch_signer),
+            ("GET", re.compile(r"^/signers/([^/]+)$"), self._get_signer),
+            ("GET", re.compile(r"^/clients$"), self._list_clients),
+            ("PUT", re.compile(r"^/clients/([^/]+)$"), self._put_client),
+            ("PATCH", re.compile(r"^/clients/([^/]+)$"), self._patch_client),
+            ("GET", re.compile(r"^/clients/([^/]+)$"), self._get_client),
+            ("GET", re.compile(r"^/clients/([^/]+)/invoices$"), self._list_invoices),
+            ("PUT", re.compile(r"^/clients/([^/]+)/invoices/([^/]+)$"), self._put_invoice),
+            ("PATCH", re.compile(r"^/clients/([^/]+)/invoices/([^/]+)$"), self._patch_invoice),
+            ("GET", re.compile(r"^/clients/([^/]+)/invoices/([^/]+)$"), self._get_invoice),
+            ("GET", re.compile(r"^/clients/([^/]+)/invoices/([^/]+)/xml$"), self._invoice_xml),
+            ("GET", re.compile(r"^/invoices$"), self._search_invoices),
+            ("GET", re.compile(r"^/exports$"), self._list_exports),
+            ("PUT", re.compile(r"^/exports/([^/]+)$"), self._put_export),
+            ("PATCH", re.compile(r"^/exports/([^/]+)$"), self._patch_export),
+            ("GET", re.compile(r"^/exports/([^/]+)$"), self._get_export),
+            ("GET", re.compile(r"^/exports/([^/]+)/file$"), self._export_file),
+        ]
+
+    # --- Autenticación ---
+
+    def issue_token(self) -> Tuple[str, int]:
+        """
+        Emite un token Bearer nuevo y devuelve (bearer, expires_at).
+        """
+        bearer = secrets.token_urlsafe(24)
+        expires_at = time.time() + self.token_ttl
+        with self._lock:
+            self._tokens[bearer] = expires_at
+        return bearer, int(expires_at)
+
+    def expire_tokens(self):
+        """
+        Caduca todos los tokens emitidos (el siguiente uso recibirá un 401).
+        """
+        with self._lock:
+            self._tokens.clear()
+
+    def _authorized(self, headers: Dict[str, str]) -> bool:
+        auth = headers.get("authorization", "")
+        if not auth.startswith("Bearer "):
+            return False
+        with self._lock:
+            expires_at = self._tokens.get(auth[len("Bearer "):])
+        return expires_at is not None and expires_at > time.time()
+
+    def _auth(self, body: Dict[str, Any]) -> SimResponse:
+        content = body.get("content") or {}
+        if content.get("api_key") != self.api_key or content.get("api_secret") != self.api_secret:
+            return SimResponse.error(401, "E_UNAUTHORIZED", "Credenciales inválidas")
+        bearer, expires_at = self.issue_token()
+        return SimResponse.json({"content": {"access_token": {"bearer": bearer, "expires_at": expires_at}}})
+
+    # --- Despacho ---
+
+    def handle(self, method: str, path: str, query: Dict[str, str], headers: Dict[str, str], body: bytes) -> SimResponse:
+        """
+        Procesa una petición.
+
+        :param method: Método HTTP.
+        :param path: Ruta relativa a la URL base de la API.
+        :param query: Parámetros de la query string.
+        :param headers: Cabeceras (claves en minúsculas).
+        :param body: Cuerpo sin decodificar.
+        """
+        try:
+            payload = json.loads(body) if body else {}
+        except ValueError:
+            return SimResponse.error(400, "E_BAD_REQUEST", "JSON inválido")
+
+        if method == "POST" and path == "/auth":
+            return self._auth(payload)
+        if not self._authorized(headers):
+            return SimResponse.error(401, "E_UNAUTHORIZED", "Token Bearer ausente, inválido o caducado")
+
+        path_matched = False
+        for route_method, pattern, handler in self._routes:
+            match = pattern.match(path)
+            if not match:
+                continue
+            path_matched = True
+            if route_method == method:
+                try:
+                    with self._lock:
+                        response = handler(*match.groups(), query=query, body=payload, headers=headers)
+                except ValueError as e:
+                    return SimResponse.error(400, "E_BAD_REQUEST", str(e))
+                return _conditional(method, response, headers)
+        if path_matched:
+            return SimResponse.error(405, "E_METHOD_NOT_ALLOWED", f"{method} no permitido en {path}")
+        return SimResponse.error(404, "E_NOT_FOUND", f"Ruta desconocida: {path}")
+
+    def _page(self, items: List[Dict[str, Any]], query: Dict[str, str]) -> Dict[str, Any]:
+        limit = min(int(query.get("limit") or self.default_page_size), self.max_page_size)
+        if limit <= 0:
+            raise ValueError("limit debe ser positivo")
+        offset = _decode_token(query.get("token"))
+        chunk = items[offset:offset + limit]
+        next_offset = offset + len(chunk)
+        token = _encode_token(next_offset) if next_offset < len(items) else None
+        return {"results": chunk, "pagination": {"limit": limit, "token": token, "next": None}}
+
+    # --- Software y taxpayer ---
+
+    def _software(self, **_):
+        return SimResponse.json({"content": {"software_id": "fiskaly-simulator", "name": "Fiskaly SIGN ES simulator"}})
+
+    def _put_taxpayer(self, body, **_):
+        content = body.get("content") or {}
+        issuer = content.get("issuer") or {}
+        if not issuer.get("tax_number") or not content.get("territory"):
+            raise ValueError("issuer.tax_number y territory son obligatorios")
+        self.taxpayer = {"content": {"issuer": issuer, "territory": content["territory"], "state": "ENABLED"}}
+        return SimResponse.json(self.taxpayer)
+
+    def _get_taxpayer(self, **_):
+        if self.taxpayer is None:
+            return SimResponse.error(404, "E_NOT_FOUND", "Taxpayer no configurado")
+        return SimResponse.json(self.taxpayer)
+
+    def _patch_taxpayer(self, body, **_):
+        if self.taxpayer is None:
+            return SimResponse.error(404, "E_NOT_FOUND", "Taxpayer no configurado")
+        state = (body.get("content") or {}).get("state")
+        if state:
+            self.taxpayer["content"]["state"] = state
+        return SimResponse.json(self.taxpayer)
+
+    def _generate_agreement(self, **_):
+        self.agreement = {"content": {"agreement_id": "agreement-1", "state": "GENERATED"}}
+        return SimResponse.json(self.agreement)
+
+    def _upload_agreement(self, **_):
+        if self.agreement is None:
+            return SimResponse.error(409, "E_CONFLICT", "El acuerdo no se ha generado")
+        self.agreement["content"]["state"] = "SIGNED"
+        return SimResponse.json(self.agreement)
+
+    def _get_agreement(self, **_):
+        if self.agreement is None:
+            return SimResponse.error(404, "E_NOT_FOUND", "Acuerdo no generado")
+        return SimResponse.json(self.agreement)
+
+    def _agreement_pdf(self, headers, **_):
+        if self.agreement is None:
+            return SimResponse.error(404, "E_NOT_FOUND", "Acuerdo no generado")
+        pdf = b"%PDF-1.4\n% Fiskaly simulator agreement\n" + b"0" * 2048 + b"\n%%EOF\n"
+        return _ranged(pdf, "application/pdf", headers)
+
+    # --- Signers y clients ---
+
+    def _put_signer(self, signer_id, body, **_):
+        if signer_id not in self.signers:
+            self.signers[signer_id] = {
+                "content": {
+                    "id": signer_id,
+                    "state": "ENABLED",
+                    "certificate": {
+                        "type": "INVOICING_POINT",
+                        "expires_at": "2030-01-01T00:00:00Z",
+                        "serial_number": secrets.token_hex(8),
+                        "x509_pem": base64.b64encode(secrets.token_bytes(256)).decode(),
+                    },
+                },
+                "metadata": {},
+            }
+        self.signers[signer_id]["metadata"].update(body.get("metadata") or {})
+        return SimResponse.json(self.signers[signer_id])
+
+    def _patch_signer(self, signer_id, body, **_):
+        signer = self.signers.get(signer_id)
+        if signer is None:
+            return SimResponse.error(404, "E_NOT_FOUND", f"Signer {signer_id} no encontrado")
+        state = (body.get("content") or {}).get("state")
+        if state:
+            signer["content"]["state"] = state
+        signer["metadata"].update(body.get("metadata") or {})
+        return SimResponse.json(signer)
+
+    def _get_signer(self, signer_id, **_):
+        signer = self.signers.get(signer_id)
+        if signer is None:
+            return SimResponse.error(404, "E_NOT_FOUND", f"Signer {signer_id} no encontrado")
+        return SimResponse.json(signer)
+
+    def _list_signers(self, query, **_):
+        return SimResponse.json(self._page(list(self.signers.values()), query))
+
+    def _put_client(self, client_id, body, **_):
+        if client_id not in self.clients:
+            if not self.signers:
+                self._put_signer("signer-default", {})
+            signer_id = next(iter(self.signers))
+            self.clients[client_id] = {
+                "content": {"id": client_id, "signer": {"id": signer_id}, "state": "ENABLED"},
+                "metadata": {},
+            }
+        self.clients[client_id]["metadata"].update(body.get("metadata") or {})
+        return SimResponse.json(self.clients[client_id])
+
+    def _patch_client(self, client_id, body, **_):
+        client = self.clients.get(client_id)
+        if client is None:
+            return SimResponse.error(404, "E_NOT_FOUND", f"Client {client_id} no encontrado")
+        state = (body.get("content") or {}).get("state")
+        if state:
+            client["content"]["state"] = state
+        client["metadata"].update(body.get("metadata") or {})
+        return SimResponse.json(client)
+
+    def _get_client(self, client_id, **_):
+        client = self.clients.get(client_id)
+        if client is None:
+            return SimResponse.error(404, "E_NOT_FOUND", f"Client {client_id} no encontrado")
+        return SimResponse.json(client)
+
+    def _list_clients(self, query, **_):
+        return SimResponse.json(self._page(list(self.clients.values()), query))
+
+    # --- Facturas ---
+
+    def _put_invoice(self, client_id, invoice_id, body, **_):
+        client = self.clients.get(client_id)
+        if client is None:
+            return SimResponse.error(404, "E_NOT_FOUND", f"Client {client_id} no encontrado")
+        if client["content"]["state"] != "ENABLED":
+            return SimResponse.error(409, "E_CLIENT_DISABLED", f"Client {client_id} deshabilitado")
+        key = (client_id, invoice_id)
+        existing = self.invoices.get(key)
+        if existing is not None:
+            # PUT idempotente: repetir la misma factura devuelve la ya emitida.
+            return SimResponse.json(existing)
+        content = body.get("content") or {}
+        number = sum(1 for (c, _) in self.invoices if c == client_id) + 1
+        now = _now()
+        self.invoices[key] = {
+            "content": {
+                "id": invoice_id,
+                "client_id": client_id,
+                "state": "ISSUED",
+                "type": content.get("type", "SIMPLIFIED"),
+                "number": content.get("number", str(number)),
+                "issued_at": now,
+                "updated_at": now,
+                "data": content,
+            },
+            "metadata": body.get("metadata") or {},
+        }
+        return SimResponse.json(self.invoices[key])
+
+    def _patch_invoice(self, client_id, invoice_id, body, **_):
+        invoice = self.invoices.get((client_id, invoice_id))
+        if invoice is None:
+            return SimResponse.error(404, "E_NOT_FOUND", f"Factura {invoice_id} no encontrada")
+        state = (body.get("content") or {}).get("state")
+        if state == "CANCELLED":
+            if invoice["content"]["state"] == "CANCELLED":
+                return SimResponse.error(409, "E_ALREADY_CANCELLED", f"La factura {invoice_id} ya está cancelada")
+            invoice["content"]["state"] = "CANCELLED"
+        invoice["metadata"].update(body.get("metadata") or {})
+        invoice["content"]["updated_at"] = _now()
+        return SimResponse.json(invoice)
+
+    def _get_invoice(self, client_id, invoice_id, **_):
+        invoice = self.invoices.get((client_id, invoice_id))
+        if invoice is None:
+            return SimResponse.error(404, "E_NOT_FOUND", f"Factura {invoice_id} no encontrada")
+        return SimResponse.json(invoice)
+
+    def _invoice_xml(self, client_id, invoice_id, headers, **_):
+        invoice = self.invoices.get((client_id, invoice_id))
+        if invoice is None:
+            return SimResponse.error(404, "E_NOT_FOUND", f"Factura {invoice_id} no encontrada")
+        content = invoice["content"]
+        xml = (
+            "<?xml version=\"1.0\" encoding=\"UTF-8\"?>"
+            f"<Invoice id=\"{content['id']}\" client=\"{client_id}\" state=\"{content['state']}\">"
+            f"<Number>{content['number']}</Number><IssuedAt>{content['issued_at']}</IssuedAt>"
+            "</Invoice>"
+        ).encode()
+        return _ranged(xml, "application/xml", headers)
+
+    def _filter_invoices(self, invoices: List[Dict[str, Any]], query: Dict[str, str]) -> List[Dict[str, Any]]:
+        state = query.get("state")
+        invoice_type = query.get("type")
+        return [
+            invoice for invoice in invoices
+            if (not state or invoice["content"]["state"] == state)
+            and (not invoice_type or invoice["content"]["type"] == invoice_type)
+        ]
+
+    def _list_invoices(self, client_id, query, **_):
+        if client_id not in self.clients:
+            return SimResponse.error(404, "E_NOT_FOUND", f"Client {client_id} no encontrado")
+        invoices = [invoice for (c, _), invoice in self.invoices.items() if c == client_id]
+        return SimResponse.json(self._page(self._filter_invoices(invoices, query), query))
+
+    def _search_invoices(self, query, **_):
+        invoices = list(self.invoices.values())
+        client_id = query.get("client_id")
+        if client_id:
+            invoices = [invoice for invoice in invoices if invoice["content"]["client_id"] == client_id]
+        updated_since = query.get("updated_since")
+        if updated_since:
+            invoices = [invoice for invoice in invoices if invoice["content"]["updated_at"] >= updated_since]
+        return SimResponse.json(self._page(self._filter_invoices(invoices, query), query))
+
+    # --- Exports ---
+
+    def _export_view(self, export_id: str) -> Dict[str, Any]:
+        export = self.exports[export_id]
+        if export["content"]["state"] == "RUNNING" and time.monotonic() - self.exports_created[export_id] >= self.export_ready_after:
+            export["content"]["state"] = "COMPLETED"
+        return export
+
+    def _put_export(self, export_id, body, **_):
+        if export_id not in self.exports:
+            self.exports[export_id] = {
+                "content": {"id": export_id, "state": "RUNNING", "filters": body.get("content") or {}},
+                "metadata": body.get("metadata") or {},
+            }
+            self.exports_created[export_id] = time.monotonic()
+        return SimResponse.json(self._export_view(export_id))
+
+    def _patch_export(self, export_id, body, **_):
+        if export_id not in self.exports:
+            return SimResponse.error(404, "E_NOT_FOUND", f"Export {export_id} no encontrado")
+        export = self._export_view(export_id)
+        export["metadata"].update(body.get("metadata") or {})
+        return SimResponse.json(export)
+
+    def _get_export(self, export_id, **_):
+        if export_id not in self.exports:
+            return SimResponse.error(404, "E_NOT_FOUND", f"Export {export_id} no encontrado")
+        return SimResponse.json(self._export_view(export_id))
+
+    def _list_exports(self, **_):
+        return SimResponse.json({"content": [self._export_view(export_id)["content"] for export_id in self.exports]})
+
+    def _export_file(self, export_id, headers, **_):
+        if export_id not in self.exports:
+            return SimResponse.error(404, "E_NOT_FOUND", f"Export {export_id} no encontrado")
+        if self._export_view(export_id)["content"]["state"] != "COMPLETED":
+            return SimResponse.error(409, "E_EXPORT_NOT_READY", f"Export {export_id} todavía en curso")
+        buffer = io.BytesIO()
+        with zipfile.ZipFile(buffer, "w", zipfile.ZIP_DEFLATED) as archive:
+            for (client_id, invoice_id), invoice in sorted(self.invoices.items()):
+                archive.writestr(f"{client_id}/{invoice_id}.json", json.dumps(invoice))
+        return _ranged(buffer.getvalue(), "application/zip", headers)
+
+
+def _conditional(method: str, response: SimResponse, headers: Dict[str, str]) -> SimResponse:
+    """
+    Añade un ETag a los GET JSON y responde 304 si coincide con `If-None-Match`.
+    """
+    if method != "GET" or response.status != 200 or response.content_type != "application/json":
+        return response
+    etag = '"' + hashlib.sha1(response.body).hexdigest()[:20] + '"'
+    if headers.get("if-none-match") == etag:
+        return SimResponse(304, b"", response.content_type, {"ETag": etag})
+    response.headers["ETag"] = etag
+    return response
+
+
+_RANGE_RE = re.compile(r"^bytes=(\d+)-(\d*)$")
+
+
+def _ranged(data: bytes, content_type: str, headers: Dict[str, str]) -> SimResponse:
+    """
+    Respuesta binaria con soporte de `Range: bytes=N-` (206) para reanudar descargas.
+    """
+    match = _RANGE_RE.match(headers.get("range", ""))
+    if not match:
+        return SimResponse(200, data, content_type, {"Accept-Ranges": "bytes"})
+    start = int(match.group(1))
+    end = int(match.group(2)) if match.group(2) else len(data) - 1
+    if start >= len(data):
+        return SimResponse(416, b"", content_type, {"Content-Range": f"bytes */{len(data)}"})
+    end = min(end, len(data) - 1)
+    return SimResponse(206, data[start:end + 1], content_type, {
+        "Accept-Ranges": "bytes",
+        "Content-Range": f"bytes {start}-{end}/{len(data)}",
+    })
@@ -0,0 +1,336 @@
+# fiskaly_sdk/simulator/server.py
+
+"""
+Servidor HTTP local del simulador, con latencia configurable e inyección de fallos.
+"""
+
+import math
+import random
+import threading
+import time
+from collections import deque
+from dataclasses import dataclass, field
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Deque, Dict, List, Optional, Tuple
+from urllib.parse import parse_qsl, urlsplit
+
+from .api import SimResponse, SimulatedAPI
+
+BASE_PATH = "/api/v1"
+
+
+@dataclass
+class LatencyModel:
+    """
+    Distribución de la latencia añadida a cada respuesta, en segundos.
+
+    :param distribution: "constant", "uniform", "exponential" o "lognormal".
+    :param mean: Latencia media (para "uniform", el mínimo es `low`).
+    :param low: Mínimo para "uniform".
+    :param high: Máximo para "uniform".
+    :param sigma: Dispersión para "lognormal".
+    :param max_delay: Latencia máxima (recorta las colas largas).
+    """
+    distribution: str = "constant"
+    mean: float = 0.0
+    low: float = 0.0
+    high: float = 0.0
+    sigma: float = 0.5
+    max_delay: float = 10.0
+
+    def sample(self, rng: random.Random) -> float:
+        if self.distribution == "constant":
+            delay = self.mean
+        elif self.distribution == "uniform":
+            delay = rng.uniform(self.low, self.high)
+        elif self.distribution == "exponential":
+            delay = rng.expovariate(1.0 / self.mean) if self.mean > 0 else 0.0
+        elif self.distribution == "lognormal":
+            # mu elegido para que la media de la distribución sea `mean`.
+            delay = rng.lognormvariate(math.log(self.mean) - self.sigma ** 2 / 2, self.sigma) if self.mean > 0 else 0.0
+        else:
+            raise ValueError(f"Distribución de latencia desconocida: {self.distribution}")
+        return min(max(0.0, delay), self.max_delay)
+
+
+@dataclass
+class FaultConfig:
+    """
+    Fallos aleatorios inyectados antes de procesar cada petición autenticada.
+
+    :param rate_429: Probabilidad de responder 429 Too Many Requests.
+    :param rate_5xx: Probabilidad de responder 503 Service Unavailable.
+    :param rate_timeout: Probabilidad de no responder durante `timeout_delay`.
+    :param retry_after: Valor de la cabecera Retry-After en los 429, en segundos.
+    :param timeout_delay: Segundos que se retiene una petición "colgada".
+    """
+    rate_429: float = 0.0
+    rate_5xx: float = 0.0
+    rate_timeout: float = 0.0
+    retry_after: float = 1.0
+    timeout_delay: float = 30.0
+
+
+@dataclass
+class _Injected:
+    status: int
+    method: Optional[str]
+    path_prefix: Optional[str]
+    retry_after: Optional[float]
+    timeout: bool = False
+    remaining: int = 1
+
+
+@dataclass
+class SimulatorStats:
+    """
+    Contadores del simulador.
+    """
+    requests: int = 0
+    by_status: Dict[int, int] = field(default_factory=dict)
+    by_route: Dict[str, int] = field(default_factory=dict)
+    injected: int = 0
+
+
+class FiskalySimulator:
+    """
+    Simulador local de la API Fiskaly SIGN ES sobre HTTP en localhost.
+
+    Uso:
+        with FiskalySimulator(latency=LatencyModel("lognormal", mean=0.02)) as sim:
+            client = FiskalyClient(sim.api_key, sim.api_secret, base_url=sim.base_url)
+            client.authenticate()
+            sim.inject(503, count=2, path_prefix="/clients")
+    """
+
+    def __init__(
+        self,
+        host: str = "127.0.0.1",
+        port: int = 0,
+        latency: Optional[LatencyModel] = None,
+        route_latency: Optional[Dict[str, LatencyModel]] = None,
+        faults: Optional[FaultConfig] = None,
+        seed: Optional[int] = None,
+        **api_options
+    ):
+        """
+        :param host: Interfaz en la que escuchar.
+        :param port: Puerto (0 = uno libre).
+        :param latency: Latencia por defecto de todas las rutas.
+        :param route_latency: Latencia por prefijo de ruta (p.ej. {"/invoices": ...}).
+        :param faults: Fallos aleatorios a inyectar.
+        :param seed: Semilla para que latencias y fallos sean reproducibles.
+        :param api_options: Opciones de SimulatedAPI (token_ttl, max_page_size...).
+        """
+        self.api = SimulatedAPI(**api_options)
+        self.latency = latency or LatencyModel()
+        self.route_latency = route_latency or {}
+        self.faults = faults or FaultConfig()
+        self.stats = SimulatorStats()
+        self._rng = random.Random(seed)
+        self._lock = threading.Lock()
+        self._injected: Deque[_Injected] = deque()
+        self._server = _Server((host, port), _make_handler(self))
+        self._server.daemon_threads = True
+        self._thread: Optional[threading.Thread] = None
+
+    @property
+    def api_key(self) -> str:
+        return self.api.api_key
+
+    @property
+    def api_secret(self) -> str:
+        return self.api.api_secret
+
+    @property
+    def base_url(self) -> str:
+        host, port = self._server.server_address[:2]
+        return f"http://{host}:{port}{BASE_PATH}"
+
+    def inject(
+        self,
+        status: int = 503,
+        count: int = 1,
+        method: Optional[str] = None,
+        path_prefix: Optional[str] = None,
+        retry_after: Optional[float] = None,
+        timeout: bool = False,
+    ):
+        """
+        Programa fallos deterministas para las siguientes peticiones que coincidan.
+
+        :param status: Código HTTP a devolver (ignorado si `timeout`).
+        :param count: Número de peticiones afectadas.
+        :param method: Solo peticiones con este método (None = todas).
+        :param path_prefix: Solo rutas con este prefijo (None = todas).
+        :param retry_after: Cabecera Retry-After a incluir, en segundos.
+        :param timeout: Si True, la petición queda sin respuesta `faults.timeout_delay` segundos.
+        """
+        with self._lock:
+            self._injected.append(_Injected(status, method, path_prefix, retry_after, timeout, count))
+
+    def expire_tokens(self):
+        """
+        Caduca todos los tokens Bearer emitidos.
+        """
+        self.api.expire_tokens()
+
+    def _latency_for(self, path: str) -> LatencyModel:
+        for prefix, model in self.route_latency.items():
+            if path.startswith(prefix):
+                return model
+        return self.latency
+
+    def _take_fault(self, method: str, path: str) -> Optional[Tuple[Optional[SimResponse], bool]]:
+        """
+        Devuelve (respuesta de error o None, colgar) si hay que inyectar un fallo.
+        """
+        with self._lock:
+            for injected in self._injected:
+                if injected.method not in (None, method):
+                    continue
+                if injected.path_prefix is not None and not path.startswith(injected.path_prefix):
+                    continue
+                injected.remaining -= 1
+                if injected.remaining <= 0:
+                    self._injected.remove(injected)
+                return self._fault_response(injected.status, injected.retry_after), injected.timeout
+            roll = self._rng.random()
+            faults = self.faults
+            if roll < faults.rate_timeout:
+                return None, True
+            roll -= faults.rate_timeout
+            if roll < faults.rate_429:
+                return self._fault_response(429, faults.retry_after), False
+            roll -= faults.rate_429
+            if roll < faults.rate_5xx:
+                return self._fault_response(503, None), False
+        return None
+
+    @staticmethod
+    def _fault_response(status: int, retry_after: Optional[float]) -> SimResponse:
+        headers = {"Retry-After": f"{retry_after:g}"} if retry_after is not None else {}
+        code = "E_TOO_MANY_REQUESTS" if status == 429 else "E_INJECTED"
+        return SimResponse.error(status, code, "Fallo inyectado por el simulador", headers)
+
+    def dispatch(self, method: str, raw_path: str, headers: Dict[str, str], body: bytes) -> Optional[SimResponse]:
+        """
+        Aplica latencia y fallos y procesa la petición.
+
+        :return: Respuesta, o None si la petición debe quedarse sin respuesta (timeout).
+        """
+        url = urlsplit(raw_path)
+        path = url.path[len(BASE_PATH):] if url.path.startswith(BASE_PATH) else url.path
+        query = dict(parse_qsl(url.query))
+        with self._lock:
+            delay = self._latency_for(path).sample(self._rng)
+        if delay:
+            time.sleep(delay)
+
+        fault = None if path == "/auth" else self._take_fault(method, path)
+        if fault is not None and fault[1]:
+            time.sleep(self.faults.timeout_delay)
+            self._record(path, 0, injected=True)
+            return None
+        if fault is not None:
+            response = fault[0]
+        else:
+            response = self.api.handle(method, path, query, headers, body)
+        self._record(path, response.status, injected=fault is not None)
+        return response
+
+    def _record(self, path: str, status: int, injected: bool):
+        route = "/" + path.strip("/").split("/", 1)[0]
+        with self._lock:
+            stats = self.stats
+            stats.requests += 1
+            stats.by_status[status] = stats.by_status.get(status, 0) + 1
+            stats.by_route[route] = stats.by_route.get(route, 0) + 1
+            if injected:
+                stats.injected += 1
+
+    def start(self) -> "FiskalySimulator":
+        self._thread = threading.Thread(target=self._server.serve_forever, name="fiskaly-simulator", daemon=True)
+        self._thread.start()
+        return self
+
+    def stop(self):
+        self._server.shutdown()
+        self._server.server_close()
+
+    def __enter__(self):
+        return self.start()
+
+    def __exit__(self, exc_type, exc, tb):
+        self.stop()
+
+
+class _Server(ThreadingHTTPServer):
+    # La cola de conexiones por defecto (5) se desborda con cientos de hilos
+    # conectando a la vez y el kernel resetea las conexiones sobrantes.
+    request_queue_size = 1024
+
+
+def _make_handler(simulator: FiskalySimulator):
+    class Handler(BaseHTTPRequestHandler):
+        protocol_version = "HTTP/1.1"
+        disable_nagle_algorithm = True
+
+        def _handle(self):
+            length = int(self.headers.get("Content-Length") or 0)
+            body = self.rfile.read(length) if length else b""
+            headers = {key.lower(): value for key, value in self.headers.items()}
+            response = simulator.dispatch(self.command, self.path, headers, body)
+            if response is None:
+                # Timeout simulado: se cierra la conexión sin responder.
+                self.close_connection = True
+                return
+            self.send_response(response.status)
+            self.send_header("Content-Type", response.content_type)
+            self.send_header("Content-Length", str(len(response.body)))
+            for key, value in response.headers.items():
+                self.send_header(key, value)
+            self.end_headers()
+            self.wfile.write(response.body)
+
+        do_GET = do_PUT = do_POST = do_PATCH = do_DELETE = _handle
+
+        def log_message(self, format, *args):
+            pass
+
+    return Handler
+
+
+def main(argv: Optional[List[str]] = None):
+    """
+    Arranca el simulador en primer plano: `python -m fiskaly_sdk.simulator`.
+    """
+    import argparse
+
+    parser = argparse.ArgumentParser(description="Simulador local de la API Fiskaly SIGN ES")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8787)
+    parser.add_argument("--latency", default="constant", help="constant, uniform, exponential o lognormal")
+    parser.add_argument("--latency-mean", type=float, default=0.0, help="Latencia media en segundos")
+    parser.add_argument("--rate-429", type=float, default=0.0)
+    parser.add_argument("--rate-5xx", type=float, default=0.0)
+    parser.add_argument("--rate-timeout", type=float, default=0.0)
+    parser.add_argument("--token-ttl", type=float, default=300.0)
+    parser.add_argument("--seed", type=int)
+    args = parser.parse_args(argv)
+
+    simulator = FiskalySimulator(
+        host=args.host,
+        port=args.port,
+        latency=LatencyModel(args.latency, mean=args.latency_mean, high=args.latency_mean * 2),
+        faults=FaultConfig(rate_429=args.rate_429, rate_5xx=args.rate_5xx, rate_timeout=args.rate_timeout),
+        seed=args.seed,
+        token_ttl=args.token_ttl,
+    )
+    print(f"Simulador escuchando en {simulator.base_url} (api_key={simulator.api_key}, api_secret={simulator.api_secret})")
+    try:
+        simulator._server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        simulator._server.server_close()
@@ -0,0 +1,242 @@
+# fiskaly_sdk/tenants.py
+
+"""
+Pool de clientes multi-tenant del SDK Fiskaly SIGN ES.
+
+Para emitir facturas en nombre de muchos contribuyentes (cada uno con su API
+key y secret) no hace falta un FiskalyClient completo por contribuyente: el
+TenantPool mantiene un único transporte HTTP con un único pool de conexiones y
+entrega por credenciales una vista ligera (un FiskalyClient que comparte ese
+transporte) con su propio token.
+
+Las vistas se expulsan por LRU al superar `max_tenants` (y, opcionalmente, tras
+`idle_timeout` segundos sin uso), así que la memoria y los sockets abiertos no
+crecen con el número de contribuyentes. El token de una vista expulsada se
+guarda en una caché acotada y se reutiliza si el contribuyente vuelve antes de
+que caduque, sin repetir la autenticación.
+
+    with TenantPool(max_tenants=500) as pool:
+        client = pool.client(api_key, api_secret)
+        client.invoices.create(client_id, None, content)
+"""
+
+import threading
+import time
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Optional, Tuple
+
+from .client import FiskalyClient
+from .config import FiskalyConfig
+from .metrics import default_registry
+from .pool import PoolStats
+from .retry import RetryPolicy
+from .transport import build_transport
+
+
+@dataclass
+class TenantPoolStats:
+    """
+    Estado de un TenantPool.
+    """
+    tenants: int
+    created: int
+    evicted: int
+    cached_tokens: int
+    token_reuses: int
+
+
+class _Tenant:
+    __slots__ = ("secret", "client", "last_used")
+
+    def __init__(self, secret: str, client: FiskalyClient, last_used: float):
+        self.secret = secret
+        self.client = client
+        self.last_used = last_used
+
+
+class TenantPool:
+    """
+    Clientes por contribuyente sobre un único pool de conexiones, con expulsión LRU.
+
+    Las vistas son FiskalyClient normales y se pueden usar desde varios hilos. Una
+    vista expulsada mientras otro hilo la usa sigue funcionando (el transporte
+    es compartido); simplemente deja de estar en el pool.
+    """
+
+    def __init__(
+        self,
+        base_url: str = "https://sign-api.fiskaly.com/api/v1",
+        timeout: int = 30,
+        verify_ssl: bool = True,
+        max_tenants: int = 1000,
+        idle_timeout: Optional[float] = None,
+        token_cache_size: Optional[int] = None,
+        **options
+    ):
+        """
+        :param base_url: URL base de la API.
+        :param timeout: Timeout de cada petición, en segundos.
+        :param verify_ssl: Verifica el certificado TLS del servidor.
+        :param max_tenants: Vistas activas como máximo; al superarlo se expulsa la menos usada.
+        :param idle_timeout: Segundos sin uso tras los que se expulsa una vista (None = solo LRU).
+        :param token_cache_size: Tokens de vistas expulsadas que se conservan (por defecto, 4 * max_tenants).
+        :param options: Opciones de FiskalyConfig comunes a todas las vistas (transport,
+            pool_maxsize, retry_policy, rate_limiter...). Las vistas no refrescan el token en segundo
+            plano (sería un temporizador por contribuyente) salvo que se pida con
+            `token_background_refresh=True`.
+        :raises ValueError: Si se pasa `response_cache` (una caché compartida mezclaría
+            respuestas de contribuyentes distintos) o max_tenants < 1.
+        """
+        if max_tenants < 1:
+            raise ValueError("max_tenants debe ser al menos 1")
+        if options.get("response_cache") is not None:
+            raise ValueError("TenantPool no admite response_cache: se compartiría entre contribuyentes")
+        options.setdefault("token_background_refresh", False)
+        # Una sola política (y presupuesto) de reintentos para el transporte compartido.
+        options.setdefault("retry_policy", RetryPolicy())
+        options.setdefault("metrics", default_registry())
+        # Valida las opciones una vez y configura el pool compartido.
+        config = FiskalyConfig(api_key="", api_secret="", base_url=base_url, timeout=timeout, **options)
+
+        self.base_url = base_url
+        self.timeout = timeout
+        self.verify_ssl = verify_ssl
+        self.max_tenants = max_tenants
+        self.idle_timeout = idle_timeout
+        self.token_cache_size = token_cache_size if token_cache_size is not None else 4 * max_tenants
+        self._owns_transport = isinstance(config.transport, str)
+        self.transport = build_transport(config, verify_ssl)
+        options["transport"] = self.transport
+        self._options = options
+        if config.metrics is not None:
+            config.metrics.track_pool(self)
+
+        self._lock = threading.Lock()
+        self._tenants: "OrderedDict[str, _Tenant]" = OrderedDict()
+        # api_key -> (secret, bearer, expires_at) de vistas expulsadas.
+        self._tokens: "OrderedDict[str, Tuple[str, str, Optional[int]]]" = OrderedDict()
+        self._created = 0
+        self._evicted = 0
+        self._token_reuses = 0
+
+    def client(self, api_key: str, api_secret: str) -> FiskalyClient:
+        """
+        Devuelve la vista del contribuyente, creándola si no está en el pool.
+
+        Si el secret no coincide con el de la vista existente (credenciales
+        rotadas), la vista se sustituye y su token se descarta.
+
+        :param api_key: API Key del contribuyente.
+        :param api_secret: API Secret del contribuyente.
+        :return: FiskalyClient que comparte el transporte HTTP del pool.
+        """
+        now = time.monotonic()
+        with self._lock:
+            self._expire_idle(now)
+            tenant = self._tenants.get(api_key)
+            if tenant is not None:
+                if tenant.secret == api_secret:
+                    tenant.last_used = now
+                    self._tenants.move_to_end(api_key)
+                    return tenant.client
+                self._evict(api_key, keep_token=False)
+
+            client = FiskalyClient(
+                api_key,
+                api_secret,
+                base_url=self.base_url,
+                timeout=self.timeout,
+                verify_ssl=self.verify_ssl,
+                **self._options
+            )
+            cached = self._tokens.pop(api_key, None)
+            if cached is not None and cached[0] == api_secret and self._token_usable(cached[2]):
+                client.set_bearer_token(cached[1], cached[2])
+                self._token_reuses += 1
+            self._tenants[api_key] = _Tenant(api_secret, client, now)
+            self._created += 1
+            while len(self._tenants) > self.max_tenants:
+                self._evict(next(iter(self._tenants)))
+            return client
+
+    def evict(self, api_key: str) -> bool:
+        """
+        Saca una vista del pool (su token se conserva en la caché de tokens).
+
+        :return: True si la vista estaba en el pool.
+        """
+        with self._lock:
+            if api_key not in self._tenants:
+                return False
+            self._evict(api_key)
+            return True
+
+    def _token_usable(self, expires_at: Optional[int]) -> bool:
+        margin = self._options.get("token_refresh_margin", 60)
+        return expires_at is None or expires_at - margin > time.time()
+
+    def _expire_idle(self, now: float):
+        if self.idle_timeout is None:
+            return
+        deadline = now - self.idle_timeout
+        while self._tenants:
+            api_key, tenant = next(iter(self._tenants.items()))
+            if tenant.last_used > deadline:
+                break
+            self._evict(api_key)
+
+    def _evict(self, api_key: str, keep_token: bool = True):
+        tenant = self._tenants.pop(api_key)
+        client = tenant.client
+        bearer, expires_at = client.get_bearer_token(), client._token_manager.expires_at
+        client.close()
+        self._evicted += 1
+        if keep_token and bearer and self.token_cache_size > 0 and self._token_usable(expires_at):
+            self._tokens[api_key] = (tenant.secret, bearer, expires_at)
+            self._tokens.move_to_end(api_key)
+            while len(self._tokens) > self.token_cache_size:
+                self._tokens.popitem(last=False)
+
+    def pool_stats(self) -> PoolStats:
+        """
+        Estadísticas del pool de conexiones compartido.
+        """
+        return self.transport.stats()
+
+    def stats(self) -> TenantPoolStats:
+        """
+        Vistas activas, creadas y expulsadas, y tokens conservados.
+        """
+        with self._lock:
+            return TenantPoolStats(
+                tenants=len(self._tenants),
+                created=self._created,
+                evicted=self._evicted,
+                cached_tokens=len(self._tokens),
+                token_reuses=self._token_reuses,
+            )
+
+    def __len__(self) -> int:
+        return len(self._tenants)
+
+    def __contains__(self, api_key: str) -> bool:
+        return api_key in self._tenants
+
+    def close(self):
+        """
+        Cierra todas las vistas y el transporte HTTP compartido.
+        """
+        with self._lock:
+            for tenant in self._tenants.values():
+                tenant.client.close()
+            self._tenants.clear()
+            self._tokens.clear()
+        if self._owns_transport:
+            self.transport.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.close()
@@ -2,6 +2,7 @@
 
 import pytest
 from fiskaly_sdk.client import FiskalyClient
+from fiskaly_sdk.simulator import FiskalySimulator
 
 @pytest.fixture
 def client():
@@ -13,3 +14,37 @@ def client():
         api_secret="test_api_secret",
         base_url="https://sign-api.fiskaly.com/api/v1"
     )
+
+@pytest.fixture
+def sim_options():
+    """
+    Opciones del simulador del fixture `sim`. Un módulo lo sobrescribe con su
+    propio fixture y un test, parametrizando `sim_options`.
+    """
+    return {}
+
+@pytest.fixture
+def sim(sim_options):
+    """
+    Simulador local de la API, arrancado para el test.
+    """
+    with FiskalySimulator(**sim_options) as simulator:
+        yield simulator
+
+@pytest.fixture
+def make_client(sim):
+    """
+    Factoría de FiskalyClient autenticados contra `sim`: `make_client(**opciones)`.
+    Los clientes se cierran al terminar el test.
+    """
+    clients = []
+
+    def make(**options):
+        client = FiskalyClient(sim.api_key, sim.api_secret, base_url=sim.base_url, **options)
+        clients.append(client)
+        client.authenticate()
+        return client
+
+    yield make
+    for client in clients:
+        client.close()
@@ -0,0 +1,74 @@
+import asyncio
+import tarfile
+import zipfile
+import pytest
+from fiskaly_sdk.aio.client import AsyncFiskalyClient
+from fiskaly_sdk.archive import archive_name
+
+@pytest.fixture
+def sim_client(sim, make_client):
+    client = make_client()
+    client.clients.create("c1")
+    for i in range(6):
+        client.invoices.create("c1", f"inv-{i}", {"type": "SIMPLIFIED", "full_amount": "1.00"})
+    return sim, client
+
+PAIRS = [("c1", f"inv-{i}") for i in range(6)]
+
+def test_get_many_to_directory_skips_present_files(sim_client, tmp_path):
+    _, client = sim_client
+    results = list(client.invoice_xml.get_many(PAIRS + [("c1", "missing")], tmp_path, max_workers=3))
+    assert sorted(r.invoice_id for r in results if r.ok and not r.skipped) == [f"inv-{i}" for i in range(6)]
+    [failed] = [r for r in results if not r.ok]
+    assert failed.invoice_id == "missing" and failed.error.status_code == 404
+    assert (tmp_path / "c1" / "inv-0.xml").read_bytes().startswith(b"<?xml")
+    assert not list(tmp_path.rglob("*.part"))
+
+    (tmp_path / "c1" / "inv-1.xml").write_bytes(b"<?xml version='1.0'?><Invoice")  # cortado
+    again = list(client.invoice_xml.get_many(PAIRS, tmp_path))
+    assert [r.invoice_id for r in again if not r.skipped] == ["inv-1"]
+    assert (tmp_path / "c1" / "inv-1.xml").read_bytes().endswith(b"</Invoice>")
+
+def test_get_many_appends_to_tar_and_recovers_truncated_entry(sim_client, tmp_path):
+    _, client = sim_client
+    path = tmp_path / "xml.tar"
+    assert all(r.ok for r in client.invoice_xml.get_many(PAIRS[:3], path))
+    # Simula una ejecución interrumpida a mitad de la última entrada.
+    with tarfile.open(path) as tar:
+        last = tar.getmembers()[-1]
+    with open(path, "r+b") as f:
+        f.truncate(last.offset_data + 10)
+
+    results = list(client.invoice_xml.get_many(PAIRS, path))
+    refetched = sorted(r.name for r in results if not r.skipped)
+    assert refetched == sorted([last.name] + [archive_name(*pair) for pair in PAIRS[3:]])
+    with tarfile.open(path) as tar:
+        assert sorted(tar.getnames()) == sorted(archive_name(*pair) for pair in PAIRS)
+        assert tar.extractfile(last.name).read().endswith(b"</Invoice>")
+
+def test_get_many_appends_to_zip(sim_client, tmp_path):
+    _, client = sim_client
+    path = tmp_path / "xml.zip"
+    list(client.invoice_xml.get_many(PAIRS[:2], path))
+    results = list(client.invoice_xml.get_many(PAIRS, path))
+    assert sum(r.skipped for r in results) == 2
+    with zipfile.ZipFile(path) as archive:
+        assert archive.testzip() is None
+        assert sorted(archive.namelist()) == sorted(archive_name(*pair) for pair in PAIRS)
+
+def test_get_many_rejects_unsafe_ids(client, tmp_path):
+    [result] = client.invoice_xml.get_many([("c1", "../etc")], tmp_path)
+    assert isinstance(result.error, ValueError)
+
+def test_async_get_many(sim_client, tmp_path):
+    sim, _ = sim_client
+
+    async def main():
+        async with AsyncFiskalyClient(sim.api_key, sim.api_secret, base_url=sim.base_url) as client:
+            await client.authenticate()
+            return [r async for r in client.invoice_xml.get_many(PAIRS, tmp_path / "xml.tar", max_concurrency=4)]
+
+    results = asyncio.run(main())
+    assert len(results) == 6 and all(r.ok and not r.skipped for r in results)
+    with tarfile.open(tmp_path / "xml.tar") as tar:
+        assert len(tar.getnames()) == 6
@@ -0,0 +1,46 @@
+import asyncio
+import pytest
+
+httpx = pytest.importorskip("httpx")
+
+from fiskaly_sdk.aio import AsyncFiskalyClient
+from fiskaly_sdk.models.software import SoftwareResponseContent
+
+def _client(handler):
+    client = AsyncFiskalyClient(api_key="test", api_secret="test")
+    client.session = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+    return client
+
+def test_async_authenticate_and_get_software():
+    def handler(request):
+        if request.url.path.endswith("/auth"):
+            return httpx.Response(200, json={"content": {"access_token": {"bearer": "tok", "expires_at": 9999999999}}})
+        assert request.headers["Authorization"] == "Bearer tok"
+        return httpx.Response(200, json={"content": {"software_id": "soft123", "name": "DemoSoft"}})
+
+    async def main():
+        async with _client(handler) as client:
+            await client.authenticate()
+            return await client.software.get()
+
+    resp = asyncio.run(main())
+    assert isinstance(resp.content, SoftwareResponseContent)
+    assert resp.content.name == "DemoSoft"
+
+def test_async_concurrent_refresh_single_auth_call():
+    auth_calls = []
+
+    def handler(request):
+        if request.url.path.endswith("/auth"):
+            auth_calls.append(1)
+            return httpx.Response(200, json={"content": {"access_token": {"bearer": "fresh", "expires_at": 9999999999}}})
+        return httpx.Response(200, json={"content": {"id": "inv1", "state": "ISSUED"}})
+
+    async def main():
+        async with _client(handler) as client:
+            client.set_bearer_token("old", expires_at=1)
+            return await asyncio.gather(*[client.invoices.get("c1", "inv1") for _ in range(20)])
+
+    results = asyncio.run(main())
+    assert len(results) == 20
+    assert len(auth_calls) == 1
@@ -0,0 +1,39 @@
+import json
+from fiskaly_sdk.benchmarks.fixtures import CASES, select_cases, start_simulator
+from fiskaly_sdk.benchmarks.suite import compare, make_client, measure_overhead, run_suite
+
+def test_every_case_runs_in_memory():
+    rows = measure_overhead(CASES, iterations=1, warmup=0)
+    assert [row["case"] for row in rows] == [name for name, _ in CASES]
+
+def test_every_case_runs_against_the_simulator():
+    sim, bearer = start_simulator()
+    client = make_client(sim.base_url, bearer, retry_policy=None)
+    try:
+        for name, call in CASES:
+            call(client)
+    finally:
+        client.close()
+        sim.stop()
+
+def test_select_cases_by_prefix():
+    names = [name for name, _ in select_cases(["invoices", "software.get"])]
+    assert "invoices.create" in names and "software.get" in names
+    assert "invoice_search.search_page" not in names
+
+def test_run_suite_report_is_json():
+    report = run_suite(cases=["invoices.get"], iterations=3, concurrency_levels=[1, 2], duration=0.1, startup_repeat=1)
+    report = json.loads(json.dumps(report))
+    assert report["overhead"][0]["case"] == "invoices.get"
+    assert report["allocations"][0]["peak_kib"] >= 0
+    assert {row["concurrency"] for row in report["throughput"]} == {1, 2}
+    assert all(row["errors"] == 0 and row["calls"] > 0 for row in report["throughput"])
+    assert [row["case"] for row in report["startup"]] == ["import", "client_import", "construct", "first_resource"]
+
+def test_compare_flags_regressions():
+    baseline = {"overhead": [{"case": "invoices.get", "mean_us": 100, "p95_us": 200}],
+                "throughput": [{"case": "invoices.get", "concurrency": 4, "rps": 1000}]}
+    current = {"overhead": [{"case": "invoices.get", "mean_us": 105, "p95_us": 300}],
+               "throughput": [{"case": "invoices.get", "concurrency": 4, "rps": 800}]}
+    regressions = compare(baseline, current, threshold=0.10)
+    assert {(r["key"], r["metric"]) for r in regressions} == {("invoices.get", "p95_us"), ("invoices.get@4", "rps")}
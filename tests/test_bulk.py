@@ -0,0 +1,35 @@
+import threading
+import time
+from unittest.mock import patch
+from fiskaly_sdk.exceptions import FiskalyApiError
+
+def test_create_many_keeps_order_per_client(client):
+    seen = []
+    lock = threading.Lock()
+
+    def fake_request(method, endpoint, **kwargs):
+        _, _, client_id, _, invoice_id = endpoint.split("/")
+        if invoice_id == "a-2":
+            raise FiskalyApiError("boom", status_code=422)
+        time.sleep(0.01)
+        with lock:
+            seen.append((client_id, invoice_id))
+        return {"content": {"id": invoice_id, "state": "ISSUED"}}
+
+    items = [("a", f"a-{i}", {"type": "SIMPLIFIED"}) for i in range(5)]
+    items += [("b", f"b-{i}", {"type": "SIMPLIFIED"}, {"k": "v"}) for i in range(5)]
+    with patch("fiskaly_sdk.client.FiskalyClient.request", side_effect=fake_request):
+        results = list(client.invoices.create_many(items, max_workers=4))
+
+    assert len(results) == 10
+    failed = [r for r in results if not r.ok]
+    assert [r.invoice_id for r in failed] == ["a-2"]
+    assert [i for c, i in seen if c == "a"] == ["a-0", "a-1", "a-3", "a-4"]
+    assert [i for c, i in seen if c == "b"] == [f"b-{i}" for i in range(5)]
+
+def test_create_many_generates_missing_ids(client):
+    with patch("fiskaly_sdk.client.FiskalyClient.request") as mock_request:
+        mock_request.return_value = {"content": {"id": "x", "state": "ISSUED"}}
+        results = list(client.invoices.create_many([("a", None, {})]))
+    assert results[0].ok
+    assert results[0].invoice_id
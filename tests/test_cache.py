@@ -0,0 +1,60 @@
+import time
+from fiskaly_sdk.cache import ResponseCache
+
+def test_fresh_entries_skip_the_network(sim, make_client):
+    cache = ResponseCache(ttl=60)
+    client = make_client(response_cache=cache)
+    client.taxpayer.set("B12345678", "Sim SL", "GIPUZKOA")
+    before = sim.stats.requests
+    for _ in range(5):
+        assert client.taxpayer.get().content.issuer.legal_name == "Sim SL"
+        assert client.software.get().content.software_id
+    assert sim.stats.requests - before == 2
+    assert cache.stats().hits == 8
+
+def test_stale_entry_revalidated_with_etag(sim, make_client):
+    cache = ResponseCache(ttl=0.05)
+    client = make_client(response_cache=cache)
+    client.software.get()
+    time.sleep(0.06)
+    assert client.software.get().content.name
+    assert sim.stats.by_status.get(304) == 1
+    assert cache.stats().revalidated == 1
+
+def test_writes_invalidate_the_resource(make_client):
+    cache = ResponseCache(ttl=60)
+    client = make_client(response_cache=cache)
+    client.clients.create("client-1")
+    assert client.clients.get("client-1").content.state == "ENABLED"
+    client.clients.disable("client-1")
+    assert client.clients.get("client-1").content.state == "DISABLED"
+    assert cache.stats().invalidations >= 1
+
+def test_raw_hits_are_copies_of_the_cached_json(make_client):
+    cache = ResponseCache(ttl=60)
+    client = make_client(response_cache=cache, response_mode="raw")
+    first = client.software.get()
+    name = first["content"]["name"]
+    first["content"]["name"] = "mutated"
+    first["content"].clear()
+    assert client.software.get()["content"]["name"] == name
+
+    value = {"content": {"id": "c1"}}
+    cache.store(cache.key("/clients/c1"), value, {})
+    value["content"]["id"] = "changed"
+    assert cache.lookup(cache.key("/clients/c1")).get() == {"content": {"id": "c1"}}
+
+def test_lru_eviction_and_non_cacheable_endpoints():
+    cache = ResponseCache(ttl=60, max_entries=2)
+    assert cache.key("/clients/c1/invoices") is None
+    for client_id in ("c1", "c2", "c3"):
+        cache.store(cache.key(f"/clients/{client_id}"), {"id": client_id}, {})
+    assert cache.lookup(cache.key("/clients/c1")) is None
+    assert cache.lookup(cache.key("/clients/c3")).value == {"id": "c3"}
+    assert cache.stats().evictions == 1
+
+def test_no_store_is_respected():
+    cache = ResponseCache()
+    key = cache.key("/software")
+    cache.store(key, {"content": {}}, {"Cache-Control": "no-store"})
+    assert cache.lookup(key) is None
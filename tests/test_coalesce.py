@@ -0,0 +1,130 @@
+import asyncio
+import threading
+import pytest
+from fiskaly_sdk.coalesce import AsyncSingleFlight, SingleFlight
+from fiskaly_sdk.exceptions import FiskalyApiError
+from fiskaly_sdk.simulator import LatencyModel
+
+@pytest.fixture
+def sim_options():
+    return {"route_latency": {"/clients": LatencyModel(mean=0.2)}}
+
+def _concurrent(fn, n=20):
+    barrier = threading.Barrier(n)
+    results, errors = [], []
+
+    def worker():
+        barrier.wait()
+        try:
+            results.append(fn())
+        except Exception as e:
+            errors.append(e)
+
+    threads = [threading.Thread(target=worker) for _ in range(n)]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+    return results, errors
+
+def test_concurrent_gets_share_one_call(sim, make_client):
+    client = make_client(pool_maxsize=20)
+    client.clients.create("client-1")
+    before = sim.stats.by_route["/clients"]
+    results, errors = _concurrent(lambda: client.clients.get("client-1"))
+    assert not errors
+    assert len(results) == 20
+    assert all(r.content.id == "client-1" for r in results)
+    assert sim.stats.by_route["/clients"] - before == 1
+
+def test_coalesced_callers_get_their_own_copy(make_client):
+    client = make_client(pool_maxsize=20)
+    client.clients.create("client-1")
+    results, errors = _concurrent(lambda: client.request("GET", "/clients/client-1"))
+    assert not errors
+    assert client._flights.coalesced > 0
+    results[0]["content"]["id"] = "mutated"
+    results[0]["content"].clear()
+    assert all(r["content"]["id"] == "client-1" for r in results[1:])
+
+def test_async_single_flight_copies_for_each_caller():
+    async def fetch():
+        await asyncio.sleep(0.05)
+        return {"content": {"id": "c1"}}
+
+    async def main():
+        flights = AsyncSingleFlight(copy=lambda value: dict(value, content=dict(value["content"])))
+        return await asyncio.gather(*[flights.do("k", fetch) for _ in range(3)])
+
+    results = asyncio.run(main())
+    results[0]["content"]["id"] = "mutated"
+    assert [r["content"]["id"] for r in results[1:]] == ["c1", "c1"]
+
+def test_followers_receive_the_leader_error(sim, make_client):
+    client = make_client(pool_maxsize=20, retry_policy=None)
+    sim.inject(404, count=1, path_prefix="/clients")
+    results, errors = _concurrent(lambda: client.clients.get("missing"))
+    assert not results
+    assert len(errors) == 20
+    assert all(isinstance(e, FiskalyApiError) and e.status_code == 404 for e in errors)
+
+def test_coalescing_can_be_disabled(sim, make_client):
+    client = make_client(pool_maxsize=20, coalesce_gets=False)
+    client.clients.create("client-1")
+    before = sim.stats.by_route["/clients"]
+    _concurrent(lambda: client.clients.get("client-1"), n=5)
+    assert sim.stats.by_route["/clients"] - before == 5
+
+def test_single_flight_starts_a_new_flight_after_completion():
+    flights = SingleFlight()
+    calls = []
+    assert flights.do("k", lambda: calls.append(1) or len(calls)) == 1
+    assert flights.do("k", lambda: calls.append(1) or len(calls)) == 2
+    assert flights.in_flight() == 0
+
+def test_async_single_flight_shares_result_and_error():
+    calls = []
+
+    async def fetch():
+        calls.append(1)
+        await asyncio.sleep(0.05)
+        return {"n": len(calls)}
+
+    async def fail():
+        await asyncio.sleep(0.05)
+        raise FiskalyApiError("boom", status_code=503)
+
+    async def main():
+        flights = AsyncSingleFlight()
+        results = await asyncio.gather(*[flights.do("k", fetch) for _ in range(10)])
+        errors = await asyncio.gather(*[flights.do("e", fail) for _ in range(5)], return_exceptions=True)
+        return flights, results, errors
+
+    flights, results, errors = asyncio.run(main())
+    assert len(calls) == 1
+    assert all(r is results[0] for r in results)
+    assert all(isinstance(e, FiskalyApiError) for e in errors)
+    assert flights.coalesced == 13
+    assert flights.in_flight() == 0
+
+def test_async_client_coalesces_gets():
+    httpx = pytest.importorskip("httpx")
+    from fiskaly_sdk.aio import AsyncFiskalyClient
+
+    hits = []
+
+    async def handler(request):
+        hits.append(request.url.path)
+        await asyncio.sleep(0.05)
+        return httpx.Response(200, json={"content": {"software_id": "soft123", "name": "DemoSoft"}})
+
+    async def main():
+        client = AsyncFiskalyClient(api_key="test", api_secret="test", token_background_refresh=False)
+        client.session = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+        client.set_bearer_token("tok", expires_at=9999999999)
+        async with client:
+            return await asyncio.gather(*[client.software.get() for _ in range(10)])
+
+    results = asyncio.run(main())
+    assert len(results) == 10
+    assert len(hits) == 1
@@ -0,0 +1,71 @@
+import json
+from decimal import Decimal
+import pytest
+from fiskaly_sdk.benchmarks.codec import run as run_codec_benchmark
+from fiskaly_sdk.client import FiskalyClient
+from fiskaly_sdk.codec import CODECS, JsonCodec, StdlibJsonCodec, get_codec
+from fiskaly_sdk.models.invoice import InvoiceRequest
+
+def _codecs():
+    codecs = []
+    for name, factory in CODECS.items():
+        try:
+            codecs.append(factory())
+        except ImportError:
+            continue
+    return codecs
+
+@pytest.mark.parametrize("codec", _codecs(), ids=lambda codec: codec.name)
+def test_codecs_round_trip_bytes(codec):
+    body = InvoiceRequest(content={"type": "SIMPLIFIED", "text": "Café", "full_amount": "1.00"}, metadata={"n": 1})
+    encoded = codec.dumps(body)
+    assert isinstance(encoded, bytes)
+    assert json.loads(encoded) == body.model_dump()
+    assert codec.loads(encoded) == body.model_dump()
+    assert json.loads(codec.dumps({"amount": Decimal("1.10"), "model": body})) == {"amount": "1.10", "model": body.model_dump()}
+    with pytest.raises(ValueError):
+        codec.loads(b"{no json")
+
+def test_get_codec():
+    assert get_codec("auto") is get_codec()
+    assert get_codec("auto").name in CODECS
+    assert isinstance(get_codec("json"), StdlibJsonCodec)
+    custom = StdlibJsonCodec()
+    assert get_codec(custom) is custom
+    with pytest.raises(ValueError):
+        get_codec("yaml")
+    with pytest.raises(ValueError):
+        FiskalyClient("key", "secret", json_codec="yaml")
+
+class RecordingCodec(StdlibJsonCodec):
+    def __init__(self):
+        self.dumped, self.loaded = [], 0
+
+    def dumps(self, obj):
+        self.dumped.append(obj)
+        return super().dumps(obj)
+
+    def loads(self, data):
+        assert isinstance(data, bytes)
+        self.loaded += 1
+        return super().loads(data)
+
+def test_client_bodies_go_through_codec(make_client):
+    codec = RecordingCodec()
+    client = make_client(json_codec=codec)
+    client.clients.create("client-1")
+    invoice = client.invoices.create("client-1", "inv-1", {"type": "SIMPLIFIED", "full_amount": "1.00"})
+    assert invoice.content.id == "inv-1"
+    # El modelo llega al codec sin pasar por dict().
+    assert isinstance(codec.dumped[-1], InvoiceRequest)
+    assert codec.loaded == 3
+
+def test_codec_is_resolved_on_first_request():
+    client = FiskalyClient("key", "secret", token_background_refresh=False)
+    assert client._codec is None
+    assert isinstance(client.codec, JsonCodec)
+
+def test_benchmark_runs():
+    rows = run_codec_benchmark(lines=10, items=10, repeat=1)
+    assert {row["case"] for row in rows} == {"encode_invoice", "decode_list"}
+    assert {"baseline", "json"} <= {row["codec"] for row in rows}
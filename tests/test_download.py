@@ -0,0 +1,61 @@
+import hashlib
+import io
+import pytest
+import requests
+from unittest.mock import MagicMock
+from fiskaly_sdk.client import FiskalyClient
+from fiskaly_sdk.exceptions import FiskalyApiError
+
+PAYLOAD = b"PK" + bytes(range(256)) * 100
+
+def _stream(status, chunks, fail_after=None):
+    resp = MagicMock(ok=200 <= status < 400, status_code=status, headers={}, text="error")
+
+    def iter_content(chunk_size):
+        for i, chunk in enumerate(chunks):
+            if fail_after is not None and i == fail_after:
+                raise requests.exceptions.ChunkedEncodingError("conexión cortada")
+            yield chunk
+    resp.iter_content.side_effect = iter_content
+    return resp
+
+@pytest.fixture
+def dl_client():
+    client = FiskalyClient(api_key="test", api_secret="test")
+    client.set_bearer_token("token")
+    return client
+
+def test_download_zip_to_file(dl_client, tmp_path):
+    dl_client.session.request = MagicMock(return_value=_stream(200, [PAYLOAD[:1000], PAYLOAD[1000:]]))
+    dest = tmp_path / "export.zip"
+    result = dl_client.exports.download_zip_to("exp1", dest)
+    assert dest.read_bytes() == PAYLOAD
+    assert result.bytes_written == len(PAYLOAD)
+    assert result.checksum == hashlib.sha256(PAYLOAD).hexdigest()
+    assert dl_client.session.request.call_args.kwargs["stream"] is True
+
+def test_download_resumes_with_range(dl_client):
+    first = _stream(200, [PAYLOAD[:1000], PAYLOAD[1000:]], fail_after=1)
+    second = _stream(206, [PAYLOAD[1000:]])
+    dl_client.session.request = MagicMock(side_effect=[first, second])
+    sink = io.BytesIO()
+    result = dl_client.invoice_xml.get_xml_to("client1", "inv1", sink, checksum="md5")
+    assert sink.getvalue() == PAYLOAD
+    assert result.resumes == 1
+    assert result.checksum == hashlib.md5(PAYLOAD).hexdigest()
+    assert dl_client.session.request.call_args.kwargs["headers"]["Range"] == "bytes=1000-"
+
+def test_download_restarts_when_range_ignored(dl_client):
+    first = _stream(200, [PAYLOAD[:1000], PAYLOAD[1000:]], fail_after=1)
+    second = _stream(200, [PAYLOAD])
+    dl_client.session.request = MagicMock(side_effect=[first, second])
+    sink = io.BytesIO()
+    result = dl_client.taxpayer_agreement.download_pdf_to(sink)
+    assert sink.getvalue() == PAYLOAD
+    assert result.bytes_written == len(PAYLOAD)
+
+def test_download_error_status(dl_client):
+    dl_client.session.request = MagicMock(return_value=_stream(404, []))
+    with pytest.raises(FiskalyApiError) as exc:
+        dl_client.exports.download_zip_to("exp1", io.BytesIO())
+    assert exc.value.status_code == 404
@@ -0,0 +1,65 @@
+import threading
+import pytest
+from unittest.mock import patch
+from fiskaly_sdk.exceptions import FiskalyApiError, FiskalyExportError
+from fiskaly_sdk.export_scheduler import ExportBackoff
+
+def _export(state, export_id="export-id-1"):
+    return {"content": {"id": export_id, "state": state}}
+
+FAST = {"initial_delay": 0, "max_delay": 0, "jitter": 0}
+
+def test_backoff_grows_and_resets_on_state_change():
+    backoff = ExportBackoff(initial_delay=1, max_delay=3, factor=2, jitter=0)
+    assert [backoff.next_delay("RUNNING") for _ in range(4)] == [1, 2, 3, 3]
+    assert backoff.next_delay("FINALIZING") == 1
+
+@patch("fiskaly_sdk.client.FiskalyClient.request")
+def test_wait_until_ready(mock_request, client):
+    mock_request.side_effect = [
+        _export("RUNNING"),
+        FiskalyApiError("Error API [503]", status_code=503),
+        _export("COMPLETED"),
+    ]
+    resp = client.exports.wait_until_ready("export-id-1", **FAST)
+    assert resp.content.state == "COMPLETED"
+    assert mock_request.call_count == 3
+
+@patch("fiskaly_sdk.client.FiskalyClient.request")
+def test_wait_until_ready_failed_export(mock_request, client):
+    mock_request.return_value = _export("ERROR")
+    with pytest.raises(FiskalyExportError) as exc:
+        client.exports.wait_until_ready("export-id-1", **FAST)
+    assert exc.value.export.content.state == "ERROR"
+
+@patch("fiskaly_sdk.client.FiskalyClient.request")
+def test_wait_until_ready_timeout(mock_request, client):
+    mock_request.return_value = _export("RUNNING")
+    with pytest.raises(FiskalyExportError):
+        client.exports.wait_until_ready("export-id-1", timeout=0.05, initial_delay=0.01, jitter=0)
+
+@patch("fiskaly_sdk.client.FiskalyClient.request")
+def test_scheduler_resolves_futures_and_callbacks(mock_request, client):
+    polls = {}
+    lock = threading.Lock()
+
+    def fake_request(method, endpoint, **kwargs):
+        export_id = endpoint.rsplit("/", 1)[-1]
+        with lock:
+            polls[export_id] = polls.get(export_id, 0) + 1
+            count = polls[export_id]
+        if export_id == "bad":
+            return _export("FAILED", export_id)
+        return _export("COMPLETED" if count >= 3 else "RUNNING", export_id)
+    mock_request.side_effect = fake_request
+
+    done = []
+    with client.exports.scheduler(requests_per_second=1000, initial_delay=0, max_delay=0) as scheduler:
+        futures = [scheduler.track(f"exp{i}", callback=lambda *args: done.append(args)) for i in range(5)]
+        bad = scheduler.track("bad")
+        scheduler.wait_all(timeout=5)
+        assert all(f.result().content.state == "COMPLETED" for f in futures)
+        assert isinstance(bad.exception(), FiskalyExportError)
+        assert scheduler.pending == 0
+    assert sorted(args[0] for args in done) == [f"exp{i}" for i in range(5)]
+    assert all(polls[f"exp{i}"] == 3 for i in range(5))
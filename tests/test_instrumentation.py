@@ -0,0 +1,142 @@
+import asyncio
+import logging
+import pytest
+from fiskaly_sdk.client import FiskalyClient
+from fiskaly_sdk.exceptions import FiskalyApiError
+from fiskaly_sdk.instrumentation import CallbackInstrumentation, LoggingInstrumentation, endpoint_template
+from fiskaly_sdk.retry import RetryPolicy
+from fiskaly_sdk.simulator import LatencyModel
+
+@pytest.fixture
+def sim_options():
+    return {"route_latency": {"/clients": LatencyModel(mean=0.05)}}
+
+def test_endpoint_template():
+    assert endpoint_template("/clients/c1/invoices/i1") == "/clients/{id}/invoices/{id}"
+    assert endpoint_template("/clients/c1/invoices") == "/clients/{id}/invoices"
+    assert endpoint_template("/taxpayer/agreement") == "/taxpayer/agreement"
+    assert endpoint_template("/exports/e1/file") == "/exports/{id}/file"
+
+def test_event_with_phase_breakdown(make_client):
+    events = []
+    client = make_client(instrumentation=CallbackInstrumentation(events.append))
+    client.clients.create("client-1")
+    events.clear()
+    client.invoices.create("client-1", "inv-1", {"type": "SIMPLIFIED", "full_amount": "1.00"})
+    assert len(events) == 1
+    event = events[0]
+    assert (event.method, event.endpoint, event.path) == ("PUT", "/clients/{id}/invoices/{id}", "/clients/client-1/invoices/inv-1")
+    assert event.status == 200 and event.retries == 0 and event.error is None
+    assert event.bytes_out > 0 and event.bytes_in > 0
+    t = event.timings
+    assert t.server >= 0.05
+    assert t.decode > 0 and t.validate > 0
+    assert event.duration >= sum(seconds for _, seconds in t.phases()) * 0.99
+
+def test_retries_and_errors_are_reported(sim, make_client):
+    events = []
+    client = make_client(instrumentation=CallbackInstrumentation(events.append), retry_policy=RetryPolicy(backoff_base=0.01))
+    client.clients.create("client-1")
+    events.clear()
+    sim.inject(503, count=1, method="GET", path_prefix="/clients")
+    client.clients.get("client-1")
+    assert events[-1].retries == 1
+    assert events[-1].timings.queue > 0
+
+    with pytest.raises(FiskalyApiError):
+        client.clients.get("missing")
+    assert events[-1].status == 404
+    assert isinstance(events[-1].error, FiskalyApiError)
+
+def test_direct_request_event_emitted_before_returning(make_client):
+    events = []
+    client = make_client(instrumentation=CallbackInstrumentation(events.append))
+    events.clear()
+    client.request("GET", "/software")
+    assert [e.endpoint for e in events] == ["/software"]
+    assert events[0].timings.validate == 0
+
+def test_resource_event_waits_for_validation(make_client):
+    events = []
+    client = make_client(instrumentation=CallbackInstrumentation(events.append))
+    events.clear()
+    client.request("GET", "/software", will_parse=True)
+    assert events == []
+    client.software.get()
+    assert [e.endpoint for e in events] == ["/software", "/software"]
+    assert events[1].timings.validate > 0
+
+def test_list_without_items_still_emits(make_client):
+    events = []
+    client = make_client(instrumentation=CallbackInstrumentation(events.append))
+    events.clear()
+    assert client.exports.list() == []
+    assert [e.endpoint for e in events] == ["/exports"]
+
+def test_streamed_download_emits_an_event(tmp_path, make_client):
+    events = []
+    client = make_client(instrumentation=CallbackInstrumentation(events.append))
+    client.clients.create("client-1")
+    client.invoices.create("client-1", "inv-1", {"type": "SIMPLIFIED", "full_amount": "1.00"})
+    events.clear()
+    result = client.invoice_xml.get_xml_to("client-1", "inv-1", tmp_path / "inv-1.xml")
+    [event] = events
+    assert (event.method, event.endpoint, event.status) == ("GET", "/clients/{id}/invoices/{id}/xml", 200)
+    assert event.bytes_in == result.bytes_written
+    assert event.timings.server > 0 and event.error is None
+
+    with pytest.raises(FiskalyApiError):
+        client.invoice_xml.get_xml_to("client-1", "missing", tmp_path / "missing.xml")
+    assert events[-1].status == 404 and isinstance(events[-1].error, FiskalyApiError)
+
+def test_logging_instrumentation(sim, caplog):
+    client = FiskalyClient(sim.api_key, sim.api_secret, base_url=sim.base_url, instrumentation=LoggingInstrumentation())
+    with caplog.at_level(logging.DEBUG, logger="fiskaly_sdk.requests"):
+        client.authenticate()
+    assert any("POST /auth -> 200" in record.getMessage() for record in caplog.records)
+
+def test_hook_errors_do_not_break_requests(sim):
+    def broken(event):
+        raise RuntimeError("hook")
+    client = FiskalyClient(sim.api_key, sim.api_secret, base_url=sim.base_url, instrumentation=CallbackInstrumentation(broken))
+    assert client.authenticate()
+
+def test_async_client_events():
+    httpx = pytest.importorskip("httpx")
+    from fiskaly_sdk.aio import AsyncFiskalyClient
+
+    events = []
+
+    def handler(request):
+        return httpx.Response(200, json={"content": {"software_id": "soft123", "name": "DemoSoft"}})
+
+    async def main():
+        client = AsyncFiskalyClient(
+            api_key="test", api_secret="test", token_background_refresh=False,
+            instrumentation=CallbackInstrumentation(events.append),
+        )
+        client.session = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+        client.set_bearer_token("tok", expires_at=9999999999)
+        async with client:
+            # Dos GET idénticos a la vez comparten una petición: un solo evento.
+            await asyncio.gather(client.software.get(), client.software.get())
+
+    asyncio.run(main())
+    assert len(events) == 1
+    assert events[0].endpoint == "/software" and events[0].timings.validate > 0
+
+def test_opentelemetry_spans(make_client):
+    pytest.importorskip("opentelemetry.sdk")
+    from opentelemetry.sdk.trace import TracerProvider
+    from opentelemetry.sdk.trace.export import SimpleSpanProcessor
+    from opentelemetry.sdk.trace.export.in_memory_span_exporter import InMemorySpanExporter
+    from fiskaly_sdk.instrumentation import OpenTelemetryInstrumentation
+
+    exporter = InMemorySpanExporter()
+    provider = TracerProvider()
+    provider.add_span_processor(SimpleSpanProcessor(exporter))
+    instrumentation = OpenTelemetryInstrumentation(provider.get_tracer("test"))
+    make_client(instrumentation=instrumentation)
+    spans = {span.name: span for span in exporter.get_finished_spans()}
+    assert spans["POST /auth"].attributes["http.response.status_code"] == 200
+    assert spans["fiskaly.server"].parent.span_id == spans["POST /auth"].context.span_id
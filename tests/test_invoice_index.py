@@ -0,0 +1,81 @@
+import datetime
+import pytest
+from fiskaly_sdk.exceptions import FiskalyApiError
+from fiskaly_sdk.invoice_index import _timestamp
+
+@pytest.fixture
+def sim_client(sim, make_client):
+    client = make_client(response_mode="raw")
+    for client_id in ("c1", "c2"):
+        client.clients.create(client_id)
+    for i in range(5):
+        client_id = "c1" if i < 3 else "c2"
+        client.invoices.create(client_id, f"inv-{i}", {"type": "SIMPLIFIED", "full_amount": "1.00"})
+        content = sim.api.invoices[(client_id, f"inv-{i}")]["content"]
+        content["issued_at"] = content["updated_at"] = f"2024-01-0{i + 1}T10:00:00Z"
+    return sim, client
+
+def test_sync_is_incremental(sim_client):
+    sim, client = sim_client
+    with client.invoice_search.index(":memory:", overlap=0, page_size=2) as index:
+        first = index.sync()
+        assert (first.fetched, first.inserted, first.since) == (5, 5, None)
+        assert first.high_water_mark == "2024-01-05T10:00:00Z"
+
+        client.invoices.create("c1", "inv-new", {"type": "SIMPLIFIED"})
+        content = sim.api.invoices[("c2", "inv-4")]["content"]
+        content["state"], content["updated_at"] = "CANCELLED", "2030-01-01T00:00:00Z"
+
+        second = index.sync()
+        # Solo lo modificado desde la marca (inv-4 y la nueva); inv-0..3 no se piden.
+        assert second.since == "2024-01-05T10:00:00Z"
+        assert (second.fetched, second.inserted, second.updated) == (2, 1, 1)
+        assert index.high_water_mark() == "2030-01-01T00:00:00Z"
+        assert len(index) == 6
+
+        third = index.sync()
+        assert (third.inserted, third.updated, third.unchanged) == (0, 0, 1)
+
+def test_local_queries(sim_client):
+    _, client = sim_client
+    with client.invoice_search.index(":memory:") as index:
+        index.sync()
+        assert [i["content"]["id"] for i in index.query(client_id="c1")] == ["inv-0", "inv-1", "inv-2"]
+        assert index.count(client_id=["c1", "c2"], state="ISSUED") == 5
+        window = index.query(issued_from="2024-01-02", issued_before=datetime.date(2024, 1, 4), newest_first=True)
+        assert [i["content"]["id"] for i in window] == ["inv-2", "inv-1"]
+        assert index.query(limit=2, offset=1)[0]["content"]["id"] == "inv-1"
+        assert index.get("inv-3")["content"]["client_id"] == "c2"
+        assert index.get("missing") is None
+
+def test_sync_scopes_keep_their_own_mark(sim_client):
+    _, client = sim_client
+    with client.invoice_search.index(":memory:") as index:
+        assert index.sync({"client_id": "c2"}).fetched == 2
+        assert index.high_water_mark({"client_id": "c2"}) == "2024-01-05T10:00:00Z"
+        assert index.high_water_mark() is None
+
+def test_failed_sync_does_not_advance_mark(sim_client, monkeypatch):
+    _, client = sim_client
+    request = client.request
+    calls = []
+
+    def flaky(method, endpoint, **kwargs):
+        calls.append(endpoint)
+        if len(calls) == 2:
+            raise FiskalyApiError("Error API [503]", status_code=503)
+        return request(method, endpoint, **kwargs)
+
+    monkeypatch.setattr(client, "request", flaky)
+    with client.invoice_search.index(":memory:", page_size=2) as index:
+        with pytest.raises(FiskalyApiError):
+            index.sync()
+        # La primera página quedó guardada, pero la marca no avanza.
+        assert len(index) == 2 and index.high_water_mark() is None
+        assert index.sync().inserted == 3
+
+def test_timestamp_normalization():
+    assert _timestamp("2024-01-02T03:04:05+02:00") == "2024-01-02T01:04:05Z"
+    assert _timestamp(0) == "1970-01-01T00:00:00Z"
+    assert _timestamp(datetime.date(2024, 1, 2)) == "2024-01-02T00:00:00Z"
+    assert _timestamp("not a date") == "not a date"
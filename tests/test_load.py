@@ -0,0 +1,43 @@
+import pytest
+from fiskaly_sdk.benchmarks.load import LoadContext, parse_mix, percentile, prepare, run_load
+
+def test_parse_mix():
+    assert parse_mix("create=70,cancel=10") == {"create": 70.0, "cancel": 10.0}
+    with pytest.raises(ValueError):
+        parse_mix("create=70,refund=5")
+    with pytest.raises(ValueError):
+        parse_mix("create=0")
+
+def test_percentile_nearest_rank():
+    values = sorted(range(1, 101))
+    assert percentile(values, 0.50) == 50
+    assert percentile(values, 0.99) == 99
+    assert percentile([], 0.95) == 0.0
+
+@pytest.mark.parametrize("sim_options", [{"export_ready_after": 0.05}])
+def test_run_load_against_simulator(make_client):
+    client = make_client()
+    ctx = LoadContext(client, prepare(client, 2))
+    report = run_load(ctx, parse_mix("create=5,cancel=2,search=2,export=1"), concurrency=2, duration=0.5)
+    assert report["requests"] > 0
+    assert report["errors"] == 0
+    ops = {op["operation"]: op for op in report["operations"]}
+    assert ops["create"]["count"] > 0
+    endpoints = {ep["endpoint"]: ep for ep in report["endpoints"]}
+    created = endpoints["PUT /clients/{id}/invoices/{id}"]
+    assert created["p50_ms"] <= created["p99_ms"] <= created["max_ms"]
+    if "export" in ops:
+        # Cada llamada de un export cuenta en su propio endpoint.
+        assert endpoints["PUT /exports/{id}"]["count"] == ops["export"]["count"]
+        assert "GET /exports/{id}/file" in endpoints
+    assert report["cpu_ms_per_request"] > 0
+    assert client.config.instrumentation is None
+
+def test_cancel_without_issued_invoices_counts_as_create(make_client):
+    client = make_client()
+    ctx = LoadContext(client, prepare(client, 1))
+    report = run_load(ctx, parse_mix("cancel=1"), concurrency=1, duration=0.3)
+    ops = {op["operation"]: op["count"] for op in report["operations"]}
+    endpoints = {ep["endpoint"]: ep["count"] for ep in report["endpoints"]}
+    assert ops["create"] == endpoints["PUT /clients/{id}/invoices/{id}"]
+    assert ops["cancel"] == endpoints["PATCH /clients/{id}/invoices/{id}"]
@@ -0,0 +1,95 @@
+import threading
+import time
+import pytest
+from fiskaly_sdk.client import FiskalyClient
+from fiskaly_sdk.exceptions import FiskalyApiError
+from fiskaly_sdk.metrics import MetricsRegistry, prometheus_text
+
+def test_histograms_by_endpoint_template_and_status_class(make_client):
+    registry = MetricsRegistry()
+    client = make_client(metrics=registry, retry_policy=None)
+    for i in range(3):
+        client.clients.create(f"client-{i}")
+    with pytest.raises(FiskalyApiError):
+        client.clients.get("missing")
+
+    snapshot = registry.snapshot()
+    created = snapshot.series("PUT", "/clients/{id}")
+    assert created.count == 3
+    assert created.buckets[-1] == (float("inf"), 3)
+    assert created.sum > 0
+    assert snapshot.series("GET", "/clients/{id}", "4xx").count == 1
+    assert snapshot.series("POST", "/auth").count == 1
+    assert snapshot.in_flight == 0
+    assert snapshot.pool_reused > 0
+
+def test_concurrent_threads_are_merged(make_client):
+    registry = MetricsRegistry()
+    client = make_client(metrics=registry, retry_policy=None)
+    client.clients.create("client-1")
+
+    def worker():
+        for _ in range(10):
+            client.invoices.list_page("client-1")
+
+    threads = [threading.Thread(target=worker) for _ in range(8)]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+    assert registry.snapshot().series("GET", "/clients/{id}/invoices").count == 80
+
+def test_prometheus_text(make_client):
+    registry = MetricsRegistry(buckets=(0.5, 1.0))
+    client = make_client(metrics=registry, retry_policy=None)
+    client.software.get()
+    text = prometheus_text(registry)
+    labels = 'method="GET",endpoint="/software",status_class="2xx"'
+    assert "# TYPE fiskaly_request_duration_seconds histogram" in text
+    assert f'fiskaly_request_duration_seconds_bucket{{{labels},le="0.5"}} 1' in text
+    assert f'fiskaly_request_duration_seconds_bucket{{{labels},le="+Inf"}} 1' in text
+    assert f"fiskaly_request_duration_seconds_count{{{labels}}} 1" in text
+    assert "fiskaly_requests_in_flight 0" in text
+    assert 'fiskaly_pool_connections{state="idle"}' in text
+
+def test_streamed_downloads_are_recorded(tmp_path, make_client):
+    registry = MetricsRegistry()
+    client = make_client(metrics=registry, retry_policy=None)
+    client.clients.create("c1")
+    client.invoices.create("c1", "inv-1", {"type": "SIMPLIFIED", "full_amount": "1.00"})
+    client.invoice_xml.get_xml_to("c1", "inv-1", tmp_path / "inv-1.xml")
+    with pytest.raises(FiskalyApiError):
+        client.invoice_xml.get_xml_to("c1", "missing", tmp_path / "missing.xml")
+
+    snapshot = registry.snapshot()
+    assert snapshot.series("GET", "/clients/{id}/invoices/{id}/xml").count == 1
+    assert snapshot.series("GET", "/clients/{id}/invoices/{id}/xml", "4xx").count == 1
+    assert snapshot.in_flight == 0
+
+def test_metrics_can_be_disabled(sim):
+    client = FiskalyClient(sim.api_key, sim.api_secret, base_url=sim.base_url, metrics=None)
+    assert client.authenticate()
+
+def test_recording_is_cheap():
+    shard = MetricsRegistry().shard()
+    n = 20000
+    started = time.perf_counter()
+    for _ in range(n):
+        shard.observe("GET", "/clients/c1/invoices/i1", "2xx", 0.012)
+    assert (time.perf_counter() - started) / n < 20e-6
+
+def test_shards_of_finished_threads_are_retired():
+    registry = MetricsRegistry()
+
+    def work():
+        registry.shard().observe("GET", "/software", "2xx", 0.001)
+
+    for _ in range(200):
+        thread = threading.Thread(target=work)
+        thread.start()
+        thread.join()
+    assert len(registry._shards) <= 1
+    # Los contadores de los hilos retirados se conservan.
+    assert registry.snapshot().series("GET", "/software").count == 200
+    registry.reset()
+    assert registry.snapshot().series("GET", "/software") is None
@@ -0,0 +1,77 @@
+import time
+import pytest
+from fiskaly_sdk.outbox import DELIVERED, FAILED
+from fiskaly_sdk.simulator import LatencyModel
+
+CONTENT = {"type": "SIMPLIFIED", "full_amount": "12.10"}
+
+@pytest.fixture
+def sim_options():
+    return {"route_latency": {"/clients": LatencyModel(mean=0.01)}}
+
+def _client(make_client, **options):
+    client = make_client(**options)
+    client.clients.create("client-1")
+    client.clients.create("client-2")
+    return client
+
+def test_enqueue_returns_before_delivery_and_keeps_order(tmp_path, make_client):
+    client = _client(make_client)
+    with client.invoices.outbox(str(tmp_path / "outbox.db"), workers=4) as outbox:
+        started = time.perf_counter()
+        ids = [outbox.enqueue(f"client-{i % 2 + 1}", CONTENT) for i in range(20)]
+        assert time.perf_counter() - started < 0.1
+        assert outbox.flush(timeout=10)
+        entries = [outbox.status(invoice_id) for invoice_id in ids]
+    assert all(entry.state == DELIVERED for entry in entries)
+    for client_id in ("client-1", "client-2"):
+        numbers = [int(e.response["content"]["number"]) for e in entries if e.client_id == client_id]
+        assert numbers == list(range(1, 11))
+
+def test_transient_errors_are_retried_idempotently(sim, make_client):
+    client = _client(make_client, retry_policy=None)
+    sim.inject(503, count=2, method="PUT", path_prefix="/clients/client-1/invoices")
+    with client.invoices.outbox(":memory:", initial_delay=0.01) as outbox:
+        invoice_id = outbox.enqueue("client-1", CONTENT, invoice_id="inv-1")
+        assert outbox.enqueue("client-1", CONTENT, invoice_id="inv-1") == "inv-1"
+        entry = outbox.wait(invoice_id, timeout=10)
+    assert entry.state == DELIVERED
+    assert entry.attempts == 3
+    assert entry.response["content"]["id"] == "inv-1"
+
+def test_permanent_errors_fail_without_blocking_the_queue(make_client):
+    client = _client(make_client, retry_policy=None)
+    with client.invoices.outbox(":memory:") as outbox:
+        bad = outbox.enqueue("unknown-client", CONTENT)
+        good = outbox.enqueue("client-1", CONTENT)
+        assert outbox.wait(good, timeout=10).state == DELIVERED
+        entry = outbox.wait(bad, timeout=10)
+        assert entry.state == FAILED
+        assert "404" in entry.last_error
+        assert [e.invoice_id for e in outbox.failed()] == [bad]
+        client.clients.create("unknown-client")
+        assert outbox.retry_failed() == 1
+        assert outbox.wait(bad, timeout=10).state == DELIVERED
+        assert outbox.counts() == {DELIVERED: 2}
+
+def test_queue_survives_restart(tmp_path, make_client):
+    client = _client(make_client)
+    path = str(tmp_path / "outbox.db")
+    with client.invoices.outbox(path, start=False) as outbox:
+        invoice_id = outbox.enqueue("client-2", CONTENT)
+        assert outbox.pending() == 1
+    with client.invoices.outbox(path) as outbox:
+        assert outbox.wait(invoice_id, timeout=10).state == DELIVERED
+        assert outbox.purge() == 1
+        assert outbox.pending() == 0
+
+def test_non_json_response_is_stored_and_lane_keeps_flowing(monkeypatch, make_client):
+    client = _client(make_client)
+    monkeypatch.setattr(client, "request", lambda *args, **kwargs: b"\x00not json")
+    with client.invoices.outbox(":memory:") as outbox:
+        first = outbox.enqueue("client-1", CONTENT)
+        second = outbox.enqueue("client-1", CONTENT)
+        assert outbox.flush(timeout=5)
+        assert outbox.status(first).state == DELIVERED
+        assert outbox.status(first).response == "\x00not json"
+        assert outbox.status(second).state == DELIVERED
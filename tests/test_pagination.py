@@ -0,0 +1,44 @@
+import threading
+from unittest.mock import patch
+from fiskaly_sdk.pagination import iter_pages
+
+def _invoice_page(ids, token):
+    return {
+        "results": [{"content": {"id": i, "state": "ISSUED"}} for i in ids],
+        "pagination": {"limit": 2, "token": token},
+    }
+
+@patch("fiskaly_sdk.client.FiskalyClient.request")
+def test_invoice_search_iter_all_follows_token(mock_request, client):
+    mock_request.side_effect = [
+        _invoice_page(["inv1", "inv2"], "page-2"),
+        _invoice_page(["inv3"], None),
+    ]
+    ids = [inv.content.id for inv in client.invoice_search.iter_all({"from_date": "2024-01-01"}, limit=2)]
+    assert ids == ["inv1", "inv2", "inv3"]
+    second_params = mock_request.call_args_list[1].kwargs["params"]
+    assert second_params == {"from_date": "2024-01-01", "limit": 2, "token": "page-2"}
+
+def test_iter_pages_stops_on_repeated_token():
+    calls = []
+
+    def fetch_page(token):
+        calls.append(token)
+        return [1], "same"
+
+    pages = list(iter_pages(fetch_page, prefetch=False))
+    assert len(pages) == 2
+    assert calls == [None, "same"]
+
+@patch("fiskaly_sdk.client.FiskalyClient.request")
+def test_iter_all_reuses_the_client_prefetch_executor(mock_request, client):
+    mock_request.side_effect = lambda *args, **kwargs: _invoice_page(["inv1"], None)
+    executor = client.prefetch_executor
+    before = threading.active_count()
+    for _ in range(50):
+        assert len(list(client.invoice_search.iter_all())) == 1
+    assert client.prefetch_executor is executor
+    assert threading.active_count() <= before + 1
+    client.close()
+    assert executor._shutdown
+    assert client._prefetch_executor is None
@@ -0,0 +1,39 @@
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from fiskaly_sdk.client import FiskalyClient
+
+class _Handler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+
+    def do_GET(self):
+        body = b'{"content": {"software_id": "soft123", "name": "DemoSoft"}}'
+        self.send_response(200)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, *args):
+        pass
+
+def test_pool_stats_count_reused_connections():
+    server = ThreadingHTTPServer(("127.0.0.1", 0), _Handler)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    client = FiskalyClient(
+        api_key="test",
+        api_secret="test",
+        base_url=f"http://127.0.0.1:{server.server_port}",
+        pool_maxsize=4,
+    )
+    client.set_bearer_token("token")
+    try:
+        for _ in range(3):
+            assert client.software.get().content.name == "DemoSoft"
+        stats = client.pool_stats()
+        assert stats.created == 1
+        assert stats.reused == 2
+        assert stats.in_use == 0
+        assert stats.idle == 1
+    finally:
+        client.close()
+        server.shutdown()
@@ -0,0 +1,32 @@
+from unittest.mock import MagicMock
+from fiskaly_sdk.client import FiskalyClient
+from fiskaly_sdk.rate_limit import RateLimiter
+
+def test_client_bucket_delays_requests_for_same_client_id():
+    limiter = RateLimiter(client_rate=10, client_burst=1)
+    assert limiter.reserve("org", "/clients/c1/invoices/i1") == 0
+    assert limiter.reserve("org", "/clients/c2/invoices/i1") == 0
+    assert limiter.reserve("org", "/clients/c1/invoices/i2") > 0
+    assert limiter.reserve("org", "/software") == 0
+    stats = limiter.stats()
+    assert stats.requests == 4
+    assert stats.delayed == 1
+
+def test_org_bucket_applies_to_every_endpoint():
+    limiter = RateLimiter(org_rate=5, org_burst=2)
+    waits = [limiter.reserve("org", "/software") for _ in range(3)]
+    assert waits[:2] == [0, 0]
+    assert abs(waits[2] - 0.2) < 0.05
+    assert limiter.reserve("other-org", "/software") == 0
+
+def test_client_records_wait_and_network_time():
+    limiter = RateLimiter(org_rate=1000)
+    client = FiskalyClient(api_key="test", api_secret="test", rate_limiter=limiter)
+    client.set_bearer_token("token")
+    ok = MagicMock(ok=True, status_code=200, headers={"Content-Type": "application/json"})
+    ok.content = b'{"content": {"software_id": "soft123", "name": "DemoSoft"}}'
+    client.session.request = MagicMock(return_value=ok)
+    client.software.get()
+    stats = limiter.stats()
+    assert stats.requests == 1
+    assert stats.network_requests == 1
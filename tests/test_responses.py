@@ -0,0 +1,56 @@
+import pytest
+from unittest.mock import patch
+from pydantic import ValidationError
+from fiskaly_sdk.client import FiskalyClient
+from fiskaly_sdk.models.invoice import InvoiceResponse, InvoicesListResponse
+from fiskaly_sdk.responses import LazyModel, ResponseMode
+
+PAGE = {
+    "results": [
+        {"content": {"id": "inv1", "state": "ISSUED"}},
+        {"content": {"state": "ISSUED"}},  # sin id: inválido
+    ],
+    "pagination": {"limit": 2, "token": "next"},
+}
+
+def _client(mode):
+    client = FiskalyClient(api_key="test", api_secret="test", response_mode=mode)
+    client.set_bearer_token("token")
+    return client
+
+def test_response_mode_from_string():
+    assert _client("lazy").config.response_mode is ResponseMode.LAZY
+    with pytest.raises(ValueError):
+        _client("fast")
+
+@patch("fiskaly_sdk.client.FiskalyClient.request")
+def test_raw_mode_returns_dicts(mock_request):
+    mock_request.return_value = PAGE
+    client = _client("raw")
+    assert client.invoices.list_page("client1") is PAGE
+    assert client.invoices.list("client1") == PAGE["results"]
+
+@patch("fiskaly_sdk.client.FiskalyClient.request")
+def test_lazy_mode_validates_items_on_access(mock_request):
+    mock_request.return_value = PAGE
+    page = _client(ResponseMode.LAZY).invoices.list_page("client1")
+    assert isinstance(page, InvoicesListResponse)
+    assert page.pagination.token == "next"
+    first, second = page.results
+    assert isinstance(first, LazyModel) and not first.is_validated
+    assert first.content.id == "inv1"
+    assert first.is_validated
+    assert first == InvoiceResponse.model_validate(PAGE["results"][0])
+    with pytest.raises(ValidationError):
+        second.content
+
+@patch("fiskaly_sdk.client.FiskalyClient.request")
+def test_lazy_mode_iter_all(mock_request):
+    mock_request.side_effect = [PAGE, {"results": [], "pagination": {"limit": 2}}]
+    items = list(_client("lazy").invoices.iter_all("client1", limit=2, prefetch=False))
+    assert [item.raw for item in items] == PAGE["results"]
+
+@patch("fiskaly_sdk.client.FiskalyClient.request")
+def test_validated_mode_is_default(mock_request, client):
+    mock_request.return_value = {"content": {"id": "inv1", "state": "ISSUED"}}
+    assert isinstance(client.invoices.get("client1", "inv1"), InvoiceResponse)
@@ -0,0 +1,44 @@
+import json
+import pytest
+from unittest.mock import MagicMock
+from fiskaly_sdk.client import FiskalyClient
+from fiskaly_sdk.exceptions import FiskalyApiError
+from fiskaly_sdk.retry import RetryBudget, RetryPolicy
+
+def _response(status, headers=None, body=None):
+    resp = MagicMock(ok=200 <= status < 400, status_code=status, headers=headers or {})
+    resp.content = json.dumps(body or {}).encode()
+    return resp
+
+@pytest.fixture
+def retry_client():
+    client = FiskalyClient(api_key="test", api_secret="test", retry_policy=RetryPolicy(backoff_base=0))
+    client.set_bearer_token("token")
+    return client
+
+def test_put_invoice_retried_after_503(retry_client):
+    ok = _response(200, {"Content-Type": "application/json"}, {"content": {"id": "inv1", "state": "ISSUED"}})
+    retry_client.session.request = MagicMock(side_effect=[_response(503, {"Retry-After": "0"}), ok])
+    resp = retry_client.invoices.create("client1", "inv1", {"type": "SIMPLIFIED"})
+    assert resp.content.id == "inv1"
+    assert retry_client.session.request.call_count == 2
+
+def test_patch_not_retried(retry_client):
+    retry_client.session.request = MagicMock(return_value=_response(503))
+    with pytest.raises(FiskalyApiError) as exc:
+        retry_client.invoices.cancel("client1", "inv1")
+    assert exc.value.status_code == 503
+    assert retry_client.session.request.call_count == 1
+
+def test_retry_budget_exhausted():
+    budget = RetryBudget(ratio=0, min_per_second=0, max_balance=1)
+    policy = RetryPolicy(backoff_base=0, budget=budget)
+    assert policy.delay_for_status("GET", "/software", 0, 503, {}) is not None
+    assert policy.delay_for_status("GET", "/software", 0, 503, {}) is None
+
+def test_idempotent_routes():
+    policy = RetryPolicy()
+    assert policy.is_idempotent("PUT", "/clients/c1/invoices/i1")
+    assert policy.is_idempotent("GET", "/invoices")
+    assert not policy.is_idempotent("POST", "/taxpayer/agreement")
+    assert not policy.is_idempotent("PATCH", "/clients/c1")
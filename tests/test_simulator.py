@@ -0,0 +1,67 @@
+import hashlib
+import zipfile
+import pytest
+from fiskaly_sdk.exceptions import FiskalyApiError
+from fiskaly_sdk.retry import RetryPolicy
+from fiskaly_sdk.simulator import FaultConfig, LatencyModel
+
+@pytest.fixture
+def sim_options():
+    return {"seed": 1, "export_ready_after": 0.05}
+
+def _fast_retry():
+    return RetryPolicy(backoff_base=0.01, backoff_max=0.05)
+
+def test_full_flow_with_pagination_and_export(tmp_path, make_client):
+    client = make_client(retry_policy=_fast_retry())
+    client.taxpayer.set("B12345678", "Sim SL", "GIPUZKOA")
+    client.signers.create("signer-1")
+    client.clients.create("client-1")
+    for i in range(25):
+        client.invoices.create("client-1", f"inv-{i:02d}", {"type": "SIMPLIFIED"})
+    client.invoices.cancel("client-1", "inv-00")
+
+    ids = [invoice.content.id for invoice in client.invoices.iter_all("client-1", limit=10)]
+    assert ids == [f"inv-{i:02d}" for i in range(25)]
+    cancelled = client.invoice_search.search({"state": "CANCELLED"})
+    assert [invoice.content.id for invoice in cancelled] == ["inv-00"]
+    assert client.invoice_xml.get_xml("client-1", "inv-01").startswith(b"<?xml")
+
+    export = client.exports.create("export-1", {})
+    assert export.content.state == "RUNNING"
+    client.exports.wait_until_ready("export-1", initial_delay=0.02, timeout=5)
+    result = client.exports.download_zip_to("export-1", tmp_path / "export.zip")
+    with zipfile.ZipFile(tmp_path / "export.zip") as archive:
+        assert len(archive.namelist()) == 25
+    assert result.checksum == hashlib.sha256((tmp_path / "export.zip").read_bytes()).hexdigest()
+    assert client.software.get().content.software_id == "fiskaly-simulator"
+
+def test_injected_503_and_429_are_retried(sim, make_client):
+    client = make_client(retry_policy=_fast_retry())
+    client.clients.create("client-1")
+    sim.inject(503, count=2, path_prefix="/clients")
+    sim.inject(429, count=1, retry_after=0, path_prefix="/clients")
+    assert client.invoices.create("client-1", "inv-1", {"type": "SIMPLIFIED"}).content.state == "ISSUED"
+    assert sim.stats.injected == 3
+
+def test_expired_token_is_refreshed(sim, make_client):
+    client = make_client(retry_policy=_fast_retry())
+    sim.expire_tokens()
+    assert client.software.get().content.name
+    assert sim.stats.by_status[401] == 1
+
+def test_injected_timeout(sim, make_client):
+    sim.faults = FaultConfig(timeout_delay=0.5)
+    client = make_client(timeout=0.1, retry_policy=None)
+    sim.inject(timeout=True, path_prefix="/software")
+    with pytest.raises(FiskalyApiError):
+        client.software.get()
+
+def test_latency_models():
+    import random
+    rng = random.Random(0)
+    samples = [LatencyModel("lognormal", mean=0.02).sample(rng) for _ in range(2000)]
+    assert 0.015 < sum(samples) / len(samples) < 0.025
+    assert LatencyModel("uniform", low=0.1, high=0.2).sample(rng) >= 0.1
+    with pytest.raises(ValueError):
+        LatencyModel("gamma").sample(rng)
@@ -0,0 +1,31 @@
+from fiskaly_sdk.benchmarks.startup import loaded_modules, measure_startup
+
+# Presupuestos holgados para no fallar en máquinas lentas: hoy `import fiskaly_sdk`
+# tarda ~2 ms y crear el cliente (sin contar la importación de requests) <1 ms.
+IMPORT_BUDGET_MS = 50
+CONSTRUCT_BUDGET_MS = 20
+
+def test_creating_a_client_loads_no_resources_or_models():
+    modules = loaded_modules()
+    sdk = [name for name in modules if name.startswith("fiskaly_sdk.")]
+    assert not [name for name in sdk if name.startswith(("fiskaly_sdk.api.", "fiskaly_sdk.models."))]
+    assert "pydantic" not in modules
+    assert "sqlite3" not in modules
+
+def test_startup_budget():
+    rows = {row["case"]: row for row in measure_startup(repeat=3)}
+    assert rows["import"]["median_ms"] < IMPORT_BUDGET_MS
+    assert rows["construct"]["median_ms"] < CONSTRUCT_BUDGET_MS
+    assert rows["construct"]["sdk_modules"] <= 25
+
+def test_lazy_resources_and_models():
+    import fiskaly_sdk
+    from fiskaly_sdk import models
+    from fiskaly_sdk.models.invoice import InvoiceResponse
+
+    assert models.InvoiceResponse is InvoiceResponse
+    assert "SoftwareResponse" in dir(models)
+    client = fiskaly_sdk.FiskalyClient("k", "s", token_background_refresh=False)
+    assert "invoices" not in vars(client)
+    assert client.invoices is client.invoices
+    assert client.invoices.client is client
@@ -0,0 +1,58 @@
+import pytest
+from fiskaly_sdk.cache import ResponseCache
+from fiskaly_sdk.tenants import TenantPool
+
+def test_views_share_one_connection_pool_and_are_evicted_lru(sim):
+    with TenantPool(base_url=sim.base_url, max_tenants=10) as pool:
+        for i in range(50):
+            client = pool.client(f"key-{i}", "secret")
+            client.set_bearer_token(*sim.api.issue_token())
+            assert client.transport is pool.transport
+            client.software.get()
+        assert len(pool) == 10
+        assert "key-49" in pool and "key-0" not in pool
+        stats = pool.stats()
+        assert (stats.created, stats.evicted) == (50, 40)
+        # Secuencial: todas las vistas reutilizan la misma conexión.
+        assert pool.pool_stats().created == 1
+
+def test_recently_used_tenant_survives_eviction():
+    with TenantPool(max_tenants=2) as pool:
+        first = pool.client("a", "s")
+        pool.client("b", "s")
+        assert pool.client("a", "s") is first
+        pool.client("c", "s")
+        assert "a" in pool and "b" not in pool
+
+def test_token_kept_after_eviction(sim):
+    with TenantPool(base_url=sim.base_url, max_tenants=1) as pool:
+        client = pool.client(sim.api_key, sim.api_secret)
+        bearer = client.authenticate()
+        pool.client("other", "secret")
+        assert sim.api_key not in pool
+        # La vista expulsada sigue funcionando: la sesión compartida no se cierra.
+        assert client.software.get()
+
+        again = pool.client(sim.api_key, sim.api_secret)
+        assert again is not client
+        assert again.get_bearer_token() == bearer
+        assert pool.stats().token_reuses == 1
+
+def test_rotated_secret_replaces_view_and_drops_token():
+    with TenantPool() as pool:
+        old = pool.client("a", "old-secret")
+        old.set_bearer_token("token", expires_at=9999999999)
+        new = pool.client("a", "new-secret")
+        assert new is not old
+        assert new.get_bearer_token() is None
+        assert new.config.api_secret == "new-secret"
+
+def test_idle_timeout():
+    with TenantPool(idle_timeout=0) as pool:
+        pool.client("a", "s")
+        pool.client("b", "s")
+        assert "a" not in pool and len(pool) == 1
+
+def test_shared_response_cache_is_rejected():
+    with pytest.raises(ValueError):
+        TenantPool(response_cache=ResponseCache())
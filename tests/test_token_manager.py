@@ -0,0 +1,44 @@
+import threading
+import time
+from unittest.mock import MagicMock, patch
+from fiskaly_sdk.token_manager import TokenManager
+
+def test_refresh_single_flight():
+    calls = []
+
+    def fetcher():
+        calls.append(1)
+        time.sleep(0.05)
+        return "new_token", int(time.time()) + 3600
+
+    manager = TokenManager(fetcher, background=False)
+    manager.set_token("old_token", int(time.time()) - 1)
+    results = []
+    threads = [threading.Thread(target=lambda: results.append(manager.get_token())) for _ in range(50)]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+    assert len(calls) == 1
+    assert set(results) == {"new_token"}
+
+def test_token_valid_not_refreshed():
+    fetcher = MagicMock(return_value=("new_token", 0))
+    manager = TokenManager(fetcher, refresh_margin=60, background=False)
+    manager.set_token("token", int(time.time()) + 3600)
+    assert manager.get_token() == "token"
+    fetcher.assert_not_called()
+
+def test_request_retries_once_after_401(client):
+    client.set_bearer_token("stale_token", int(time.time()) + 3600)
+    unauthorized = MagicMock(ok=False, status_code=401, headers={})
+    ok = MagicMock(ok=True, status_code=200, headers={"Content-Type": "application/json"})
+    ok.content = b'{"content": {"software_id": "soft123", "name": "DemoSoft"}}'
+    client.session.request = MagicMock(side_effect=[unauthorized, ok])
+    with patch.object(client.auth, "fetch_access_token") as fetch:
+        fetch.return_value = MagicMock(bearer="fresh_token", expires_at=int(time.time()) + 3600)
+        resp = client.software.get()
+    assert resp.content.name == "DemoSoft"
+    second_headers = client.session.request.call_args_list[1].kwargs["headers"]
+    assert second_headers["Authorization"] == "Bearer fresh_token"
+    client.close()
@@ -0,0 +1,130 @@
+import multiprocessing
+import os
+import stat
+import threading
+import time
+import pytest
+from fiskaly_sdk.client import FiskalyClient
+from fiskaly_sdk.simulator import LatencyModel
+from fiskaly_sdk.token_store import SQLiteTokenStore, ashared_token, shared_token
+
+@pytest.fixture
+def store(tmp_path):
+    store = SQLiteTokenStore(str(tmp_path / "tokens.db"), wait=2.0, poll_interval=0.01)
+    yield store
+    store.close()
+
+def _fetcher(calls, expires_in=300):
+    def fetch():
+        calls.append(1)
+        return f"token-{len(calls)}", int(time.time()) + expires_in
+    return fetch
+
+def test_valid_token_is_reused(store):
+    calls = []
+    assert shared_token(store, "key", _fetcher(calls)) == shared_token(store, "key", _fetcher(calls))
+    assert len(calls) == 1
+    assert shared_token(store, "other", _fetcher(calls))[0] == "token-2"
+    assert stat.S_IMODE(os.stat(store.path).st_mode) == 0o600
+
+def test_stale_or_expiring_token_is_renewed(store):
+    calls = []
+    bearer, _ = shared_token(store, "key", _fetcher(calls, expires_in=30), margin=60)
+    assert shared_token(store, "key", _fetcher(calls), margin=60)[0] != bearer
+    current, _ = shared_token(store, "key", _fetcher(calls))
+    assert shared_token(store, "key", _fetcher(calls), stale=current)[0] != current
+    assert len(calls) == 3
+
+def test_waits_for_the_process_holding_the_lease(store):
+    calls = []
+    lease = store.acquire("key")
+    assert store.acquire("key") is None
+
+    def leader():
+        time.sleep(0.1)
+        store.save("key", "from-leader", int(time.time()) + 300)
+        store.release("key", lease)
+
+    threading.Thread(target=leader).start()
+    assert shared_token(store, "key", _fetcher(calls))[0] == "from-leader"
+    assert calls == []
+
+def test_authenticates_itself_when_leader_is_too_slow(store):
+    calls = []
+    store.wait = 0.05
+    store.acquire("key")
+    assert shared_token(store, "key", _fetcher(calls))[0] == "token-1"
+
+def test_lease_is_released_when_fetch_fails(store):
+    def fail():
+        raise RuntimeError("auth caída")
+
+    with pytest.raises(RuntimeError):
+        shared_token(store, "key", fail)
+    assert store.acquire("key") is not None
+
+def test_async_store_calls_run_off_the_event_loop(store):
+    import asyncio
+    threads = []
+    load = store.load
+
+    def recording_load(api_key):
+        threads.append(threading.get_ident())
+        return load(api_key)
+
+    store.load = recording_load
+
+    async def fetch():
+        return "async-token", int(time.time()) + 300
+
+    async def main():
+        first = await ashared_token(store, "key", fetch)
+        return first, await ashared_token(store, "key", fetch), threading.get_ident()
+
+    first, second, loop_thread = asyncio.run(main())
+    assert first == second and first[0] == "async-token"
+    assert threads and loop_thread not in threads
+
+def _worker(base_url, api_key, api_secret, store, queue):
+    client = FiskalyClient(api_key, api_secret, base_url=base_url, token_store=store, token_background_refresh=False)
+    queue.put(client.authenticate())
+
+@pytest.mark.parametrize("sim_options", [{"route_latency": {"/auth": LatencyModel(mean=0.2)}}])
+def test_one_auth_call_across_processes(store, sim):
+    if "fork" not in multiprocessing.get_all_start_methods():
+        pytest.skip("requiere fork")
+    ctx = multiprocessing.get_context("fork")
+    store.load("warm-up")  # conexión abierta antes del fork: cada worker la reabre
+    queue = ctx.Queue()
+    workers = [ctx.Process(target=_worker, args=(sim.base_url, sim.api_key, sim.api_secret, store, queue)) for _ in range(6)]
+    for worker in workers:
+        worker.start()
+    bearers = {queue.get(timeout=10) for _ in workers}
+    for worker in workers:
+        worker.join(timeout=10)
+    assert len(bearers) == 1
+    assert sim.stats.by_route["/auth"] == 1
+
+def test_async_client_uses_store(store):
+    httpx = pytest.importorskip("httpx")
+    import asyncio
+    from fiskaly_sdk.aio import AsyncFiskalyClient
+
+    calls = []
+
+    def handler(request):
+        calls.append(request.url.path)
+        token = {"bearer": "async-token", "expires_at": int(time.time()) + 300}
+        return httpx.Response(200, json={"content": {"access_token": token}})
+
+    async def main():
+        bearers = []
+        for _ in range(2):
+            client = AsyncFiskalyClient(api_key="key", api_secret="secret", token_store=store, token_background_refresh=False)
+            client.session = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+            async with client:
+                bearers.append(await client.authenticate())
+        return bearers
+
+    assert asyncio.run(main()) == ["async-token", "async-token"]
+    assert len(calls) == 1
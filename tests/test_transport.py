@@ -0,0 +1,146 @@
+import io
+import socket
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+import pytest
+import requests
+from fiskaly_sdk.client import FiskalyClient
+from fiskaly_sdk.exceptions import FiskalyApiError
+from fiskaly_sdk.instrumentation import CallbackInstrumentation
+from fiskaly_sdk.retry import RetryPolicy
+from fiskaly_sdk.transport import TRANSPORTS, HttpxResponse, Urllib3Transport, _query_string
+
+def _available():
+    names = ["requests", "urllib3"]
+    try:
+        import h2  # noqa: F401
+        import httpx  # noqa: F401
+        names.append("http2")
+    except ImportError:
+        pass
+    return names
+
+@pytest.mark.parametrize("transport", _available())
+def test_resources_work_over_every_transport(sim, transport):
+    with FiskalyClient(sim.api_key, sim.api_secret, base_url=sim.base_url, transport=transport) as client:
+        assert client.transport.name == transport
+        client.authenticate()
+        client.clients.create("client-1")
+        invoice = client.invoices.create("client-1", "inv-1", {"type": "SIMPLIFIED", "full_amount": "1.00"})
+        assert invoice.content.id == "inv-1"
+        page = client.invoices.list_page("client-1", {"limit": 1})
+        assert len(page.results) == 1
+
+        out = io.BytesIO()
+        result = client.invoice_xml.get_xml_to("client-1", "inv-1", out)
+        assert out.getvalue().startswith(b"<?xml") and result.bytes_written == len(out.getvalue())
+
+        with pytest.raises(FiskalyApiError) as error:
+            client.clients.get("missing")
+        assert error.value.status_code == 404
+
+def test_urllib3_transport_reuses_connections(make_client):
+    client = make_client(transport="urllib3")
+    for _ in range(5):
+        client.software.get()
+    stats = client.pool_stats()
+    assert stats.created == 1 and stats.reused == 5 and stats.in_use == 0
+
+def test_connection_errors_are_retried_like_requests():
+    with socket.socket() as s:
+        s.bind(("127.0.0.1", 0))
+        port = s.getsockname()[1]
+    client = FiskalyClient(
+        "key", "secret", base_url=f"http://127.0.0.1:{port}", transport="urllib3",
+        retry_policy=RetryPolicy(max_retries=2, backoff_base=0),
+    )
+    client.set_bearer_token("token")
+    with pytest.raises(FiskalyApiError, match="conexión"):
+        client.software.get()
+    with pytest.raises(requests.ConnectionError):
+        client.transport.send("GET", f"http://127.0.0.1:{port}/software", {}, 1)
+
+def test_query_string_matches_requests():
+    params = {"limit": 10, "token": None, "state": ["ISSUED", "CANCELLED"]}
+    prepared = requests.Request("GET", "http://x/", params=params).prepare()
+    assert prepared.url == f"http://x/?{_query_string(params)}"
+
+def test_transport_selection():
+    assert set(TRANSPORTS) == {"requests", "urllib3", "http2"}
+    client = FiskalyClient("key", "secret", transport="urllib3")
+    assert isinstance(client.transport, Urllib3Transport) and client.session is None
+    with pytest.raises(ValueError):
+        FiskalyClient("key", "secret", transport="carrier-pigeon")
+
+def test_shared_transport_is_not_closed_by_client():
+    class SpyTransport(Urllib3Transport):
+        closed = False
+
+        def close(self):
+            self.closed = True
+            super().close()
+
+    transport = SpyTransport(FiskalyClient("k", "s").config)
+    client = FiskalyClient("key", "secret", transport=transport)
+    assert client.transport is transport
+    client.close()
+    assert not transport.closed
+
+PAYLOAD = b"<?xml version=\"1.0\"?><Invoice>" + b"x" * 200000 + b"</Invoice>"
+
+class _TruncatingHandler(BaseHTTPRequestHandler):
+    """
+    Sin Range corta la conexión a mitad del cuerpo; con Range sirve el resto (206).
+    """
+    protocol_version = "HTTP/1.1"
+
+    def do_GET(self):
+        start = int(self.headers.get("Range", "bytes=0-")[6:].rstrip("-") or 0)
+        if not start:
+            self.send_response(200)
+            self.send_header("Content-Length", str(len(PAYLOAD)))
+            self.end_headers()
+            self.wfile.write(PAYLOAD[:len(PAYLOAD) // 2])
+            self.wfile.flush()
+            self.connection.shutdown(socket.SHUT_RDWR)
+            self.close_connection = True
+            return
+        self.send_response(206)
+        self.send_header("Content-Length", str(len(PAYLOAD) - start))
+        self.end_headers()
+        self.wfile.write(PAYLOAD[start:])
+
+    def log_message(self, format, *args):
+        pass
+
+@pytest.fixture
+def truncating_server():
+    server = ThreadingHTTPServer(("127.0.0.1", 0), _TruncatingHandler)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    yield f"http://127.0.0.1:{server.server_address[1]}"
+    server.shutdown()
+    server.server_close()
+
+@pytest.mark.parametrize("transport", _available())
+def test_truncated_stream_resumes_over_every_transport(truncating_server, transport):
+    events = []
+    instrumentation = CallbackInstrumentation(events.append)
+    with FiskalyClient("key", "secret", base_url=truncating_server, transport=transport, instrumentation=instrumentation) as client:
+        client.set_bearer_token("token")
+        out = io.BytesIO()
+        result = client.invoice_xml.get_xml_to("c1", "inv-1", out)
+    assert out.getvalue() == PAYLOAD
+    assert result.resumes == 1
+    # Un evento por intento: el cortado y la reanudación.
+    assert [event.status for event in events] == [200, 206]
+    assert events[0].error is not None and events[1].error is None
+    assert sum(event.bytes_in for event in events) == len(PAYLOAD)
+
+def test_httpx_stream_errors_are_mapped(truncating_server):
+    httpx = pytest.importorskip("httpx")
+    with httpx.Client() as http:
+        with http.stream("GET", f"{truncating_server}/xml") as resp:
+            with pytest.raises(requests.exceptions.ChunkedEncodingError):
+                for _ in HttpxResponse(resp).iter_content(4096):
+                    pass
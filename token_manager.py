@@ -0,0 +1,230 @@
+# fiskaly_sdk/token_manager.py
+
+"""
+Gestión del ciclo de vida del token Bearer del SDK Fiskaly SIGN ES.
+
+El TokenManager guarda el token junto a su `expires_at`, lo refresca en segundo
+plano antes de que caduque y garantiza que, aunque muchos hilos detecten a la vez
+un token caducado (o un 401), solo se haga una llamada a `/auth`.
+"""
+
+import logging
+import threading
+import time
+from typing import Callable, Optional, Tuple
+
+from .exceptions import FiskalyAuthError
+
+logger = logging.getLogger(__name__)
+
+# Función que obtiene un token nuevo: devuelve (bearer, expires_at).
+TokenFetcher = Callable[[], Tuple[str, Optional[int]]]
+
+
+class _Flight:
+    """
+    Refresco en curso compartido por todos los hilos que lo esperan.
+    """
+
+    def __init__(self):
+        self.done = threading.Event()
+        self.bearer: Optional[str] = None
+        self.error: Optional[BaseException] = None
+
+
+class _TokenState:
+    """
+    Estado del token (bearer, expiración y momento de refresco) común a las
+    variantes síncrona y asíncrona del gestor.
+    """
+
+    def __init__(self, refresh_margin: float, background: bool, clock: Callable[[], float]):
+        self.refresh_margin = refresh_margin
+        self.background = background
+        self._clock = clock
+        self._bearer: Optional[str] = None
+        self._expires_at: Optional[int] = None
+        self._refresh_at: Optional[float] = None
+        self._closed = False
+
+    @property
+    def bearer(self) -> Optional[str]:
+        """
+        Token actual, sin comprobar su caducidad.
+        """
+        return self._bearer
+
+    @property
+    def expires_at(self) -> Optional[int]:
+        """
+        Timestamp (segundos) de expiración del token actual, si se conoce.
+        """
+        return self._expires_at
+
+    def needs_refresh(self) -> bool:
+        """
+        Indica si el token actual está caducado o dentro del margen de refresco.
+        """
+        refresh_at = self._refresh_at
+        if refresh_at is None:
+            return False
+        return self._clock() >= refresh_at
+
+    def _refresh_delay(self) -> Optional[float]:
+        """
+        Segundos hasta el refresco en segundo plano, o None si no hay que programarlo.
+        """
+        if not self.background or self._closed or self._refresh_at is None:
+            return None
+        delay = self._refresh_at - self._clock()
+        if delay <= 0:
+            # Ya caducado: lo refrescará el siguiente request.
+            return None
+        return delay
+
+    def _store(self, bearer: Optional[str], expires_at: Optional[int]):
+        """
+        Guarda el token y calcula cuándo refrescarlo. Con tokens de vida más corta
+        que el margen se refresca a mitad de su vida, para no entrar en bucle.
+        """
+        self._bearer = bearer
+        self._expires_at = expires_at
+        if expires_at is None:
+            self._refresh_at = None
+        else:
+            remaining = expires_at - self._clock()
+            self._refresh_at = expires_at - min(self.refresh_margin, max(remaining, 0) / 2)
+
+
+class TokenManager(_TokenState):
+    """
+    Mantiene un token Bearer válido para un cliente.
+
+    - `get_token()` devuelve el token actual o lo refresca si está por caducar.
+    - `refresh()` hace el refresco en modo single-flight: una sola llamada a la API
+      aunque la pidan cientos de hilos a la vez.
+    - Si `background` está activo, programa un refresco `refresh_margin` segundos
+      antes de `expires_at`.
+    """
+
+    def __init__(
+        self,
+        fetcher: TokenFetcher,
+        refresh_margin: float = 60.0,
+        background: bool = True,
+        clock: Callable[[], float] = time.time,
+    ):
+        """
+        :param fetcher: Función que obtiene un token nuevo de la API.
+        :param refresh_margin: Segundos antes de `expires_at` en los que se refresca el token.
+        :param background: Si True, refresca el token en un hilo antes de que caduque.
+        :param clock: Reloj en segundos epoch (inyectable para tests).
+        """
+        super().__init__(refresh_margin, background, clock)
+        self._fetcher = fetcher
+        self._lock = threading.Lock()
+        self._flight: Optional[_Flight] = None
+        self._timer: Optional[threading.Timer] = None
+
+    def set_token(self, bearer: Optional[str], expires_at: Optional[int] = None):
+        """
+        Establece el token actual (por ejemplo, tras un login explícito).
+
+        :param bearer: Token Bearer (None para olvidar el token).
+        :param expires_at: Timestamp (segundos) de expiración, si se conoce.
+        """
+        with self._lock:
+            self._store(bearer, expires_at if bearer else None)
+        self._schedule()
+
+    def get_token(self) -> Optional[str]:
+        """
+        Devuelve un token válido, refrescándolo si está a punto de caducar.
+
+        :return: Token Bearer, o None si nunca se ha autenticado el cliente.
+        :raises FiskalyAuthError: Si el refresco necesario falla.
+        """
+        bearer = self._bearer
+        if bearer is None or not self.needs_refresh():
+            return bearer
+        return self.refresh(stale=bearer)
+
+    def refresh(self, stale: Optional[str] = None) -> str:
+        """
+        Obtiene un token nuevo en modo single-flight.
+
+        Si otro hilo ya está refrescando, espera a su resultado en lugar de llamar
+        otra vez a `/auth`. Si se indica `stale` y el token actual ya es distinto
+        (otro hilo lo renovó entre medias), se devuelve el token actual.
+
+        :param stale: Token que el llamador considera caducado o rechazado.
+        :return: Token Bearer nuevo.
+        :raises FiskalyAuthError: Si la autenticación falla.
+        """
+        with self._lock:
+            if stale is not None and self._bearer is not None and self._bearer != stale:
+                return self._bearer
+            flight = self._flight
+            leader = flight is None
+            if leader:
+                flight = self._flight = _Flight()
+
+        if not leader:
+            flight.done.wait()
+            if flight.error is not None:
+                raise flight.error
+            return flight.bearer
+
+        try:
+            bearer, expires_at = self._fetcher()
+            with self._lock:
+                self._store(bearer, expires_at)
+            flight.bearer = bearer
+        except Exception as e:
+            flight.error = e if isinstance(e, FiskalyAuthError) else FiskalyAuthError(f"Error refrescando el token: {e}")
+            raise flight.error
+        finally:
+            with self._lock:
+                self._flight = None
+            flight.done.set()
+
+        self._schedule()
+        return bearer
+
+    def close(self):
+        """
+        Cancela el refresco en segundo plano pendiente.
+        """
+        with self._lock:
+            self._closed = True
+            timer, self._timer = self._timer, None
+        if timer is not None:
+            timer.cancel()
+
+    def _schedule(self):
+        """
+        Programa el refresco en segundo plano para el token actual.
+        """
+        with self._lock:
+            if self._timer is not None:
+                self._timer.cancel()
+                self._timer = None
+            delay = self._refresh_delay()
+            if delay is None:
+                return
+            # Esperas muy largas se parten: al despertar se vuelve a programar.
+            delay = min(delay, threading.TIMEOUT_MAX)
+            timer = threading.Timer(delay, self._background_refresh, args=(self._bearer,))
+            timer.daemon = True
+            self._timer = timer
+        timer.start()
+
+    def _background_refresh(self, stale: Optional[str]):
+        if not self.needs_refresh():
+            self._schedule()
+            return
+        try:
+            self.refresh(stale=stale)
+        except Exception as e:
+            # El siguiente request lo reintentará de forma síncrona.
+            logger.warning("No se pudo refrescar el token en segundo plano: %s", e)
@@ -0,0 +1,294 @@
+# fiskaly_sdk/token_store.py
+
+"""
+Almacén de tokens Bearer compartido entre procesos del SDK Fiskaly SIGN ES.
+
+En servidores pre-fork (gunicorn, celery...) cada proceso tiene su propio
+cliente y, sin coordinación, cada uno llama a `/auth` al arrancar o cuando el
+token está por caducar. Con un TokenStore en `token_store`, el cliente consulta
+primero el almacén: si hay un token válido de la misma API key lo reutiliza y,
+si no, un solo proceso lo renueva (con un "lease" en el almacén) mientras los
+demás esperan brevemente a que lo publique.
+
+    store = SQLiteTokenStore("/run/fiskaly/tokens.db")
+    client = FiskalyClient(api_key, api_secret, token_store=store)
+"""
+
+import functools
+import os
+import sqlite3
+import threading
+import time
+import uuid
+from dataclasses import dataclass
+from typing import Any, Awaitable, Callable, Generator, Optional, Tuple
+
+TokenPair = Tuple[str, Optional[int]]
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS tokens (
+    api_key TEXT PRIMARY KEY,
+    bearer TEXT,
+    expires_at INTEGER,
+    lease_id TEXT,
+    lease_until REAL NOT NULL DEFAULT 0,
+    updated_at REAL NOT NULL
+);
+"""
+
+
+@dataclass
+class StoredToken:
+    """
+    Token guardado en un TokenStore.
+    """
+    bearer: str
+    expires_at: Optional[int]
+
+    def usable(self, margin: float, stale: Optional[str] = None) -> bool:
+        """
+        True si no es el token `stale` y le quedan más de `margin` segundos de vida.
+        """
+        if self.bearer == stale:
+            return False
+        return self.expires_at is None or self.expires_at - margin > time.time()
+
+
+class TokenStore:
+    """
+    Interfaz de un almacén de tokens compartido.
+
+    `acquire` / `release` implementan el lease que garantiza que un solo proceso
+    renueva el token de cada API key a la vez.
+    """
+
+    # Segundos que un proceso espera a que otro publique el token antes de autenticarse él mismo.
+    wait: float = 10.0
+    # Segundos que dura un lease (si el proceso que lo tiene muere, otro lo toma al caducar).
+    lease_ttl: float = 30.0
+    # Intervalo de consulta mientras se espera, en segundos.
+    poll_interval: float = 0.05
+
+    def load(self, api_key: str) -> Optional[StoredToken]:
+        """
+        Devuelve el token guardado para una API key, o None.
+        """
+        raise NotImplementedError
+
+    def save(self, api_key: str, bearer: str, expires_at: Optional[int]):
+        """
+        Guarda el token de una API key.
+        """
+        raise NotImplementedError
+
+    def acquire(self, api_key: str) -> Optional[str]:
+        """
+        Intenta tomar el lease de renovación de una API key.
+
+        :return: Identificador del lease, o None si lo tiene otro proceso.
+        """
+        raise NotImplementedError
+
+    def release(self, api_key: str, lease_id: str):
+        """
+        Libera un lease tomado con `acquire`.
+        """
+        raise NotImplementedError
+
+    def close(self):
+        pass
+
+
+class SQLiteTokenStore(TokenStore):
+    """
+    TokenStore en un fichero SQLite, compartido por los procesos de una máquina.
+
+    El fichero se crea con permisos 0600 (contiene tokens Bearer). La conexión se
+    reabre tras un fork, así que el almacén se puede crear antes de arrancar los
+    workers.
+    """
+
+    def __init__(
+        self,
+        path: str = "fiskaly_tokens.db",
+        wait: float = 10.0,
+        lease_ttl: float = 30.0,
+        poll_interval: float = 0.05,
+    ):
+        """
+        :param path: Fichero SQLite (":memory:" solo sirve dentro de un proceso).
+        :param wait: Segundos que se espera a que otro proceso publique el token.
+        :param lease_ttl: Duración del lease de renovación, en segundos.
+        :param poll_interval: Intervalo de consulta mientras se espera, en segundos.
+        """
+        self.path = path
+        self.wait = wait
+        self.lease_ttl = lease_ttl
+        self.poll_interval = poll_interval
+        self._lock = threading.Lock()
+        self._db: Optional[sqlite3.Connection] = None
+        self._pid: Optional[int] = None
+
+    def _conn(self) -> sqlite3.Connection:
+        pid = os.getpid()
+        if self._db is None or self._pid != pid:
+            if self.path != ":memory:" and not os.path.exists(self.path):
+                os.close(os.open(self.path, os.O_CREAT | os.O_WRONLY, 0o600))
+            # Una conexión heredada de otro proceso no se debe usar (ni cerrar).
+            db = sqlite3.connect(self.path, timeout=self.wait, check_same_thread=False, isolation_level=None)
+            db.execute("PRAGMA journal_mode=WAL")
+            db.executescript(_SCHEMA)
+            self._db, self._pid = db, pid
+        return self._db
+
+    def load(self, api_key: str) -> Optional[StoredToken]:
+        with self._lock:
+            row = self._conn().execute(
+                "SELECT bearer, expires_at FROM tokens WHERE api_key = ? AND bearer IS NOT NULL", (api_key,)
+            ).fetchone()
+        return StoredToken(row[0], row[1]) if row else None
+
+    def save(self, api_key: str, bearer: str, expires_at: Optional[int]):
+        now = time.time()
+        with self._lock:
+            db = self._conn()
+            db.execute("INSERT OR IGNORE INTO tokens (api_key, updated_at) VALUES (?, ?)", (api_key, now))
+            db.execute(
+                "UPDATE tokens SET bearer = ?, expires_at = ?, updated_at = ? WHERE api_key = ?",
+                (bearer, expires_at, now, api_key),
+            )
+
+    def acquire(self, api_key: str) -> Optional[str]:
+        lease_id = uuid.uuid4().hex
+        now = time.time()
+        with self._lock:
+            db = self._conn()
+            db.execute("INSERT OR IGNORE INTO tokens (api_key, updated_at) VALUES (?, ?)", (api_key, now))
+            taken = db.execute(
+                "UPDATE tokens SET lease_id = ?, lease_until = ? WHERE api_key = ? AND lease_until < ?",
+                (lease_id, now + self.lease_ttl, api_key, now),
+            ).rowcount
+        return lease_id if taken else None
+
+    def release(self, api_key: str, lease_id: str):
+        with self._lock:
+            self._conn().execute(
+                "UPDATE tokens SET lease_id = NULL, lease_until = 0 WHERE api_key = ? AND lease_id = ?",
+                (api_key, lease_id),
+            )
+
+    def close(self):
+        with self._lock:
+            if self._db is not None and self._pid == os.getpid():
+                self._db.close()
+            self._db = None
+
+
+# Paso de `_renewal` que pide autenticarse contra la API.
+_FETCH = object()
+
+
+def _renewal(store: TokenStore, api_key: str, stale: Optional[str], margin: float) -> Generator[Any, Any, TokenPair]:
+    """
+    Lease y espera compartidos por `shared_token` y `ashared_token`.
+
+    Es un generador que no bloquea: produce cada paso y recibe su resultado (o
+    la excepción, con `throw`). Un paso es una llamada al almacén (callable sin
+    argumentos), `_FETCH` para autenticarse o los segundos que hay que esperar.
+    """
+    deadline = time.monotonic() + store.wait
+    while True:
+        token = yield functools.partial(store.load, api_key)
+        if token is not None and token.usable(margin, stale):
+            return token.bearer, token.expires_at
+        lease_id = yield functools.partial(store.acquire, api_key)
+        if lease_id is not None:
+            try:
+                # Otro proceso pudo publicarlo entre la lectura y el lease.
+                token = yield functools.partial(store.load, api_key)
+                if token is not None and token.usable(margin, stale):
+                    return token.bearer, token.expires_at
+                bearer, expires_at = yield _FETCH
+                yield functools.partial(store.save, api_key, bearer, expires_at)
+                return bearer, expires_at
+            finally:
+                yield functools.partial(store.release, api_key, lease_id)
+        if time.monotonic() >= deadline:
+            # El proceso que renueva tarda demasiado: se autentica este mismo.
+            bearer, expires_at = yield _FETCH
+            yield functools.partial(store.save, api_key, bearer, expires_at)
+            return bearer, expires_at
+        yield store.poll_interval
+
+
+def shared_token(
+    store: TokenStore,
+    api_key: str,
+    fetch: Callable[[], TokenPair],
+    stale: Optional[str] = None,
+    margin: float = 60.0,
+) -> TokenPair:
+    """
+    Devuelve un token válido del almacén o lo renueva un solo proceso.
+
+    :param store: Almacén compartido.
+    :param api_key: API key del token.
+    :param fetch: Autenticación contra la API; devuelve (bearer, expires_at).
+    :param stale: Token que el llamador ya tiene y quiere sustituir (no se reutiliza).
+    :param margin: Segundos de vida mínimos para reutilizar un token guardado.
+    :return: (bearer, expires_at).
+    """
+    steps = _renewal(store, api_key, stale, margin)
+    result: Any = None
+    error: Optional[BaseException] = None
+    while True:
+        try:
+            step = steps.send(result) if error is None else steps.throw(error)
+        except StopIteration as stop:
+            return stop.value
+        result, error = None, None
+        try:
+            if step is _FETCH:
+                result = fetch()
+            elif callable(step):
+                result = step()
+            else:
+                time.sleep(step)
+        except BaseException as e:
+            error = e
+
+
+async def ashared_token(
+    store: TokenStore,
+    api_key: str,
+    fetch: Callable[[], Awaitable[TokenPair]],
+    stale: Optional[str] = None,
+    margin: float = 60.0,
+) -> TokenPair:
+    """
+    Versión asíncrona de `shared_token` (la autenticación es una corrutina).
+
+    Las llamadas al almacén, que pueden bloquear hasta `store.wait` segundos si
+    otro proceso tiene la base de datos ocupada, se ejecutan en el executor por
+    defecto del bucle para no detenerlo.
+    """
+    import asyncio
+    loop = asyncio.get_running_loop()
+    steps = _renewal(store, api_key, stale, margin)
+    result: Any = None
+    error: Optional[BaseException] = None
+    while True:
+        try:
+            step = steps.send(result) if error is None else steps.throw(error)
+        except StopIteration as stop:
+            return stop.value
+        result, error = None, None
+        try:
+            if step is _FETCH:
+                result = await fetch()
+            elif callable(step):
+                result = await loop.run_in_executor(None, step)
+            else:
+                await asyncio.sleep(step)
+        except BaseException as e:
+            error = e
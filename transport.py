@@ -0,0 +1,389 @@
+# fiskaly_sdk/transport.py
+
+"""
+Transportes HTTP del cliente síncrono del SDK Fiskaly SIGN ES.
+
+FiskalyClient no llama directamente a `requests`: envía cada petición a través
+de un Transport, que se elige con `transport`:
+
+  - "requests" (por defecto): `requests.Session` con el HTTPAdapter de `pool`.
+  - "urllib3": el mismo pool de urllib3 sin la capa de requests (sin preparar
+    PreparedRequest, cookies, hooks ni proxies de entorno): menos coste por llamada.
+  - "http2": httpx con HTTP/2, que multiplexa muchas peticiones concurrentes
+    sobre pocas conexiones TLS (`pip install 'fiskaly-sdk-sign-es[http2]'`).
+
+Todos los transportes devuelven respuestas con la interfaz que usa el cliente
+(`status_code`, `ok`, `headers`, `content`, `text`, `iter_content`, `close` y
+`request.headers`) y convierten sus errores de red a las excepciones de
+`requests`, así que la política de reintentos funciona igual con cualquiera.
+"""
+
+import threading
+from typing import Any, Dict, Iterator, Mapping, Optional, Union
+from urllib.parse import urlencode
+
+import requests
+
+from .pool import FiskalyHTTPAdapter, PoolStats, StatsPoolManager, keepalive_socket_options
+from .version import __version__
+
+
+class Transport:
+    """
+    Interfaz de un transporte HTTP.
+    """
+    name = "base"
+
+    def send(
+        self,
+        method: str,
+        url: str,
+        headers: Mapping[str, str],
+        timeout: float,
+        params: Optional[Mapping[str, Any]] = None,
+        data: Optional[bytes] = None,
+        stream: bool = False,
+    ):
+        """
+        Envía una petición y devuelve la respuesta.
+
+        :param stream: Si True, el cuerpo se lee bajo demanda con `iter_content`.
+        :raises requests.RequestException: Si la conexión falla o vence el timeout.
+        """
+        raise NotImplementedError
+
+    def stats(self) -> PoolStats:
+        """
+        Estadísticas del pool de conexiones del transporte.
+        """
+        return PoolStats(in_use=0, idle=0, created=0, reused=0, pools=0)
+
+    def close(self):
+        pass
+
+    def __repr__(self):
+        return f"<{type(self).__name__} {self.name}>"
+
+
+class RequestsTransport(Transport):
+    """
+    Transporte sobre `requests.Session` (el comportamiento histórico del cliente).
+    """
+    name = "requests"
+
+    def __init__(self, config, verify: bool = True, session: Optional[requests.Session] = None):
+        """
+        :param config: FiskalyConfig con el tamaño del pool y el keep-alive.
+        :param verify: Verifica el certificado TLS del servidor.
+        :param session: Sesión ya configurada (por defecto se crea una con FiskalyHTTPAdapter).
+        """
+        self.verify = verify
+        if session is None:
+            session = requests.Session()
+            adapter = FiskalyHTTPAdapter.from_config(config)
+            session.mount("https://", adapter)
+            session.mount("http://", adapter)
+        self.session = session
+
+    def send(self, method, url, headers, timeout, params=None, data=None, stream=False):
+        kwargs: Dict[str, Any] = {}
+        if params is not None:
+            kwargs["params"] = params
+        if data is not None:
+            kwargs["data"] = data
+        if stream:
+            kwargs["stream"] = True
+        return self.session.request(
+            method=method,
+            url=url,
+            headers=headers,
+            timeout=timeout,
+            verify=self.verify,
+            **kwargs
+        )
+
+    def stats(self) -> PoolStats:
+        adapter = self.session.get_adapter("https://")
+        if isinstance(adapter, FiskalyHTTPAdapter):
+            return adapter.stats()
+        return super().stats()
+
+    def close(self):
+        self.session.close()
+
+
+def _query_string(params: Mapping[str, Any]) -> str:
+    # Igual que requests: los valores None se omiten y las listas repiten la clave.
+    return urlencode([(key, value) for key, value in params.items() if value is not None], doseq=True)
+
+
+class _SentRequest:
+    __slots__ = ("headers",)
+
+    def __init__(self, headers: Dict[str, str]):
+        self.headers = headers
+
+
+class Urllib3Response:
+    """
+    Respuesta de Urllib3Transport con la interfaz de `requests.Response` que usa el SDK.
+    """
+
+    def __init__(self, raw, request_headers: Dict[str, str]):
+        self.raw = raw
+        self.status_code: int = raw.status
+        self.headers = raw.headers
+        self.request = _SentRequest(request_headers)
+        self._content: Optional[bytes] = None
+
+    @property
+    def ok(self) -> bool:
+        return self.status_code < 400
+
+    @property
+    def content(self) -> bytes:
+        if self._content is None:
+            self._content = self.raw.data or b""
+        return self._content
+
+    @property
+    def text(self) -> str:
+        return self.content.decode("utf-8", errors="replace")
+
+    def iter_content(self, chunk_size: int = 65536) -> Iterator[bytes]:
+        """
+        Lee el cuerpo por trozos. Como en requests, un corte a mitad del cuerpo se
+        convierte en ChunkedEncodingError y un timeout en ConnectionError, que es
+        lo que espera `download.stream_download` para reanudar.
+        """
+        import urllib3
+
+        try:
+            yield from self.raw.stream(chunk_size, decode_content=True)
+        except urllib3.exceptions.ProtocolError as e:
+            raise requests.exceptions.ChunkedEncodingError(e)
+        except urllib3.exceptions.DecodeError as e:
+            raise requests.exceptions.ContentDecodingError(e)
+        except urllib3.exceptions.ReadTimeoutError as e:
+            raise requests.ConnectionError(e)
+        except urllib3.exceptions.SSLError as e:
+            raise requests.exceptions.SSLError(e)
+
+    def close(self):
+        self.raw.close()
+        self.raw.release_conn()
+
+
+class Urllib3Transport(Transport):
+    """
+    Transporte directo sobre el PoolManager de urllib3 (sin requests).
+    """
+    name = "urllib3"
+
+    def __init__(self, config, verify: bool = True):
+        """
+        :param config: FiskalyConfig con el tamaño del pool y el keep-alive.
+        :param verify: Verifica el certificado TLS del servidor (con el bundle de certifi).
+        """
+        import urllib3
+
+        self._urllib3 = urllib3
+        pool_kwargs: Dict[str, Any] = {}
+        if config.tcp_keepalive:
+            pool_kwargs["socket_options"] = keepalive_socket_options(
+                config.tcp_keepalive_idle,
+                config.tcp_keepalive_interval,
+                config.tcp_keepalive_count,
+            )
+        if verify:
+            import certifi
+            pool_kwargs.update(cert_reqs="CERT_REQUIRED", ca_certs=certifi.where())
+        else:
+            pool_kwargs["cert_reqs"] = "CERT_NONE"
+        self.pool = StatsPoolManager(
+            num_pools=config.pool_connections,
+            maxsize=config.pool_maxsize,
+            block=config.pool_block,
+            **pool_kwargs
+        )
+        self._default_headers = {
+            "User-Agent": f"fiskaly-sdk-sign-es/{__version__}",
+            "Accept-Encoding": "gzip, deflate",
+        }
+
+    def send(self, method, url, headers, timeout, params=None, data=None, stream=False):
+        if params:
+            query = _query_string(params)
+            if query:
+                url = f"{url}{'&' if '?' in url else '?'}{query}"
+        request_headers = {**self._default_headers, **headers}
+        if data is not None:
+            request_headers["Content-Length"] = str(len(data))
+        urllib3 = self._urllib3
+        try:
+            raw = self.pool.urlopen(
+                method,
+                url,
+                body=data,
+                headers=request_headers,
+                timeout=urllib3.Timeout(connect=timeout, read=timeout),
+                retries=False,
+                redirect=False,
+                preload_content=not stream,
+            )
+        except urllib3.exceptions.NewConnectionError as e:
+            raise requests.ConnectionError(e)
+        except urllib3.exceptions.ConnectTimeoutError as e:
+            raise requests.ConnectTimeout(e)
+        except urllib3.exceptions.ReadTimeoutError as e:
+            raise requests.ReadTimeout(e)
+        except urllib3.exceptions.SSLError as e:
+            raise requests.exceptions.SSLError(e)
+        except urllib3.exceptions.HTTPError as e:
+            raise requests.ConnectionError(e)
+        return Urllib3Response(raw, request_headers)
+
+    def stats(self) -> PoolStats:
+        return self.pool.stats()
+
+    def close(self):
+        self.pool.clear()
+
+
+class HttpxResponse:
+    """
+    Respuesta de HTTP2Transport con la interfaz de `requests.Response` que usa el SDK.
+    """
+
+    def __init__(self, resp):
+        self.raw = resp
+        self.status_code: int = resp.status_code
+        self.headers = resp.headers
+        self.request = resp.request
+        self.http_version: str = resp.http_version
+
+    @property
+    def ok(self) -> bool:
+        return self.status_code < 400
+
+    @property
+    def content(self) -> bytes:
+        return self.raw.read()
+
+    @property
+    def text(self) -> str:
+        return self.content.decode("utf-8", errors="replace")
+
+    def iter_content(self, chunk_size: int = 65536) -> Iterator[bytes]:
+        """
+        Lee el cuerpo por trozos, con los errores de httpx convertidos como en
+        `Urllib3Response.iter_content`.
+        """
+        import httpx
+
+        try:
+            yield from self.raw.iter_bytes(chunk_size)
+        except httpx.DecodingError as e:
+            raise requests.exceptions.ContentDecodingError(e)
+        except httpx.TimeoutException as e:
+            raise requests.ConnectionError(e)
+        except httpx.TransportError as e:
+            raise requests.exceptions.ChunkedEncodingError(e)
+
+    def close(self):
+        self.raw.close()
+
+
+class HTTP2Transport(Transport):
+    """
+    Transporte httpx con HTTP/2: las peticiones concurrentes de todos los hilos
+    comparten unas pocas conexiones (streams multiplexados) en lugar de ocupar
+    una conexión cada una.
+
+    HTTP/2 se negocia por ALPN, así que solo se usa contra servidores HTTPS; con
+    `http://` el transporte habla HTTP/1.1.
+    """
+    name = "http2"
+
+    def __init__(self, config, verify: bool = True):
+        """
+        :param config: FiskalyConfig; `pool_connections` limita las conexiones abiertas.
+        :param verify: Verifica el certificado TLS del servidor.
+        :raises ImportError: Si no están instalados httpx y h2.
+        """
+        try:
+            import h2  # noqa: F401
+            import httpx
+        except ImportError as e:
+            raise ImportError(
+                "El transporte http2 requiere httpx y h2: pip install 'fiskaly-sdk-sign-es[http2]'"
+            ) from e
+        self._httpx = httpx
+        self.client = httpx.Client(
+            http2=True,
+            verify=verify,
+            limits=httpx.Limits(
+                max_connections=config.pool_connections,
+                max_keepalive_connections=config.pool_connections,
+            ),
+        )
+        self._lock = threading.Lock()
+        self._in_use = 0
+
+    def send(self, method, url, headers, timeout, params=None, data=None, stream=False):
+        httpx = self._httpx
+        request = self.client.build_request(method, url, headers=headers, params=params, content=data, timeout=timeout)
+        with self._lock:
+            self._in_use += 1
+        try:
+            resp = self.client.send(request, stream=stream)
+        except httpx.ConnectTimeout as e:
+            raise requests.ConnectTimeout(e)
+        except httpx.ConnectError as e:
+            raise requests.ConnectionError(e)
+        except (httpx.ReadTimeout, httpx.WriteTimeout) as e:
+            raise requests.ReadTimeout(e)
+        except httpx.TimeoutException as e:
+            raise requests.Timeout(e)
+        except httpx.TransportError as e:
+            raise requests.ConnectionError(e)
+        finally:
+            with self._lock:
+                self._in_use -= 1
+        return HttpxResponse(resp)
+
+    def stats(self) -> PoolStats:
+        """
+        Peticiones en curso (httpx no expone el estado de sus conexiones).
+        """
+        with self._lock:
+            return PoolStats(in_use=self._in_use, idle=0, created=0, reused=0, pools=1)
+
+    def close(self):
+        self.client.close()
+
+
+TRANSPORTS = {
+    "requests": RequestsTransport,
+    "urllib3": Urllib3Transport,
+    "http2": HTTP2Transport,
+}
+
+
+def build_transport(config, verify: bool = True) -> Transport:
+    """
+    Crea el transporte indicado por `config.transport`.
+
+    :param config: FiskalyConfig.
+    :param verify: Verifica el certificado TLS del servidor.
+    :return: Transporte nuevo (o el objeto de `config.transport` si ya es un Transport).
+    :raises ValueError: Si el nombre no corresponde a ningún transporte.
+    """
+    transport: Union[str, Transport] = config.transport
+    if not isinstance(transport, str):
+        return transport
+    try:
+        factory = TRANSPORTS[transport]
+    except KeyError:
+        raise ValueError(f"transport desconocido: {transport!r} (opciones: {', '.join(TRANSPORTS)})")
+    return factory(config, verify)
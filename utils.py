@@ -5,6 +5,7 @@ Utilidades varias para el SDK Fiskaly.
 """
 
 import uuid
+from typing import Any
 
 def generate_guid() -> str:
     """
@@ -13,3 +14,17 @@ def generate_guid() -> str:
     :return: String UUID.
     """
     return str(uuid.uuid4())
+
+
+def copy_json(value: Any) -> Any:
+    """
+    Copia un JSON decodificado: dicts y listas se copian en profundidad y el resto
+    (str, números, bytes, None) se comparte, porque es inmutable.
+
+    :return: Copia que se puede modificar sin afectar al original.
+    """
+    if isinstance(value, dict):
+        return {key: copy_json(item) for key, item in value.items()}
+    if isinstance(value, list):
+        return [copy_json(item) for item in value]
+    return value